@@ -24,11 +24,18 @@ class InfrastructureConfig:
         project_name: Base name for all resources (default: cns427-task-api)
         environment: Environment identifier (default: dev)
         region: AWS region for deployment (default: us-west-2)
+        task_list_indexes: How many of the task listing GSIs to deploy, in order (default: 3).
+            CloudFormation adds at most one GSI to an existing table per update, so an existing
+            stack is upgraded by deploying with 1, 2 and then 3.
+        status_priority_index_ready: Whether the status_priority attribute has been backfilled,
+            so listings may query the status_priority index (default: false)
     """
 
     project_name: str = 'cns427-task-api'
     environment: str = 'dev'
     region: str = 'us-west-2'
+    task_list_indexes: int = 3
+    status_priority_index_ready: bool = False
 
     # Core Infrastructure Resource Names
 
@@ -41,6 +48,42 @@ class InfrastructureConfig:
         """
         return f'{self.project_name}-tasks'
 
+    def task_graph_table_name(self) -> str:
+        """
+        Get DynamoDB table name for the task dependency-graph index.
+
+        Returns:
+            Table name in format: {project_name}-task-graph
+        """
+        return f'{self.project_name}-task-graph'
+
+    def task_outbox_table_name(self) -> str:
+        """
+        Get DynamoDB table name for the transactional task event outbox.
+
+        Returns:
+            Table name in format: {project_name}-task-outbox
+        """
+        return f'{self.project_name}-task-outbox'
+
+    def notification_idempotency_table_name(self) -> str:
+        """
+        Get DynamoDB table name recording task events the notification handler has processed.
+
+        Returns:
+            Table name in format: {project_name}-notification-idempotency
+        """
+        return f'{self.project_name}-notification-idempotency'
+
+    def update_window_table_name(self) -> str:
+        """
+        Get DynamoDB table name holding coalescing windows of task updates for the notification handler.
+
+        Returns:
+            Table name in format: {project_name}-update-windows
+        """
+        return f'{self.project_name}-update-windows'
+
     def event_bus_name(self) -> str:
         """
         Get EventBridge custom event bus name.
@@ -50,6 +93,15 @@ class InfrastructureConfig:
         """
         return f'{self.project_name}-core-task-events'
 
+    def event_spill_queue_name(self) -> str:
+        """
+        Get SQS queue name for task events spilled while EventBridge is unavailable.
+
+        Returns:
+            Queue name in format: {project_name}-event-spill
+        """
+        return f'{self.project_name}-event-spill'
+
     def task_handler_function_name(self) -> str:
         """
         Get Lambda function name for task CRUD operations.
@@ -68,6 +120,51 @@ class InfrastructureConfig:
         """
         return f'{self.project_name}-notification-handler'
 
+    def notification_queue_name(self) -> str:
+        """
+        Get SQS queue name batching task events for the notification handler.
+
+        Returns:
+            Queue name in format: {project_name}-notifications
+        """
+        return f'{self.project_name}-notifications'
+
+    def notification_dlq_name(self) -> str:
+        """
+        Get SQS dead-letter queue name for task events the notification handler keeps failing.
+
+        Returns:
+            Queue name in format: {project_name}-notifications-dlq
+        """
+        return f'{self.project_name}-notifications-dlq'
+
+    def outbox_relay_function_name(self) -> str:
+        """
+        Get Lambda function name for relaying outbox events to EventBridge.
+
+        Returns:
+            Function name in format: {project_name}-outbox-relay
+        """
+        return f'{self.project_name}-outbox-relay'
+
+    def outbox_relay_dlq_name(self) -> str:
+        """
+        Get SQS dead-letter queue name for outbox stream batches the relay keeps failing.
+
+        Returns:
+            Queue name in format: {project_name}-outbox-relay-dlq
+        """
+        return f'{self.project_name}-outbox-relay-dlq'
+
+    def task_export_function_name(self) -> str:
+        """
+        Get Lambda function name for exporting tasks to S3.
+
+        Returns:
+            Function name in format: {project_name}-task-export
+        """
+        return f'{self.project_name}-task-export'
+
     def api_name(self) -> str:
         """
         Get API Gateway REST API name.
@@ -193,4 +290,6 @@ class InfrastructureConfig:
             project_name=node.try_get_context('project_name') or cls.project_name,
             environment=node.try_get_context('environment') or cls.environment,
             region=node.try_get_context('region') or cls.region,
+            task_list_indexes=int(node.try_get_context('task_list_indexes') or cls.task_list_indexes),
+            status_priority_index_ready=str(node.try_get_context('status_priority_index_ready')).lower() == 'true',
         )
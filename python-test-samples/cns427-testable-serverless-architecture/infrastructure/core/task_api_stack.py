@@ -17,6 +17,12 @@ from aws_cdk import (
 from aws_cdk import (
     aws_logs as logs,
 )
+from aws_cdk import (
+    aws_s3 as s3,
+)
+from aws_cdk import (
+    aws_sqs as sqs,
+)
 from cdk_nag import NagSuppressions
 from constructs import Construct
 
@@ -44,9 +50,116 @@ class TaskApiCoreStack(Stack):
             point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
         )
 
+        # GSIs for filtered listing, sorted by creation time (index names are mirrored in shared/integration/dynamodb_adapter.py).
+        # CloudFormation creates at most one GSI per update of an existing table, so task_list_indexes adds them in stages.
+        for index_name, partition_attribute in [
+            ('status-created_at-index', 'status'),
+            ('priority-created_at-index', 'priority'),
+            ('status_priority-created_at-index', 'status_priority'),
+        ][: config.task_list_indexes]:
+            self.tasks_table.add_global_secondary_index(
+                index_name=index_name,
+                partition_key=dynamodb.Attribute(name=partition_attribute, type=dynamodb.AttributeType.STRING),
+                sort_key=dynamodb.Attribute(name='created_at', type=dynamodb.AttributeType.STRING),
+                projection_type=dynamodb.ProjectionType.ALL,
+            )
+
+        # DynamoDB table for the dependency-graph index (adjacency and reverse adjacency per task)
+        self.task_graph_table = dynamodb.Table(
+            self,
+            'TaskGraphTable',
+            table_name=config.task_graph_table_name(),
+            partition_key=dynamodb.Attribute(name='task_id', type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            encryption=dynamodb.TableEncryption.AWS_MANAGED,
+            removal_policy=RemovalPolicy.DESTROY,  # For demo purposes
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
+        )
+
+        # DynamoDB table for the transactional event outbox, drained through its stream by the outbox relay
+        self.task_outbox_table = dynamodb.Table(
+            self,
+            'TaskOutboxTable',
+            table_name=config.task_outbox_table_name(),
+            partition_key=dynamodb.Attribute(name='event_id', type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            encryption=dynamodb.TableEncryption.AWS_MANAGED,
+            stream=dynamodb.StreamViewType.NEW_IMAGE,
+            time_to_live_attribute='expires_at',
+            removal_policy=RemovalPolicy.DESTROY,  # For demo purposes
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
+        )
+
+        # DynamoDB table of processed event ids, deduplicating redelivered notifications; items expire by TTL
+        self.notification_idempotency_table = dynamodb.Table(
+            self,
+            'NotificationIdempotencyTable',
+            table_name=config.notification_idempotency_table_name(),
+            partition_key=dynamodb.Attribute(name='idempotency_key', type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            encryption=dynamodb.TableEncryption.AWS_MANAGED,
+            time_to_live_attribute='expires_at',
+            removal_policy=RemovalPolicy.DESTROY,  # For demo purposes
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
+        )
+
+        # DynamoDB table of coalescing windows, merging bursts of task updates into one notification
+        self.update_window_table = dynamodb.Table(
+            self,
+            'UpdateWindowTable',
+            table_name=config.update_window_table_name(),
+            partition_key=dynamodb.Attribute(name='task_id', type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            encryption=dynamodb.TableEncryption.AWS_MANAGED,
+            time_to_live_attribute='expires_at',
+            removal_policy=RemovalPolicy.DESTROY,  # For demo purposes
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
+        )
+
+        # S3 bucket receiving NDJSON task exports
+        self.export_bucket = s3.Bucket(
+            self,
+            'TaskExportBucket',
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            enforce_ssl=True,
+            lifecycle_rules=[s3.LifecycleRule(abort_incomplete_multipart_upload_after=Duration.days(1), expiration=Duration.days(30))],
+            removal_policy=RemovalPolicy.DESTROY,  # For demo purposes
+        )
+        NagSuppressions.add_resource_suppressions(
+            self.export_bucket,
+            [
+                {
+                    'id': 'AwsSolutions-S1',
+                    'reason': 'Export objects are short-lived analytics snapshots written only by the export function; access logging is not required for the demo.',
+                }
+            ],
+        )
+
         # EventBridge custom event bus
         self.event_bus = events.EventBus(self, 'TaskEventBus', event_bus_name=config.event_bus_name())
 
+        # SQS queue holding task events while the event publishing circuit is open; drained by the outbox relay,
+        # as it publishes and on a schedule
+        self.event_spill_queue = sqs.Queue(
+            self,
+            'EventSpillQueue',
+            queue_name=config.event_spill_queue_name(),
+            encryption=sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+            retention_period=Duration.days(14),
+            visibility_timeout=Duration.seconds(30),
+        )
+        NagSuppressions.add_resource_suppressions(
+            self.event_spill_queue,
+            [
+                {
+                    'id': 'AwsSolutions-SQS3',
+                    'reason': 'The spill queue is itself the fallback for undeliverable events; messages are retried until drained, not dead-lettered.',
+                }
+            ],
+        )
+
         # CloudWatch log group for application logs
         self.app_log_group = logs.LogGroup(
             self,
@@ -78,16 +191,30 @@ class TaskApiCoreStack(Stack):
                 resources=[
                     f'arn:aws:logs:{self.region}:{self.account}:log-group:/aws/lambda/{config.task_handler_function_name()}:*',
                     f'arn:aws:logs:{self.region}:{self.account}:log-group:/aws/lambda/{config.notification_handler_function_name()}:*',
+                    f'arn:aws:logs:{self.region}:{self.account}:log-group:/aws/lambda/{config.outbox_relay_function_name()}:*',
+                    f'arn:aws:logs:{self.region}:{self.account}:log-group:/aws/lambda/{config.task_export_function_name()}:*',
                 ],
             )
         )
 
         # Grant DynamoDB permissions
         self.tasks_table.grant_read_write_data(self.lambda_execution_role)
+        self.task_graph_table.grant_read_write_data(self.lambda_execution_role)
+        self.task_outbox_table.grant_read_write_data(self.lambda_execution_role)
+        self.task_outbox_table.grant_stream_read(self.lambda_execution_role)
+        self.notification_idempotency_table.grant_read_write_data(self.lambda_execution_role)
+        self.update_window_table.grant_read_write_data(self.lambda_execution_role)
+
+        # Grant S3 permissions for task exports (PutObject also covers multipart uploads)
+        self.export_bucket.grant_put(self.lambda_execution_role)
 
         # Grant EventBridge permissions
         self.event_bus.grant_put_events_to(self.lambda_execution_role)
 
+        # Grant SQS permissions for spilling and draining events
+        self.event_spill_queue.grant_send_messages(self.lambda_execution_role)
+        self.event_spill_queue.grant_consume_messages(self.lambda_execution_role)
+
         # Grant CloudWatch Logs permissions for application log group
         self.app_log_group.grant_write(self.lambda_execution_role)
 
@@ -117,8 +244,16 @@ class TaskApiCoreStack(Stack):
                     'appliesTo': [
                         f'Resource::arn:aws:logs:{self.region}:<AWS::AccountId>:log-group:/aws/lambda/{config.task_handler_function_name()}:*',
                         f'Resource::arn:aws:logs:{self.region}:<AWS::AccountId>:log-group:/aws/lambda/{config.notification_handler_function_name()}:*',
+                        f'Resource::arn:aws:logs:{self.region}:<AWS::AccountId>:log-group:/aws/lambda/{config.outbox_relay_function_name()}:*',
+                        f'Resource::arn:aws:logs:{self.region}:<AWS::AccountId>:log-group:/aws/lambda/{config.task_export_function_name()}:*',
                     ],
                 },
+                {
+                    'id': 'AwsSolutions-IAM5',
+                    'reason': 'Task exports write objects under generated keys in the export bucket, and aborting a failed multipart upload '
+                    'needs the s3:Abort* actions. Access is limited to that one bucket.',
+                    'appliesTo': ['Action::s3:Abort*', {'regex': '/^Resource::<TaskExportBucket.*\\.Arn>\\/\\*$/'}],
+                },
             ],
             apply_to_children=True,
         )
@@ -135,7 +270,13 @@ class TaskApiStack(Stack):
 
         # Import core resources
         self.tasks_table = core_stack.tasks_table
+        self.task_graph_table = core_stack.task_graph_table
+        self.task_outbox_table = core_stack.task_outbox_table
+        self.notification_idempotency_table = core_stack.notification_idempotency_table
+        self.update_window_table = core_stack.update_window_table
         self.event_bus = core_stack.event_bus
+        self.export_bucket = core_stack.export_bucket
+        self.event_spill_queue = core_stack.event_spill_queue
         self.lambda_role = core_stack.lambda_execution_role
 
         # Lambda function for task CRUD operations
@@ -180,6 +321,9 @@ class TaskApiStack(Stack):
             description='Handles task CRUD operations via API Gateway with DynamoDB persistence and EventBridge publishing',
             environment={
                 'TASKS_TABLE_NAME': self.tasks_table.table_name,
+                'TASK_GRAPH_TABLE_NAME': self.task_graph_table.table_name,
+                'TASK_OUTBOX_TABLE_NAME': self.task_outbox_table.table_name,
+                'TASK_STATUS_PRIORITY_INDEX_READY': str(config.status_priority_index_ready and config.task_list_indexes >= 3).lower(),
                 'EVENT_BUS_NAME': self.event_bus.event_bus_name,
                 'POWERTOOLS_SERVICE_NAME': 'task-api',
                 'POWERTOOLS_METRICS_NAMESPACE': 'CNS427/TaskAPI',
@@ -224,7 +368,151 @@ class TaskApiStack(Stack):
             tracing=lambda_.Tracing.ACTIVE,
             log_group=notification_handler_log_group,
             description='Processes task events from EventBridge and handles notification logic',
-            environment={'POWERTOOLS_SERVICE_NAME': 'task-notifications', 'POWERTOOLS_METRICS_NAMESPACE': 'CNS427/TaskAPI', 'LOG_LEVEL': 'INFO'},
+            environment={
+                'IDEMPOTENCY_TABLE_NAME': self.notification_idempotency_table.table_name,
+                'UPDATE_WINDOW_TABLE_NAME': self.update_window_table.table_name,
+                'NOTIFICATION_COALESCE_WINDOW_SECONDS': '30',
+                'POWERTOOLS_SERVICE_NAME': 'task-notifications',
+                'POWERTOOLS_METRICS_NAMESPACE': 'CNS427/TaskAPI',
+                'LOG_LEVEL': 'INFO',
+            },
+        )
+
+        # Lambda function relaying outbox records to EventBridge
+        # Create log group for outbox relay
+        outbox_relay_log_group = logs.LogGroup(
+            self,
+            'OutboxRelayLogGroup',
+            log_group_name=f'/aws/lambda/{config.outbox_relay_function_name()}',
+            retention=logs.RetentionDays.ONE_WEEK,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        self.outbox_relay = lambda_.Function(
+            self,
+            'OutboxRelay',
+            function_name=config.outbox_relay_function_name(),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            architecture=lambda_.Architecture.ARM_64,
+            handler='services.outbox_relay.handler.lambda_handler',
+            code=lambda_.Code.from_asset(
+                '.',
+                bundling=BundlingOptions(
+                    image=lambda_.Runtime.PYTHON_3_13.bundling_image,
+                    platform='linux/arm64',
+                    command=[
+                        'bash',
+                        '-c',
+                        'pip install -r services/outbox_relay/requirements.txt -t /asset-output && '
+                        + 'cp -r services /asset-output/ && '
+                        + 'cp -r shared /asset-output/',
+                    ],
+                ),
+            ),
+            role=self.lambda_role,
+            timeout=Duration.seconds(30),
+            memory_size=256,
+            tracing=lambda_.Tracing.ACTIVE,
+            log_group=outbox_relay_log_group,
+            description='Relays task events from the outbox table stream to EventBridge',
+            environment={
+                'EVENT_BUS_NAME': self.event_bus.event_bus_name,
+                'EVENT_SPILL_QUEUE_URL': self.event_spill_queue.queue_url,
+                'POWERTOOLS_SERVICE_NAME': 'task-outbox-relay',
+                'POWERTOOLS_METRICS_NAMESPACE': 'CNS427/TaskAPI',
+                'LOG_LEVEL': 'INFO',
+            },
+        )
+
+        # Stream source: only inserts carry events, failed chunks are retried from the reported record
+        from aws_cdk import aws_lambda_event_sources as lambda_event_sources
+
+        # Records still failing after the retries, or after bisecting down to the failing record, are sent here
+        outbox_relay_dlq = sqs.Queue(
+            self,
+            'OutboxRelayDLQ',
+            queue_name=config.outbox_relay_dlq_name(),
+            encryption=sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+            retention_period=Duration.days(14),
+        )
+        NagSuppressions.add_resource_suppressions(
+            outbox_relay_dlq,
+            [
+                {
+                    'id': 'AwsSolutions-SQS3',
+                    'reason': 'The queue is the on-failure destination of the outbox stream source and so is itself a dead-letter queue.',
+                }
+            ],
+        )
+        self.outbox_relay.add_event_source(
+            lambda_event_sources.DynamoEventSource(
+                self.task_outbox_table,
+                starting_position=lambda_.StartingPosition.TRIM_HORIZON,
+                batch_size=100,
+                max_batching_window=Duration.millis(100),
+                report_batch_item_failures=True,
+                retry_attempts=10,
+                bisect_batch_on_error=True,
+                on_failure=lambda_event_sources.SqsDlq(outbox_relay_dlq),
+                filters=[lambda_.FilterCriteria.filter({'eventName': lambda_.FilterRule.is_equal('INSERT')})],
+            )
+        )
+
+        # The relay only drains the spill queue while it publishes, so a schedule drains it in quiet periods too
+        from aws_cdk import aws_events_targets as targets
+
+        events.Rule(
+            self,
+            'SpillQueueDrainSchedule',
+            schedule=events.Schedule.rate(Duration.minutes(5)),
+            targets=[targets.LambdaFunction(self.outbox_relay, event=events.RuleTargetInput.from_object({'drain_spill_queue': True}))],
+        )
+
+        # Lambda function streaming all tasks to S3 as NDJSON, invoked directly or on a schedule
+        # Create log group for task export
+        task_export_log_group = logs.LogGroup(
+            self,
+            'TaskExportLogGroup',
+            log_group_name=f'/aws/lambda/{config.task_export_function_name()}',
+            retention=logs.RetentionDays.ONE_WEEK,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        self.task_export = lambda_.Function(
+            self,
+            'TaskExport',
+            function_name=config.task_export_function_name(),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            architecture=lambda_.Architecture.ARM_64,
+            handler='services.task_export.handler.lambda_handler',
+            code=lambda_.Code.from_asset(
+                '.',
+                bundling=BundlingOptions(
+                    image=lambda_.Runtime.PYTHON_3_13.bundling_image,
+                    platform='linux/arm64',
+                    command=[
+                        'bash',
+                        '-c',
+                        'pip install -r services/task_export/requirements.txt -t /asset-output && '
+                        + 'cp -r services /asset-output/ && '
+                        + 'cp -r shared /asset-output/',
+                    ],
+                ),
+            ),
+            role=self.lambda_role,
+            timeout=Duration.minutes(15),
+            memory_size=1024,
+            tracing=lambda_.Tracing.ACTIVE,
+            log_group=task_export_log_group,
+            description='Streams every task as NDJSON to the export bucket',
+            environment={
+                'TASKS_TABLE_NAME': self.tasks_table.table_name,
+                'EXPORT_BUCKET_NAME': self.export_bucket.bucket_name,
+                'TASK_EXPORT_SCAN_SEGMENTS': '4',
+                'POWERTOOLS_SERVICE_NAME': 'task-export',
+                'LOG_LEVEL': 'INFO',
+            },
         )
 
         # API Gateway
@@ -240,7 +528,8 @@ class TaskApiStack(Stack):
             default_cors_preflight_options=apigateway.CorsOptions(
                 allow_origins=apigateway.Cors.ALL_ORIGINS,
                 allow_methods=apigateway.Cors.ALL_METHODS,
-                allow_headers=['Content-Type', 'Authorization', 'X-Amz-Date', 'X-Amz-Security-Token'],
+                allow_headers=['Content-Type', 'Authorization', 'X-Amz-Date', 'X-Amz-Security-Token', 'If-Match', 'If-None-Match'],
+                expose_headers=['ETag'],
             ),
         )
 
@@ -269,6 +558,15 @@ class TaskApiStack(Stack):
             request_validator=request_validator,
         )  # Create task
 
+        # Bulk create (custom method style path: POST /tasks:batch)
+        tasks_batch_resource = self.api.root.add_resource('tasks:batch')
+        tasks_batch_resource.add_method(
+            'POST',
+            task_integration,
+            authorization_type=apigateway.AuthorizationType.IAM,
+            request_validator=request_validator,
+        )  # Create tasks in bulk
+
         task_resource = tasks_resource.add_resource('{id}')
         task_resource.add_method(
             'GET',
@@ -301,10 +599,37 @@ class TaskApiStack(Stack):
             event_pattern=events.EventPattern(source=['cns427-task-api'], detail_type=['TaskCreated', 'TaskUpdated', 'TaskDeleted']),
         )
 
-        # Add notification handler as target
-        from aws_cdk import aws_events_targets as targets
-
-        task_event_rule.add_target(targets.LambdaFunction(self.notification_handler))
+        # Events reach the notification handler through an SQS queue, so one invocation handles a whole batch
+        notification_dlq = sqs.Queue(
+            self,
+            'NotificationDLQ',
+            queue_name=config.notification_dlq_name(),
+            encryption=sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+            retention_period=Duration.days(14),
+        )
+        self.notification_queue = sqs.Queue(
+            self,
+            'NotificationQueue',
+            queue_name=config.notification_queue_name(),
+            encryption=sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+            # Six times the handler timeout, as Lambda recommends for SQS event sources
+            visibility_timeout=Duration.seconds(180),
+            # Coalescing defers each window's owner record once, which uses up one receive
+            dead_letter_queue=sqs.DeadLetterQueue(queue=notification_dlq, max_receive_count=4),
+        )
+        task_event_rule.add_target(targets.SqsQueue(self.notification_queue))
+
+        # Failed records are reported individually, so only those return to the queue
+        self.notification_handler.add_event_source(
+            lambda_event_sources.SqsEventSource(
+                self.notification_queue,
+                batch_size=10,
+                max_batching_window=Duration.seconds(1),
+                report_batch_item_failures=True,
+            )
+        )
 
         # CDK Nag Suppressions for API Gateway
         # These are acceptable for demo/educational purposes to reduce cost and complexity
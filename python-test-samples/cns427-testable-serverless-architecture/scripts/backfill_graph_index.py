@@ -0,0 +1,58 @@
+"""
+Dependency Graph Index Backfill
+
+Adds the tasks stored before the dependency-graph index was enabled to the index. Until
+then those tasks read as having no dependencies, so cycle checks cannot see their edges.
+The backfill only sets each task's adjacency and adds it to its dependencies' reverse
+adjacency, so it can be re-run safely.
+
+Usage:
+    poetry run backfill-graph-index
+    poetry run backfill-graph-index --tasks-table my-tasks --graph-table my-task-graph
+"""
+
+import argparse
+import os
+import sys
+
+from infrastructure.config import InfrastructureConfig
+
+
+def print_status(message: str) -> None:
+    """Print status message in blue."""
+    print(f'\033[0;34m[INFO]\033[0m {message}')
+
+
+def print_success(message: str) -> None:
+    """Print success message in green."""
+    print(f'\033[0;32m[SUCCESS]\033[0m {message}')
+
+
+def print_error(message: str) -> None:
+    """Print error message in red."""
+    print(f'\033[0;31m[ERROR]\033[0m {message}')
+
+
+def main() -> None:
+    """Backfill the dependency-graph index from the tasks table."""
+    config = InfrastructureConfig()
+    parser = argparse.ArgumentParser(description='Backfill the dependency-graph index from the tasks table')
+    parser.add_argument('--tasks-table', default=os.environ.get('TASKS_TABLE_NAME', config.tasks_table_name()))
+    parser.add_argument('--graph-table', default=os.environ.get('TASK_GRAPH_TABLE_NAME', config.task_graph_table_name()))
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    from shared.integration.dynamodb_adapter import DynamoDBTaskRepository
+
+    print_status(f'Backfilling graph index {args.graph_table} from {args.tasks_table}...')
+    repository = DynamoDBTaskRepository(table_name=args.tasks_table, graph_table_name=args.graph_table)
+    try:
+        backfilled = repository.backfill_graph_index(page_size=args.page_size)
+    except Exception as e:
+        print_error(f'Backfill failed: {e}')
+        sys.exit(1)
+    print_success(f'Backfilled the graph index for {backfilled} task(s) with dependencies')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Status + Priority Attribute Backfill
+
+Writes the status_priority attribute on the tasks stored before it existed, so they appear
+in the status_priority index that serves listings filtered by both status and priority.
+Until it has run, deploy with status_priority_index_ready unset: those listings then query
+the status index with a priority filter. Tasks changed while the backfill runs are left as
+their writer stored them, so it can be re-run safely.
+
+Usage:
+    poetry run backfill-status-priority
+    poetry run backfill-status-priority --tasks-table my-tasks --scan-segments 4
+"""
+
+import argparse
+import os
+import sys
+
+from infrastructure.config import InfrastructureConfig
+
+
+def print_status(message: str) -> None:
+    """Print status message in blue."""
+    print(f'\033[0;34m[INFO]\033[0m {message}')
+
+
+def print_success(message: str) -> None:
+    """Print success message in green."""
+    print(f'\033[0;32m[SUCCESS]\033[0m {message}')
+
+
+def print_error(message: str) -> None:
+    """Print error message in red."""
+    print(f'\033[0;31m[ERROR]\033[0m {message}')
+
+
+def main() -> None:
+    """Backfill the status_priority attribute of stored tasks."""
+    config = InfrastructureConfig()
+    parser = argparse.ArgumentParser(description='Backfill the status_priority attribute of stored tasks')
+    parser.add_argument('--tasks-table', default=os.environ.get('TASKS_TABLE_NAME', config.tasks_table_name()))
+    parser.add_argument('--scan-segments', type=int, default=1)
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    from shared.integration.dynamodb_adapter import DynamoDBTaskRepository
+
+    print_status(f'Backfilling status_priority in {args.tasks_table}...')
+    repository = DynamoDBTaskRepository(table_name=args.tasks_table, scan_segments=args.scan_segments)
+    try:
+        backfilled = repository.backfill_status_priority(page_size=args.page_size)
+    except Exception as e:
+        print_error(f'Backfill failed: {e}')
+        sys.exit(1)
+    print_success(f'Backfilled status_priority for {backfilled} task(s)')
+    print_status('Deploy with -c status_priority_index_ready=true to query the status_priority index')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark Scripts
+
+Poetry-integrated micro-benchmarks for hot paths in the services.
+Each module exposes a main() entry point and prints a results table.
+"""
+
+import gc
+import time
+from typing import Callable
+
+
+def print_status(message: str) -> None:
+    """Print status message in blue."""
+    print(f'\033[0;34m[INFO]\033[0m {message}')
+
+
+def print_success(message: str) -> None:
+    """Print success message in green."""
+    print(f'\033[0;32m[SUCCESS]\033[0m {message}')
+
+
+def print_error(message: str) -> None:
+    """Print error message in red."""
+    print(f'\033[0;31m[ERROR]\033[0m {message}')
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Return the fastest wall-clock time in seconds over `repeat` runs of func.
+
+    The cyclic garbage collector is paused while timing (as timeit does), so that
+    collections triggered by earlier allocations are not billed to the code under test.
+    """
+    best = float('inf')
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
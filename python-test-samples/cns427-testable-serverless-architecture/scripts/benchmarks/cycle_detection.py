@@ -0,0 +1,110 @@
+"""
+Cycle Detection Benchmark
+
+Runs find_dependency_cycle on synthetic acyclic dependency graphs of 10k to 1M nodes
+and checks that run time grows linearly with graph size. The scaling exponent k in
+time ~ nodes^k is fitted between the smallest and largest size: k ~= 1 is linear,
+k ~= 2 would be quadratic. Per-node cost still creeps up a little at 1M nodes because
+the working set no longer fits in CPU caches.
+
+Shapes:
+- chain: t0 -> t1 -> ... -> tN (worst case for recursive traversal depth)
+- fanout: a root depending on N independent leaves (widest single frontier)
+- diamonds: repeated top -> left/right -> bottom blocks (shared subgraphs)
+
+Usage:
+    poetry run benchmark-cycles
+    poetry run benchmark-cycles --max-nodes 100000
+"""
+
+import argparse
+import math
+import sys
+from typing import Callable, Dict, List, Tuple
+
+from scripts.benchmarks import best_of, print_error, print_status, print_success
+from services.task_service.domain.business_rules import find_dependency_cycle
+
+Graph = Dict[str, List[str]]
+
+# Largest fitted scaling exponent we accept as linear
+MAX_SCALING_EXPONENT = 1.25
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def build_chain(size: int) -> Tuple[Graph, List[str]]:
+    """Build a linear chain of `size` nodes; the new task depends on its head."""
+    graph = {f't{i}': [f't{i + 1}'] for i in range(size - 1)}
+    return graph, ['t0']
+
+
+def build_fanout(size: int) -> Tuple[Graph, List[str]]:
+    """Build a root depending on `size - 1` leaves; the new task depends on the root."""
+    graph = {'root': [f'leaf{i}' for i in range(size - 1)]}
+    return graph, ['root']
+
+
+def build_diamonds(size: int) -> Tuple[Graph, List[str]]:
+    """Build a chain of diamond blocks (4 nodes each); the new task depends on every block top."""
+    graph: Graph = {}
+    blocks = size // 4
+    for b in range(blocks):
+        top, left, right, bottom = f'd{b}t', f'd{b}l', f'd{b}r', f'd{b}b'
+        graph[top] = [left, right]
+        graph[left] = [bottom]
+        graph[right] = [bottom]
+        if b + 1 < blocks:
+            graph[bottom] = [f'd{b + 1}t']
+    return graph, [f'd{b}t' for b in range(0, blocks, max(1, blocks // 100))]
+
+
+SHAPES: Dict[str, Callable[[int], Tuple[Graph, List[str]]]] = {
+    'chain': build_chain,
+    'fanout': build_fanout,
+    'diamonds': build_diamonds,
+}
+
+
+def run(sizes: List[int]) -> bool:
+    """Run every shape at every size, print the results table and return whether scaling is linear."""
+    print(f'{"shape":<10} {"nodes":>10} {"seconds":>10} {"ns/node":>10}')
+    linear = True
+
+    for shape, builder in SHAPES.items():
+        timings = []
+        for size in sizes:
+            graph, dependencies = builder(size)
+            assert find_dependency_cycle('new-task', dependencies, graph) is None
+            seconds = best_of(lambda graph=graph, dependencies=dependencies: find_dependency_cycle('new-task', dependencies, graph))
+            timings.append(seconds)
+            print(f'{shape:<10} {size:>10,} {seconds:>10.4f} {seconds / size * 1e9:>10.1f}')
+
+        if len(sizes) < 2:
+            continue
+        exponent = math.log(timings[-1] / timings[0]) / math.log(sizes[-1] / sizes[0])
+        print(f'{shape:<10} scaling exponent: {exponent:.2f}')
+        if exponent > MAX_SCALING_EXPONENT:
+            print_error(f'{shape}: run time grows as nodes^{exponent:.2f} between {sizes[0]:,} and {sizes[-1]:,} nodes')
+            linear = False
+
+    return linear
+
+
+def main() -> None:
+    """Entry point for the cycle detection benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark find_dependency_cycle on synthetic DAGs')
+    parser.add_argument('--max-nodes', type=int, default=SIZES[-1], help='Largest graph size to run')
+    args = parser.parse_args()
+
+    sizes = [size for size in SIZES if size <= args.max_nodes] or [args.max_nodes]
+    print_status(f'Benchmarking cycle detection on sizes: {", ".join(f"{s:,}" for s in sizes)}')
+
+    if run(sizes):
+        print_success('Cycle detection scales linearly')
+        sys.exit(0)
+    print_error('Cycle detection did not scale linearly')
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
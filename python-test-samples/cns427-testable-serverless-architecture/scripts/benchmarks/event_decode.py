@@ -0,0 +1,94 @@
+"""
+Event Decode Benchmark
+
+Measures decode throughput of task event payloads through the cached TypeAdapters,
+against validating details with the Task entity model and against building a TypeAdapter
+per event, on a realistic mix of TaskCreated, TaskUpdated and TaskDeleted events.
+Reports events per second for each path and fails if the cached adapters are not faster
+than entity model validation.
+
+Usage:
+    poetry run benchmark-events
+    poetry run benchmark-events --events 5000 --repeat 5
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List, Tuple
+
+from pydantic import TypeAdapter
+
+from scripts.benchmarks import best_of, print_error, print_status, print_success
+from scripts.benchmarks.task_codec import build_tasks
+from services.task_service.models.event_payloads import PAYLOAD_TYPES, decode_payload
+from services.task_service.models.task import Task, TaskCreatedEvent, TaskDeletedEvent, TaskUpdatedEvent
+
+# Per-event adapter construction is slow enough that a sample gives a stable rate
+UNCACHED_SAMPLE = 100
+
+
+def build_events(count: int) -> List[Tuple[str, Dict[str, Any]]]:
+    """Build (event_type, detail) pairs: mostly updates, some creations and deletions."""
+    events = []
+    for index, task in enumerate(build_tasks(count)):
+        if index % 10 == 0:
+            event = TaskDeletedEvent(task.task_id)
+        elif index % 4 == 0:
+            event = TaskCreatedEvent(task)
+        else:
+            event = TaskUpdatedEvent(task)
+        events.append((event.event_type, event.task_data))
+    return events
+
+
+def model_decode(event_type: str, detail: Dict[str, Any]) -> Any:
+    """Validate a detail with the entity model, the alternative to payload types."""
+    if event_type == 'TaskDeleted':
+        return detail['task_id']
+    return Task.model_validate(detail)
+
+
+def uncached_decode(event_type: str, detail: Dict[str, Any]) -> Any:
+    """Validate a detail through a TypeAdapter built for this event alone."""
+    return TypeAdapter(PAYLOAD_TYPES[event_type]).validate_python(detail)
+
+
+def run(count: int, repeat: int) -> bool:
+    """Time the decode paths, print the results table and return whether the cached adapters are fastest."""
+    events = build_events(count)
+    sample = events[:UNCACHED_SAMPLE]
+    assert [decode_payload(event_type, detail) for event_type, detail in sample] == [
+        uncached_decode(event_type, detail) for event_type, detail in sample
+    ]
+
+    rates = {
+        'cached adapter': count / best_of(lambda: [decode_payload(event_type, detail) for event_type, detail in events], repeat),
+        'entity model': count / best_of(lambda: [model_decode(event_type, detail) for event_type, detail in events], repeat),
+        'adapter per event': len(sample) / best_of(lambda: [uncached_decode(event_type, detail) for event_type, detail in sample], repeat),
+    }
+
+    print(f'{"path":<18} {"events/s":>12} {"us/event":>10}')
+    for path, rate in rates.items():
+        print(f'{path:<18} {rate:>12,.0f} {1e6 / rate:>10.2f}')
+
+    return rates['cached adapter'] > rates['entity model']
+
+
+def main() -> None:
+    """Entry point for the event decode benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark typed task event payload decoding')
+    parser.add_argument('--events', type=int, default=2000, help='Events decoded per timing run')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per path; the fastest is reported')
+    args = parser.parse_args()
+
+    print_status(f'Benchmarking event payload decoding on {args.events} events')
+
+    if run(args.events, args.repeat):
+        print_success('Cached adapters decode faster than entity model validation')
+        sys.exit(0)
+    print_error('Cached adapters are not faster than entity model validation')
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Handler Import-Time Profiler
+
+Imports each Lambda handler module in a fresh interpreter with `python -X importtime`
+and reports what the import costs, which is the part of cold-start INIT duration under
+our control. Each handler is imported several times and the fastest run per module is
+kept, to filter out disk cache and scheduling noise.
+
+Reports per handler:
+- total: cumulative import time of the handler module
+- by package: self time summed per top-level package (pydantic, aws_lambda_powertools, ...)
+- slowest modules: the modules with the largest self time
+
+Usage:
+    poetry run profile-imports
+    poetry run profile-imports --top 30 --budget-ms 400
+    poetry run profile-imports services.outbox_relay.handler
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from scripts.benchmarks import print_error, print_status, print_success
+
+HANDLERS = ['services.task_service.handler', 'services.notification_service.handler']
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Parse `-X importtime` output into module -> (self us, cumulative us)."""
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:') :].split('|')
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def profile_module(module: str, repeat: int) -> Dict[str, Tuple[int, int]]:
+    """Import the module in `repeat` fresh interpreters and keep the fastest timings per module."""
+    best: Dict[str, Tuple[int, int]] = {}
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            raise RuntimeError(f'Importing {module} failed:\n{result.stderr.splitlines()[-1] if result.stderr else ""}')
+        for name, (self_us, cumulative_us) in parse_importtime(result.stderr).items():
+            previous = best.get(name)
+            best[name] = (self_us, cumulative_us) if previous is None else (min(previous[0], self_us), min(previous[1], cumulative_us))
+    return best
+
+
+def report(module: str, timings: Dict[str, Tuple[int, int]], top: int) -> float:
+    """Print the report for one handler and return its total import time in milliseconds."""
+    total_ms = timings[module][1] / 1000
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, (self_us, _) in timings.items():
+        by_package[name.split('.')[0]] += self_us
+    packages: List[Tuple[str, int]] = sorted(by_package.items(), key=lambda item: item[1], reverse=True)
+
+    print(f'\n{module}: {total_ms:.1f} ms total, {len(timings)} modules')
+    print(f'  {"package":<40} {"self ms":>10}')
+    for package, self_us in packages[:top]:
+        print(f'  {package:<40} {self_us / 1000:>10.1f}')
+
+    print(f'  {"module":<60} {"self ms":>10} {"cumulative ms":>14}')
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[:top]:
+        print(f'  {name:<60} {self_us / 1000:>10.1f} {cumulative_us / 1000:>14.1f}')
+
+    return total_ms
+
+
+def main() -> None:
+    """Entry point for the import-time profiler."""
+    parser = argparse.ArgumentParser(description='Report per-module import cost of the Lambda handlers')
+    parser.add_argument('modules', nargs='*', default=HANDLERS, help='Modules to profile (default: task and notification handlers)')
+    parser.add_argument('--top', type=int, default=15, help='Rows to show per table')
+    parser.add_argument('--repeat', type=int, default=3, help='Fresh interpreters per module; the fastest run is kept')
+    parser.add_argument('--budget-ms', type=float, default=None, help='Fail if any module takes longer than this to import')
+    args = parser.parse_args()
+
+    print_status(f'Profiling imports of: {", ".join(args.modules)}')
+
+    over_budget = []
+    for module in args.modules:
+        try:
+            total_ms = report(module, profile_module(module, args.repeat), args.top)
+        except RuntimeError as e:
+            print_error(str(e))
+            sys.exit(1)
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append(f'{module} ({total_ms:.1f} ms)')
+
+    if over_budget:
+        print_error(f'Import time over the {args.budget_ms:.0f} ms budget: {", ".join(over_budget)}')
+        sys.exit(1)
+    print_success('Import profiling complete')
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Response JSON Benchmark
+
+Compares the previous response pipeline (Task -> TaskResponse -> dict -> json.dumps) with
+serializing Task models directly through pydantic-core, on list pages of realistic tasks.
+Reports per-task times for a list response body and fails if the direct serializer is not
+faster than the legacy pipeline.
+
+Usage:
+    poetry run benchmark-json
+    poetry run benchmark-json --page-size 25 --pages 400
+"""
+
+import argparse
+import json
+import sys
+
+from scripts.benchmarks import best_of, print_error, print_status, print_success
+from scripts.benchmarks.task_codec import build_tasks
+from services.task_service.models.api import PaginationInfo, TaskResponse, dumps_response
+
+
+def legacy_dumps(tasks, pagination: PaginationInfo) -> str:
+    """The pipeline used before direct serialization: copy into TaskResponse, dump to dicts, encode."""
+    body = {'tasks': [TaskResponse.from_task(task).model_dump() for task in tasks], 'pagination': pagination.model_dump()}
+    return json.dumps(body, separators=(',', ':'))
+
+
+def run(page_size: int, pages: int) -> bool:
+    """Time both pipelines, print the results table and return whether direct serialization is faster."""
+    tasks = build_tasks(page_size)
+    pagination = PaginationInfo(limit=page_size, next_token='token')
+    assert json.loads(legacy_dumps(tasks, pagination)) == json.loads(dumps_response({'tasks': tasks, 'pagination': pagination}))
+
+    legacy = best_of(lambda: [legacy_dumps(tasks, pagination) for _ in range(pages)])
+    direct = best_of(lambda: [dumps_response({'tasks': tasks, 'pagination': pagination}) for _ in range(pages)])
+
+    per_task = pages * page_size
+    print(f'{"pipeline":<10} {"us/task":>10} {"us/page":>10}')
+    print(f'{"legacy":<10} {legacy / per_task * 1e6:>10.2f} {legacy / pages * 1e6:>10.1f}')
+    print(f'{"direct":<10} {direct / per_task * 1e6:>10.2f} {direct / pages * 1e6:>10.1f}')
+    print(f'speedup: {legacy / direct:.1f}x')
+
+    return direct < legacy
+
+
+def main() -> None:
+    """Entry point for the response JSON benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark direct Task JSON serialization against the TaskResponse pipeline')
+    parser.add_argument('--page-size', type=int, default=100, help='Tasks per list page')
+    parser.add_argument('--pages', type=int, default=100, help='Pages serialized per timing run')
+    args = parser.parse_args()
+
+    print_status(f'Benchmarking response serialization on {args.pages} pages of {args.page_size} tasks')
+
+    if run(args.page_size, args.pages):
+        print_success('Direct serialization is faster than the TaskResponse pipeline')
+        sys.exit(0)
+    print_error('Direct serialization is not faster than the TaskResponse pipeline')
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Task Codec Benchmark
+
+Compares the compiled Task <-> DynamoDB codec with the TypeSerializer/TypeDeserializer
+conversion plus pydantic validation it replaced, on list pages of realistic tasks.
+Reports per-page times for decoding (the list read path) and encoding (the write path)
+and fails if the codec is not faster than the legacy conversion on decode.
+
+Usage:
+    poetry run benchmark-codec
+    poetry run benchmark-codec --page-size 25 --pages 400
+"""
+
+import argparse
+import sys
+from datetime import UTC, datetime, timedelta
+from typing import List
+
+from scripts.benchmarks import best_of, print_error, print_status, print_success
+from services.task_service.models.task import Task, TaskPriority, TaskStatus
+from shared.integration.dynamodb_adapter import dynamo_to_python, python_to_dynamo
+from shared.integration.task_codec import decode_tasks, encode_task
+
+
+def build_tasks(count: int) -> List[Task]:
+    """Build tasks with a mix of statuses, priorities, descriptions and dependencies."""
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        Task(
+            task_id=f'task-{i:06d}',
+            title=f'Task {i}',
+            description=None if i % 3 == 0 else f'Description for task {i}',
+            status=statuses[i % len(statuses)],
+            priority=priorities[i % len(priorities)],
+            dependencies=[f'task-{j:06d}' for j in range(max(0, i - i % 4), i)],
+            created_at=start + timedelta(seconds=i),
+            updated_at=start + timedelta(seconds=i, milliseconds=500),
+            version=1 + i % 5,
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_encode(task: Task) -> dict:
+    """The serializer-based conversion used before the codec."""
+    item = task.model_dump(mode='json')
+    item['created_at'] = task.created_at.isoformat()
+    item['updated_at'] = task.updated_at.isoformat()
+    item['status_priority'] = f'{task.status.value}#{task.priority.value}'
+    return python_to_dynamo(item)
+
+
+def legacy_decode(dynamo_item: dict) -> Task:
+    """The deserializer-based conversion with full validation used before the codec."""
+    item = dynamo_to_python(dynamo_item)
+    item.pop('status_priority', None)
+    item['created_at'] = datetime.fromisoformat(item['created_at'])
+    item['updated_at'] = datetime.fromisoformat(item['updated_at'])
+    return Task(**item)
+
+
+def run(page_size: int, pages: int) -> bool:
+    """Time both conversions, print the results table and return whether the codec decodes faster."""
+    tasks = build_tasks(page_size)
+    items = [encode_task(task) for task in tasks]
+    assert [legacy_encode(task) for task in tasks] == items
+    assert [legacy_decode(item) for item in items] == decode_tasks(items)
+
+    def repeat(func):
+        return lambda: [func() for _ in range(pages)]
+
+    timings = {
+        ('decode', 'legacy'): best_of(repeat(lambda: [legacy_decode(item) for item in items])),
+        ('decode', 'codec'): best_of(repeat(lambda: decode_tasks(items))),
+        ('encode', 'legacy'): best_of(repeat(lambda: [legacy_encode(task) for task in tasks])),
+        ('encode', 'codec'): best_of(repeat(lambda: [encode_task(task) for task in tasks])),
+    }
+
+    print(f'{"path":<8} {"legacy us/page":>15} {"codec us/page":>15} {"speedup":>8}')
+    for path in ('decode', 'encode'):
+        legacy, codec = timings[(path, 'legacy')] / pages * 1e6, timings[(path, 'codec')] / pages * 1e6
+        print(f'{path:<8} {legacy:>15.1f} {codec:>15.1f} {legacy / codec:>7.1f}x')
+
+    return timings[('decode', 'codec')] < timings[('decode', 'legacy')]
+
+
+def main() -> None:
+    """Entry point for the task codec benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark the Task <-> DynamoDB codec against TypeSerializer + validation')
+    parser.add_argument('--page-size', type=int, default=100, help='Tasks per list page')
+    parser.add_argument('--pages', type=int, default=100, help='Pages converted per timing run')
+    args = parser.parse_args()
+
+    print_status(f'Benchmarking task codec on {args.pages} pages of {args.page_size} tasks')
+
+    if run(args.page_size, args.pages):
+        print_success('Codec decodes faster than the serializer-based conversion')
+        sys.exit(0)
+    print_error('Codec is not faster than the serializer-based conversion')
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
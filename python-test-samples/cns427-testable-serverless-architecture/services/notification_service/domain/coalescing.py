@@ -0,0 +1,173 @@
+"""
+Coalescing of TaskUpdated events into one notification per task and window.
+
+Within a batch, updates of the same task are always merged: the newest state is kept
+(by version, then by arrival) and the fields that differed between the merged states
+are collected as changed_fields.
+
+With a window store, merging also spans batches. The first update of a task opens a
+window of window_seconds and becomes its owner: its message is deferred until the window
+closes rather than notified. Updates arriving while the window is open are merged into the
+stored window and acknowledged. Once the window has closed, the next message for the task,
+normally the redelivered owner, delivers the merged notification under the owner's event
+id and marks the window delivered, so a later redelivery of the owner is acknowledged
+without a second notification.
+"""
+
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from aws_lambda_powertools import Logger
+
+from services.notification_service.models.update_window import UpdateWindow
+from services.task_service.models.task import TaskEvent
+from shared.integration.interfaces import UpdateWindowStore
+
+logger = Logger()
+
+# Fields every update changes, which say nothing about what was edited
+UNTRACKED_FIELDS = frozenset({'version', 'updated_at', 'changed_fields', 'coalesced_events'})
+
+
+def changed_fields(previous: Dict[str, Any], current: Dict[str, Any]) -> Set[str]:
+    """Fields whose values differ between two task states."""
+    return {key for key in previous.keys() | current.keys() if key not in UNTRACKED_FIELDS and previous.get(key) != current.get(key)}
+
+
+def merge_task_states(state: Dict[str, Any], changed: Set[str], updates: Iterable[Dict[str, Any]]) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Merge task states into a current state.
+
+    Returns:
+        The newest state and the union of changed with every field that differed between states
+    """
+    changed = set(changed)
+    for update in updates:
+        changed |= changed_fields(state, update) | set(update.get('changed_fields') or [])
+        version, current_version = update.get('version'), state.get('version')
+        if not (isinstance(version, int) and isinstance(current_version, int) and version < current_version):
+            state = update
+    return state, changed
+
+
+@dataclass
+class Delivery:
+    """An event to notify, standing for the batch records at indices."""
+
+    indices: List[int]
+    event: TaskEvent
+    # Window to mark delivered once the notification has been sent
+    window: Optional[UpdateWindow] = None
+
+
+@dataclass
+class CoalescedBatch:
+    """
+    Outcome of coalescing a batch.
+
+    Records not in any delivery, deferred or failures were merged into a notification
+    and need no further processing.
+    """
+
+    deliveries: List[Delivery] = field(default_factory=list)
+    deferred: Dict[int, float] = field(default_factory=dict)
+    failures: Dict[int, Exception] = field(default_factory=dict)
+
+
+class UpdateCoalescer:
+    """Merge TaskUpdated events of the same task within a batch and, with a store, within a time window."""
+
+    def __init__(self, window_seconds: float, store: Optional[UpdateWindowStore] = None, clock: Callable[[], float] = time.time):
+        """Initialize the coalescer; without a store only updates in the same batch are merged."""
+        self.window_seconds = window_seconds
+        self.store = store
+        self.clock = clock
+
+    def coalesce(self, events: Sequence[TaskEvent]) -> CoalescedBatch:
+        """Plan the notifications for a batch of events."""
+        batch = CoalescedBatch()
+        updates: Dict[str, List[int]] = {}
+        for index, event in enumerate(events):
+            task_id = event.task_data.get('task_id')
+            if event.event_type == 'TaskUpdated' and task_id:
+                updates.setdefault(task_id, []).append(index)
+            else:
+                batch.deliveries.append(Delivery([index], event))
+
+        for task_id, indices in updates.items():
+            group = [events[index] for index in indices]
+            try:
+                if self.store is None or any(event.event_id is None for event in group):
+                    self._merge_batch(batch, indices, group)
+                else:
+                    self._merge_window(batch, self.store, task_id, indices, group)
+            except Exception as e:
+                logger.warning(f'Failed to coalesce updates of task {task_id}: {e}')
+                batch.failures.update(dict.fromkeys(indices, e))
+
+        merged = len(events) - len(batch.deliveries) - len(batch.deferred) - len(batch.failures)
+        if merged:
+            logger.info(f'Coalesced {merged} of {len(events)} task event(s) into other notifications')
+        return batch
+
+    def mark_delivered(self, window: UpdateWindow) -> None:
+        """Record that the notification of a window was sent."""
+        if self.store is not None:
+            self.store.put_window(window, expected_revision=window.revision - 1)
+
+    def _merge_batch(self, batch: CoalescedBatch, indices: List[int], group: List[TaskEvent]) -> None:
+        """Deliver the updates of one task in this batch as one notification."""
+        if len(group) == 1:
+            batch.deliveries.append(Delivery(indices, group[0]))
+            return
+        state, changed = merge_task_states(group[0].task_data, set(), (event.task_data for event in group[1:]))
+        task_data = {**state, 'changed_fields': sorted(changed), 'coalesced_events': len(group)}
+        batch.deliveries.append(Delivery(indices, TaskEvent('TaskUpdated', task_data, source=group[-1].source, event_id=group[-1].event_id)))
+
+    def _merge_window(self, batch: CoalescedBatch, store: UpdateWindowStore, task_id: str, indices: List[int], group: List[TaskEvent]) -> None:
+        """Merge the updates of one task into its stored window, opening, extending or delivering it."""
+        now = self.clock()
+        window = store.get_window(task_id)
+
+        if window is not None and window.delivered:
+            # Redeliveries of the owner of a delivered window are done
+            pending = [(index, event) for index, event in zip(indices, group, strict=True) if event.event_id != window.owner_event_id]
+            if not pending:
+                return
+            indices, group = [index for index, _ in pending], [event for _, event in pending]
+
+        if window is None or window.delivered:
+            state, changed = merge_task_states(group[0].task_data, set(), (event.task_data for event in group[1:]))
+            opened = UpdateWindow(
+                task_id=task_id,
+                window_ends_at=now + self.window_seconds,
+                task_data=state,
+                owner_event_id=group[-1].event_id,
+                changed_fields=changed,
+                event_count=len(group),
+                revision=window.revision + 1 if window is not None else 1,
+            )
+            store.put_window(opened, expected_revision=window.revision if window is not None else None)
+            batch.deferred[indices[-1]] = self.window_seconds
+            return
+
+        new_events = [event for event in group if event.event_id != window.owner_event_id]
+        state, changed = merge_task_states(window.task_data, window.changed_fields, (event.task_data for event in new_events))
+        merged = replace(
+            window, task_data=state, changed_fields=changed, event_count=window.event_count + len(new_events), revision=window.revision + 1
+        )
+
+        if now < window.window_ends_at:
+            if new_events:
+                store.put_window(merged, expected_revision=window.revision)
+            for index, event in zip(indices, group, strict=True):
+                if event.event_id == window.owner_event_id:
+                    batch.deferred[index] = window.window_ends_at - now
+            return
+
+        delivered = replace(merged, delivered=True)
+        task_data = {**delivered.task_data, 'changed_fields': sorted(delivered.changed_fields), 'coalesced_events': delivered.event_count}
+        batch.deliveries.append(
+            Delivery(indices, TaskEvent('TaskUpdated', task_data, source=group[-1].source, event_id=window.owner_event_id), delivered)
+        )
@@ -0,0 +1,144 @@
+"""
+Concurrent delivery of notifications to several channels.
+
+Channels are called in parallel on a thread pool kept for the life of the container, so
+a slow channel only delays its own delivery: dispatch waits at most for the longest
+channel timeout. Each channel has its own token bucket; a channel whose bucket stays
+empty for longer than its timeout fails with a ChannelError instead of holding up the
+others. Failures are collected per channel rather than raised one by one.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Collection, Dict, List, Optional, Sequence, Tuple
+
+from aws_lambda_powertools import Logger
+
+from services.notification_service.domain.exceptions import ChannelError
+from services.notification_service.models.notification import Notification
+from shared.integration.interfaces import NotificationChannel
+
+logger = Logger()
+
+
+@dataclass(frozen=True)
+class ChannelSettings:
+    """Rate limit and timeout of one channel."""
+
+    rate: float = 10.0
+    burst: int = 10
+    timeout: float = 2.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate tokens per second, holding at most capacity tokens."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize a full bucket."""
+        if rate <= 0 or capacity < 1:
+            raise ValueError('rate must be positive and capacity at least 1')
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if one is available, otherwise return how long until the next one."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def try_acquire(self, max_wait: float) -> bool:
+        """Take a token, waiting up to max_wait seconds for one; return whether a token was taken."""
+        deadline = self.clock() + max_wait
+        while True:
+            wait_time = self._reserve()
+            if wait_time == 0:
+                return True
+            if self.clock() + wait_time > deadline:
+                return False
+            self.sleep(wait_time)
+
+
+class NotificationDispatcher:
+    """Send each notification to every channel concurrently."""
+
+    def __init__(
+        self,
+        channels: Sequence[Tuple[NotificationChannel, ChannelSettings]],
+        max_workers: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the dispatcher with its channels and their settings."""
+        self.channels: List[Tuple[NotificationChannel, ChannelSettings, TokenBucket]] = [
+            (channel, settings, TokenBucket(settings.rate, settings.burst, clock=clock, sleep=sleep)) for channel, settings in channels
+        ]
+        self.clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or max(len(self.channels), 1), thread_name_prefix='notification-channel')
+
+    def _send(self, channel: NotificationChannel, settings: ChannelSettings, bucket: TokenBucket, notification: Notification) -> None:
+        """Deliver to one channel within its timeout, rate limit wait included."""
+        started = self.clock()
+        if not bucket.try_acquire(settings.timeout):
+            raise ChannelError(f'{channel.name} rate limit exceeded')
+        channel.send(notification, timeout=max(settings.timeout - (self.clock() - started), 0.001))
+
+    @property
+    def channel_names(self) -> List[str]:
+        """Names of the channels, in configuration order."""
+        return [channel.name for channel, _, _ in self.channels]
+
+    def dispatch(self, notification: Notification, channel_names: Optional[Collection[str]] = None) -> Dict[str, Exception]:
+        """
+        Deliver a notification to all channels, or only to the channels named in channel_names.
+
+        Returns:
+            Mapping of channel name -> error for every channel that failed or did not finish in time
+        """
+        channels = [entry for entry in self.channels if channel_names is None or entry[0].name in channel_names]
+        if not channels:
+            return {}
+        futures: Dict[Future, str] = {
+            self._executor.submit(self._send, channel, settings, bucket, notification): channel.name for channel, settings, bucket in channels
+        }
+        timeout = max(settings.timeout for _, settings, _ in channels)
+        done, not_done = wait(futures, timeout=timeout)
+
+        failures: Dict[str, Exception] = {}
+        for future in done:
+            error = future.exception()
+            if error is None:
+                continue
+            if not isinstance(error, Exception):
+                # SystemExit, KeyboardInterrupt and the like are not delivery failures
+                raise error
+            failures[futures[future]] = error
+        for future in not_done:
+            future.cancel()
+            failures[futures[future]] = ChannelError(f'{futures[future]} timed out after {timeout}s')
+
+        for name, error in failures.items():
+            logger.warning(f'Notification for task {notification.task_id} not delivered to {name}: {error}')
+        logger.info(f'Delivered notification for task {notification.task_id} to {len(futures) - len(failures)} of {len(futures)} channel(s)')
+        return failures
+
+    def close(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,29 @@
+"""Domain exceptions for notification delivery."""
+
+from typing import Dict
+
+
+class ChannelError(Exception):
+    """Raised when a channel fails to deliver a notification (error response, timeout or rate limit)."""
+
+    pass
+
+
+class NotificationDeliveryError(Exception):
+    """Raised when one or more channels failed to deliver a notification."""
+
+    def __init__(self, channel_errors: Dict[str, Exception]):
+        self.channel_errors = channel_errors
+        self.message = 'Notification delivery failed for ' + ', '.join(f'{name}: {error}' for name, error in sorted(channel_errors.items()))
+        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class NotificationDeferred(Exception):
+    """Raised for an event held back until its coalescing window closes; its message should be redelivered after delay_seconds."""
+
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+        super().__init__(f'Notification deferred for {delay_seconds:.1f}s')
@@ -1,64 +1,175 @@
 """Domain logic for notification processing."""
 
-from typing import Any, Dict
+from dataclasses import replace
+from typing import Any, Dict, Optional, Sequence
 
 from aws_lambda_powertools import Logger
 
+from services.notification_service.domain.coalescing import CoalescedBatch, Delivery, UpdateCoalescer
+from services.notification_service.domain.dispatcher import NotificationDispatcher
+from services.notification_service.domain.exceptions import NotificationDeferred, NotificationDeliveryError
+from services.notification_service.models.notification import Notification
+from services.task_service.models.event_payloads import TaskCreatedPayload, TaskDeletedPayload, TaskUpdatedPayload, decode_payload
+from services.task_service.models.task import TaskEvent, TaskEventType
+from shared.integration.interfaces import IdempotencyStore
+
 logger = Logger()
 
 
 class NotificationService:
-    """Pure business logic for notification processing."""
+    """
+    Pure business logic for notification processing.
+
+    With an idempotency store, events that carry an event id are claimed before any
+    notification work, so redelivered duplicates are skipped.
+
+    With a dispatcher, notifications are delivered to its channels; if any channel fails
+    the event fails with NotificationDeliveryError, so it is retried. With an idempotency
+    store too and more than one channel, each channel is claimed under event_id#channel,
+    so a retry only delivers to the channels that failed.
+
+    With a coalescer, batches of events are first coalesced so a burst of updates to one
+    task produces a single notification.
+
+    Event details are validated into typed payloads before notification; a detail that does
+    not match its payload type fails the event.
+    """
 
-    def process_task_event(self, event_type: str, task_data: Dict[str, Any]) -> None:
-        """Process a task event and generate appropriate notification."""
+    # Notification handler by event type; each receives the decoded payload
+    _HANDLERS = {
+        TaskEventType.TASK_CREATED.value: '_handle_task_created',
+        TaskEventType.TASK_UPDATED.value: '_handle_task_updated',
+        TaskEventType.TASK_DELETED.value: '_handle_task_deleted',
+    }
+
+    def __init__(
+        self,
+        idempotency_store: Optional[IdempotencyStore] = None,
+        dispatcher: Optional[NotificationDispatcher] = None,
+        coalescer: Optional[UpdateCoalescer] = None,
+    ):
+        """Initialize the service with an optional idempotency store, dispatcher and coalescer."""
+        self.idempotency_store = idempotency_store
+        self.dispatcher = dispatcher
+        self.coalescer = coalescer
+
+    def process_task_event(self, event_type: str, task_data: Dict[str, Any], event_id: Optional[str] = None) -> None:
+        """Process a task event and generate appropriate notification, unless event_id was already processed."""
         logger.info(f'Processing task event: {event_type}')
         logger.debug(f'Event data: {task_data}')
 
-        if event_type == 'TaskCreated':
-            self._handle_task_created(task_data)
-        elif event_type == 'TaskUpdated':
-            self._handle_task_updated(task_data)
-        elif event_type == 'TaskDeleted':
-            self._handle_task_deleted(task_data)
-        else:
+        if event_id is None or self.idempotency_store is None:
+            self._notify(event_type, task_data, event_id)
+            return
+
+        if not self.idempotency_store.claim(event_id):
+            logger.info(f'Skipping duplicate {event_type} event: {event_id}')
+            return
+        try:
+            self._notify(event_type, task_data, event_id)
+        except Exception:
+            self.idempotency_store.release(event_id)
+            raise
+        self.idempotency_store.complete(event_id)
+
+    def _notify(self, event_type: str, task_data: Dict[str, Any], event_id: Optional[str] = None) -> None:
+        """Decode the event payload, generate its notification and deliver it through the dispatcher, if any."""
+        handler_name = self._HANDLERS.get(event_type)
+        if handler_name is None:
             logger.warning(f'Unknown event type: {event_type}')
+            return
+        notification = getattr(self, handler_name)(decode_payload(event_type, task_data))
 
-    def _handle_task_created(self, task_data: Dict[str, Any]) -> None:
-        """Handle task created notification."""
-        task_id = task_data.get('task_id')
-        title = task_data.get('title')
-        priority = task_data.get('priority')
+        if self.dispatcher is None or notification is None:
+            return
+        notification = replace(notification, data=task_data, event_id=event_id)
+        if event_id is None or self.idempotency_store is None or len(self.dispatcher.channels) < 2:
+            failures = self.dispatcher.dispatch(notification)
+        else:
+            failures = self._dispatch_undelivered(self.dispatcher, self.idempotency_store, notification, event_id)
+        if failures:
+            raise NotificationDeliveryError(failures)
+
+    @staticmethod
+    def _dispatch_undelivered(
+        dispatcher: NotificationDispatcher, store: IdempotencyStore, notification: Notification, event_id: str
+    ) -> Dict[str, Exception]:
+        """Deliver to the channels not yet delivered for this event, recording each channel's outcome under event_id#channel."""
+        pending = [name for name in dispatcher.channel_names if store.claim(f'{event_id}#{name}')]
+        if len(pending) < len(dispatcher.channels):
+            logger.info(f'Event {event_id} already delivered to {len(dispatcher.channels) - len(pending)} channel(s)')
+        failures = dispatcher.dispatch(notification, channel_names=pending) if pending else {}
+        for name in pending:
+            if name in failures:
+                store.release(f'{event_id}#{name}')
+            else:
+                store.complete(f'{event_id}#{name}')
+        return failures
+
+    def process_task_events(self, events: Sequence[TaskEvent]) -> Dict[int, Exception]:
+        """
+        Process a batch of task events independently of each other.
+
+        Returns:
+            Mapping of batch index -> error for every event that failed; the others were processed.
+            Events held back by the coalescer are reported as NotificationDeferred.
+        """
+        if self.coalescer is not None:
+            batch = self.coalescer.coalesce(events)
+        else:
+            batch = CoalescedBatch(deliveries=[Delivery([index], event) for index, event in enumerate(events)])
+
+        failures: Dict[int, Exception] = dict(batch.failures)
+        failures.update({index: NotificationDeferred(delay) for index, delay in batch.deferred.items()})
+        for delivery in batch.deliveries:
+            event = delivery.event
+            try:
+                self.process_task_event(event.event_type, event.task_data, event.event_id)
+                if delivery.window is not None and self.coalescer is not None:
+                    self.coalescer.mark_delivered(delivery.window)
+            except Exception as e:
+                logger.warning(f'Failed to process {event.event_type} event at batch index {delivery.indices[-1]}: {e}')
+                failures.update(dict.fromkeys(delivery.indices, e))
+        logger.info(f'Processed {len(events) - len(failures)} of {len(events)} task event(s)')
+        return failures
 
-        logger.debug(f'Handling TaskCreated: task_id={task_id}, priority={priority}')
+    def _handle_task_created(self, payload: TaskCreatedPayload) -> Notification:
+        """Handle task created notification."""
+        logger.debug(f'Handling TaskCreated: task_id={payload.task_id}, priority={payload.priority.value}')
         logger.info(
-            f'Task created notification: {title}',
-            extra={'task_id': task_id, 'event_type': 'TaskCreated'},
+            f'Task created notification: {payload.title}',
+            extra={'task_id': payload.task_id, 'event_type': 'TaskCreated'},
+        )
+        return Notification(
+            'TaskCreated',
+            payload.task_id,
+            f'Task created: {payload.title}',
+            f'Task {payload.task_id} was created with priority {payload.priority.value}.',
         )
 
-    def _handle_task_updated(self, task_data: Dict[str, Any]) -> None:
+    def _handle_task_updated(self, payload: TaskUpdatedPayload) -> Notification:
         """Handle task updated notification."""
-        task_id = task_data.get('task_id')
-        title = task_data.get('title')
-        status = task_data.get('status')
-        version = task_data.get('version')
+        status = payload.status.value
 
-        logger.debug(f'Handling TaskUpdated: task_id={task_id}, status={status}, version={version}')
+        logger.debug(f'Handling TaskUpdated: task_id={payload.task_id}, status={status}, version={payload.version}')
         logger.info(
-            f'Task updated notification: {title} (status: {status})',
+            f'Task updated notification: {payload.title} (status: {status})',
             extra={
-                'task_id': task_id,
+                'task_id': payload.task_id,
                 'event_type': 'TaskUpdated',
                 'new_status': status,
             },
         )
+        text = f'Task {payload.task_id} is now {status} (version {payload.version}).'
+        if payload.changed_fields:
+            text += f' Changed: {", ".join(payload.changed_fields)}.'
+        return Notification('TaskUpdated', payload.task_id, f'Task updated: {payload.title}', text)
 
-    def _handle_task_deleted(self, task_data: Dict[str, Any]) -> None:
+    def _handle_task_deleted(self, payload: TaskDeletedPayload) -> Notification:
         """Handle task deleted notification."""
-        task_id = task_data.get('task_id')
-
-        logger.debug(f'Handling TaskDeleted: task_id={task_id}')
+        logger.debug(f'Handling TaskDeleted: task_id={payload.task_id}')
         logger.info(
-            f'Task deleted notification: {task_id}',
-            extra={'task_id': task_id, 'event_type': 'TaskDeleted'},
+            f'Task deleted notification: {payload.task_id}',
+            extra={'task_id': payload.task_id, 'event_type': 'TaskDeleted'},
         )
+        return Notification('TaskDeleted', payload.task_id, f'Task deleted: {payload.task_id}', f'Task {payload.task_id} was deleted.')
@@ -1,13 +1,20 @@
-"""Lambda handler for processing task events from EventBridge."""
+"""Lambda handler for processing task events from EventBridge, directly or in SQS batches."""
 
 import json
-from typing import Any, Dict, Optional
+import math
+import os
+from typing import Any, Dict, List, Optional, Tuple
 
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.logging import correlation_paths
 
+from services.notification_service.domain.coalescing import UpdateCoalescer
+from services.notification_service.domain.dispatcher import ChannelSettings, NotificationDispatcher
+from services.notification_service.domain.exceptions import NotificationDeferred
 from services.notification_service.domain.notification_service import NotificationService
 from services.task_service.models.task import TaskEvent
+from shared.integration.interfaces import NotificationChannel
+from shared.observability import metrics
 
 logger = Logger()
 
@@ -15,19 +22,124 @@ logger = Logger()
 notification_service: Optional[NotificationService] = None
 
 
+def _build_dispatcher() -> Optional[NotificationDispatcher]:
+    """Build a dispatcher for the channels whose URLs are configured, or None if there are none."""
+    from shared.integration.notification_channels import ChatChannel, EmailRelayChannel, WebhookChannel
+
+    settings = ChannelSettings(
+        rate=float(os.environ.get('NOTIFICATION_CHANNEL_RATE', '10')),
+        burst=int(os.environ.get('NOTIFICATION_CHANNEL_BURST', '10')),
+        timeout=float(os.environ.get('NOTIFICATION_CHANNEL_TIMEOUT_SECONDS', '2')),
+    )
+    channels: List[Tuple[NotificationChannel, ChannelSettings]] = []
+    if os.environ.get('NOTIFICATION_WEBHOOK_URL'):
+        channels.append((WebhookChannel('webhook', os.environ['NOTIFICATION_WEBHOOK_URL']), settings))
+    if os.environ.get('NOTIFICATION_EMAIL_RELAY_URL'):
+        recipients = [address.strip() for address in os.environ.get('NOTIFICATION_EMAIL_RECIPIENTS', '').split(',') if address.strip()]
+        sender = os.environ.get('NOTIFICATION_EMAIL_SENDER', 'notifications@example.com')
+        channels.append((EmailRelayChannel('email', os.environ['NOTIFICATION_EMAIL_RELAY_URL'], recipients, sender), settings))
+    if os.environ.get('NOTIFICATION_CHAT_WEBHOOK_URL'):
+        channels.append((ChatChannel('chat', os.environ['NOTIFICATION_CHAT_WEBHOOK_URL']), settings))
+    return NotificationDispatcher(channels) if channels else None
+
+
+def _build_coalescer() -> Optional[UpdateCoalescer]:
+    """Build a coalescer if NOTIFICATION_COALESCE_WINDOW_SECONDS is set, spanning batches if UPDATE_WINDOW_TABLE_NAME is set too."""
+    window_seconds = float(os.environ.get('NOTIFICATION_COALESCE_WINDOW_SECONDS', '0'))
+    if window_seconds <= 0:
+        return None
+    store = None
+    if os.environ.get('UPDATE_WINDOW_TABLE_NAME'):
+        from shared.integration.update_window_store import DynamoDBUpdateWindowStore
+
+        store = DynamoDBUpdateWindowStore(os.environ['UPDATE_WINDOW_TABLE_NAME'])
+    return UpdateCoalescer(window_seconds, store=store)
+
+
 def _initialize_dependencies():
     """Initialize dependencies with dependency injection."""
     global notification_service
 
     if notification_service is None:
-        notification_service = NotificationService()
+        # IDEMPOTENCY_TABLE_NAME turns on deduplication of redelivered events
+        idempotency_table_name = os.environ.get('IDEMPOTENCY_TABLE_NAME')
+        idempotency_store = None
+        if idempotency_table_name:
+            from shared.integration.idempotency_store import CachingIdempotencyStore, DynamoDBIdempotencyStore
+
+            idempotency_store = CachingIdempotencyStore(
+                DynamoDBIdempotencyStore(idempotency_table_name, ttl_seconds=int(os.environ.get('IDEMPOTENCY_TTL_SECONDS', str(24 * 60 * 60)))),
+                max_entries=int(os.environ.get('IDEMPOTENCY_CACHE_MAX_ENTRIES', '10000')),
+            )
+        notification_service = NotificationService(idempotency_store=idempotency_store, dispatcher=_build_dispatcher(), coalescer=_build_coalescer())
+
+
+def _publish_metrics() -> None:
+    """Report deduplication counters so the dedup hit rate can be followed in CloudWatch."""
+    publish_metrics = getattr(getattr(notification_service, 'idempotency_store', None), 'publish_metrics', None)
+    if publish_metrics is not None:
+        publish_metrics()
+
+
+def _defer_record(record: Dict[str, Any], delay_seconds: float) -> None:
+    """Hide a record from the queue for delay_seconds, so its redelivery comes after the coalescing window."""
+    from shared.integration.resilient_publisher import get_sqs_client
+
+    # arn:aws:sqs:{region}:{account}:{queue name}
+    _, _, _, region, account, queue_name = record['eventSourceARN'].split(':')
+    try:
+        get_sqs_client().change_message_visibility(
+            QueueUrl=f'https://sqs.{region}.amazonaws.com/{account}/{queue_name}',
+            ReceiptHandle=record['receiptHandle'],
+            VisibilityTimeout=max(1, math.ceil(delay_seconds)),
+        )
+    except Exception as e:
+        # The record still returns to the queue, after the queue's own visibility timeout
+        logger.warning(f'Failed to defer notification record {record["messageId"]}: {e}')
+
+
+def _process_sqs_batch(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Process SQS records whose bodies are EventBridge events, reporting only the failed ones.
+
+    Records that cannot be parsed are reported as failures too, so they reach the dead-letter
+    queue instead of being dropped. Records deferred by the coalescer are reported as failures
+    after their visibility timeout has been set to the rest of their window.
+    """
+    if notification_service is None:
+        raise RuntimeError('Notification service not initialized')
+
+    failed_ids: List[str] = []
+    parsed_records: List[Dict[str, Any]] = []
+    task_events: List[TaskEvent] = []
+    for record in records:
+        try:
+            task_events.append(TaskEvent.from_eventbridge_event(json.loads(record['body'])))
+            parsed_records.append(record)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f'Malformed notification record {record.get("messageId")}: {e}')
+            failed_ids.append(record['messageId'])
+
+    failures = notification_service.process_task_events(task_events)
+    for index, failure in sorted(failures.items()):
+        if isinstance(failure, NotificationDeferred):
+            _defer_record(parsed_records[index], failure.delay_seconds)
+        failed_ids.append(parsed_records[index]['messageId'])
+
+    logger.info(f'Processed {len(records) - len(failed_ids)} of {len(records)} notification record(s)')
+    return {'batchItemFailures': [{'itemIdentifier': message_id} for message_id in failed_ids]}
 
 
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.EVENT_BRIDGE)
+@metrics.log_metrics
 def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
     """
     Lambda handler entry point for EventBridge events.
 
+    In batch mode the rule targets an SQS queue and the event is an SQS batch: each record
+    is processed on its own and the response lists the failed records as batchItemFailures,
+    so only those are retried.
+
     EventBridge Event Structure:
     {
         "version": "0",
@@ -50,6 +162,20 @@ def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
     logger.info('Notification handler invoked')
     logger.debug(f'Event: {json.dumps(event)}')
 
+    # The idempotency and update window stores retry DynamoDB calls within this invocation's time
+    from shared.integration.dynamodb_adapter import retry_policy_invocation
+
+    with retry_policy_invocation(context):
+        try:
+            if 'Records' in event:
+                return _process_sqs_batch(event['Records'])
+            return _process_eventbridge_event(event)
+        finally:
+            _publish_metrics()
+
+
+def _process_eventbridge_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Process a single EventBridge event delivered directly by the rule."""
     try:
         # Extract EventBridge event fields
         detail = event.get('detail', {})
@@ -79,7 +205,7 @@ def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
         # Delegate to domain service
         if notification_service is None:
             raise RuntimeError('Notification service not initialized')
-        notification_service.process_task_event(task_event.event_type, task_event.task_data)
+        notification_service.process_task_event(task_event.event_type, task_event.task_data, task_event.event_id)
 
         logger.info(f'Successfully processed {task_event.event_type} event for task: {task_id}')
         return {'statusCode': 200, 'processedEvents': 1}
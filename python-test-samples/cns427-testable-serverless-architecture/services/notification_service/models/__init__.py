@@ -0,0 +1 @@
+"""Notification service models layer."""
@@ -0,0 +1,20 @@
+"""Notification model delivered to channels."""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class Notification:
+    """A message about a task event, rendered by each channel in its own format."""
+
+    event_type: str
+    task_id: str
+    subject: str
+    text: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    event_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form, for JSON payloads."""
+        return asdict(self)
@@ -0,0 +1,24 @@
+"""Coalescing window of TaskUpdated events for one task."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+
+
+@dataclass
+class UpdateWindow:
+    """
+    Updates of one task merged while its window is open.
+
+    owner_event_id is the event whose message is held back until window_ends_at and then
+    delivers the merged notification. revision increases with every write, for optimistic
+    locking in the window store.
+    """
+
+    task_id: str
+    window_ends_at: float
+    task_data: Dict[str, Any]
+    owner_event_id: Optional[str] = None
+    changed_fields: Set[str] = field(default_factory=set)
+    event_count: int = 1
+    delivered: bool = False
+    revision: int = 0
@@ -0,0 +1,5 @@
+"""Outbox relay service package.
+
+Drains the task event outbox (DynamoDB Streams) to EventBridge.
+Contains only a handler (input adapter); publishing goes through the EventPublisher port.
+"""
@@ -0,0 +1,77 @@
+"""Lambda handler relaying task events from the outbox table stream to EventBridge."""
+
+from typing import Any, Dict, Optional
+
+from aws_lambda_powertools import Logger
+
+from services.task_service.domain.task_service import default_event_publisher
+from shared.integration.eventbridge_adapter import PUT_EVENTS_MAX_ENTRIES
+from shared.integration.interfaces import EventPublisher
+from shared.integration.outbox import event_from_outbox_image
+from shared.observability import metrics
+
+logger = Logger()
+
+# Dependencies - injected at runtime
+event_publisher: Optional[EventPublisher] = None
+
+
+def _initialize_dependencies():
+    """Initialize dependencies with dependency injection."""
+    global event_publisher
+
+    if event_publisher is None:
+        # EVENT_SPILL_QUEUE_URL puts the publisher behind a circuit breaker that spills to SQS
+        event_publisher = default_event_publisher()
+
+
+def _drain_spilled() -> int:
+    """Drain the publisher's spill buffer until it reads empty; publishers without one have nothing to drain."""
+    drain_spilled = getattr(event_publisher, 'drain_spilled', None)
+    if drain_spilled is None:
+        logger.info('No spill buffer configured, nothing to drain')
+        return 0
+    drained = drain_spilled()
+    logger.info(f'Drained {drained} spilled event(s) on schedule')
+    return drained
+
+
+@logger.inject_lambda_context
+@metrics.log_metrics
+def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
+    """
+    Lambda handler entry point for DynamoDB Streams batches from the outbox table.
+
+    Records are published in stream order, one PutEvents-sized chunk at a time. When a
+    chunk fails, the first record of that chunk is reported as the batch item failure, so
+    Lambda retries from there: already published chunks are not resent, and events are
+    delivered at least once.
+
+    With a spill queue configured, chunks published while EventBridge is unavailable are
+    spilled instead of failing, and are drained by a later invocation once the circuit
+    half-opens. A chunk that cannot be spilled either is retried as above.
+
+    A scheduled invocation with {"drain_spill_queue": true} drains the spill queue without
+    stream records, so spilled events are published in quiet periods too.
+    """
+    _initialize_dependencies()
+
+    if event.get('drain_spill_queue'):
+        return {'drained': _drain_spilled()}
+
+    # Only inserts carry new events; TTL expiry shows up as REMOVE records
+    records = [record for record in event.get('Records', []) if record.get('eventName') == 'INSERT']
+    logger.info(f'Relaying {len(records)} outbox record(s)')
+
+    for start in range(0, len(records), PUT_EVENTS_MAX_ENTRIES):
+        chunk = records[start : start + PUT_EVENTS_MAX_ENTRIES]
+        try:
+            if event_publisher is None:
+                raise RuntimeError('Event publisher not initialized')
+            event_publisher.publish_events([event_from_outbox_image(record['dynamodb']['NewImage']) for record in chunk])
+        except Exception as e:
+            sequence_number = chunk[0]['dynamodb']['SequenceNumber']
+            logger.warning(f'Failed to relay outbox records from sequence {sequence_number}, reporting for retry: {e}', exc_info=True)
+            return {'batchItemFailures': [{'itemIdentifier': sequence_number}]}
+
+    return {'batchItemFailures': []}
@@ -0,0 +1,5 @@
+"""Task export service package.
+
+Streams every task as NDJSON to S3 for analytics jobs.
+Contains only a handler (input adapter); reads go through the TaskRepository port.
+"""
@@ -0,0 +1,54 @@
+"""Lambda handler exporting every task as NDJSON to S3."""
+
+import os
+from datetime import UTC, datetime
+from typing import Any, Dict, Optional
+
+from aws_lambda_powertools import Logger
+
+from shared.integration.interfaces import TaskRepository
+from shared.integration.task_export import GZIP_CONTENT_TYPE, NDJSON_CONTENT_TYPE, S3MultipartWriter, export_tasks
+
+logger = Logger()
+
+# Dependencies - injected at runtime
+repository: Optional[TaskRepository] = None
+
+
+def _initialize_dependencies():
+    """Initialize dependencies with dependency injection."""
+    global repository
+
+    if repository is None:
+        from shared.integration.dynamodb_adapter import DynamoDBTaskRepository
+
+        repository = DynamoDBTaskRepository(
+            table_name=os.environ.get('TASKS_TABLE_NAME', 'tasks'),
+            scan_segments=int(os.environ.get('TASK_EXPORT_SCAN_SEGMENTS', '4')),
+        )
+
+
+@logger.inject_lambda_context
+def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
+    """
+    Lambda handler entry point for task exports, invoked directly or on a schedule.
+
+    Streams every task to s3://EXPORT_BUCKET_NAME/<key> as NDJSON while the table is still
+    being scanned. Optional event fields:
+    - key: object key (default: exports/tasks-<UTC timestamp>.ndjson[.gz])
+    - gzip: compress the export unless false or 0, as a boolean or string (default: true)
+    """
+    _initialize_dependencies()
+    if repository is None:
+        raise RuntimeError('Repository not initialized')
+
+    bucket = os.environ['EXPORT_BUCKET_NAME']
+    # Scheduled rules and CLI payloads may send the flag as a string
+    compress = str(event.get('gzip', True)).lower() not in ('false', '0')
+    key = event.get('key') or f'exports/tasks-{datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")}.ndjson' + ('.gz' if compress else '')
+    logger.info(f'Exporting tasks to s3://{bucket}/{key}')
+
+    with S3MultipartWriter(bucket, key, content_type=GZIP_CONTENT_TYPE if compress else NDJSON_CONTENT_TYPE) as writer:
+        result = export_tasks(repository, writer, compress=compress)
+
+    return {'bucket': bucket, 'key': key, 'task_count': result.task_count, 'bytes_written': result.bytes_written}
@@ -0,0 +1,201 @@
+"""Asyncio variant of the task service, overlapping independent repository calls."""
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+from aws_lambda_powertools import Logger
+
+from services.task_service.domain.exceptions import ConflictError
+from services.task_service.domain.task_service import (
+    batch_cycle_errors,
+    batch_results,
+    check_dependency_cycle,
+    default_event_publisher,
+    default_repository,
+    external_dependencies,
+    new_batch_tasks,
+    new_task,
+    task_patch,
+    validate_page_limit,
+)
+from services.task_service.models.api import BatchCreateTaskItem, CreateTaskRequest, UpdateTaskRequest
+from services.task_service.models.task import PartialTask, Task, TaskBatchResult, TaskEvent, TaskPriority, TaskSortOrder, TaskStatus
+from shared.integration.interfaces import AsyncEventPublisher, AsyncTaskRepository
+
+logger = Logger()
+
+
+class AsyncTaskService:
+    """
+    Business logic for task operations on asyncio repositories and publishers.
+
+    Applies the same rules, events and outbox handling as TaskService. Where an operation
+    needs several reads that don't depend on each other, they are awaited together.
+    """
+
+    def __init__(self, repository: AsyncTaskRepository = None, event_publisher: AsyncEventPublisher = None, use_outbox: bool = False):
+        """Initialize service with dependencies."""
+        self.use_outbox = use_outbox
+        if repository is None:
+            from shared.integration.async_adapters import ExecutorTaskRepository
+
+            sync_repository, outbox_enabled = default_repository()
+            repository = ExecutorTaskRepository(sync_repository)
+            self.use_outbox = use_outbox or outbox_enabled
+        self.repository = repository
+        self._event_publisher = event_publisher
+
+    @property
+    def event_publisher(self) -> AsyncEventPublisher:
+        """Event publisher; the default EventBridge publisher is only loaded by operations that publish."""
+        if self._event_publisher is None:
+            from shared.integration.async_adapters import ExecutorEventPublisher
+
+            self._event_publisher = ExecutorEventPublisher(default_event_publisher())
+        return self._event_publisher
+
+    @event_publisher.setter
+    def event_publisher(self, event_publisher: AsyncEventPublisher) -> None:
+        self._event_publisher = event_publisher
+
+    async def create_task(self, request: CreateTaskRequest) -> Task:
+        """Create a new task from request data."""
+        task = new_task(request, datetime.now(UTC))
+
+        logger.info(f'Creating task with ID: {task.task_id}')
+
+        if request.dependencies:
+            check_dependency_cycle(task.task_id, request.dependencies, await self.repository.get_dependency_graph(request.dependencies))
+
+        from services.task_service.models.task import TaskCreatedEvent
+
+        event = TaskCreatedEvent(task)
+        created_task = await self.repository.create_task(task, **self._outbox(event))
+        await self._publish(event)
+
+        logger.info(f'Task created successfully: {task.task_id}')
+        return created_task
+
+    async def create_tasks(self, requests: List[BatchCreateTaskItem]) -> List[TaskBatchResult]:
+        """Create many tasks in one call; see TaskService.create_tasks."""
+        tasks = new_batch_tasks(requests, datetime.now(UTC))
+        logger.info(f'Creating {len(tasks)} tasks in batch')
+
+        dependencies = external_dependencies(tasks)
+        graph = await self.repository.get_dependency_graph(dependencies) if dependencies else {}
+        errors = batch_cycle_errors(tasks, graph)
+
+        from services.task_service.models.task import TaskCreatedEvent
+
+        valid_tasks = [task for task in tasks if task.task_id not in errors]
+        events: Dict[str, TaskEvent] = {task.task_id: TaskCreatedEvent(task) for task in valid_tasks}
+        if valid_tasks:
+            if self.use_outbox:
+                errors.update(await self.repository.create_tasks(valid_tasks, outbox_events=events))
+            else:
+                errors.update(await self.repository.create_tasks(valid_tasks))
+
+        created_events: List[TaskEvent] = [event for task_id, event in events.items() if task_id not in errors]
+        if created_events and not self.use_outbox:
+            await self.event_publisher.publish_events(created_events)
+
+        logger.info(f'Batch created {len(tasks) - len(errors)} of {len(tasks)} tasks')
+        return batch_results(requests, tasks, errors)
+
+    async def get_task(self, task_id: str, fields: Optional[List[str]] = None) -> Union[Task, PartialTask]:
+        """Retrieve a task by ID, or only the given fields of it."""
+        task = await self.repository.get_task_fields(task_id, fields) if fields else await self.repository.get_task(task_id)
+        if task is None:
+            raise ValueError(f'Task not found: {task_id}')
+        return task
+
+    async def get_task_version(self, task_id: str) -> int:
+        """Read only the current version of a task, to answer conditional requests."""
+        version = await self.repository.get_task_version(task_id)
+        if version is None:
+            raise ValueError(f'Task not found: {task_id}')
+        return version
+
+    async def list_tasks(
+        self,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[Union[List[Task], List[PartialTask]], Optional[str]]:
+        """List tasks with pagination, optionally filtered by status, priority and creation time, or only the given fields of them."""
+        validated_limit = validate_page_limit(limit)
+        if sort is not None and status is None and priority is None:
+            raise ValueError('Sorting requires a status or priority filter')
+        if fields:
+            return await self.repository.list_task_fields(
+                fields, validated_limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort
+            )
+        return await self.repository.list_tasks(validated_limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort)
+
+    async def update_task(self, task_id: str, request: UpdateTaskRequest) -> Task:
+        """
+        Update an existing task with optimistic concurrency control.
+
+        Without a dependency change this is one conditional patch, as in TaskService. A
+        dependency change needs the reachable dependency graph and, for the graph index
+        transaction, the stored task; both are loaded concurrently and the write still
+        carries the version condition.
+        """
+        logger.info(f'Updating task: {task_id}, request_version: {request.version}')
+
+        patch, allowed_statuses = task_patch(request, datetime.now(UTC))
+
+        from services.task_service.models.task import TaskUpdatedEvent
+
+        if request.dependencies is not None:
+            existing, graph = await asyncio.gather(self.repository.get_task(task_id), self.repository.get_dependency_graph(request.dependencies))
+            check_dependency_cycle(task_id, request.dependencies, graph)
+            if existing is None:
+                raise ValueError(f'Task not found: {task_id}')
+            if existing.version != request.version:
+                raise ConflictError(f'Task {task_id} was modified by another process', current_task=existing.model_dump())
+            if allowed_statuses is not None and patch.status is not None and existing.status not in allowed_statuses:
+                raise ValueError(f'Invalid status transition from {existing.status.value} to {patch.status.value}')
+
+            updated_task = patch.apply(existing)
+            outbox = {'outbox_event': TaskUpdatedEvent(updated_task)} if self.use_outbox else {}
+            saved_task = await self.repository.update_task(updated_task, expected_version=request.version, **outbox)
+        else:
+            saved_task = await self.repository.patch_task(
+                task_id,
+                patch,
+                expected_version=request.version,
+                allowed_statuses=allowed_statuses,
+                build_outbox_event=TaskUpdatedEvent if self.use_outbox else None,
+            )
+
+        await self._publish(TaskUpdatedEvent(saved_task))
+        return saved_task
+
+    async def delete_task(self, task_id: str, version: Optional[int] = None) -> None:
+        """Delete a task; see TaskService.delete_task."""
+        if version is None:
+            existing_task = await self.repository.get_task(task_id)
+            if existing_task is None:
+                raise ValueError(f'Task not found: {task_id}')
+            version = existing_task.version
+
+        from services.task_service.models.task import TaskDeletedEvent
+
+        event = TaskDeletedEvent(task_id)
+        await self.repository.delete_task(task_id, version, **self._outbox(event))
+        await self._publish(event)
+
+    def _outbox(self, event: TaskEvent) -> dict:
+        """Repository keyword arguments that store the event in the outbox when outbox mode is on."""
+        return {'outbox_event': event} if self.use_outbox else {}
+
+    async def _publish(self, event: TaskEvent) -> None:
+        """Publish the event inline, unless the outbox relay will publish it."""
+        if not self.use_outbox:
+            await self.event_publisher.publish_event(event)
@@ -1,6 +1,6 @@
 """Business rules for task management."""
 
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 
 from services.task_service.models.task import TaskStatus
 
@@ -83,31 +83,156 @@ def can_transition_to(current_status: TaskStatus, new_status: TaskStatus) -> boo
     return new_status in valid_transitions.get(current_status, [])
 
 
+def allowed_source_statuses(new_status: TaskStatus) -> List[TaskStatus]:
+    """
+    Business Rule: Statuses a task may currently be in to move to new_status.
+
+    Rules:
+    - Inverse of can_transition_to, so a status change can be enforced as a
+      condition on the stored status instead of a read-then-check
+    """
+    return [status for status in TaskStatus if can_transition_to(status, new_status)]
+
+
 def has_circular_dependency(task_id: str, dependency_id: str, all_dependencies: Dict[str, List[str]]) -> bool:
     """
     Business Rule: Prevent circular dependencies.
 
     Rules:
     - Adding a dependency should not create a cycle
-    - Use depth-first search to detect cycles
+    - Cycles already present in the reachable graph are also rejected
+
+    Single-dependency form of find_dependency_cycle.
     """
-    if task_id == dependency_id:
-        return True  # Self-dependency is circular
+    return find_dependency_cycle(task_id, [dependency_id], all_dependencies) is not None
 
-    visited = set()
 
-    def check_cycle(current_id: str) -> bool:
-        if current_id in visited:
-            return True
-        visited.add(current_id)
+def find_dependency_cycle(task_id: str, dependencies: List[str], all_dependencies: Dict[str, List[str]]) -> Optional[List[str]]:
+    """
+    Business Rule: Prevent circular dependencies (batch form).
 
-        for dep_id in all_dependencies.get(current_id, []):
-            if dep_id == task_id:  # Would create cycle back to original task
-                return True
-            if check_cycle(dep_id):
-                return True
+    Checks all proposed dependencies of a task in one traversal.
 
-        visited.remove(current_id)
-        return False
+    Rules:
+    - The task's edges are replaced by the proposed dependencies
+    - Any cycle reachable from the task is rejected, including self-dependency
+    - Uses an iterative depth-first search, so chain depth is not limited by the Python stack
+    - Nodes that have been fully explored are shared across all proposed dependencies,
+      so every edge is followed at most once: O(nodes + edges)
+
+    Returns:
+    - None if no cycle is reachable
+    - The offending path otherwise, starting and ending at the same task ID,
+      e.g. ['task-A', 'task-B', 'task-C', 'task-A']
+    """
+    on_path = {task_id}
+    explored: set = set()
+    path = [task_id]
+    pending: List[Iterator[str]] = [iter(dependencies)]
+
+    while pending:
+        next_id = next(pending[-1], None)
+
+        if next_id is None:
+            # All edges of the node at the top of the path are explored
+            pending.pop()
+            finished_id = path.pop()
+            on_path.discard(finished_id)
+            explored.add(finished_id)
+            continue
 
-    return check_cycle(dependency_id)
+        if next_id in on_path:
+            return path[path.index(next_id) :] + [next_id]
+        if next_id in explored:
+            continue
+
+        on_path.add(next_id)
+        path.append(next_id)
+        pending.append(iter(all_dependencies.get(next_id, ())))
+
+    return None
+
+
+def find_cyclic_dependencies(task_ids: List[str], all_dependencies: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    Business Rule: Prevent circular dependencies (whole-batch form).
+
+    Validates a set of tasks, such as a bulk create, in one pass over the graph.
+
+    Rules:
+    - A task that lies on a cycle is invalid
+    - A task that depends, directly or transitively, on a task on a cycle is invalid
+    - Uses an iterative Tarjan strongly-connected-components traversal: O(nodes + edges)
+
+    Returns:
+    - Mapping of every invalid task reachable from task_ids to a cycle path that invalidates it
+    - An empty dict if the reachable graph is acyclic
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    component_stack: List[str] = []
+    on_stack: set = set()
+    invalid: Dict[str, List[str]] = {}
+
+    for root in task_ids:
+        if root in index:
+            continue
+
+        index[root] = lowlink[root] = len(index)
+        component_stack.append(root)
+        on_stack.add(root)
+        pending = [(root, iter(all_dependencies.get(root, ())))]
+
+        while pending:
+            node, children = pending[-1]
+            child = next(children, None)
+
+            if child is not None:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    component_stack.append(child)
+                    on_stack.add(child)
+                    pending.append((child, iter(all_dependencies.get(child, ()))))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+
+            pending.pop()
+            if pending:
+                parent = pending[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index[node]:
+                _close_component(node, component_stack, on_stack, all_dependencies, invalid)
+
+    return invalid
+
+
+def _close_component(
+    root: str, component_stack: List[str], on_stack: set, all_dependencies: Dict[str, List[str]], invalid: Dict[str, List[str]]
+) -> None:
+    """
+    Pop the strongly connected component rooted at root and record whether it is invalid.
+
+    Components close in reverse topological order, so every dependency outside the
+    component has already been classified.
+    """
+    component = []
+    while True:
+        member = component_stack.pop()
+        on_stack.discard(member)
+        component.append(member)
+        if member == root:
+            break
+
+    dependencies = all_dependencies.get(root, ())
+    if len(component) > 1 or root in dependencies:
+        cycle_path = find_dependency_cycle(root, list(dependencies), all_dependencies) or [root, root]
+        for member in component:
+            invalid[member] = cycle_path
+        return
+
+    for dep_id in dependencies:
+        if dep_id in invalid:
+            invalid[root] = invalid[dep_id]
+            return
@@ -1,12 +1,18 @@
 """Domain exceptions for task management."""
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class CircularDependencyError(Exception):
     """Raised when a circular dependency is detected."""
 
-    pass
+    def __init__(self, message: str, cycle_path: Optional[List[str]] = None):
+        super().__init__(message)
+        self.message = message
+        self.cycle_path = cycle_path
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ConflictError(Exception):
@@ -1,202 +1,388 @@
 """Domain logic for task management operations."""
 
+import os
 from datetime import UTC, datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from aws_lambda_powertools import Logger
 
-from services.task_service.domain.business_rules import can_transition_to, has_circular_dependency
-from services.task_service.domain.exceptions import CircularDependencyError, ConflictError
-from services.task_service.models.api import CreateTaskRequest, UpdateTaskRequest
-from services.task_service.models.task import Task, TaskStatus
+from services.task_service.domain.business_rules import allowed_source_statuses, find_cyclic_dependencies, find_dependency_cycle
+from services.task_service.domain.exceptions import CircularDependencyError
+from services.task_service.models.api import BatchCreateTaskItem, CreateTaskRequest, UpdateTaskRequest
+from services.task_service.models.task import PartialTask, Task, TaskBatchResult, TaskEvent, TaskPatch, TaskPriority, TaskSortOrder, TaskStatus
 from shared.integration.interfaces import EventPublisher, TaskRepository
 
 # Initialize logger at module level - will include module name in logs
 logger = Logger()
 
 
-class TaskService:
-    """Pure business logic for task operations."""
-
-    def __init__(self, repository: TaskRepository = None, event_publisher: EventPublisher = None):
-        """Initialize service with dependencies."""
-        if repository is None or event_publisher is None:
-            import os
+def new_version(now: datetime) -> int:
+    """Version for a write made at `now`: its UTC timestamp in milliseconds."""
+    return int(now.timestamp() * 1000)
+
+
+def default_repository() -> Tuple[TaskRepository, bool]:
+    """
+    Build the repository configured by the environment.
+
+    Returns:
+        The repository and whether it stores events in a transactional outbox
+    """
+    from shared.integration.dynamodb_adapter import DynamoDBTaskRepository
+
+    outbox_table_name = os.environ.get('TASK_OUTBOX_TABLE_NAME')
+    repository: TaskRepository = DynamoDBTaskRepository(
+        table_name=os.environ.get('TASKS_TABLE_NAME', 'tasks'),
+        graph_table_name=os.environ.get('TASK_GRAPH_TABLE_NAME'),
+        outbox_table_name=outbox_table_name,
+        scan_segments=int(os.environ.get('TASK_SCAN_SEGMENTS', '1')),
+        # Set once the status_priority attribute has been backfilled on every stored task
+        status_priority_index=os.environ.get('TASK_STATUS_PRIORITY_INDEX_READY', '').lower() == 'true',
+    )
+
+    # Optional read-through cache for warm containers, enabled by a staleness bound
+    cache_staleness = os.environ.get('TASK_CACHE_MAX_STALENESS_SECONDS')
+    if cache_staleness and float(cache_staleness) > 0:
+        from shared.integration.caching_repository import CachingTaskRepository
+
+        repository = CachingTaskRepository(
+            repository,
+            max_entries=int(os.environ.get('TASK_CACHE_MAX_ENTRIES', '1000')),
+            max_bytes=int(os.environ.get('TASK_CACHE_MAX_BYTES', str(4 * 1024 * 1024))),
+            max_staleness_seconds=float(cache_staleness),
+        )
+    return repository, outbox_table_name is not None
 
-            from shared.integration.dynamodb_adapter import DynamoDBTaskRepository
-            from shared.integration.eventbridge_adapter import EventBridgePublisher
 
-            self.repository = repository or DynamoDBTaskRepository(table_name=os.environ.get('TASKS_TABLE_NAME', 'tasks'))
-            self.event_publisher = event_publisher or EventBridgePublisher(event_bus_name=os.environ.get('EVENT_BUS_NAME', 'TaskEvents'))
-        else:
-            self.repository = repository
-            self.event_publisher = event_publisher
+def default_event_publisher() -> EventPublisher:
+    """Build the EventBridge publisher configured by the environment."""
+    from shared.integration.eventbridge_adapter import EventBridgePublisher
 
-    def create_task(self, request: CreateTaskRequest) -> Task:
-        """Create a new task from request data."""
-        # Generate task ID and timestamp for version
-        task_id = str(uuid4())
-        now = datetime.now(UTC)
-        version = int(now.timestamp() * 1000)  # UTC timestamp in milliseconds
+    publisher: EventPublisher = EventBridgePublisher(event_bus_name=os.environ.get('EVENT_BUS_NAME', 'TaskEvents'))
 
-        logger.info(f'Creating task with ID: {task_id}')
+    # Optional circuit breaker, spilling events to SQS while EventBridge is unavailable
+    spill_queue_url = os.environ.get('EVENT_SPILL_QUEUE_URL')
+    if spill_queue_url:
+        from shared.integration.resilient_publisher import CircuitBreaker, ResilientEventPublisher, SqsSpillBuffer
 
-        # Validate dependencies for circular references
-        if request.dependencies:
-            logger.debug(f'Validating dependencies: {request.dependencies}')
-            self._validate_dependencies(task_id, request.dependencies)
-
-        # Create task entity
-        task = Task(
+        publisher = ResilientEventPublisher(
+            publisher,
+            SqsSpillBuffer(spill_queue_url),
+            CircuitBreaker(
+                failure_threshold=int(os.environ.get('EVENT_CIRCUIT_FAILURE_THRESHOLD', '3')),
+                reset_timeout=float(os.environ.get('EVENT_CIRCUIT_RESET_SECONDS', '30')),
+            ),
+        )
+    return publisher
+
+
+def new_task(request: CreateTaskRequest, now: datetime) -> Task:
+    """Build a new pending task from a create request."""
+    return Task(
+        task_id=str(uuid4()),
+        title=request.title,
+        description=request.description,
+        priority=request.priority,
+        dependencies=request.dependencies,
+        status=TaskStatus.PENDING,
+        created_at=now,
+        updated_at=now,
+        version=new_version(now),
+    )
+
+
+def new_batch_tasks(requests: List[BatchCreateTaskItem], now: datetime) -> List[Task]:
+    """Build the tasks for a batch, resolving dependencies on other items' refs to their new IDs."""
+    task_ids = [str(uuid4()) for _ in requests]
+    ids_by_ref = {request.ref: task_id for request, task_id in zip(requests, task_ids, strict=True) if request.ref is not None}
+    return [
+        Task(
             task_id=task_id,
             title=request.title,
             description=request.description,
             priority=request.priority,
-            dependencies=request.dependencies,
+            dependencies=list(dict.fromkeys(ids_by_ref.get(dep, dep) for dep in request.dependencies)),
             status=TaskStatus.PENDING,
             created_at=now,
             updated_at=now,
-            version=version,
+            version=new_version(now),
+        )
+        for request, task_id in zip(requests, task_ids, strict=True)
+    ]
+
+
+def external_dependencies(tasks: List[Task]) -> List[str]:
+    """Dependencies of the tasks on IDs outside the list, in first-seen order."""
+    task_ids = {task.task_id for task in tasks}
+    return list(dict.fromkeys(dep for task in tasks for dep in task.dependencies if dep not in task_ids))
+
+
+def batch_cycle_errors(tasks: List[Task], graph: Dict[str, List[str]]) -> Dict[str, Exception]:
+    """
+    Find every task in a batch that is on or behind a dependency cycle, in a single graph pass.
+
+    Args:
+        tasks: The batch's tasks
+        graph: Dependency subgraph reachable from the batch's external dependencies
+    """
+    graph = {**graph, **{task.task_id: task.dependencies for task in tasks if task.dependencies}}
+    invalid = find_cyclic_dependencies([task.task_id for task in tasks], graph)
+    return {
+        task_id: CircularDependencyError(f'Circular dependency detected: {" -> ".join(cycle_path)}', cycle_path=cycle_path)
+        for task_id, cycle_path in invalid.items()
+    }
+
+
+def batch_results(requests: List[BatchCreateTaskItem], tasks: List[Task], errors: Dict[str, Exception]) -> List[TaskBatchResult]:
+    """One result per request item, in request order."""
+    return [
+        TaskBatchResult(index=index, ref=request.ref, task=None if task.task_id in errors else task, error=errors.get(task.task_id))
+        for index, (request, task) in enumerate(zip(requests, tasks, strict=True))
+    ]
+
+
+def task_patch(request: UpdateTaskRequest, now: datetime) -> Tuple[TaskPatch, Optional[List[TaskStatus]]]:
+    """
+    Build the patch for an update request.
+
+    Returns:
+        The patch, and the statuses the task must currently be in when the patch changes status
+    """
+    new_status = TaskStatus(request.status) if request.status is not None else None
+    allowed_statuses = allowed_source_statuses(new_status) if new_status is not None else None
+    patch = TaskPatch(
+        version=new_version(now),
+        updated_at=now,
+        title=request.title,
+        description=request.description,
+        status=new_status,
+        priority=request.priority,
+        dependencies=request.dependencies,
+    )
+    return patch, allowed_statuses
+
+
+def check_dependency_cycle(task_id: str, dependencies: List[str], graph: Dict[str, List[str]]) -> None:
+    """Raise CircularDependencyError if depending on `dependencies` would close a cycle through task_id."""
+    cycle_path = find_dependency_cycle(task_id, dependencies, graph)
+    if cycle_path:
+        raise CircularDependencyError(
+            f'Circular dependency detected with task {cycle_path[1]}: {" -> ".join(cycle_path)}',
+            cycle_path=cycle_path,
         )
 
-        # Persist task
-        created_task = self.repository.create_task(task)
 
-        # Publish event
+def validate_page_limit(limit: Optional[int] = None) -> int:
+    """Validate and normalize the page size."""
+    if limit is None:
+        return 50
+    if limit < 1:
+        raise ValueError('Limit must be greater than 0')
+    if limit > 100:
+        raise ValueError('Limit cannot exceed 100')
+    return limit
+
+
+class TaskService:
+    """
+    Pure business logic for task operations.
+
+    In outbox mode, events are handed to the repository to be stored atomically with the
+    mutation and published later by the outbox relay, instead of being published inline.
+    """
+
+    def __init__(self, repository: TaskRepository = None, event_publisher: EventPublisher = None, use_outbox: bool = False):
+        """Initialize service with dependencies."""
+        self.use_outbox = use_outbox
+        if repository is None:
+            repository, outbox_enabled = default_repository()
+            self.use_outbox = use_outbox or outbox_enabled
+        self.repository = repository
+        self._event_publisher = event_publisher
+
+    @property
+    def event_publisher(self) -> EventPublisher:
+        """Event publisher; the default EventBridge publisher is only loaded by operations that publish."""
+        if self._event_publisher is None:
+            self._event_publisher = default_event_publisher()
+        return self._event_publisher
+
+    @event_publisher.setter
+    def event_publisher(self, event_publisher: EventPublisher) -> None:
+        self._event_publisher = event_publisher
+
+    def create_task(self, request: CreateTaskRequest) -> Task:
+        """Create a new task from request data."""
+        task = new_task(request, datetime.now(UTC))
+
+        logger.info(f'Creating task with ID: {task.task_id}')
+
+        # Validate dependencies for circular references
+        if request.dependencies:
+            logger.debug(f'Validating dependencies: {request.dependencies}')
+            self._validate_dependencies(task.task_id, request.dependencies)
+
+        # Persist task
         from services.task_service.models.task import TaskCreatedEvent
 
-        event = TaskCreatedEvent(created_task)
-        self.event_publisher.publish_event(event)
+        event = TaskCreatedEvent(task)
+        created_task = self.repository.create_task(task, **self._outbox(event))
+
+        # Publish event
+        self._publish(event)
 
-        logger.info(f'Task created successfully: {task_id}')
+        logger.info(f'Task created successfully: {task.task_id}')
         return created_task
 
-    def get_task(self, task_id: str) -> Task:
-        """Retrieve a task by ID."""
-        task = self.repository.get_task(task_id)
+    def create_tasks(self, requests: List[BatchCreateTaskItem]) -> List[TaskBatchResult]:
+        """
+        Create many tasks in one call.
+
+        Dependencies may name an existing task ID or the ref of another item in the batch.
+        All dependency cycles in the batch are found in a single graph pass; items on or
+        behind a cycle are rejected and the rest are written together.
+
+        Returns:
+            One result per request item, in request order
+        """
+        tasks = new_batch_tasks(requests, datetime.now(UTC))
+        logger.info(f'Creating {len(tasks)} tasks in batch')
+
+        # Validate the whole batch against the subgraph reachable from its external dependencies
+        dependencies = external_dependencies(tasks)
+        graph = self.repository.get_dependency_graph(dependencies) if dependencies else {}
+        errors = batch_cycle_errors(tasks, graph)
+
+        from services.task_service.models.task import TaskCreatedEvent
+
+        valid_tasks = [task for task in tasks if task.task_id not in errors]
+        events: Dict[str, TaskEvent] = {task.task_id: TaskCreatedEvent(task) for task in valid_tasks}
+        if valid_tasks:
+            if self.use_outbox:
+                errors.update(self.repository.create_tasks(valid_tasks, outbox_events=events))
+            else:
+                errors.update(self.repository.create_tasks(valid_tasks))
+
+        # Publish events for created tasks
+        created_events: List[TaskEvent] = [event for task_id, event in events.items() if task_id not in errors]
+        if created_events and not self.use_outbox:
+            self.event_publisher.publish_events(created_events)
+
+        logger.info(f'Batch created {len(tasks) - len(errors)} of {len(tasks)} tasks')
+        return batch_results(requests, tasks, errors)
+
+    def get_task(self, task_id: str, fields: Optional[List[str]] = None) -> Union[Task, PartialTask]:
+        """Retrieve a task by ID, or only the given fields of it."""
+        task = self.repository.get_task_fields(task_id, fields) if fields else self.repository.get_task(task_id)
         if task is None:
             raise ValueError(f'Task not found: {task_id}')
         return task
 
-    def list_tasks(self, limit: Optional[int] = None, next_token: Optional[str] = None) -> Tuple[List[Task], Optional[str]]:
-        """List tasks with pagination."""
+    def get_task_version(self, task_id: str) -> int:
+        """Read only the current version of a task, to answer conditional requests."""
+        version = self.repository.get_task_version(task_id)
+        if version is None:
+            raise ValueError(f'Task not found: {task_id}')
+        return version
+
+    def list_tasks(
+        self,
+        limit: Optional[int] = None,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[Union[List[Task], List[PartialTask]], Optional[str]]:
+        """List tasks with pagination, optionally filtered by status, priority and creation time, or only the given fields of them."""
         validated_limit = self._validate_pagination_params(limit)
-        return self.repository.list_tasks(validated_limit, next_token)
+        if sort is not None and status is None and priority is None:
+            raise ValueError('Sorting requires a status or priority filter')
+        if fields:
+            return self.repository.list_task_fields(
+                fields, validated_limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort
+            )
+        return self.repository.list_tasks(validated_limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort)
 
     def update_task(self, task_id: str, request: UpdateTaskRequest) -> Task:
-        """Update an existing task with optimistic concurrency control."""
-        logger.info(f'Updating task: {task_id}, request_version: {request.version}')
+        """
+        Update an existing task with optimistic concurrency control.
 
-        # Get existing task
-        existing_task = self.repository.get_task(task_id)
-        if existing_task is None:
-            raise ValueError(f'Task not found: {task_id}')
-
-        logger.debug(f'Existing task version: {existing_task.version}, Request version: {request.version}')
-
-        # Validate version for optimistic locking
-        if existing_task.version != request.version:
-            # Conflict detected - version mismatch
-            logger.debug(f'Version mismatch! Existing: {existing_task.version}, Request: {request.version}')
-            raise ConflictError(f'Task {task_id} was modified by another process', current_task=existing_task.model_dump())
+        The version check and status transition rules are handed to the repository as
+        conditions on the write, so the update needs no prior read of the task.
+        """
+        logger.info(f'Updating task: {task_id}, request_version: {request.version}')
 
         # Validate dependencies if being updated
         if request.dependencies is not None:
             self._validate_dependencies(task_id, request.dependencies)
 
-        # Validate status transition if status is being updated
-        if request.status is not None:
-            new_status = TaskStatus(request.status)
-            if not can_transition_to(existing_task.status, new_status):
-                raise ValueError(f'Invalid status transition from {existing_task.status.value} to {new_status.value}')
-
-        # Create updated task with new values
-        # Domain logic: Generate new version
-        now = datetime.now(UTC)
-        new_version = int(now.timestamp() * 1000)  # UTC timestamp in milliseconds
-
-        # Keep track of old version for optimistic locking
-        old_version = existing_task.version
-
-        logger.debug(f'Generating new version: {new_version} (old: {old_version})')
-
-        updated_data = existing_task.model_dump()
-        updated_data['updated_at'] = now
-        updated_data['version'] = new_version
-
-        if request.title is not None:
-            updated_data['title'] = request.title
-        if request.description is not None:
-            updated_data['description'] = request.description
-        if request.status is not None:
-            updated_data['status'] = TaskStatus(request.status)
-            logger.debug(f'Updating status to: {request.status}')
-        if request.priority is not None:
-            updated_data['priority'] = request.priority
-        if request.dependencies is not None:
-            updated_data['dependencies'] = request.dependencies
+        # Status transitions are enforced as a condition on the stored status
+        patch, allowed_statuses = task_patch(request, datetime.now(UTC))
 
-        updated_task = Task(**updated_data)
+        logger.debug(f'Generating new version: {patch.version} (expected: {request.version})')
 
-        logger.debug(f'Calling repository.update_task with expected_version={old_version}, new_version={new_version}')
+        # Persist with the request version as the optimistic locking condition
+        from services.task_service.models.task import TaskUpdatedEvent
 
-        # Persist updated task with old version for conditional check
-        saved_task = self.repository.update_task(updated_task, expected_version=old_version)
+        saved_task = self.repository.patch_task(
+            task_id,
+            patch,
+            expected_version=request.version,
+            allowed_statuses=allowed_statuses,
+            build_outbox_event=TaskUpdatedEvent if self.use_outbox else None,
+        )
 
         logger.debug(f'Repository update successful, saved version: {saved_task.version}')
 
         # Publish event
-        from services.task_service.models.task import TaskUpdatedEvent
-
-        event = TaskUpdatedEvent(saved_task)
-        self.event_publisher.publish_event(event)
+        self._publish(TaskUpdatedEvent(saved_task))
 
         return saved_task
 
-    def delete_task(self, task_id: str) -> None:
-        """Delete a task."""
-        # Get task to validate existence and get version
-        existing_task = self.repository.get_task(task_id)
-        if existing_task is None:
-            raise ValueError(f'Task not found: {task_id}')
+    def delete_task(self, task_id: str, version: Optional[int] = None) -> None:
+        """
+        Delete a task.
+
+        With a client-supplied version the delete is one conditional repository call; a stale
+        version raises ConflictError and a missing task raises not-found. Without one, the
+        current version is read first.
+        """
+        if version is None:
+            # Get task to validate existence and get version
+            existing_task = self.repository.get_task(task_id)
+            if existing_task is None:
+                raise ValueError(f'Task not found: {task_id}')
+            version = existing_task.version
 
         # Delete task
-        self.repository.delete_task(task_id, existing_task.version)
-
-        # Publish event
         from services.task_service.models.task import TaskDeletedEvent
 
         event = TaskDeletedEvent(task_id)
-        self.event_publisher.publish_event(event)
+        self.repository.delete_task(task_id, version, **self._outbox(event))
+
+        # Publish event
+        self._publish(event)
+
+    def _outbox(self, event: TaskEvent) -> dict:
+        """Repository keyword arguments that store the event in the outbox when outbox mode is on."""
+        return {'outbox_event': event} if self.use_outbox else {}
+
+    def _publish(self, event: TaskEvent) -> None:
+        """Publish the event inline, unless the outbox relay will publish it."""
+        if not self.use_outbox:
+            self.event_publisher.publish_event(event)
 
     def _validate_dependencies(self, task_id: str, dependencies: list[str]) -> None:
         """Validate task dependencies for circular references."""
         if not dependencies:
             return
 
-        # Get all dependencies from repository
-        all_dependencies = self._get_all_dependencies()
-
-        for dep_id in dependencies:
-            if has_circular_dependency(task_id, dep_id, all_dependencies):
-                raise CircularDependencyError(f'Circular dependency detected with task {dep_id}')
-
-    def _get_all_dependencies(self) -> dict[str, list[str]]:
-        """Get all task dependencies from repository."""
-        tasks, _ = self.repository.list_tasks(limit=1000)
-        dependencies = {}
-        for task in tasks:
-            if task.dependencies:
-                dependencies[task.task_id] = task.dependencies
-        return dependencies
+        # Load only the subgraph reachable from the proposed dependencies and check them in a single traversal
+        check_dependency_cycle(task_id, dependencies, self.repository.get_dependency_graph(dependencies))
 
     def _validate_pagination_params(self, limit: Optional[int] = None) -> int:
         """Validate and normalize pagination parameters."""
-        if limit is None:
-            return 50
-        if limit < 1:
-            raise ValueError('Limit must be greater than 0')
-        if limit > 100:
-            raise ValueError('Limit cannot exceed 100')
-        return limit
+        return validate_page_limit(limit)
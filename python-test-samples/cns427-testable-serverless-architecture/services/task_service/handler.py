@@ -1,9 +1,12 @@
 """Lambda handler for task CRUD operations."""
 
-from typing import Any, Dict, Optional
+import asyncio
+import inspect
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from aws_lambda_powertools import Logger
-from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, CORSConfig, Response, content_types
 from aws_lambda_powertools.event_handler.exceptions import BadRequestError, InternalServerError, NotFoundError, ServiceError
 from aws_lambda_powertools.logging import correlation_paths
 from botocore.exceptions import ClientError
@@ -11,13 +14,35 @@ from pydantic import ValidationError
 
 from services.task_service.domain.exceptions import CircularDependencyError, ConflictError, RepositoryError, ResourceNotFoundError, ThrottlingError
 from services.task_service.domain.task_service import TaskService
-from services.task_service.models.api import CreateTaskRequest, ErrorResponse, PaginationInfo, TaskResponse, UpdateTaskRequest
+from services.task_service.models.api import (
+    BatchCreateTasksRequest,
+    BatchItemResponse,
+    BatchTasksResponse,
+    CreateTaskRequest,
+    ErrorResponse,
+    GetTaskQuery,
+    ListTasksQuery,
+    PaginationInfo,
+    UpdateTaskRequest,
+    dumps_response,
+)
+from services.task_service.models.task import PartialTask, Task
+from shared.observability import metrics
+
+if TYPE_CHECKING:
+    from services.task_service.domain.async_task_service import AsyncTaskService
 
 logger = Logger()
-app = APIGatewayRestResolver()
+# Browsers may send the conditional request headers and read the ETag they are answered with
+app = APIGatewayRestResolver(
+    serializer=dumps_response, cors=CORSConfig(allow_origin='*', allow_headers=['If-Match', 'If-None-Match'], expose_headers=['ETag'])
+)
 
 # Domain service - injected at runtime
-task_service: Optional[TaskService] = None
+task_service: Optional[Union[TaskService, 'AsyncTaskService']] = None
+
+# Event loop for the async service, created once per container and reused across invocations
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def _initialize_dependencies():
@@ -25,7 +50,24 @@ def _initialize_dependencies():
     global task_service
 
     if task_service is None:
-        task_service = TaskService()
+        # TASK_SERVICE_ASYNC=true runs the asyncio service, which overlaps independent AWS calls
+        if os.environ.get('TASK_SERVICE_ASYNC', '').lower() == 'true':
+            from services.task_service.domain.async_task_service import AsyncTaskService
+
+            task_service = AsyncTaskService()
+        else:
+            task_service = TaskService()
+
+
+def _run(result):
+    """Return a service result, running it to completion on the container's event loop if it is a coroutine."""
+    global _event_loop
+
+    if not inspect.isawaitable(result):
+        return result
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop.run_until_complete(result)
 
 
 def _handle_common_exceptions(e: Exception, operation: str = 'operation', task_id: Optional[str] = None):
@@ -69,7 +111,8 @@ def _handle_common_exceptions(e: Exception, operation: str = 'operation', task_i
 
     if isinstance(e, CircularDependencyError):
         logger.warning(f'Circular dependency error during {operation}: {str(e)}', extra=extra_context)
-        error = ErrorResponse(error='BusinessError', message=str(e), details=None)
+        details = {'cycle_path': e.cycle_path} if e.cycle_path else None
+        error = ErrorResponse(error='BusinessError', message=str(e), details=details)
         raise BadRequestError(error.model_dump_json())
 
     # AWS SDK exceptions
@@ -81,7 +124,7 @@ def _handle_common_exceptions(e: Exception, operation: str = 'operation', task_i
     # Validation exceptions
     if isinstance(e, ValidationError):
         logger.warning(f'Validation error during {operation}: {e}', extra=extra_context)
-        error = ErrorResponse(error='ValidationError', message='Invalid request data', details={'errors': e.errors()})
+        error = ErrorResponse(error='ValidationError', message='Invalid request data', details={'errors': e.errors(include_context=False)})
         raise BadRequestError(error.model_dump_json())
 
     # Business logic exceptions
@@ -104,11 +147,75 @@ def _handle_common_exceptions(e: Exception, operation: str = 'operation', task_i
     raise InternalServerError('Internal server error')
 
 
+def _etag(version: int, weak: bool = False) -> str:
+    """Entity tag for a task version; weak for a partial representation of the task."""
+    return f'W/"{version}"' if weak else f'"{version}"'
+
+
+def _task_response(task: Union[Task, PartialTask], status_code: int = 200) -> Response:
+    """JSON response for a single task, carrying its version as the ETag when it is known."""
+    partial = isinstance(task, PartialTask)
+    headers = {'ETag': _etag(task.version, weak=partial)} if task.version is not None else {}
+    return Response(status_code=status_code, content_type=content_types.APPLICATION_JSON, body=dumps_response(task), headers=headers)
+
+
+def _if_none_match_versions() -> List[str]:
+    """Read the entity tags from the If-None-Match header, unquoted and without weak prefixes; * is returned on its own."""
+    if_none_match = app.current_event.headers.get('If-None-Match')
+    if not if_none_match:
+        return []
+    if if_none_match.strip() == '*':
+        return ['*']
+    return [token.strip().removeprefix('W/').strip('"') for token in if_none_match.split(',')]
+
+
+def _if_match_version() -> Optional[int]:
+    """Read the expected task version from the If-Match header, if the client sent one."""
+    if_match = app.current_event.headers.get('If-Match')
+    if not if_match:
+        return None
+
+    # Accept a bare version or an entity tag form: "123" or W/"123"
+    token = if_match.strip().removeprefix('W/').strip('"')
+    if not token.isdigit():
+        error = ErrorResponse(error='ValidationError', message='If-Match must be a task version', details=None)
+        raise BadRequestError(error.model_dump_json())
+    return int(token)
+
+
+def _batch_item_error(e: Exception) -> tuple[int, ErrorResponse]:
+    """Map a per-item domain error from a bulk request to a status code and error body."""
+    if isinstance(e, CircularDependencyError):
+        details = {'cycle_path': e.cycle_path} if e.cycle_path else None
+        return 400, ErrorResponse(error='BusinessError', message=str(e), details=details)
+    if isinstance(e, ConflictError):
+        return 409, ErrorResponse(error='Conflict', message=str(e), details=None)
+    if isinstance(e, ThrottlingError):
+        return 503, ErrorResponse(error='ServiceUnavailable', message='Service temporarily unavailable due to high load. Please retry.', details=None)
+    if isinstance(e, ValueError):
+        return 400, ErrorResponse(error='BusinessError', message=str(e), details=None)
+
+    logger.error(f'Unexpected error for batch item: {str(e)}')
+    return 500, ErrorResponse(error='InternalError', message='Internal server error', details=None)
+
+
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@metrics.log_metrics
 def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
     """Lambda handler entry point."""
     _initialize_dependencies()
-    return app.resolve(event, context)
+
+    # DynamoDB retries must leave this invocation enough time to answer
+    from shared.integration.dynamodb_adapter import retry_policy_invocation
+
+    with retry_policy_invocation(context):
+        try:
+            return app.resolve(event, context)
+        finally:
+            # Report read-through cache counters so the cache can be sized from CloudWatch
+            publish_metrics = getattr(getattr(task_service, 'repository', None), 'publish_metrics', None)
+            if publish_metrics is not None:
+                publish_metrics()
 
 
 @app.post('/tasks')
@@ -120,11 +227,11 @@ def create_task():
         create_request = CreateTaskRequest.model_validate(request_data)
 
         # Delegate to domain service
-        created_task = task_service.create_task(create_request)
+        created_task = _run(task_service.create_task(create_request))
 
         # Return response
         logger.info(f'Created task: {created_task.task_id}')
-        return TaskResponse.from_task(created_task).model_dump(), 201
+        return _task_response(created_task, 201)
 
     except Exception as e:
         result = _handle_common_exceptions(e, 'creating task')
@@ -133,16 +240,60 @@ def create_task():
         raise
 
 
+@app.post('/tasks:batch')
+def create_tasks_batch():
+    """Create many tasks in one request, returning a result per item."""
+    try:
+        # Parse and validate request
+        request_data = app.current_event.json_body
+        batch_request = BatchCreateTasksRequest.model_validate(request_data)
+
+        # Delegate to domain service
+        results = _run(task_service.create_tasks(batch_request.tasks))
+
+        # Build per-item results
+        item_responses = []
+        for result in results:
+            if result.error is None:
+                item_responses.append(BatchItemResponse(index=result.index, ref=result.ref, status_code=201, task=result.task))
+            else:
+                status_code, error = _batch_item_error(result.error)
+                item_responses.append(BatchItemResponse(index=result.index, ref=result.ref, status_code=status_code, error=error))
+
+        failed = sum(1 for item in item_responses if item.status_code != 201)
+        logger.info(f'Batch created {len(item_responses) - failed} tasks, {failed} failed')
+        return BatchTasksResponse(results=item_responses), 201 if failed == 0 else 207
+
+    except Exception as e:
+        result = _handle_common_exceptions(e, 'creating tasks in batch')
+        if result:
+            return result
+        raise
+
+
 @app.get('/tasks/<task_id>')
 def get_task(task_id: str):
     """Retrieve a task by ID."""
     try:
         if task_service is None:
             raise RuntimeError('Task service not initialized')
-        task = task_service.get_task(task_id)
+
+        # fields=a,b returns a sparse fieldset, read with a DynamoDB projection
+        query = GetTaskQuery.model_validate(app.current_event.query_string_parameters or {})
+
+        # Conditional GET: only the version is read, and an unchanged task is not sent again
+        if_none_match = _if_none_match_versions()
+        if if_none_match:
+            version = _run(task_service.get_task_version(task_id))
+            # * matches any current version; a missing task fails the version read with 404
+            if if_none_match == ['*'] or str(version) in if_none_match:
+                logger.info(f'Task not modified: {task_id}')
+                return Response(status_code=304, headers={'ETag': _etag(version, weak=query.fields is not None)}, body=None)
+
+        task = _run(task_service.get_task(task_id, fields=query.fields))
 
         logger.info(f'Retrieved task: {task_id}')
-        return TaskResponse.from_task(task).model_dump()
+        return _task_response(task)
 
     except Exception as e:
         result = _handle_common_exceptions(e, 'retrieving task', task_id)
@@ -155,19 +306,27 @@ def get_task(task_id: str):
 def list_tasks():
     """List tasks with pagination."""
     try:
-        # Parse query parameters
-        limit = app.current_event.query_string_parameters.get('limit')
-        next_token = app.current_event.query_string_parameters.get('next_token')
+        # Parse and validate query parameters
+        query = ListTasksQuery.model_validate(app.current_event.query_string_parameters or {})
 
         # Delegate to domain service
-        tasks, next_page_token = task_service.list_tasks(int(limit) if limit else None, next_token)
+        tasks, next_page_token = _run(
+            task_service.list_tasks(
+                query.limit,
+                query.next_token,
+                status=query.status,
+                priority=query.priority,
+                created_after=query.created_after,
+                sort=query.sort,
+                fields=query.fields,
+            )
+        )
 
         # Build response
-        task_responses = [TaskResponse.from_task(task).model_dump() for task in tasks]
         pagination = PaginationInfo(limit=len(tasks), next_token=next_page_token)
 
         logger.info(f'Listed {len(tasks)} tasks')
-        return {'tasks': task_responses, 'pagination': pagination.model_dump()}
+        return {'tasks': tasks, 'pagination': pagination}
 
     except Exception as e:
         result = _handle_common_exceptions(e, 'listing tasks')
@@ -178,10 +337,15 @@ def list_tasks():
 
 @app.put('/tasks/<task_id>')
 def update_task(task_id: str):
-    """Update an existing task."""
+    """Update an existing task; the expected version comes from the body or the If-Match header."""
+    expected_version = _if_match_version()
     try:
         # Parse and validate request
         request_data = app.current_event.json_body
+        if expected_version is not None and isinstance(request_data, dict):
+            if request_data.get('version', expected_version) != expected_version:
+                raise ValueError('If-Match does not match the request body')
+            request_data = {**request_data, 'version': expected_version}
         update_request = UpdateTaskRequest.model_validate(request_data)
 
         logger.debug(f'Update request for task {task_id}: {update_request.model_dump()}')
@@ -189,13 +353,13 @@ def update_task(task_id: str):
         # Delegate to domain service
         if task_service is None:
             raise RuntimeError('Task service not initialized')
-        updated_task = task_service.update_task(task_id, update_request)
+        updated_task = _run(task_service.update_task(task_id, update_request))
 
         logger.debug(f'Update successful for task {task_id}, new version: {updated_task.version}')
 
         # Return response
         logger.info(f'Updated task: {task_id}')
-        return TaskResponse.from_task(updated_task).model_dump()
+        return _task_response(updated_task)
 
     except Exception as e:
         logger.debug(f'Update failed for task {task_id}: {type(e).__name__}: {str(e)}')
@@ -207,12 +371,13 @@ def update_task(task_id: str):
 
 @app.delete('/tasks/<task_id>')
 def delete_task(task_id: str):
-    """Delete a task."""
+    """Delete a task, optionally only if it still has the version given in If-Match."""
+    expected_version = _if_match_version()
     try:
         # Delegate to domain service
         if task_service is None:
             raise RuntimeError('Task service not initialized')
-        task_service.delete_task(task_id)
+        _run(task_service.delete_task(task_id, version=expected_version))
 
         logger.info(f'Deleted task: {task_id}')
         return '', 204
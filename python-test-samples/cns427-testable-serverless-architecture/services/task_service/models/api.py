@@ -1,10 +1,12 @@
 """API request and response models."""
 
-from typing import List, Optional
+from datetime import UTC, datetime
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic_core import to_json
 
-from services.task_service.models.task import Task, TaskPriority
+from services.task_service.models.task import TASK_FIELDS, Task, TaskPriority, TaskSortOrder, TaskStatus
 
 
 class CreateTaskRequest(BaseModel):
@@ -25,6 +27,31 @@ class CreateTaskRequest(BaseModel):
     dependencies: list[str] = Field(default_factory=list, description='List of task IDs this task depends on')
 
 
+MAX_BATCH_SIZE = 100
+
+
+class BatchCreateTaskItem(CreateTaskRequest):
+    """One task in a bulk create request."""
+
+    ref: Optional[str] = Field(
+        None, min_length=1, max_length=64, description='Client reference other items in the same batch can use in dependencies'
+    )
+
+
+class BatchCreateTasksRequest(BaseModel):
+    """Request model for creating many tasks in one call."""
+
+    tasks: List[BatchCreateTaskItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE, description='Tasks to create')
+
+    @model_validator(mode='after')
+    def validate_unique_refs(self) -> 'BatchCreateTasksRequest':
+        """Validate client references are unique within the batch."""
+        refs = [item.ref for item in self.tasks if item.ref is not None]
+        if len(refs) != len(set(refs)):
+            raise ValueError('Task refs must be unique within a batch')
+        return self
+
+
 class UpdateTaskRequest(BaseModel):
     """Request model for updating an existing task."""
 
@@ -58,6 +85,57 @@ class UpdateTaskRequest(BaseModel):
     version: int = Field(..., description='Current version for optimistic locking')
 
 
+def _split_fields(value: Any) -> Any:
+    """Split a comma-separated fields= parameter into unique task field names."""
+    if not isinstance(value, str):
+        return value
+    fields = list(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+    if not fields:
+        raise ValueError('fields must name at least one field')
+    unknown = [name for name in fields if name not in TASK_FIELDS]
+    if unknown:
+        raise ValueError(f'Unknown fields: {unknown}. Must be among: {list(TASK_FIELDS)}')
+    return fields
+
+
+class GetTaskQuery(BaseModel):
+    """Query string parameters for retrieving a task."""
+
+    fields: Optional[List[str]] = Field(None, description='Comma-separated task fields to return (default: all)')
+
+    @field_validator('fields', mode='before')
+    @classmethod
+    def validate_fields(cls, v: Any) -> Any:
+        """Split the comma-separated list and check every name is a task field."""
+        return _split_fields(v)
+
+
+class ListTasksQuery(BaseModel):
+    """Query string parameters for listing tasks."""
+
+    limit: Optional[int] = Field(None, description='Number of items per page')
+    next_token: Optional[str] = Field(None, description='Token for next page')
+    status: Optional[TaskStatus] = Field(None, description='Only return tasks with this status')
+    priority: Optional[TaskPriority] = Field(None, description='Only return tasks with this priority')
+    created_after: Optional[datetime] = Field(None, description='Only return tasks created after this timestamp (ISO 8601)')
+    sort: Optional[TaskSortOrder] = Field(None, description='Sort by creation time: created_at (oldest first) or -created_at (newest first)')
+    fields: Optional[List[str]] = Field(None, description='Comma-separated task fields to return (default: all)')
+
+    @field_validator('fields', mode='before')
+    @classmethod
+    def validate_fields(cls, v: Any) -> Any:
+        """Split the comma-separated list and check every name is a task field."""
+        return _split_fields(v)
+
+    @field_validator('created_after')
+    @classmethod
+    def validate_created_after(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """Treat timestamps without an offset as UTC."""
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=UTC)
+        return v
+
+
 class TaskResponse(BaseModel):
     """Response model for task operations."""
 
@@ -107,3 +185,31 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description='Error type')
     message: str = Field(..., description='Error message')
     details: Optional[dict] = Field(None, description='Additional error details')
+
+
+class BatchItemResponse(BaseModel):
+    """Per-item result of a bulk request."""
+
+    index: int = Field(..., description='Position of the item in the request')
+    ref: Optional[str] = Field(None, description='Client reference from the request item')
+    status_code: int = Field(..., description='HTTP status code for this item')
+    task: Optional[Task] = Field(None, description='Created task, when successful')
+    error: Optional[ErrorResponse] = Field(None, description='Error, when unsuccessful')
+
+
+class BatchTasksResponse(BaseModel):
+    """Response model for bulk requests."""
+
+    results: List[BatchItemResponse] = Field(..., description='Per-item results, in request order')
+
+
+def dumps_response(body: Any) -> str:
+    """
+    Serialize a response body to a JSON string.
+
+    Used as the API resolver's serializer. Task entities and other pydantic models in the
+    body are written by pydantic's compiled serializer straight to JSON, so routes return
+    them as-is instead of converting each one to a TaskResponse and a dict first. A Task
+    serializes to the same fields and values as TaskResponse.
+    """
+    return to_json(body).decode()
@@ -0,0 +1,99 @@
+"""
+Typed payloads of task events.
+
+Event details are validated into frozen, slotted dataclasses through pydantic TypeAdapters
+built once at import time; building an adapter compiles its validator, which costs far
+more than validating one payload. Detail types, including the TEST- prefixed ones used by
+test events, map to event types and payload adapters through dict lookups.
+
+Unknown keys in a detail are ignored, so producers can add fields without breaking
+consumers. TaskUpdated payloads may carry changed_fields and coalesced_events when they
+stand for several coalesced updates.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
+
+from services.task_service.models.task import TaskEventType, TaskPriority, TaskStatus
+
+TEST_DETAIL_TYPE_PREFIX = 'TEST-'
+
+
+@dataclass(frozen=True, slots=True)
+class TaskCreatedPayload:
+    """Detail of a TaskCreated event: the created task."""
+
+    task_id: str
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    created_at: datetime
+    updated_at: datetime
+    version: int
+    description: Optional[str] = None
+    dependencies: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class TaskUpdatedPayload:
+    """Detail of a TaskUpdated event: the task after the update."""
+
+    task_id: str
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    created_at: datetime
+    updated_at: datetime
+    version: int
+    description: Optional[str] = None
+    dependencies: Tuple[str, ...] = ()
+    changed_fields: Tuple[str, ...] = ()
+    coalesced_events: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class TaskDeletedPayload:
+    """Detail of a TaskDeleted event."""
+
+    task_id: str
+
+
+TaskEventPayload = Union[TaskCreatedPayload, TaskUpdatedPayload, TaskDeletedPayload]
+
+# Payload type and its cached adapter by event type
+PAYLOAD_TYPES: Dict[str, type] = {
+    TaskEventType.TASK_CREATED.value: TaskCreatedPayload,
+    TaskEventType.TASK_UPDATED.value: TaskUpdatedPayload,
+    TaskEventType.TASK_DELETED.value: TaskDeletedPayload,
+}
+PAYLOAD_ADAPTERS: Dict[str, TypeAdapter] = {event_type: TypeAdapter(payload_type) for event_type, payload_type in PAYLOAD_TYPES.items()}
+
+# Event type by EventBridge detail-type
+DETAIL_TYPES: Dict[str, str] = {
+    **{event_type: event_type for event_type in PAYLOAD_ADAPTERS},
+    **{f'{TEST_DETAIL_TYPE_PREFIX}{event_type}': event_type for event_type in PAYLOAD_ADAPTERS},
+}
+
+
+def event_type_for(detail_type: str) -> str:
+    """Event type of a detail-type; unknown detail types are returned without their TEST- prefix."""
+    event_type = DETAIL_TYPES.get(detail_type)
+    if event_type is not None:
+        return event_type
+    return detail_type.removeprefix(TEST_DETAIL_TYPE_PREFIX)
+
+
+def decode_payload(event_type: str, detail: Dict[str, Any]) -> TaskEventPayload:
+    """
+    Validate an event detail into the payload type of its event type.
+
+    Raises:
+        ValueError: The event type is unknown or the detail does not match its payload type
+    """
+    adapter = PAYLOAD_ADAPTERS.get(event_type)
+    if adapter is None:
+        raise ValueError(f'Unknown event type: {event_type}')
+    return adapter.validate_python(detail)
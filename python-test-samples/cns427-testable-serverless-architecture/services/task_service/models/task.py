@@ -5,10 +5,10 @@ import os
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, field_serializer, field_validator, model_serializer
 
 
 class TaskStatus(str, Enum):
@@ -27,6 +27,13 @@ class TaskPriority(str, Enum):
     HIGH = 'high'
 
 
+class TaskSortOrder(str, Enum):
+    """Sort orders supported when listing tasks."""
+
+    CREATED_AT_ASC = 'created_at'
+    CREATED_AT_DESC = '-created_at'
+
+
 class Task(BaseModel):
     """Task entity with validation."""
 
@@ -56,12 +63,93 @@ class Task(BaseModel):
             return v.strip() if v.strip() else None
         return v
 
+    @field_serializer('created_at', 'updated_at', when_used='json')
+    def serialize_timestamp(self, value: datetime) -> str:
+        """Serialize timestamps as isoformat() strings (+00:00 offset) in JSON, matching stored items and events."""
+        return value.isoformat()
+
     def model_post_init(self, __context) -> None:
         """Post-initialization to ensure updated_at is set."""
         if self.updated_at == self.created_at and hasattr(self, '_updating'):
             self.updated_at = datetime.now(UTC)
 
 
+# Field names clients can select with sparse fieldsets
+TASK_FIELDS = tuple(Task.model_fields)
+
+
+class PartialTask(BaseModel):
+    """
+    A task read with a projection: only the selected fields are set, the others are None.
+
+    Built from trusted repository data with model_construct. Serialization writes only the
+    fields that were set, so a partial response contains exactly the selected fields.
+    """
+
+    task_id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    dependencies: Optional[list[str]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    version: Optional[int] = None
+
+    @field_serializer('created_at', 'updated_at', when_used='json')
+    def serialize_timestamp(self, value: Optional[datetime]) -> Optional[str]:
+        """Serialize timestamps as Task does."""
+        return value.isoformat() if value is not None else None
+
+    @model_serializer(mode='wrap')
+    def serialize_selected(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        """Leave out fields that were not selected."""
+        return {name: value for name, value in handler(self).items() if name in self.model_fields_set}
+
+    @classmethod
+    def from_task(cls, task: Task, fields: List[str]) -> 'PartialTask':
+        """Select fields from a full task."""
+        return cls.model_construct(**{name: getattr(task, name) for name in fields})
+
+
+@dataclass
+class TaskBatchResult:
+    """Outcome of a single item in a bulk write."""
+
+    index: int
+    ref: Optional[str] = None
+    task: Optional[Task] = None
+    error: Optional[Exception] = None
+
+
+@dataclass
+class TaskPatch:
+    """
+    Field changes for a conditional in-place update.
+
+    version and updated_at are the new values; fields left as None are not changed.
+    """
+
+    version: int
+    updated_at: datetime
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    dependencies: Optional[List[str]] = None
+
+    def apply(self, task: Task) -> Task:
+        """Return a copy of the task with the changes applied."""
+        updated_data = task.model_dump()
+        updated_data['version'] = self.version
+        updated_data['updated_at'] = self.updated_at
+        for field in ('title', 'description', 'status', 'priority', 'dependencies'):
+            value = getattr(self, field)
+            if value is not None:
+                updated_data[field] = value
+        return Task(**updated_data)
+
+
 class TaskEventType(str, Enum):
     """Task event types for EventBridge."""
 
@@ -78,14 +166,17 @@ class TaskEvent:
     task_data: Dict[str, Any]
     source: str = 'cns427-task-api'
     detail_type_prefix: str = ''
+    # EventBridge event id, set on events received from EventBridge; redeliveries keep the same id
+    event_id: Optional[str] = None
 
-    def __init__(self, event_type: str, task_data: Dict[str, Any], source: str = None, detail_type_prefix: str = None):
+    def __init__(self, event_type: str, task_data: Dict[str, Any], source: str = None, detail_type_prefix: str = None, event_id: str = None):
         self.event_type = event_type
         self.task_data = task_data
         if source is not None:
             self.source = source
         if detail_type_prefix is not None:
             self.detail_type_prefix = detail_type_prefix
+        self.event_id = event_id
 
     def to_eventbridge_entry(self, event_bus_name: str = None) -> Dict[str, Any]:
         """Convert to EventBridge entry format."""
@@ -108,6 +199,7 @@ class TaskEvent:
             event: EventBridge event with structure:
                 {
                     "version": "0",
+                    "id": "event-id",
                     "detail-type": "TaskCreated",
                     "source": "cns427-task-api",
                     "detail": { task_data }
@@ -116,14 +208,15 @@ class TaskEvent:
         Returns:
             TaskEvent instance
         """
-        detail_type = event.get('detail-type', '')
-        source = event.get('source', 'cns427-task-api')
-        detail = event.get('detail', {})
-
-        # Remove TEST- prefix if present
-        event_type = detail_type.replace('TEST-', '')
-
-        return cls(event_type=event_type, task_data=detail, source=source)
+        from services.task_service.models.event_payloads import event_type_for
+
+        # TEST- prefixed detail types map to the same event types
+        return cls(
+            event_type=event_type_for(event.get('detail-type', '')),
+            task_data=event.get('detail', {}),
+            source=event.get('source', 'cns427-task-api'),
+            event_id=event.get('id'),
+        )
 
 
 @dataclass
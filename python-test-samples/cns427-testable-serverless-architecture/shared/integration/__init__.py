@@ -4,6 +4,7 @@ Infrastructure integration adapters.
 This module contains adapters for external infrastructure services:
 - DynamoDB adapter for data persistence
 - EventBridge adapter for event publishing
+- Outbox record format shared by the DynamoDB adapter and the outbox relay
 
 These are output ports in the hexagonal architecture pattern.
 """
@@ -0,0 +1,153 @@
+"""
+Asyncio adapters over the synchronous repository and publisher.
+
+The DynamoDB and EventBridge adapters keep all request building, condition handling and
+retry logic; these adapters run their blocking calls on a thread pool so that independent
+calls awaited together are in flight at the same time. botocore releases the GIL while
+waiting on the network and its clients are thread-safe, so calls overlap for real.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from services.task_service.models.task import PartialTask, Task, TaskEvent, TaskPatch, TaskPriority, TaskSortOrder, TaskStatus
+from shared.integration.interfaces import AsyncEventPublisher, AsyncTaskRepository, EventPublisher, TaskRepository
+
+T = TypeVar('T')
+
+# botocore keeps at most 10 pooled connections per client by default; more concurrent
+# calls than that would only queue for a connection inside botocore
+MAX_CONCURRENT_CALLS = 10
+
+_executor: Optional[Executor] = None
+
+
+def _default_executor() -> Executor:
+    """Return the shared thread pool, created on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS, thread_name_prefix='aws-io')
+    return _executor
+
+
+class _ExecutorAdapter:
+    """Runs blocking calls on a thread pool from coroutines."""
+
+    def __init__(self, executor: Optional[Executor] = None):
+        self._executor = executor
+
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor or _default_executor(), partial(func, *args, **kwargs))
+
+
+class ExecutorTaskRepository(_ExecutorAdapter, AsyncTaskRepository):
+    """
+    AsyncTaskRepository backed by a synchronous TaskRepository.
+
+    The wrapped repository must tolerate concurrent calls from pool threads.
+    """
+
+    def __init__(self, repository: TaskRepository, executor: Optional[Executor] = None):
+        """Initialize with the synchronous repository to run."""
+        super().__init__(executor)
+        self.repository = repository
+
+    async def create_task(self, task: Task, outbox_event: Optional[TaskEvent] = None) -> Task:
+        """Create a new task."""
+        return await self._call(self.repository.create_task, task, outbox_event=outbox_event)
+
+    async def create_tasks(self, tasks: List[Task], outbox_events: Optional[Dict[str, TaskEvent]] = None) -> Dict[str, Exception]:
+        """Create many new tasks."""
+        return await self._call(self.repository.create_tasks, tasks, outbox_events=outbox_events)
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """Retrieve a task by ID."""
+        return await self._call(self.repository.get_task, task_id)
+
+    async def get_task_version(self, task_id: str) -> Optional[int]:
+        """Read only the version of a task."""
+        return await self._call(self.repository.get_task_version, task_id)
+
+    async def list_tasks(
+        self,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[Task], Optional[str]]:
+        """List tasks with pagination."""
+        return await self._call(
+            self.repository.list_tasks, limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort
+        )
+
+    async def get_task_fields(self, task_id: str, fields: List[str]) -> Optional[PartialTask]:
+        """Retrieve only the given fields of a task."""
+        return await self._call(self.repository.get_task_fields, task_id, fields)
+
+    async def list_task_fields(
+        self,
+        fields: List[str],
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[PartialTask], Optional[str]]:
+        """List only the given fields of tasks."""
+        return await self._call(
+            self.repository.list_task_fields, fields, limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort
+        )
+
+    async def update_task(self, task: Task, expected_version: int, outbox_event: Optional[TaskEvent] = None) -> Task:
+        """Update an existing task with optimistic locking."""
+        return await self._call(self.repository.update_task, task, expected_version, outbox_event=outbox_event)
+
+    async def patch_task(
+        self,
+        task_id: str,
+        patch: TaskPatch,
+        expected_version: int,
+        allowed_statuses: Optional[List[TaskStatus]] = None,
+        build_outbox_event: Optional[Callable[[Task], TaskEvent]] = None,
+        known_task: Optional[Task] = None,
+    ) -> Task:
+        """Apply field changes to a stored task if its version and status still match."""
+        return await self._call(self.repository.patch_task, task_id, patch, expected_version, allowed_statuses, build_outbox_event, known_task)
+
+    async def delete_task(self, task_id: str, version: int, outbox_event: Optional[TaskEvent] = None) -> None:
+        """Delete a task."""
+        await self._call(self.repository.delete_task, task_id, version, outbox_event=outbox_event)
+
+    async def get_dependency_graph(self, task_ids: List[str]) -> Dict[str, List[str]]:
+        """Load the dependency subgraph reachable from the given task IDs."""
+        return await self._call(self.repository.get_dependency_graph, task_ids)
+
+    def publish_metrics(self) -> None:
+        """Publish metrics recorded by the wrapped repository, such as read-through cache counters."""
+        publish_metrics = getattr(self.repository, 'publish_metrics', None)
+        if publish_metrics is not None:
+            publish_metrics()
+
+
+class ExecutorEventPublisher(_ExecutorAdapter, AsyncEventPublisher):
+    """AsyncEventPublisher backed by a synchronous EventPublisher."""
+
+    def __init__(self, publisher: EventPublisher, executor: Optional[Executor] = None):
+        """Initialize with the synchronous publisher to run."""
+        super().__init__(executor)
+        self.publisher = publisher
+
+    async def publish_event(self, event: TaskEvent) -> None:
+        """Publish a task event."""
+        await self._call(self.publisher.publish_event, event)
+
+    async def publish_events(self, events: List[TaskEvent]) -> None:
+        """Publish several task events in the publisher's batches."""
+        await self._call(self.publisher.publish_events, events)
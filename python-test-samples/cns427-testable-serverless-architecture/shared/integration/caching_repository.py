@@ -0,0 +1,269 @@
+"""Read-through cache for task lookups in warm Lambda containers."""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import MetricUnit
+
+from services.task_service.domain.exceptions import ConflictError
+from services.task_service.models.task import PartialTask, Task, TaskEvent, TaskPatch, TaskPriority, TaskSortOrder, TaskStatus
+from shared.integration.interfaces import TaskRepository
+from shared.observability import metrics
+
+logger = Logger()
+
+# Rough per-task overhead of the model, its fields and the cache entry, on top of string contents
+_TASK_BASE_BYTES = 600
+
+
+def task_size(task: Task) -> int:
+    """Estimate the memory held by a cached task."""
+    size = _TASK_BASE_BYTES + len(task.task_id) + len(task.title) + len(task.description or '')
+    return size + sum(len(dep_id) + 60 for dep_id in task.dependencies)
+
+
+@dataclass
+class _CacheEntry:
+    task: Task
+    size: int
+    expires_at: float
+
+
+class CachingTaskRepository(TaskRepository):
+    """
+    Decorator adding a bounded LRU cache in front of another repository's get_task.
+
+    Each entry expires max_staleness_seconds after it was loaded, so a served task is never
+    older than that bound. Every write made through this repository invalidates the task's
+    entry first; successful updates and conflicts then store the task version they returned,
+    never replacing a newer cached version with an older one. Writes from other containers
+    are only picked up once entries expire.
+
+    The cache holds at most max_entries tasks and max_bytes of estimated task size, evicting
+    least recently used entries first. Hit, miss, eviction and expiration counters are kept
+    in-process; publish_metrics() records what was counted since the previous call.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        max_entries: int = 1000,
+        max_bytes: int = 4 * 1024 * 1024,
+        max_staleness_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache around the repository it reads through to."""
+        self.repository = repository
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_staleness_seconds = max_staleness_seconds
+        self.clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # Guards entries when the async service calls the repository from pool threads
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._published = {'CacheHits': 0, 'CacheMisses': 0, 'CacheEvictions': 0, 'CacheExpirations': 0}
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated bytes held by cached tasks."""
+        return self._bytes
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return the cached task if it is within the staleness bound, otherwise read it through."""
+        task = self._lookup(task_id)
+        if task is not None:
+            return task
+
+        task = self.repository.get_task(task_id)
+        if task is not None:
+            self._store(task)
+        return task
+
+    def get_task_version(self, task_id: str) -> Optional[int]:
+        """Return the cached task's version if it is within the staleness bound, otherwise read only the version."""
+        task = self._lookup(task_id)
+        if task is not None:
+            return task.version
+        return self.repository.get_task_version(task_id)
+
+    def list_tasks(
+        self,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[Task], Optional[str]]:
+        """List tasks from the underlying repository; pages are not cached."""
+        return self.repository.list_tasks(limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort)
+
+    def get_task_fields(self, task_id: str, fields: List[str]) -> Optional[PartialTask]:
+        """Select fields from a fresh cached task, otherwise read only those fields; projections are not cached."""
+        task = self._lookup(task_id)
+        if task is not None:
+            return PartialTask.from_task(task, fields)
+        return self.repository.get_task_fields(task_id, fields)
+
+    def list_task_fields(
+        self,
+        fields: List[str],
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[PartialTask], Optional[str]]:
+        """List task fields from the underlying repository; pages are not cached."""
+        return self.repository.list_task_fields(fields, limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort)
+
+    def scan_tasks(self, page_size: int = 100) -> Iterator[List[Task]]:
+        """Read every task from the underlying repository; pages are not cached."""
+        return self.repository.scan_tasks(page_size)
+
+    def get_dependency_graph(self, task_ids: List[str]) -> Dict[str, List[str]]:
+        """Load the dependency subgraph from the underlying repository."""
+        return self.repository.get_dependency_graph(task_ids)
+
+    def create_task(self, task: Task, outbox_event: Optional[TaskEvent] = None) -> Task:
+        """Create a task, invalidating any entry for its ID."""
+        self.invalidate(task.task_id)
+        return self.repository.create_task(task, outbox_event=outbox_event)
+
+    def create_tasks(self, tasks: List[Task], outbox_events: Optional[Dict[str, TaskEvent]] = None) -> Dict[str, Exception]:
+        """Create many tasks, invalidating any entries for their IDs."""
+        for task in tasks:
+            self.invalidate(task.task_id)
+        return self.repository.create_tasks(tasks, outbox_events=outbox_events)
+
+    def update_task(self, task: Task, expected_version: int, outbox_event: Optional[TaskEvent] = None) -> Task:
+        """Update a task and cache the version written."""
+        self.invalidate(task.task_id)
+        with self._caching_conflicts():
+            updated_task = self.repository.update_task(task, expected_version, outbox_event=outbox_event)
+        self._store(updated_task)
+        return updated_task
+
+    def patch_task(
+        self,
+        task_id: str,
+        patch: TaskPatch,
+        expected_version: int,
+        allowed_statuses: Optional[List[TaskStatus]] = None,
+        build_outbox_event: Optional[Callable[[Task], TaskEvent]] = None,
+        known_task: Optional[Task] = None,
+    ) -> Task:
+        """
+        Patch a task in the underlying repository and cache the version written.
+
+        The cached task, even past its staleness bound, is passed on as the known task: the
+        underlying repository still checks the stored version, so an old entry costs nothing.
+        """
+        if known_task is None:
+            with self._lock:
+                entry = self._entries.get(task_id)
+            known_task = entry.task if entry is not None else None
+        self.invalidate(task_id)
+        with self._caching_conflicts():
+            updated_task = self.repository.patch_task(task_id, patch, expected_version, allowed_statuses, build_outbox_event, known_task)
+        self._store(updated_task)
+        return updated_task
+
+    def delete_task(self, task_id: str, version: int, outbox_event: Optional[TaskEvent] = None) -> None:
+        """Delete a task, invalidating its entry."""
+        self.invalidate(task_id)
+        with self._caching_conflicts():
+            self.repository.delete_task(task_id, version, outbox_event=outbox_event)
+
+    def invalidate(self, task_id: str) -> None:
+        """Drop the cached entry for a task, if any."""
+        with self._lock:
+            if task_id in self._entries:
+                self._remove(task_id)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters and current occupancy."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+        }
+
+    def publish_metrics(self) -> None:
+        """Add counter increments since the last call, plus current occupancy, to the metrics the handler flushes."""
+        counters = {'CacheHits': self.hits, 'CacheMisses': self.misses, 'CacheEvictions': self.evictions, 'CacheExpirations': self.expirations}
+        if counters == self._published:
+            return
+        for name, value in counters.items():
+            metrics.add_metric(name=name, unit=MetricUnit.Count, value=value - self._published[name])
+        metrics.add_metric(name='CacheEntries', unit=MetricUnit.Count, value=len(self._entries))
+        metrics.add_metric(name='CacheBytes', unit=MetricUnit.Bytes, value=self._bytes)
+        self._published = counters
+
+    def _store(self, task: Task) -> None:
+        """Cache a task unless a newer version is already cached, then evict down to the budgets."""
+        size = task_size(task)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            current = self._entries.get(task.task_id)
+            if current is not None:
+                if current.task.version > task.version:
+                    return
+                self._remove(task.task_id)
+
+            self._entries[task.task_id] = _CacheEntry(task=task, size=size, expires_at=self.clock() + self.max_staleness_seconds)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                evicted_id, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+                logger.debug(f'Evicted task from cache: {evicted_id}')
+
+    def _lookup(self, task_id: str) -> Optional[Task]:
+        """Return the cached task if it is within the staleness bound, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is not None:
+                if entry.expires_at > self.clock():
+                    self._entries.move_to_end(task_id)
+                    self.hits += 1
+                    return entry.task
+                self._remove(task_id)
+                self.expirations += 1
+            self.misses += 1
+        return None
+
+    def _remove(self, task_id: str) -> None:
+        self._bytes -= self._entries.pop(task_id).size
+
+    @contextmanager
+    def _caching_conflicts(self) -> Iterator[None]:
+        """Cache the current task attached to a ConflictError before it propagates."""
+        try:
+            yield
+        except ConflictError as e:
+            if e.current_task:
+                self._store(Task.model_validate(e.current_task))
+            raise
@@ -0,0 +1,147 @@
+"""
+Opaque pagination cursors for DynamoDB reads.
+
+A cursor records where each segment of a read stopped: one segment for a Query or a plain
+Scan, several for a parallel Scan. Only the key values are stored, in the order of the key
+attributes the caller passes in, so the token neither repeats attribute names and type
+descriptors nor exposes the table's key layout.
+
+Version 1 layout, base64url-encoded without padding:
+
+    version | total_segments | segment count | per segment: segment, value count, values
+
+Integers are unsigned LEB128 varints. Each value is a tag byte followed by either 16 UUID
+bytes (canonical lowercase UUID strings, such as task IDs) or a varint length and UTF-8 bytes.
+A segment with no values has not been read yet; finished segments are left out.
+"""
+
+import base64
+import binascii
+import uuid
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CURSOR_VERSION = 1
+
+_TAG_STRING = 0
+_TAG_UUID = 1
+
+
+def encode_cursor(positions: Dict[int, Optional[dict]], key_attributes: Sequence[str], total_segments: int = 1) -> Optional[str]:
+    """
+    Encode per-segment read positions as an opaque token.
+
+    Args:
+        positions: Segment number -> LastEvaluatedKey to resume after, or None for a segment not read yet;
+            finished segments are omitted
+        key_attributes: Key attributes of the table or index, all of string type
+        total_segments: Number of segments the read is split into
+
+    Returns:
+        The token, or None when every segment is finished
+    """
+    if not positions:
+        return None
+
+    buffer = bytearray([CURSOR_VERSION])
+    _write_varint(buffer, total_segments)
+    _write_varint(buffer, len(positions))
+    for segment, last_key in sorted(positions.items()):
+        _write_varint(buffer, segment)
+        if last_key is None:
+            _write_varint(buffer, 0)
+            continue
+        _write_varint(buffer, len(key_attributes))
+        for attribute in key_attributes:
+            _write_value(buffer, last_key[attribute]['S'])
+    return base64.urlsafe_b64encode(bytes(buffer)).rstrip(b'=').decode('ascii')
+
+
+def decode_cursor(token: str, key_attributes: Sequence[str]) -> Tuple[int, Dict[int, Optional[dict]]]:
+    """
+    Decode a token from encode_cursor.
+
+    Returns:
+        Total segments and the per-segment positions, with ExclusiveStartKey maps as keys
+
+    Raises:
+        ValueError: The token is malformed, from another cursor version or for a different key layout
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        if not data or data[0] != CURSOR_VERSION:
+            raise ValueError('unsupported cursor version')
+
+        offset = 1
+        total_segments, offset = _read_varint(data, offset)
+        count, offset = _read_varint(data, offset)
+        positions: Dict[int, Optional[dict]] = {}
+        for _ in range(count):
+            segment, offset = _read_varint(data, offset)
+            value_count, offset = _read_varint(data, offset)
+            if segment >= total_segments or segment in positions or value_count not in (0, len(key_attributes)):
+                raise ValueError('cursor does not match the read')
+
+            values: List[str] = []
+            for _ in range(value_count):
+                value, offset = _read_value(data, offset)
+                values.append(value)
+            positions[segment] = {attribute: {'S': value} for attribute, value in zip(key_attributes, values, strict=True)} if values else None
+
+        if offset != len(data) or not positions:
+            raise ValueError('trailing or missing cursor data')
+        return total_segments, positions
+    except (ValueError, IndexError, binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError('Invalid pagination token') from e
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+        if shift > 63:
+            raise ValueError('varint too long')
+
+
+def _write_value(buffer: bytearray, value: str) -> None:
+    if len(value) == 36:
+        try:
+            parsed = uuid.UUID(value)
+        except ValueError:
+            parsed = None
+        # Only canonical lowercase strings decode back to the same value
+        if parsed is not None and str(parsed) == value:
+            buffer.append(_TAG_UUID)
+            buffer += parsed.bytes
+            return
+
+    encoded = value.encode('utf-8')
+    buffer.append(_TAG_STRING)
+    _write_varint(buffer, len(encoded))
+    buffer += encoded
+
+
+def _read_value(data: bytes, offset: int) -> Tuple[str, int]:
+    tag = data[offset]
+    offset += 1
+    if tag == _TAG_UUID:
+        if offset + 16 > len(data):
+            raise ValueError('truncated UUID')
+        return str(uuid.UUID(bytes=data[offset : offset + 16])), offset + 16
+    if tag != _TAG_STRING:
+        raise ValueError('unknown value tag')
+    length, offset = _read_varint(data, offset)
+    if offset + length > len(data):
+        raise ValueError('truncated string')
+    return data[offset : offset + length].decode('utf-8'), offset + length
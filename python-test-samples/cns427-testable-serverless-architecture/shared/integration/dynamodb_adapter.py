@@ -1,38 +1,123 @@
 """DynamoDB adapter for task persistence."""
 
-import json
 import os
-from datetime import datetime
-from typing import List, Optional
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-import boto3
 from aws_lambda_powertools import Logger
-from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
 
 from services.task_service.domain.exceptions import ConflictError, RepositoryError, ResourceNotFoundError, ThrottlingError
-from services.task_service.models.task import Task
+from services.task_service.models.task import PartialTask, Task, TaskEvent, TaskPatch, TaskPriority, TaskSortOrder, TaskStatus
+from shared.integration.cursors import decode_cursor, encode_cursor
 from shared.integration.interfaces import TaskRepository
+from shared.integration.outbox import outbox_item
+from shared.integration.retry_policy import AdaptiveRateLimiter, RetryingClient, RetryPolicy
+from shared.integration.task_codec import decode_partial_task, decode_task, decode_tasks, encode_task, projection, status_priority_key
 
 logger = Logger()
 
-# Initialize AWS clients at module level
+# AWS clients are created on first use: importing boto3 and building a client are a large
+# share of cold-start INIT time, and requests that fail validation never need them
 AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
-dynamodb = boto3.client('dynamodb', region_name=AWS_REGION)
+_dynamodb_client = None
+_retry_policy = None
 
-# Type serializer/deserializer for DynamoDB client
-_serializer = TypeSerializer()
-_deserializer = TypeDeserializer()
+# Type serializer/deserializer for DynamoDB client, also created on first use
+_serializer = None
+_deserializer = None
+
+# DynamoDB API limits
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+TRANSACT_MAX_ITEMS = 100
+UNPROCESSED_RETRY_ATTEMPTS = 5
+UNPROCESSED_BASE_DELAY = 0.05
+
+# Global secondary indexes on the tasks table (defined in TaskApiCoreStack), all sorted by created_at
+STATUS_INDEX = 'status-created_at-index'
+PRIORITY_INDEX = 'priority-created_at-index'
+STATUS_PRIORITY_INDEX = 'status_priority-created_at-index'
+TABLE_KEY_ATTRIBUTES = ('task_id',)
+# (status, priority) assumed for the unpatched half of the status + priority key: the values new tasks start with
+DEFAULT_INDEX_PARTS = (TaskStatus.PENDING, TaskPriority.MEDIUM)
+
+# Pages each parallel scan segment may have queued ahead of the consumer
+SCAN_PAGES_PER_SEGMENT = 2
 
 
 # Helper functions
+def get_dynamodb_client():
+    """
+    Return the shared low-level DynamoDB client, creating it on first use.
+
+    The SDK's own retries are turned off: repositories wrap the client with the retry policy.
+    """
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        import boto3
+        from botocore.config import Config
+
+        _dynamodb_client = boto3.client('dynamodb', region_name=AWS_REGION, config=Config(retries={'total_max_attempts': 1}))
+    return _dynamodb_client
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Return the container's DynamoDB retry policy, configured by the environment on first use.
+
+    DYNAMODB_MAX_ATTEMPTS, DYNAMODB_RETRY_BASE_DELAY_MS and DYNAMODB_RETRY_MAX_DELAY_MS tune the
+    backoff; DYNAMODB_ADAPTIVE_RATE_LIMIT=false turns off client-side rate limiting.
+    """
+    global _retry_policy
+    if _retry_policy is None:
+        adaptive = os.environ.get('DYNAMODB_ADAPTIVE_RATE_LIMIT', 'true').lower() != 'false'
+        _retry_policy = RetryPolicy(
+            max_attempts=int(os.environ.get('DYNAMODB_MAX_ATTEMPTS', '4')),
+            base_delay=int(os.environ.get('DYNAMODB_RETRY_BASE_DELAY_MS', '25')) / 1000,
+            max_delay=int(os.environ.get('DYNAMODB_RETRY_MAX_DELAY_MS', '1000')) / 1000,
+            rate_limiter=AdaptiveRateLimiter() if adaptive else None,
+        )
+    return _retry_policy
+
+
+@contextmanager
+def retry_policy_invocation(context) -> Iterator[RetryPolicy]:
+    """
+    Bound DynamoDB retries by the Lambda invocation's remaining time, publishing the retry counters when it ends.
+
+    Handlers whose repositories or stores wrap the client with get_retry_policy() run each invocation inside it.
+    """
+    retry_policy = get_retry_policy()
+    retry_policy.begin_invocation(getattr(context, 'get_remaining_time_in_millis', None))
+    try:
+        yield retry_policy
+    finally:
+        retry_policy.publish_metrics()
+
+
 def python_to_dynamo(python_object: dict) -> dict:
     """Convert Python dict to DynamoDB format."""
+    global _serializer
+    if _serializer is None:
+        from boto3.dynamodb.types import TypeSerializer
+
+        _serializer = TypeSerializer()
     return {k: _serializer.serialize(v) for k, v in python_object.items()}
 
 
 def dynamo_to_python(dynamo_object: dict) -> dict:
     """Convert DynamoDB format to Python dict."""
+    global _deserializer
+    if _deserializer is None:
+        from boto3.dynamodb.types import TypeDeserializer
+
+        _deserializer = TypeDeserializer()
     return {k: _deserializer.deserialize(v) for k, v in dynamo_object.items()}
 
 
@@ -50,31 +135,201 @@ def _handle_dynamodb_error(e: ClientError, operation: str, current_task: Optiona
         raise ThrottlingError(f'DynamoDB request timeout during {operation}: {error_code}') from e
     elif error_code == 'ConditionalCheckFailedException':
         raise ConflictError('The resource has been updated by another process. Please refresh and try again.', current_task=current_task) from e
+    elif error_code == 'TransactionCanceledException':
+        reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+        if 'ConditionalCheckFailed' in reasons:
+            raise ConflictError('The resource has been updated by another process. Please refresh and try again.', current_task=current_task) from e
+        if 'ThrottlingError' in reasons or 'TransactionConflict' in reasons:
+            raise ThrottlingError(f'DynamoDB transaction contention during {operation}: {reasons}') from e
+        raise RepositoryError(f'DynamoDB transaction cancelled during {operation}: {reasons}') from e
+    elif error_code == 'TransactionConflictException':
+        raise ThrottlingError(f'DynamoDB transaction contention during {operation}: {error_code}') from e
     else:
         raise RepositoryError(f'Database error during {operation}: {error_code}') from e
 
 
+def _hand_over(pages: queue.Queue, entry, stopped: threading.Event) -> bool:
+    """Put an entry on a bounded queue, giving up once the consumer has stopped."""
+    while not stopped.is_set():
+        try:
+            pages.put(entry, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _scan_segment(scan: Callable[..., dict], request_kwargs: dict, pages: queue.Queue, stopped: threading.Event) -> None:
+    """
+    Scan one parallel scan segment to its end, handing each page of items to the consumer.
+
+    Ends with None on success or the exception that stopped the scan.
+    """
+    try:
+        while True:
+            response = scan(**request_kwargs)
+            if response.get('Items') and not _hand_over(pages, response['Items'], stopped):
+                return
+            if 'LastEvaluatedKey' not in response:
+                break
+            request_kwargs = {**request_kwargs, 'ExclusiveStartKey': response['LastEvaluatedKey']}
+        _hand_over(pages, None, stopped)
+    except Exception as e:
+        _hand_over(pages, e, stopped)
+
+
+def _linked_components(tasks: List[Task]) -> List[List[Task]]:
+    """Group tasks into connected components of the dependency edges between them (union-find)."""
+    parent = {task.task_id: task.task_id for task in tasks}
+
+    def find(task_id: str) -> str:
+        while parent[task_id] != task_id:
+            parent[task_id] = parent[parent[task_id]]
+            task_id = parent[task_id]
+        return task_id
+
+    for task in tasks:
+        for dep_id in task.dependencies:
+            if dep_id in parent:
+                parent[find(task.task_id)] = find(dep_id)
+
+    components: Dict[str, List[Task]] = {}
+    for task in tasks:
+        components.setdefault(find(task.task_id), []).append(task)
+    return list(components.values())
+
+
+def _is_condition_check_failure(e: ClientError) -> bool:
+    """Whether a write failed its condition, directly or inside a cancelled transaction."""
+    error_code = e.response['Error']['Code']
+    if error_code == 'ConditionalCheckFailedException':
+        return True
+    return error_code == 'TransactionCanceledException' and any(
+        reason.get('Code') == 'ConditionalCheckFailed' for reason in e.response.get('CancellationReasons', [])
+    )
+
+
+def _condition_check_item(e: ClientError) -> Optional[dict]:
+    """Return the current item attached to a failed condition check (ReturnValuesOnConditionCheckFailure=ALL_OLD)."""
+    if 'Item' in e.response:
+        return e.response['Item']
+    for reason in e.response.get('CancellationReasons', []):
+        if reason.get('Code') == 'ConditionalCheckFailed' and 'Item' in reason:
+            return reason['Item']
+    return None
+
+
+def _assumed_stale_index_part(patch: TaskPatch, assumed: Tuple[TaskStatus, TaskPriority], stored: Task) -> bool:
+    """Whether a status-only or priority-only patch assumed the wrong value for the unpatched half of the status + priority key."""
+    if (patch.status is None) == (patch.priority is None):
+        return False
+    if patch.status is None:
+        return stored.status != assumed[0]
+    return stored.priority != assumed[1]
+
+
+def _add_index_part_clauses(
+    patch: TaskPatch, current_index_parts: Tuple[TaskStatus, TaskPriority], set_clauses: List[str], conditions: List[str], names: dict, values: dict
+) -> None:
+    """Add the status and priority changes of a patch and the status + priority key they produce, requiring any unpatched half."""
+    current_status, current_priority = current_index_parts
+    names['#status'] = 'status'
+    if patch.status is not None:
+        set_clauses.append('#status = :status')
+        values[':status'] = patch.status.value
+    else:
+        conditions.append('#status = :current_status')
+        values[':current_status'] = current_status.value
+    if patch.priority is not None:
+        set_clauses.append('priority = :priority')
+        values[':priority'] = patch.priority.value
+    else:
+        conditions.append('priority = :current_priority')
+        values[':current_priority'] = current_priority.value
+    set_clauses.append('status_priority = :status_priority')
+    values[':status_priority'] = status_priority_key(patch.status or current_status, patch.priority or current_priority)
+
+
+def _status_in_condition(allowed_statuses: List[TaskStatus], values: dict) -> str:
+    """Build a '#status IN (...)' condition, adding its placeholder values to values."""
+    placeholders = []
+    for index, status in enumerate(allowed_statuses):
+        values[f':from_status_{index}'] = status.value
+        placeholders.append(f':from_status_{index}')
+    # An empty IN list is invalid; no allowed source status means no task can match
+    return f'#status IN ({", ".join(placeholders)})' if placeholders else 'attribute_not_exists(task_id)'
+
+
 class DynamoDBTaskRepository(TaskRepository):
-    """DynamoDB implementation of TaskRepository."""
+    """
+    DynamoDB implementation of TaskRepository.
+
+    When graph_table_name is set, the repository also maintains a dependency-graph index:
+    one small item per task holding its adjacency (depends_on) and reverse adjacency (dependents)
+    as string sets. Index items are written in the same TransactWriteItems call as the task,
+    so cycle checks can read the compact index instead of full task items. Tasks stored
+    before the index was enabled are added to it with backfill_graph_index.
+
+    Listings filtered by both status and priority query the status_priority index. Tasks
+    stored before that attribute existed are missing from it until backfill_status_priority
+    has run; until then status_priority_index is False and such listings query the status
+    index with a priority filter instead.
+
+    When outbox_table_name is set, write methods accept an outbox event that is stored in
+    the outbox table within the same transaction as the task mutation (transactional outbox).
+
+    When scan_segments is above 1, unfiltered listings and scan_tasks read the table as a
+    parallel Scan split into that many segments, one thread per segment.
 
-    def __init__(self, table_name: str):
+    Calls through the shared client are retried by retry_policy (the container's policy from
+    get_retry_policy by default), so throttling is absorbed here before it becomes a 503.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        graph_table_name: Optional[str] = None,
+        outbox_table_name: Optional[str] = None,
+        scan_segments: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
+        status_priority_index: bool = True,
+    ):
         """Initialize DynamoDB repository."""
+        if scan_segments < 1:
+            raise ValueError('scan_segments must be at least 1')
         self.table_name = table_name
-        self.dynamodb = dynamodb
+        self.graph_table_name = graph_table_name
+        self.outbox_table_name = outbox_table_name
+        self.scan_segments = scan_segments
+        self.retry_policy = retry_policy
+        self.status_priority_index = status_priority_index
+        self._dynamodb = None
+
+    @property
+    def dynamodb(self):
+        """Low-level DynamoDB client; the shared client, wrapped with the retry policy, is created on first use unless one was injected."""
+        if self._dynamodb is None:
+            self._dynamodb = RetryingClient(get_dynamodb_client(), self.retry_policy or get_retry_policy())
+        return self._dynamodb
 
-    def create_task(self, task: Task) -> Task:
+    @dynamodb.setter
+    def dynamodb(self, client) -> None:
+        self._dynamodb = client
+
+    def create_task(self, task: Task, outbox_event: Optional[TaskEvent] = None) -> Task:
         """Create a new task in DynamoDB."""
         try:
-            # Convert Task to dict with enum values as strings
-            item = task.model_dump(mode='json')
-            # Convert datetime objects to ISO format strings
-            item['created_at'] = task.created_at.isoformat()
-            item['updated_at'] = task.updated_at.isoformat()
+            # Use condition to prevent overwriting existing task
+            put = {'TableName': self.table_name, 'Item': encode_task(task), 'ConditionExpression': 'attribute_not_exists(task_id)'}
 
-            dynamo_item = python_to_dynamo(item)
+            transact_items = self._outbox_puts([outbox_event] if outbox_event else [])
+            if self.graph_table_name and task.dependencies:
+                transact_items += self._graph_index_updates({task.task_id: (set(), set(task.dependencies))})
 
-            # Use condition to prevent overwriting existing task
-            self.dynamodb.put_item(TableName=self.table_name, Item=dynamo_item, ConditionExpression='attribute_not_exists(task_id)')
+            if transact_items:
+                self._transact_write([{'Put': put}] + transact_items)
+            else:
+                self.dynamodb.put_item(**put)
 
             logger.info(f'Created task: {task.task_id}')
             return task
@@ -83,6 +338,98 @@ class DynamoDBTaskRepository(TaskRepository):
             _handle_dynamodb_error(e, 'create_task')
             raise  # This line is unreachable but satisfies type checker
 
+    def create_tasks(self, tasks: List[Task], outbox_events: Optional[Dict[str, TaskEvent]] = None) -> Dict[str, Exception]:
+        """
+        Create many new tasks with as few DynamoDB calls as possible.
+
+        Tasks linked by dependencies inside the batch are grouped into connected components,
+        and each component is written atomically with one TransactWriteItems call, so a task
+        is never stored without the batch tasks it depends on. Tasks that need no transaction
+        are written with BatchWriteItem in chunks of 25.
+
+        With outbox events (task_id -> event), every task must be written together with its
+        outbox record, so independent tasks are packed into transactions instead.
+
+        A component whose transaction would exceed the item limit (a task, its outbox record
+        and its graph index items each count) is rejected without writing it, with a
+        ValueError naming the component; the other components are still written.
+
+        Returns:
+            Mapping of task_id -> domain error for every task that was not created
+        """
+        failures: Dict[str, Exception] = {}
+        independent: List[Task] = []
+        for component in _linked_components(tasks):
+            needs_index = self.graph_table_name is not None and any(task.dependencies for task in component)
+            if len(component) == 1 and not needs_index:
+                independent.append(component[0])
+            else:
+                self._create_component(component, failures, outbox_events)
+
+        if outbox_events:
+            # Two transaction items per task: the task and its outbox record
+            chunk_size = TRANSACT_MAX_ITEMS // 2
+            for start in range(0, len(independent), chunk_size):
+                self._create_component(independent[start : start + chunk_size], failures, outbox_events)
+        else:
+            for start in range(0, len(independent), BATCH_WRITE_MAX_ITEMS):
+                self._batch_put(independent[start : start + BATCH_WRITE_MAX_ITEMS], failures)
+
+        logger.info(f'Created {len(tasks) - len(failures)} of {len(tasks)} tasks in batch')
+        return failures
+
+    def _create_component(self, component: List[Task], failures: Dict[str, Exception], outbox_events: Optional[Dict[str, TaskEvent]] = None) -> None:
+        """Write a group of tasks, with their graph index items and outbox records, in one transaction."""
+        try:
+            transact_items: List[dict] = [
+                {'Put': {'TableName': self.table_name, 'Item': encode_task(task), 'ConditionExpression': 'attribute_not_exists(task_id)'}}
+                for task in component
+            ]
+            if outbox_events:
+                transact_items += self._outbox_puts([outbox_events[task.task_id] for task in component if task.task_id in outbox_events])
+            if self.graph_table_name:
+                transact_items += self._graph_index_updates(
+                    {task.task_id: (set(), set(task.dependencies)) for task in component if task.dependencies}
+                )
+            if len(transact_items) > TRANSACT_MAX_ITEMS:
+                raise ValueError(
+                    f'The {len(component)} tasks linked by dependencies to task {component[0].task_id} need {len(transact_items)} writes '
+                    f'in one transaction, over the limit of {TRANSACT_MAX_ITEMS}; create them in smaller linked groups'
+                )
+
+            try:
+                self._transact_write(transact_items)
+            except ClientError as e:
+                _handle_dynamodb_error(e, 'create_tasks')
+        except Exception as e:
+            for task in component:
+                failures[task.task_id] = e
+
+    def _batch_put(self, chunk: List[Task], failures: Dict[str, Exception]) -> None:
+        """Write up to 25 independent tasks with BatchWriteItem, retrying unprocessed items."""
+        # BatchWriteItem cannot carry conditions; task IDs are freshly generated UUIDs so overwrites are not a concern
+        request_items = {self.table_name: [{'PutRequest': {'Item': encode_task(task)}} for task in chunk]}
+
+        try:
+            try:
+                for attempt in range(UNPROCESSED_RETRY_ATTEMPTS):
+                    response = self.dynamodb.batch_write_item(RequestItems=request_items)
+                    request_items = response.get('UnprocessedItems') or {}
+                    if not request_items:
+                        return
+                    time.sleep(UNPROCESSED_BASE_DELAY * (2**attempt))
+            except ClientError as e:
+                _handle_dynamodb_error(e, 'create_tasks')
+        except Exception as e:
+            for task in chunk:
+                failures[task.task_id] = e
+            return
+
+        unprocessed_ids = {request['PutRequest']['Item']['task_id']['S'] for request in request_items.get(self.table_name, [])}
+        error = ThrottlingError(f'DynamoDB left items unprocessed after {UNPROCESSED_RETRY_ATTEMPTS} attempts during create_tasks')
+        for task_id in unprocessed_ids:
+            failures[task_id] = error
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Retrieve a task by ID from DynamoDB."""
         try:
@@ -93,120 +440,288 @@ class DynamoDBTaskRepository(TaskRepository):
                 logger.info(f'Task not found: {task_id}')
                 return None
 
-            item = dynamo_to_python(response['Item'])
-            # Convert ISO strings back to datetime objects
-            item['created_at'] = datetime.fromisoformat(item['created_at'])
-            item['updated_at'] = datetime.fromisoformat(item['updated_at'])
-            return Task(**item)
+            return decode_task(response['Item'])
 
         except ClientError as e:
             _handle_dynamodb_error(e, 'get_task')
             raise  # This line is unreachable but satisfies type checker
 
-    def list_tasks(self, limit: int = 50, next_token: Optional[str] = None) -> tuple[List[Task], Optional[str]]:
-        """List tasks with pagination."""
+    def get_task_version(self, task_id: str) -> Optional[int]:
+        """Read only the version attribute of a task, so unchanged tasks are not transferred or decoded."""
         try:
-            scan_kwargs = {'TableName': self.table_name, 'Limit': limit}
+            response = self.dynamodb.get_item(
+                TableName=self.table_name,
+                Key={'task_id': {'S': task_id}},
+                ProjectionExpression='#version',
+                ExpressionAttributeNames={'#version': 'version'},
+            )
+            if 'Item' not in response:
+                return None
+            return int(response['Item']['version']['N'])
 
-            if next_token:
-                scan_kwargs['ExclusiveStartKey'] = json.loads(next_token)
+        except ClientError as e:
+            _handle_dynamodb_error(e, 'get_task_version')
+            raise  # This line is unreachable but satisfies type checker
+
+    def get_task_fields(self, task_id: str, fields: List[str]) -> Optional[PartialTask]:
+        """Retrieve only the given fields of a task, read with a ProjectionExpression."""
+        try:
+            response = self.dynamodb.get_item(TableName=self.table_name, Key={'task_id': {'S': task_id}}, **projection(fields))
+            if 'Item' not in response:
+                logger.info(f'Task not found: {task_id}')
+                return None
+            return decode_partial_task(response['Item'])
+
+        except ClientError as e:
+            _handle_dynamodb_error(e, 'get_task')
+            raise  # This line is unreachable but satisfies type checker
 
-            response = self.dynamodb.scan(**scan_kwargs)
+    def list_tasks(
+        self,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[Task], Optional[str]]:
+        """
+        List tasks with pagination.
 
-            tasks = []
-            for dynamo_item in response.get('Items', []):
-                item = dynamo_to_python(dynamo_item)
-                # Convert ISO strings back to datetime objects
-                item['created_at'] = datetime.fromisoformat(item['created_at'])
-                item['updated_at'] = datetime.fromisoformat(item['updated_at'])
-                tasks.append(Task(**item))
+        Status and/or priority filters are served by a Query on the matching GSI, with
+        created_after as a key condition on the created_at sort key, so a page only
+        consumes capacity for matching rows. Without those filters the table is scanned.
+        """
+        items, next_page_token = self._list_items(limit, next_token, status, priority, created_after, sort)
+        tasks = decode_tasks(items)
+        logger.info(f'Listed {len(tasks)} tasks')
+        return tasks, next_page_token
 
-            # Handle pagination
-            next_token_result: Optional[str] = None
-            if 'LastEvaluatedKey' in response:
-                next_token_result = json.dumps(response['LastEvaluatedKey'])
+    def list_task_fields(
+        self,
+        fields: List[str],
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[PartialTask], Optional[str]]:
+        """List only the given fields of tasks, read with a ProjectionExpression; see list_tasks."""
+        items, next_page_token = self._list_items(limit, next_token, status, priority, created_after, sort, fields=fields)
+        tasks = [decode_partial_task(item) for item in items]
+        logger.info(f'Listed {len(tasks)} partial tasks')
+        return tasks, next_page_token
 
-            logger.info(f'Listed {len(tasks)} tasks')
-            return tasks, next_token_result
+    def _list_items(
+        self,
+        limit: int,
+        next_token: Optional[str],
+        status: Optional[TaskStatus],
+        priority: Optional[TaskPriority],
+        created_after: Optional[datetime],
+        sort: Optional[TaskSortOrder],
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Read one page of raw items for list_tasks and list_task_fields, returning them with the next page token."""
+        try:
+            if status is not None or priority is not None:
+                request_kwargs = self._build_index_query(limit, status, priority, created_after, sort)
+                key_attributes: Tuple[str, ...] = (request_kwargs['ExpressionAttributeNames']['#pk'], 'created_at', 'task_id')
+                operation = self.dynamodb.query
+                total_segments = 1
+            else:
+                if sort is not None:
+                    raise ValueError('Sorting requires a status or priority filter')
+                request_kwargs = {'TableName': self.table_name, 'Limit': limit}
+                if created_after is not None:
+                    # Not index-backed: the scan still reads every item, only the response is filtered
+                    request_kwargs['FilterExpression'] = 'created_at > :created_after'
+                    request_kwargs['ExpressionAttributeValues'] = {':created_after': {'S': created_after.astimezone(UTC).isoformat()}}
+                key_attributes = TABLE_KEY_ATTRIBUTES
+                operation = self.dynamodb.scan
+                total_segments = self.scan_segments
+
+            if next_token:
+                # A walk keeps the segment count it started with
+                total_segments, positions = decode_cursor(next_token, key_attributes)
+                if total_segments > 1 and 'IndexName' in request_kwargs:
+                    raise ValueError('Invalid pagination token')
+            else:
+                positions = dict.fromkeys(range(total_segments))
+
+            if fields is not None:
+                projected = projection(fields)
+                request_kwargs['ProjectionExpression'] = projected['ProjectionExpression']
+                request_kwargs['ExpressionAttributeNames'] = {
+                    **request_kwargs.get('ExpressionAttributeNames', {}),
+                    **projected['ExpressionAttributeNames'],
+                }
+
+            items, positions = self._read_segments(operation, request_kwargs, positions, total_segments)
+            return items, encode_cursor(positions, key_attributes, total_segments)
 
         except ClientError as e:
             _handle_dynamodb_error(e, 'list_tasks')
             raise  # This line is unreachable but satisfies type checker
 
-    def update_task(self, task: Task, expected_version: int) -> Task:
+    def scan_tasks(self, page_size: int = 100) -> Iterator[List[Task]]:
         """
-        Update an existing task with optimistic locking using conditional update.
-
-        Args:
-            task: The task object with updated fields and NEW version
-            expected_version: The OLD version to check against (for optimistic locking)
+        Read every task in the table, one page at a time, in no particular order.
 
-        Returns:
-            The updated task
+        With several scan segments each segment is scanned by its own thread and pages are
+        handed to the caller through a bounded queue, so memory use does not grow with the
+        table. Segment threads stop once the caller stops iterating.
         """
+        request_kwargs = {'TableName': self.table_name, 'Limit': page_size}
+        scan = self.dynamodb.scan
         try:
-            logger.debug(f'DynamoDB update_task called: task_id={task.task_id}, expected_version={expected_version}, new_version={task.version}')
+            if self.scan_segments == 1:
+                positions: Dict[int, Optional[dict]] = {0: None}
+                while positions:
+                    items, positions = self._read_segments(scan, request_kwargs, positions, 1)
+                    if items:
+                        yield decode_tasks(items)
+                return
+
+            pages: queue.Queue = queue.Queue(maxsize=SCAN_PAGES_PER_SEGMENT * self.scan_segments)
+            stopped = threading.Event()
+            with ThreadPoolExecutor(max_workers=self.scan_segments, thread_name_prefix='scan-segment') as executor:
+                try:
+                    for segment in range(self.scan_segments):
+                        segment_kwargs = {**request_kwargs, 'Segment': segment, 'TotalSegments': self.scan_segments}
+                        executor.submit(_scan_segment, scan, segment_kwargs, pages, stopped)
 
-            # Build update expression dynamically
-            update_expression_parts = []
-            expression_attribute_values: dict = {}
-            expression_attribute_names: dict = {}
+                    remaining = self.scan_segments
+                    while remaining:
+                        entry = pages.get()
+                        if entry is None:
+                            remaining -= 1
+                        elif isinstance(entry, Exception):
+                            raise entry
+                        else:
+                            yield decode_tasks(entry)
+                finally:
+                    stopped.set()
 
-            # Use the version and updated_at from the task object (set by domain service)
-            # Always update these fields
-            update_expression_parts.append('#updated_at = :updated_at')
-            expression_attribute_names['#updated_at'] = 'updated_at'
-            expression_attribute_values[':updated_at'] = task.updated_at.isoformat()
+        except ClientError as e:
+            _handle_dynamodb_error(e, 'scan_tasks')
+            raise  # This line is unreachable but satisfies type checker
 
-            update_expression_parts.append('#version = :new_version')
-            expression_attribute_names['#version'] = 'version'
-            expression_attribute_values[':new_version'] = task.version  # NEW version from domain
+    def _read_segments(
+        self, operation: Callable[..., dict], request_kwargs: dict, positions: Dict[int, Optional[dict]], total_segments: int
+    ) -> Tuple[List[dict], Dict[int, Optional[dict]]]:
+        """
+        Read one page from the segments in positions, splitting the page limit between them.
 
-            logger.debug(f'Setting new version in DynamoDB: {task.version}')
+        Segments are read concurrently when there are several. At most `Limit` segments are
+        read, so every one gets a limit of at least 1; the rest keep their position.
 
-            # Update other fields
-            update_expression_parts.append('title = :title')
-            expression_attribute_values[':title'] = task.title
+        Returns:
+            The items read and the positions to continue from, without finished segments
+        """
+        limit = request_kwargs['Limit']
+        segments = sorted(positions)[:limit]
 
-            if task.description is not None:
-                update_expression_parts.append('description = :description')
-                expression_attribute_values[':description'] = task.description
+        def read(index: int, segment: int) -> dict:
+            segment_kwargs = {**request_kwargs, 'Limit': limit // len(segments) + (index < limit % len(segments))}
+            if total_segments > 1:
+                segment_kwargs['Segment'] = segment
+                segment_kwargs['TotalSegments'] = total_segments
+            if positions[segment] is not None:
+                segment_kwargs['ExclusiveStartKey'] = positions[segment]
+            return operation(**segment_kwargs)
 
-            # Status is a reserved keyword
-            update_expression_parts.append('#status = :status')
-            expression_attribute_names['#status'] = 'status'
-            expression_attribute_values[':status'] = task.status.value
+        if len(segments) == 1:
+            responses = [read(0, segments[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix='scan-segment') as executor:
+                responses = list(executor.map(read, range(len(segments)), segments))
 
-            update_expression_parts.append('priority = :priority')
-            expression_attribute_values[':priority'] = task.priority.value
+        items: List[dict] = []
+        next_positions = dict(positions)
+        for segment, response in zip(segments, responses, strict=True):
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' in response:
+                next_positions[segment] = response['LastEvaluatedKey']
+            else:
+                del next_positions[segment]
+        return items, next_positions
 
-            update_expression_parts.append('dependencies = :dependencies')
-            expression_attribute_values[':dependencies'] = task.dependencies
+    def _build_index_query(
+        self,
+        limit: int,
+        status: Optional[TaskStatus],
+        priority: Optional[TaskPriority],
+        created_after: Optional[datetime],
+        sort: Optional[TaskSortOrder],
+    ) -> dict:
+        """Build the Query parameters for the GSI that matches the given filters."""
+        filter_priority = None
+        if status is not None and priority is not None and self.status_priority_index:
+            index_name, partition_attribute, partition_value = STATUS_PRIORITY_INDEX, 'status_priority', status_priority_key(status, priority)
+        elif status is not None:
+            # Without a backfilled status_priority index, the priority is filtered after the read
+            index_name, partition_attribute, partition_value = STATUS_INDEX, 'status', status.value
+            filter_priority = priority
+        elif priority is not None:
+            index_name, partition_attribute, partition_value = PRIORITY_INDEX, 'priority', priority.value
+        else:
+            raise ValueError('An index query needs a status or priority filter')
 
-            # Build the complete update expression
-            update_expression = 'SET ' + ', '.join(update_expression_parts)
+        key_condition = '#pk = :pk'
+        expression_attribute_values = {':pk': {'S': partition_value}}
+        if created_after is not None:
+            key_condition += ' AND created_at > :created_after'
+            expression_attribute_values[':created_after'] = {'S': created_after.astimezone(UTC).isoformat()}
 
-            # Condition: check that current version matches expected version (OLD version)
-            condition_expression = '#version = :expected_version'
-            expression_attribute_values[':expected_version'] = expected_version
+        request_kwargs = {
+            'TableName': self.table_name,
+            'IndexName': index_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeNames': {'#pk': partition_attribute},
+            'ExpressionAttributeValues': expression_attribute_values,
+            'ScanIndexForward': sort != TaskSortOrder.CREATED_AT_DESC,
+            'Limit': limit,
+        }
+        if filter_priority is not None:
+            request_kwargs['FilterExpression'] = 'priority = :priority'
+            expression_attribute_values[':priority'] = {'S': filter_priority.value}
+        return request_kwargs
 
-            logger.debug(f'Condition: version must equal {expected_version}')
-            logger.debug(f'Update expression: {update_expression}')
+    def update_task(self, task: Task, expected_version: int, outbox_event: Optional[TaskEvent] = None) -> Task:
+        """
+        Update an existing task with optimistic locking using conditional update.
 
-            # Convert to DynamoDB format
-            key = python_to_dynamo({'task_id': task.task_id})
-            dynamo_expression_values = python_to_dynamo(expression_attribute_values)
+        Args:
+            task: The task object with updated fields and NEW version
+            expected_version: The OLD version to check against (for optimistic locking)
+            outbox_event: Event to store in the outbox within the same transaction
+
+        Returns:
+            The updated task
+        """
+        try:
+            logger.debug(f'DynamoDB update_task called: task_id={task.task_id}, expected_version={expected_version}, new_version={task.version}')
+
+            update = self._build_update(task, expected_version)
+
+            transact_items = self._outbox_puts([outbox_event] if outbox_event else [])
+            if self.graph_table_name:
+                old_dependencies = self._get_graph_dependencies(task.task_id)
+                new_dependencies = set(task.dependencies)
+                if old_dependencies != new_dependencies:
+                    logger.debug(f'Dependencies changed for task {task.task_id}, updating graph index in transaction')
+                    transact_items += self._graph_index_updates({task.task_id: (old_dependencies, new_dependencies)})
+
+            if transact_items:
+                self._transact_write([{'Update': update}] + transact_items)
+                logger.info(f'Updated task: {task.task_id}')
+                return task
 
             logger.debug(f'Calling DynamoDB update_item for task {task.task_id}')
 
-            self.dynamodb.update_item(
-                TableName=self.table_name,
-                Key=key,
-                UpdateExpression=update_expression,
-                ConditionExpression=condition_expression,
-                ExpressionAttributeNames=expression_attribute_names,
-                ExpressionAttributeValues=dynamo_expression_values,
-            )
+            self.dynamodb.update_item(**update)
 
             logger.info(f'Updated task: {task.task_id}')
             logger.debug(f'DynamoDB update successful for task {task.task_id}')
@@ -215,33 +730,485 @@ class DynamoDBTaskRepository(TaskRepository):
             return task
 
         except ClientError as e:
-            # For conflict errors, fetch current task state
+            # For conflict errors, the failed condition returns the current task state (ALL_OLD)
             current_task = None
-            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                try:
-                    current = self.get_task(task.task_id)
-                    if current:
-                        current_task = current.model_dump()
-                except Exception:
-                    pass  # If we can't get current task, proceed without it
+            old_item = _condition_check_item(e)
+            if old_item:
+                current_task = decode_task(old_item).model_dump()
             _handle_dynamodb_error(e, 'update_task', current_task=current_task)
             raise  # This line is unreachable but satisfies type checker
 
-    def delete_task(self, task_id: str, version: int) -> None:
-        """Delete a task with version check."""
+    def patch_task(
+        self,
+        task_id: str,
+        patch: TaskPatch,
+        expected_version: int,
+        allowed_statuses: Optional[List[TaskStatus]] = None,
+        build_outbox_event: Optional[Callable[[Task], TaskEvent]] = None,
+        known_task: Optional[Task] = None,
+    ) -> Task:
+        """
+        Apply field changes with a single conditional UpdateItem.
+
+        The version check and allowed status transitions are part of the ConditionExpression.
+        The updated task comes back via ReturnValues=ALL_NEW, and on a failed condition the
+        current item comes back via ReturnValuesOnConditionCheckFailure=ALL_OLD, so both the
+        happy path and the conflict path cost one call.
+
+        A patch of only status or only priority still rewrites the status + priority index key
+        in the same UpdateItem, with the unpatched half made part of the condition. That half is
+        taken from known_task when it has the expected version, which the caching repository
+        supplies from its entry. Without it the default value is assumed, and a task stored with
+        another value costs a second UpdateItem: the ALL_OLD item supplies the stored value and
+        the patch is written once more with it, so the key is never left stale.
+
+        Outbox writes and graph index changes need a transaction, which cannot return the
+        updated item; those fall back to reading the task first.
+        """
+        if build_outbox_event is not None or (self.graph_table_name and patch.dependencies is not None):
+            return super().patch_task(task_id, patch, expected_version, allowed_statuses, build_outbox_event, known_task)
+
+        current_index_parts = DEFAULT_INDEX_PARTS
+        if known_task is not None and known_task.version == expected_version:
+            current_index_parts = (known_task.status, known_task.priority)
+        current: Optional[Task] = None
+        for _ in range(2):
+            try:
+                response = self.dynamodb.update_item(**self._build_patch(task_id, patch, expected_version, allowed_statuses, current_index_parts))
+                logger.info(f'Patched task: {task_id}')
+                return decode_task(response['Attributes'])
+
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    _handle_dynamodb_error(e, 'patch_task')
+                    raise  # This line is unreachable but satisfies type checker
+                old_item = _condition_check_item(e)
+                if not old_item:
+                    raise ValueError(f'Task not found: {task_id}') from e
+                current = decode_task(old_item)
+                if current.version != expected_version:
+                    raise ConflictError(f'Task {task_id} was modified by another process', current_task=current.model_dump()) from e
+                if allowed_statuses is not None and patch.status is not None and current.status not in allowed_statuses:
+                    raise ValueError(f'Invalid status transition from {current.status.value} to {patch.status.value}') from e
+                if not _assumed_stale_index_part(patch, current_index_parts, current):
+                    raise ConflictError(f'Task {task_id} was modified by another process', current_task=current.model_dump()) from e
+                # Only the assumed half of the index key was wrong: write again with the stored value
+                current_index_parts = (current.status, current.priority)
+
+        raise ConflictError(f'Task {task_id} was modified by another process', current_task=current.model_dump() if current else None)
+
+    def _build_patch(
+        self,
+        task_id: str,
+        patch: TaskPatch,
+        expected_version: int,
+        allowed_statuses: Optional[List[TaskStatus]],
+        current_index_parts: Tuple[TaskStatus, TaskPriority] = DEFAULT_INDEX_PARTS,
+    ) -> dict:
+        """
+        Build the low-level UpdateItem parameters for a conditional patch.
+
+        current_index_parts is the (status, priority) the task is assumed to have; when the patch
+        changes only one of them, the other is taken from it and required by the condition.
+        """
+        set_clauses = ['updated_at = :updated_at', '#version = :new_version']
+        remove_clauses = []
+        names = {'#version': 'version'}
+        values: dict = {':updated_at': patch.updated_at.isoformat(), ':new_version': patch.version, ':expected_version': expected_version}
+        # attribute_exists keeps the update from creating a new item; status IN (...) enforces the transition rules
+        conditions = ['attribute_exists(task_id)', '#version = :expected_version']
+
+        if patch.title is not None:
+            set_clauses.append('title = :title')
+            values[':title'] = patch.title
+        if patch.description is not None:
+            if patch.description.strip():
+                set_clauses.append('description = :description')
+                values[':description'] = patch.description.strip()
+            else:
+                remove_clauses.append('description')
+        if patch.status is not None or patch.priority is not None:
+            _add_index_part_clauses(patch, current_index_parts, set_clauses, conditions, names, values)
+        if patch.dependencies is not None:
+            set_clauses.append('dependencies = :dependencies')
+            values[':dependencies'] = patch.dependencies
+
+        update_expression = 'SET ' + ', '.join(set_clauses)
+        if remove_clauses:
+            update_expression += ' REMOVE ' + ', '.join(remove_clauses)
+
+        if allowed_statuses is not None:
+            names['#status'] = 'status'
+            conditions.append(_status_in_condition(allowed_statuses, values))
+
+        return {
+            'TableName': self.table_name,
+            'Key': python_to_dynamo({'task_id': task_id}),
+            'UpdateExpression': update_expression,
+            'ConditionExpression': ' AND '.join(conditions),
+            'ExpressionAttributeNames': names,
+            'ExpressionAttributeValues': python_to_dynamo(values),
+            'ReturnValues': 'ALL_NEW',
+            'ReturnValuesOnConditionCheckFailure': 'ALL_OLD',
+        }
+
+    def _build_update(self, task: Task, expected_version: int) -> dict:
+        """Build the low-level UpdateItem parameters for a versioned task update."""
+        # Build update expression dynamically
+        update_expression_parts = []
+        expression_attribute_values: dict = {}
+        expression_attribute_names: dict = {}
+
+        # Use the version and updated_at from the task object (set by domain service)
+        # Always update these fields
+        update_expression_parts.append('#updated_at = :updated_at')
+        expression_attribute_names['#updated_at'] = 'updated_at'
+        expression_attribute_values[':updated_at'] = task.updated_at.isoformat()
+
+        update_expression_parts.append('#version = :new_version')
+        expression_attribute_names['#version'] = 'version'
+        expression_attribute_values[':new_version'] = task.version  # NEW version from domain
+
+        logger.debug(f'Setting new version in DynamoDB: {task.version}')
+
+        # Update other fields
+        update_expression_parts.append('title = :title')
+        expression_attribute_values[':title'] = task.title
+
+        if task.description is not None:
+            update_expression_parts.append('description = :description')
+            expression_attribute_values[':description'] = task.description
+
+        # Status is a reserved keyword
+        update_expression_parts.append('#status = :status')
+        expression_attribute_names['#status'] = 'status'
+        expression_attribute_values[':status'] = task.status.value
+
+        update_expression_parts.append('priority = :priority')
+        expression_attribute_values[':priority'] = task.priority.value
+
+        # Keep the composite key of the status + priority index in sync
+        update_expression_parts.append('status_priority = :status_priority')
+        expression_attribute_values[':status_priority'] = status_priority_key(task.status, task.priority)
+
+        update_expression_parts.append('dependencies = :dependencies')
+        expression_attribute_values[':dependencies'] = task.dependencies
+
+        # Build the complete update expression
+        update_expression = 'SET ' + ', '.join(update_expression_parts)
+
+        # Condition: check that current version matches expected version (OLD version)
+        condition_expression = '#version = :expected_version'
+        expression_attribute_values[':expected_version'] = expected_version
+
+        logger.debug(f'Condition: version must equal {expected_version}')
+        logger.debug(f'Update expression: {update_expression}')
+
+        return {
+            'TableName': self.table_name,
+            'Key': python_to_dynamo({'task_id': task.task_id}),
+            'UpdateExpression': update_expression,
+            'ConditionExpression': condition_expression,
+            'ExpressionAttributeNames': expression_attribute_names,
+            'ExpressionAttributeValues': python_to_dynamo(expression_attribute_values),
+            'ReturnValuesOnConditionCheckFailure': 'ALL_OLD',
+        }
+
+    def delete_task(self, task_id: str, version: int, outbox_event: Optional[TaskEvent] = None) -> None:
+        """
+        Delete a task with version check.
+
+        The delete is a single conditional call: on a failed condition the current item comes
+        back via ReturnValuesOnConditionCheckFailure=ALL_OLD, so a stale version raises
+        ConflictError with the current task and a missing task raises not-found without a read.
+
+        With the graph index, the task's index item is deleted in the same transaction without
+        reading it first. The reverse adjacency of the task's dependencies is left as it is; see
+        get_dependents.
+        """
         try:
             key = python_to_dynamo({'task_id': task_id})
             expression_values = python_to_dynamo({':version': version})
 
-            self.dynamodb.delete_item(
-                TableName=self.table_name,
-                Key=key,
-                ConditionExpression='#version = :version',
-                ExpressionAttributeNames={'#version': 'version'},
-                ExpressionAttributeValues=expression_values,
-            )
+            delete = {
+                'TableName': self.table_name,
+                'Key': key,
+                'ConditionExpression': '#version = :version',
+                'ExpressionAttributeNames': {'#version': 'version'},
+                'ExpressionAttributeValues': expression_values,
+                'ReturnValuesOnConditionCheckFailure': 'ALL_OLD',
+            }
+
+            transact_items = self._outbox_puts([outbox_event] if outbox_event else [])
+            if self.graph_table_name:
+                transact_items.append({'Delete': {'TableName': self.graph_table_name, 'Key': key}})
+
+            if transact_items:
+                self._transact_write([{'Delete': delete}] + transact_items)
+            else:
+                self.dynamodb.delete_item(**delete)
 
             logger.info(f'Deleted task: {task_id}')
 
         except ClientError as e:
+            if _is_condition_check_failure(e):
+                old_item = _condition_check_item(e)
+                if old_item is None:
+                    raise ValueError(f'Task not found: {task_id}') from e
+                current_task = decode_task(old_item).model_dump()
+                raise ConflictError(
+                    'The resource has been updated by another process. Please refresh and try again.', current_task=current_task
+                ) from e
             _handle_dynamodb_error(e, 'delete_task')
+
+    def get_dependency_graph(self, task_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Load the dependency subgraph reachable from the given task IDs.
+
+        Expands the traversal frontier one level at a time with BatchGetItem, so the cost
+        is proportional to the size of the reachable subgraph rather than the table.
+        Reads the compact graph index when configured, otherwise projects the
+        dependencies attribute from the tasks table.
+        """
+        try:
+            graph: Dict[str, List[str]] = {}
+            frontier = list(dict.fromkeys(task_ids))
+            seen = set(frontier)
+
+            while frontier:
+                adjacency = self._batch_get_adjacency(frontier)
+                next_frontier = []
+                for node_id, dependencies in adjacency.items():
+                    if not dependencies:
+                        continue
+                    graph[node_id] = dependencies
+                    for dep_id in dependencies:
+                        if dep_id not in seen:
+                            seen.add(dep_id)
+                            next_frontier.append(dep_id)
+                frontier = next_frontier
+
+            logger.debug(f'Loaded dependency subgraph: {len(seen)} nodes reached from {len(task_ids)} roots')
+            return graph
+
+        except ClientError as e:
+            _handle_dynamodb_error(e, 'get_dependency_graph')
+            raise  # This line is unreachable but satisfies type checker
+
+    def get_dependents(self, task_id: str) -> List[str]:
+        """
+        Return the IDs of tasks that depend on the given task (reverse adjacency from the graph index).
+
+        Deleting a task does not read its dependencies, so it stays in their reverse adjacency:
+        the result may name deleted tasks, and callers must tolerate IDs that no longer exist.
+        Cycle checks only follow forward adjacency and are not affected.
+        """
+        if not self.graph_table_name:
+            raise RepositoryError('Dependency graph index is not configured')
+        try:
+            response = self.dynamodb.get_item(
+                TableName=self.graph_table_name,
+                Key=python_to_dynamo({'task_id': task_id}),
+                ProjectionExpression='dependents',
+            )
+            return sorted(response.get('Item', {}).get('dependents', {}).get('SS', []))
+
+        except ClientError as e:
+            _handle_dynamodb_error(e, 'get_dependents')
+            raise  # This line is unreachable but satisfies type checker
+
+    def backfill_graph_index(self, page_size: int = 100) -> int:
+        """
+        Write the graph index items of every stored task that has dependencies.
+
+        The index is only maintained by writes made while it is configured, and a task without
+        an index item reads as having no edges, so tasks stored before the index was enabled
+        must be backfilled for cycle checks and dependency changes to see their edges. Items are
+        written with SET and ADD, so the backfill can be re-run safely.
+
+        Returns:
+            The number of tasks whose edges were written
+        """
+        if not self.graph_table_name:
+            raise RepositoryError('Dependency graph index is not configured')
+        backfilled = 0
+        try:
+            for tasks in self.scan_tasks(page_size):
+                changes: Dict[str, Tuple[set, set]] = {task.task_id: (set(), set(task.dependencies)) for task in tasks if task.dependencies}
+                for item in self._graph_index_updates(changes):
+                    self.dynamodb.update_item(**item['Update'])
+                backfilled += len(changes)
+            logger.info(f'Backfilled graph index for {backfilled} task(s)')
+            return backfilled
+
+        except ClientError as e:
+            _handle_dynamodb_error(e, 'backfill_graph_index')
+            raise  # This line is unreachable but satisfies type checker
+
+    def backfill_status_priority(self, page_size: int = 100) -> int:
+        """
+        Write the status_priority attribute of every stored task that lacks it.
+
+        Tasks written before the attribute existed are missing from the status_priority index.
+        Each write is conditioned on the status and priority that were read, so a task changed
+        in the meantime, which then already carries the attribute, is left alone. The backfill
+        can be re-run safely.
+
+        Returns:
+            The number of tasks whose attribute was written
+        """
+        request_kwargs = {
+            'TableName': self.table_name,
+            'Limit': page_size,
+            'FilterExpression': 'attribute_not_exists(status_priority)',
+            'ProjectionExpression': 'task_id, #status, priority',
+            'ExpressionAttributeNames': {'#status': 'status'},
+        }
+        backfilled = 0
+        try:
+            positions: Dict[int, Optional[dict]] = dict.fromkeys(range(self.scan_segments))
+            while positions:
+                items, positions = self._read_segments(self.dynamodb.scan, request_kwargs, positions, self.scan_segments)
+                for item in items:
+                    backfilled += self._backfill_status_priority_item(item)
+            logger.info(f'Backfilled status_priority for {backfilled} task(s)')
+            return backfilled
+
+        except ClientError as e:
+            _handle_dynamodb_error(e, 'backfill_status_priority')
+            raise  # This line is unreachable but satisfies type checker
+
+    def _backfill_status_priority_item(self, item: dict) -> int:
+        """Set status_priority on one scanned item; returns 1 if written, 0 if the task changed or was deleted meanwhile."""
+        status, priority = item['status']['S'], item['priority']['S']
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key={'task_id': item['task_id']},
+                UpdateExpression='SET status_priority = :status_priority',
+                ConditionExpression='#status = :status AND priority = :priority',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':status_priority': {'S': status_priority_key(TaskStatus(status), TaskPriority(priority))},
+                    ':status': {'S': status},
+                    ':priority': {'S': priority},
+                },
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            return 0
+        return 1
+
+    def _batch_get_adjacency(self, task_ids: List[str]) -> Dict[str, List[str]]:
+        """Fetch the outgoing edges of the given tasks with BatchGetItem, retrying unprocessed keys."""
+        if self.graph_table_name:
+            table_name, attribute = self.graph_table_name, 'depends_on'
+        else:
+            table_name, attribute = self.table_name, 'dependencies'
+
+        adjacency: Dict[str, List[str]] = {}
+        for start in range(0, len(task_ids), BATCH_GET_MAX_KEYS):
+            chunk = task_ids[start : start + BATCH_GET_MAX_KEYS]
+            request_items = {
+                table_name: {
+                    'Keys': [{'task_id': {'S': task_id}} for task_id in chunk],
+                    'ProjectionExpression': 'task_id, #edges',
+                    'ExpressionAttributeNames': {'#edges': attribute},
+                }
+            }
+
+            for attempt in range(UNPROCESSED_RETRY_ATTEMPTS):
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get('Responses', {}).get(table_name, []):
+                    edges = item.get(attribute)
+                    if edges is None:
+                        adjacency[item['task_id']['S']] = []
+                    elif 'SS' in edges:
+                        adjacency[item['task_id']['S']] = edges['SS']
+                    else:
+                        adjacency[item['task_id']['S']] = [value['S'] for value in edges.get('L', [])]
+
+                request_items = response.get('UnprocessedKeys') or {}
+                if not request_items:
+                    break
+                time.sleep(UNPROCESSED_BASE_DELAY * (2**attempt))
+            else:
+                raise ThrottlingError(f'DynamoDB left keys unprocessed after {UNPROCESSED_RETRY_ATTEMPTS} attempts during get_dependency_graph')
+
+        return adjacency
+
+    def _get_graph_dependencies(self, task_id: str) -> set:
+        """Read the current adjacency of a task from the graph index."""
+        response = self.dynamodb.get_item(
+            TableName=self.graph_table_name,
+            Key=python_to_dynamo({'task_id': task_id}),
+            ProjectionExpression='depends_on',
+            ConsistentRead=True,
+        )
+        return set(response.get('Item', {}).get('depends_on', {}).get('SS', []))
+
+    def _graph_index_updates(self, changes: Dict[str, Tuple[set, set]]) -> List[dict]:
+        """
+        Build the transaction items that move tasks' edges from their old to their new dependencies.
+
+        Args:
+            changes: Mapping of task_id -> (old_dependencies, new_dependencies)
+
+        Each changed task's index item gets its adjacency replaced; each added or removed
+        dependency gets the task ID added to or deleted from its reverse adjacency. Changes
+        touching the same index item are merged, since a transaction may touch an item only once.
+        """
+        adjacency: Dict[str, set] = {}
+        added_dependents: Dict[str, set] = {}
+        removed_dependents: Dict[str, set] = {}
+        for task_id, (old_dependencies, new_dependencies) in changes.items():
+            adjacency[task_id] = new_dependencies
+            for dep_id in new_dependencies - old_dependencies:
+                added_dependents.setdefault(dep_id, set()).add(task_id)
+            for dep_id in old_dependencies - new_dependencies:
+                removed_dependents.setdefault(dep_id, set()).add(task_id)
+
+        items = []
+        for node_id in sorted(set(adjacency) | set(added_dependents) | set(removed_dependents)):
+            set_clauses, remove_clauses, add_clauses, delete_clauses = [], [], [], []
+            values: dict = {}
+            if node_id in adjacency:
+                if adjacency[node_id]:
+                    set_clauses.append('depends_on = :deps')
+                    values[':deps'] = {'SS': sorted(adjacency[node_id])}
+                else:
+                    remove_clauses.append('depends_on')
+            if node_id in added_dependents:
+                add_clauses.append('dependents :added')
+                values[':added'] = {'SS': sorted(added_dependents[node_id])}
+            if node_id in removed_dependents:
+                delete_clauses.append('dependents :removed')
+                values[':removed'] = {'SS': sorted(removed_dependents[node_id])}
+
+            update_expression = ' '.join(
+                f'{action} {", ".join(clauses)}'
+                for action, clauses in [('SET', set_clauses), ('REMOVE', remove_clauses), ('ADD', add_clauses), ('DELETE', delete_clauses)]
+                if clauses
+            )
+            update = {'TableName': self.graph_table_name, 'Key': python_to_dynamo({'task_id': node_id}), 'UpdateExpression': update_expression}
+            if values:
+                update['ExpressionAttributeValues'] = values
+            items.append({'Update': update})
+        return items
+
+    def _outbox_puts(self, events: List[TaskEvent]) -> List[dict]:
+        """Build the transaction items that record events in the outbox table."""
+        if not events:
+            return []
+        if not self.outbox_table_name:
+            raise RepositoryError('Outbox table is not configured')
+        return [{'Put': {'TableName': self.outbox_table_name, 'Item': outbox_item(event)}} for event in events]
+
+    def _transact_write(self, transact_items: List[dict]) -> None:
+        """Execute a TransactWriteItems call, enforcing the per-transaction item limit."""
+        if len(transact_items) > TRANSACT_MAX_ITEMS:
+            raise ValueError(
+                f'Too many dependency changes in one write: {len(transact_items)} items exceeds the {TRANSACT_MAX_ITEMS} item transaction limit'
+            )
+        self.dynamodb.transact_write_items(TransactItems=transact_items)
@@ -2,21 +2,41 @@
 
 import json
 import os
+import random
 import time
+from typing import Any, Dict, Iterator, List
 
-import boto3
 from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import MetricUnit
 from botocore.exceptions import ClientError
 
 from services.task_service.domain.exceptions import RepositoryError
 from services.task_service.models.task import TaskEvent
 from shared.integration.interfaces import EventPublisher
+from shared.observability import metrics
 
 logger = Logger()
 
-# Initialize AWS clients at module level
+# The EventBridge client is created on first use, so read-only invocations never build it
 AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
-events_client = boto3.client('events', region_name=AWS_REGION)
+_events_client = None
+
+# PutEvents service limits
+PUT_EVENTS_MAX_ENTRIES = 10
+PUT_EVENTS_MAX_BYTES = 256 * 1024
+
+# Per-entry error codes worth resending; anything else will fail again
+RETRYABLE_ENTRY_ERRORS = {'InternalFailure', 'InternalException', 'ThrottlingException', 'ServiceUnavailableException'}
+
+
+def get_events_client():
+    """Return the shared EventBridge client, creating it on first use."""
+    global _events_client
+    if _events_client is None:
+        import boto3
+
+        _events_client = boto3.client('events', region_name=AWS_REGION)
+    return _events_client
 
 
 def _handle_eventbridge_error(e: ClientError, operation: str) -> None:
@@ -35,53 +55,143 @@ def _handle_eventbridge_error(e: ClientError, operation: str) -> None:
         raise RepositoryError(f'EventBridge error during {operation}: {error_code}') from e
 
 
+def entry_size(entry: Dict[str, Any]) -> int:
+    """
+    Calculate the size of a PutEvents entry as EventBridge counts it.
+
+    Source, DetailType, Detail and Resources count as UTF-8 bytes; a Time field adds 14 bytes.
+    """
+    size = 14 if entry.get('Time') else 0
+    for field in ('Source', 'DetailType', 'Detail'):
+        if entry.get(field):
+            size += len(entry[field].encode('utf-8'))
+    for resource in entry.get('Resources', []):
+        size += len(resource.encode('utf-8'))
+    return size
+
+
+def pack_entries(entries: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Group entries into PutEvents calls of at most 10 entries and 256 KB, preserving order."""
+    batch: List[Dict[str, Any]] = []
+    batch_bytes = 0
+    for entry in entries:
+        size = entry_size(entry)
+        if size > PUT_EVENTS_MAX_BYTES:
+            raise RepositoryError(f'Event entry of {size} bytes exceeds the PutEvents limit of {PUT_EVENTS_MAX_BYTES} bytes')
+        if batch and (len(batch) == PUT_EVENTS_MAX_ENTRIES or batch_bytes + size > PUT_EVENTS_MAX_BYTES):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(entry)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
 class EventBridgePublisher(EventPublisher):
-    """EventBridge implementation of EventPublisher."""
+    """
+    EventBridge implementation of EventPublisher.
+
+    publish_events sends the events it is given packed into as few PutEvents calls as the
+    service limits allow.
+    """
 
     def __init__(self, event_bus_name: str = 'default'):
         """Initialize EventBridge publisher."""
         self.event_bus_name = event_bus_name
-        self.events_client = events_client
+        self._events_client = None
         self.max_retries = 3
         self.base_delay = 0.1
 
+    @property
+    def events_client(self):
+        """EventBridge client; the shared client is created on first use unless one was injected."""
+        if self._events_client is None:
+            self._events_client = get_events_client()
+        return self._events_client
+
+    @events_client.setter
+    def events_client(self, client) -> None:
+        self._events_client = client
+
     def publish_event(self, event: TaskEvent) -> None:
-        """Publish a task event to EventBridge with retry logic."""
+        """Publish a task event to EventBridge."""
+        self.publish_events([event])
+
+    def publish_events(self, events: List[TaskEvent]) -> None:
+        """Publish task events packed into PutEvents calls."""
+        entries = [event.to_eventbridge_entry(event_bus_name=self.event_bus_name) for event in events]
+        self._send(entries)
+        logger.info(f'Published {len(entries)} event(s): {", ".join(event.event_type for event in events)}')
+
+    def _send(self, entries: List[Dict[str, Any]]) -> None:
+        """Send entries in packed PutEvents calls and record publish metrics."""
+        started = time.perf_counter()
+        failed: List[Dict[str, Any]] = []
+        try:
+            for batch in pack_entries(entries):
+                failed.extend(self._put_entries(batch))
+        finally:
+            metrics.add_metric(name='EventPublishLatency', unit=MetricUnit.Milliseconds, value=(time.perf_counter() - started) * 1000)
+            if failed:
+                metrics.add_metric(name='EventEntriesFailed', unit=MetricUnit.Count, value=len(failed))
+
+        if failed:
+            error_codes = sorted({result.get('ErrorCode', 'Unknown') for result in failed})
+            logger.error(f'Failed to publish {len(failed)} of {len(entries)} event(s): {error_codes}')
+            raise RepositoryError(f'Failed to publish {len(failed)} event(s): {", ".join(error_codes)}')
+
+    def _put_entries(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send one packed PutEvents call, resending only the entries that failed.
+
+        Returns the per-entry results that still failed after the retries.
+        """
+        pending = entries
+        failed_results: List[Dict[str, Any]] = []
         for attempt in range(self.max_retries):
             try:
-                # Use the event's to_eventbridge_entry method
-                entry = event.to_eventbridge_entry(event_bus_name=self.event_bus_name)
-                logger.debug(f'Publishing event: {json.dumps(entry)}')
-
-                response = self.events_client.put_events(Entries=[entry])
-
-                # Check for failed entries
-                if response.get('FailedEntryCount', 0) > 0:
-                    failed_entries = response.get('Entries', [])
-                    error_msg = f'Failed to publish event: {failed_entries}'
-                    logger.error(error_msg)
-                    raise RuntimeError(error_msg)
-
-                logger.info(f'Published event: {event.event_type}')
-                return
-
+                logger.debug(f'Publishing {len(pending)} event(s): {json.dumps(pending)}')
+                response = self.events_client.put_events(Entries=pending)
             except ClientError as e:
                 error_code = e.response['Error']['Code']
 
                 # Don't retry on certain errors
                 if error_code in ['ValidationException', 'InvalidParameterException']:
-                    logger.error(f'Non-retryable error publishing event: {e}')
+                    logger.error(f'Non-retryable error publishing events: {e}')
                     _handle_eventbridge_error(e, 'publish_event')
 
                 # Retry on throttling and service errors
                 if attempt < self.max_retries - 1:
-                    delay = self.base_delay * (2**attempt)  # Exponential backoff
-                    logger.warning(f'Retrying event publish in {delay}s (attempt {attempt + 1})')
+                    delay = self._backoff(attempt)
+                    logger.warning(f'Retrying event publish in {delay:.3f}s (attempt {attempt + 1})')
                     time.sleep(delay)
+                    continue
+                logger.error(f'Failed to publish events after {self.max_retries} attempts: {e}')
+                _handle_eventbridge_error(e, 'publish_event')
+
+            metrics.add_metric(name='EventEntriesPerCall', unit=MetricUnit.Count, value=len(pending))
+            if response.get('FailedEntryCount', 0) == 0:
+                return failed_results
+
+            # Results are positional: resend only the entries that failed transiently
+            retryable = []
+            for entry, result in zip(pending, response.get('Entries', []), strict=False):
+                if 'ErrorCode' not in result:
+                    continue
+                if result['ErrorCode'] in RETRYABLE_ENTRY_ERRORS and attempt < self.max_retries - 1:
+                    retryable.append(entry)
                 else:
-                    logger.error(f'Failed to publish event after {self.max_retries} attempts: {e}')
-                    _handle_eventbridge_error(e, 'publish_event')
+                    failed_results.append(result)
+
+            if not retryable:
+                return failed_results
+            pending = retryable
+            delay = self._backoff(attempt)
+            logger.warning(f'Resending {len(pending)} failed event(s) in {delay:.3f}s (attempt {attempt + 1})')
+            time.sleep(delay)
+
+        return failed_results
 
-            except Exception as e:
-                logger.error(f'Unexpected error publishing event: {e}')
-                raise
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff so concurrent publishers don't retry in lockstep."""
+        return random.uniform(0, self.base_delay * (2**attempt))
@@ -0,0 +1,168 @@
+"""
+Idempotency stores for deduplicating redelivered messages.
+
+DynamoDBIdempotencyStore keeps one item per key, written with a conditional put, so only
+one delivery of a message can claim it across all containers. A claim is held as
+in_progress for lease_seconds: if the consumer dies before completing or releasing it,
+a redelivery after the lease can claim the key again. Completed keys are kept for
+ttl_seconds, which should cover the redelivery window of the event source; expired items
+are treated as absent, since DynamoDB TTL deletes them lazily.
+
+CachingIdempotencyStore puts a bounded LRU of keys this container completed in front of
+another store, so most duplicates are answered without a DynamoDB call.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import MetricUnit
+from botocore.exceptions import ClientError
+
+from services.task_service.domain.exceptions import RepositoryError
+from shared.integration.dynamodb_adapter import get_dynamodb_client, get_retry_policy
+from shared.integration.interfaces import IdempotencyStore
+from shared.integration.retry_policy import RetryingClient
+from shared.observability import metrics
+
+logger = Logger()
+
+STATUS_IN_PROGRESS = 'in_progress'
+STATUS_COMPLETED = 'completed'
+
+
+class DynamoDBIdempotencyStore(IdempotencyStore):
+    """DynamoDB implementation of IdempotencyStore, keyed on idempotency_key with expires_at as the TTL attribute."""
+
+    def __init__(self, table_name: str, ttl_seconds: int = 24 * 60 * 60, lease_seconds: int = 60, clock: Callable[[], float] = time.time):
+        """Initialize the store for the given table."""
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+        self._dynamodb = None
+
+    @property
+    def dynamodb(self):
+        """Low-level DynamoDB client; the shared client, wrapped with the retry policy, is created on first use unless one was injected."""
+        if self._dynamodb is None:
+            self._dynamodb = RetryingClient(get_dynamodb_client(), get_retry_policy())
+        return self._dynamodb
+
+    @dynamodb.setter
+    def dynamodb(self, client) -> None:
+        self._dynamodb = client
+
+    def claim(self, key: str) -> bool:
+        """Write an in_progress item unless the key is completed or under an unexpired lease."""
+        now = int(self.clock())
+        try:
+            self.dynamodb.put_item(
+                TableName=self.table_name,
+                Item={
+                    'idempotency_key': {'S': key},
+                    'status': {'S': STATUS_IN_PROGRESS},
+                    'lease_expires_at': {'N': str(now + self.lease_seconds)},
+                    'expires_at': {'N': str(now + self.ttl_seconds)},
+                },
+                ConditionExpression='attribute_not_exists(idempotency_key) OR expires_at < :now OR (#status = :in_progress AND lease_expires_at < :now)',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={':now': {'N': str(now)}, ':in_progress': {'S': STATUS_IN_PROGRESS}},
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise RepositoryError(f'Idempotency store error during claim: {e.response["Error"]["Code"]}') from e
+
+    def complete(self, key: str) -> None:
+        """Mark the key as completed for ttl_seconds."""
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key={'idempotency_key': {'S': key}},
+                UpdateExpression='SET #status = :completed, expires_at = :expires_at REMOVE lease_expires_at',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={':completed': {'S': STATUS_COMPLETED}, ':expires_at': {'N': str(int(self.clock()) + self.ttl_seconds)}},
+            )
+        except ClientError as e:
+            raise RepositoryError(f'Idempotency store error during complete: {e.response["Error"]["Code"]}') from e
+
+    def release(self, key: str) -> None:
+        """Delete the claim, unless processing completed in the meantime."""
+        try:
+            self.dynamodb.delete_item(
+                TableName=self.table_name,
+                Key={'idempotency_key': {'S': key}},
+                ConditionExpression='#status = :in_progress',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={':in_progress': {'S': STATUS_IN_PROGRESS}},
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return
+            raise RepositoryError(f'Idempotency store error during release: {e.response["Error"]["Code"]}') from e
+
+
+class CachingIdempotencyStore(IdempotencyStore):
+    """
+    Decorator answering duplicates of recently completed keys from an in-container LRU.
+
+    Counters for local hits, store hits and misses are kept in-process; publish_metrics()
+    emits what was counted since the previous call, from which the dedup hit rate follows.
+    """
+
+    def __init__(self, store: IdempotencyStore, max_entries: int = 10000):
+        """Initialize the cache around the store it reads through to."""
+        self.store = store
+        self.max_entries = max_entries
+        self._completed: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self._published = {'IdempotencyLocalHits': 0, 'IdempotencyStoreHits': 0, 'IdempotencyMisses': 0}
+
+    def claim(self, key: str) -> bool:
+        """Claim through the store unless this container already completed the key."""
+        with self._lock:
+            if key in self._completed:
+                self._completed.move_to_end(key)
+                self.local_hits += 1
+                return False
+
+        claimed = self.store.claim(key)
+        with self._lock:
+            if claimed:
+                self.misses += 1
+            else:
+                self.store_hits += 1
+        return claimed
+
+    def complete(self, key: str) -> None:
+        """Complete in the store and remember the key locally."""
+        self.store.complete(key)
+        with self._lock:
+            self._completed[key] = None
+            self._completed.move_to_end(key)
+            while len(self._completed) > self.max_entries:
+                self._completed.popitem(last=False)
+
+    def release(self, key: str) -> None:
+        """Release the claim in the store."""
+        self.store.release(key)
+
+    def stats(self) -> dict:
+        """Current counters."""
+        return {'local_hits': self.local_hits, 'store_hits': self.store_hits, 'misses': self.misses, 'entries': len(self._completed)}
+
+    def publish_metrics(self) -> None:
+        """Add counter increments since the last call to the metrics the handler flushes."""
+        counters = {'IdempotencyLocalHits': self.local_hits, 'IdempotencyStoreHits': self.store_hits, 'IdempotencyMisses': self.misses}
+        if counters == self._published:
+            return
+        for name, value in counters.items():
+            metrics.add_metric(name=name, unit=MetricUnit.Count, value=value - self._published[name])
+        self._published = counters
@@ -1,48 +1,231 @@
 """Core interfaces for the task management API."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
 
-from services.task_service.models.task import Task, TaskEvent
+from services.notification_service.models.notification import Notification
+from services.notification_service.models.update_window import UpdateWindow
+from services.task_service.domain.exceptions import ConflictError
+from services.task_service.models.task import PartialTask, Task, TaskEvent, TaskPatch, TaskPriority, TaskSortOrder, TaskStatus
 
 
 class TaskRepository(ABC):
-    """Interface for task data persistence."""
+    """
+    Interface for task data persistence.
+
+    Write methods take an optional outbox_event. Repositories supporting a transactional
+    outbox store it atomically with the mutation; others raise RepositoryError when given one.
+    """
 
     @abstractmethod
-    def create_task(self, task: Task) -> Task:
+    def create_task(self, task: Task, outbox_event: Optional[TaskEvent] = None) -> Task:
         """Create a new task."""
         pass
 
+    def create_tasks(self, tasks: List[Task], outbox_events: Optional[Dict[str, TaskEvent]] = None) -> Dict[str, Exception]:
+        """
+        Create many new tasks.
+
+        Args:
+            tasks: Tasks to create; dependencies may reference other tasks in the same list
+            outbox_events: Optional mapping of task_id -> event to store with each task
+
+        Returns:
+            Mapping of task_id -> error for every task that was not created
+
+        The default implementation creates tasks one at a time and is not atomic.
+        """
+        failures: Dict[str, Exception] = {}
+        for task in tasks:
+            try:
+                if outbox_events:
+                    self.create_task(task, outbox_event=outbox_events.get(task.task_id))
+                else:
+                    self.create_task(task)
+            except Exception as e:
+                failures[task.task_id] = e
+        return failures
+
     @abstractmethod
     def get_task(self, task_id: str) -> Optional[Task]:
         """Retrieve a task by ID."""
         pass
 
+    def get_task_version(self, task_id: str) -> Optional[int]:
+        """
+        Read only the version of a task, or None if it does not exist.
+
+        The default implementation reads the whole task. Repositories that can project
+        attributes should override it.
+        """
+        task = self.get_task(task_id)
+        return task.version if task is not None else None
+
     @abstractmethod
-    def list_tasks(self, limit: int = 50, next_token: Optional[str] = None) -> tuple[List[Task], Optional[str]]:
-        """List tasks with pagination."""
+    def list_tasks(
+        self,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[Task], Optional[str]]:
+        """
+        List tasks with pagination.
+
+        Args:
+            limit: Maximum number of tasks per page
+            next_token: Token from a previous page
+            status: Only return tasks with this status
+            priority: Only return tasks with this priority
+            created_after: Only return tasks created strictly after this timestamp
+            sort: Order by creation time; requires a status or priority filter
+        """
         pass
 
+    def get_task_fields(self, task_id: str, fields: List[str]) -> Optional[PartialTask]:
+        """
+        Retrieve only the given fields of a task.
+
+        The default implementation reads the whole task. Repositories that can project
+        attributes should override it.
+        """
+        task = self.get_task(task_id)
+        return PartialTask.from_task(task, fields) if task is not None else None
+
+    def list_task_fields(
+        self,
+        fields: List[str],
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[PartialTask], Optional[str]]:
+        """
+        List only the given fields of tasks; see list_tasks for the other arguments.
+
+        The default implementation lists whole tasks. Repositories that can project
+        attributes should override it.
+        """
+        tasks, next_token = self.list_tasks(limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort)
+        return [PartialTask.from_task(task, fields) for task in tasks], next_token
+
+    def scan_tasks(self, page_size: int = 100) -> Iterator[List[Task]]:
+        """
+        Read every task, one page at a time, in no particular order.
+
+        The default implementation pages through list_tasks. Repositories that can split a
+        full read into independent parts should override it to read them in parallel.
+        """
+        next_token: Optional[str] = None
+        while True:
+            tasks, next_token = self.list_tasks(limit=page_size, next_token=next_token)
+            if tasks:
+                yield tasks
+            if not next_token:
+                break
+
     @abstractmethod
-    def update_task(self, task: Task, expected_version: int) -> Task:
+    def update_task(self, task: Task, expected_version: int, outbox_event: Optional[TaskEvent] = None) -> Task:
         """
         Update an existing task with optimistic locking.
 
         Args:
             task: The task with updated fields and new version
             expected_version: The old version to check against
+            outbox_event: Optional event to store atomically with the update
 
         Returns:
             The updated task
         """
         pass
 
+    def patch_task(
+        self,
+        task_id: str,
+        patch: TaskPatch,
+        expected_version: int,
+        allowed_statuses: Optional[List[TaskStatus]] = None,
+        build_outbox_event: Optional[Callable[[Task], TaskEvent]] = None,
+        known_task: Optional[Task] = None,
+    ) -> Task:
+        """
+        Apply field changes to a stored task if its version and status still match.
+
+        Args:
+            task_id: Task to change
+            patch: Field changes, including the new version
+            expected_version: Version the task must currently have
+            allowed_statuses: Statuses the task must currently be in, when the patch changes status
+            build_outbox_event: Builds the outbox event from the updated task, in outbox mode
+            known_task: A copy of the task the caller already holds; only a hint, the stored version is still checked
+
+        Returns:
+            The updated task
+
+        Raises:
+            ValueError: The task does not exist, or its status cannot move to the patched status
+            ConflictError: The task's version does not match, with the current task attached
+
+        The default implementation reads the task, checks it in process and calls update_task.
+        Repositories that can evaluate the checks as a write condition should override it.
+        """
+        existing = self.get_task(task_id)
+        if existing is None:
+            raise ValueError(f'Task not found: {task_id}')
+        if existing.version != expected_version:
+            raise ConflictError(f'Task {task_id} was modified by another process', current_task=existing.model_dump())
+        if allowed_statuses is not None and patch.status is not None and existing.status not in allowed_statuses:
+            raise ValueError(f'Invalid status transition from {existing.status.value} to {patch.status.value}')
+
+        updated_task = patch.apply(existing)
+        if build_outbox_event is not None:
+            return self.update_task(updated_task, expected_version=expected_version, outbox_event=build_outbox_event(updated_task))
+        return self.update_task(updated_task, expected_version=expected_version)
+
     @abstractmethod
-    def delete_task(self, task_id: str, version: int) -> None:
+    def delete_task(self, task_id: str, version: int, outbox_event: Optional[TaskEvent] = None) -> None:
         """Delete a task."""
         pass
 
+    def get_dependency_graph(self, task_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Load the dependency subgraph reachable from the given task IDs.
+
+        Args:
+            task_ids: Task IDs to start the traversal from
+
+        Returns:
+            Adjacency map of task_id -> dependencies for every reachable task that has dependencies
+
+        The default implementation reads every task with scan_tasks and walks the result in memory.
+        Repositories backed by a key-value store should override it to fetch only the reachable subgraph.
+        """
+        adjacency: Dict[str, List[str]] = {}
+        for tasks in self.scan_tasks():
+            for task in tasks:
+                if task.dependencies:
+                    adjacency[task.task_id] = task.dependencies
+
+        graph: Dict[str, List[str]] = {}
+        frontier = list(dict.fromkeys(task_ids))
+        seen = set(frontier)
+        while frontier:
+            current_id = frontier.pop()
+            dependencies = adjacency.get(current_id)
+            if not dependencies:
+                continue
+            graph[current_id] = dependencies
+            for dep_id in dependencies:
+                if dep_id not in seen:
+                    seen.add(dep_id)
+                    frontier.append(dep_id)
+        return graph
+
 
 class EventPublisher(ABC):
     """Interface for publishing task events."""
@@ -51,3 +234,202 @@ class EventPublisher(ABC):
     def publish_event(self, event: TaskEvent) -> None:
         """Publish a task event."""
         pass
+
+    def publish_events(self, events: List[TaskEvent]) -> None:
+        """
+        Publish several task events.
+
+        The default implementation publishes events one at a time. Adapters whose
+        backend accepts batches should override this.
+        """
+        for event in events:
+            self.publish_event(event)
+
+
+class EventSpillBuffer(ABC):
+    """Interface for durable storage of events that could not be published yet."""
+
+    @abstractmethod
+    def spill(self, events: List[TaskEvent]) -> None:
+        """Store events for a later drain."""
+        pass
+
+    @abstractmethod
+    def drain(self, publish: Callable[[List[TaskEvent]], None], max_events: int) -> int:
+        """
+        Hand up to max_events stored events to publish, removing them once it returns.
+
+        Events stay stored if publish raises. Returns the number of events drained.
+        """
+        pass
+
+
+class IdempotencyStore(ABC):
+    """
+    Interface for recording which messages have been processed.
+
+    A consumer claims a key before processing it, then completes the claim on success or
+    releases it on failure so a redelivery can process the message again.
+    """
+
+    @abstractmethod
+    def claim(self, key: str) -> bool:
+        """Claim a key for processing; returns False if it was already processed or is being processed."""
+        pass
+
+    @abstractmethod
+    def complete(self, key: str) -> None:
+        """Record a claimed key as processed."""
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Give up a claim whose processing failed."""
+        pass
+
+
+class NotificationChannel(ABC):
+    """Interface for delivering notifications to one destination, such as a webhook, an email relay or a chat."""
+
+    name: str
+
+    @abstractmethod
+    def send(self, notification: Notification, timeout: float) -> None:
+        """
+        Deliver a notification within timeout seconds.
+
+        Raises:
+            ChannelError: The destination rejected the notification or did not answer in time
+        """
+        pass
+
+
+class UpdateWindowStore(ABC):
+    """Interface for keeping coalescing windows of task updates between batches."""
+
+    @abstractmethod
+    def get_window(self, task_id: str) -> Optional[UpdateWindow]:
+        """Retrieve the window of a task, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def put_window(self, window: UpdateWindow, expected_revision: Optional[int] = None) -> None:
+        """
+        Store a window.
+
+        Args:
+            window: The window to store, with its new revision
+            expected_revision: Revision the stored window must have; None if none may exist yet
+
+        Raises:
+            ConflictError: Another consumer changed the window first
+        """
+        pass
+
+
+class AsyncTaskRepository(ABC):
+    """
+    Asyncio interface for task data persistence.
+
+    Mirrors TaskRepository, including its outbox arguments and error contract, with every
+    operation as a coroutine so that independent calls can run concurrently.
+    """
+
+    @abstractmethod
+    async def create_task(self, task: Task, outbox_event: Optional[TaskEvent] = None) -> Task:
+        """Create a new task."""
+        pass
+
+    @abstractmethod
+    async def create_tasks(self, tasks: List[Task], outbox_events: Optional[Dict[str, TaskEvent]] = None) -> Dict[str, Exception]:
+        """Create many new tasks, returning a mapping of task_id -> error for every task that was not created."""
+        pass
+
+    @abstractmethod
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """Retrieve a task by ID."""
+        pass
+
+    async def get_task_version(self, task_id: str) -> Optional[int]:
+        """Read only the version of a task, or None if it does not exist; see TaskRepository.get_task_version."""
+        task = await self.get_task(task_id)
+        return task.version if task is not None else None
+
+    @abstractmethod
+    async def list_tasks(
+        self,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[Task], Optional[str]]:
+        """List tasks with pagination."""
+        pass
+
+    async def get_task_fields(self, task_id: str, fields: List[str]) -> Optional[PartialTask]:
+        """Retrieve only the given fields of a task; see TaskRepository.get_task_fields."""
+        task = await self.get_task(task_id)
+        return PartialTask.from_task(task, fields) if task is not None else None
+
+    async def list_task_fields(
+        self,
+        fields: List[str],
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[PartialTask], Optional[str]]:
+        """List only the given fields of tasks; see TaskRepository.list_task_fields."""
+        tasks, next_token = await self.list_tasks(limit, next_token, status=status, priority=priority, created_after=created_after, sort=sort)
+        return [PartialTask.from_task(task, fields) for task in tasks], next_token
+
+    @abstractmethod
+    async def update_task(self, task: Task, expected_version: int, outbox_event: Optional[TaskEvent] = None) -> Task:
+        """Update an existing task with optimistic locking."""
+        pass
+
+    @abstractmethod
+    async def patch_task(
+        self,
+        task_id: str,
+        patch: TaskPatch,
+        expected_version: int,
+        allowed_statuses: Optional[List[TaskStatus]] = None,
+        build_outbox_event: Optional[Callable[[Task], TaskEvent]] = None,
+        known_task: Optional[Task] = None,
+    ) -> Task:
+        """Apply field changes to a stored task if its version and status still match."""
+        pass
+
+    @abstractmethod
+    async def delete_task(self, task_id: str, version: int, outbox_event: Optional[TaskEvent] = None) -> None:
+        """Delete a task."""
+        pass
+
+    @abstractmethod
+    async def get_dependency_graph(self, task_ids: List[str]) -> Dict[str, List[str]]:
+        """Load the dependency subgraph reachable from the given task IDs."""
+        pass
+
+
+class AsyncEventPublisher(ABC):
+    """Asyncio interface for publishing task events."""
+
+    @abstractmethod
+    async def publish_event(self, event: TaskEvent) -> None:
+        """Publish a task event."""
+        pass
+
+    async def publish_events(self, events: List[TaskEvent]) -> None:
+        """
+        Publish several task events.
+
+        The default implementation publishes events one at a time. Adapters whose
+        backend accepts batches should override this.
+        """
+        for event in events:
+            await self.publish_event(event)
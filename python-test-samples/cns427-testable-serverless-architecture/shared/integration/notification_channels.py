@@ -0,0 +1,75 @@
+"""
+HTTP notification channels.
+
+Each channel POSTs a JSON rendering of a notification to one URL with the standard library
+HTTP client, so the notification Lambda needs no extra dependency. Requests carry an
+Idempotency-Key header made of the event id and the channel name, letting receivers drop
+the repeats caused by redelivered events and by retries of partially failed deliveries.
+"""
+
+import json
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+from services.notification_service.domain.exceptions import ChannelError
+from services.notification_service.models.notification import Notification
+from shared.integration.interfaces import NotificationChannel
+
+
+class HttpChannel(NotificationChannel):
+    """Channel posting the notification as JSON to a URL; subclasses choose the payload."""
+
+    def __init__(self, name: str, url: str, headers: Optional[Dict[str, str]] = None):
+        """Initialize the channel for the given endpoint."""
+        self.name = name
+        self.url = url
+        self.headers = headers or {}
+
+    def payload(self, notification: Notification) -> Dict[str, Any]:
+        """Request body for a notification."""
+        return notification.to_dict()
+
+    def send(self, notification: Notification, timeout: float) -> None:
+        """POST the payload, treating any non-2xx response, timeout or connection error as a ChannelError."""
+        headers = {'Content-Type': 'application/json', **self.headers}
+        if notification.event_id:
+            headers['Idempotency-Key'] = f'{notification.event_id}:{self.name}'
+        request = urllib.request.Request(
+            self.url, data=json.dumps(self.payload(notification), default=str).encode('utf-8'), headers=headers, method='POST'
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response.read()
+        except urllib.error.HTTPError as e:
+            raise ChannelError(f'{self.name} returned HTTP {e.code}') from e
+        except (urllib.error.URLError, TimeoutError, OSError) as e:
+            raise ChannelError(f'{self.name} request failed: {e}') from e
+
+
+class WebhookChannel(HttpChannel):
+    """Generic webhook receiving the whole notification."""
+
+    pass
+
+
+class EmailRelayChannel(HttpChannel):
+    """HTTP email relay receiving sender, recipients, subject and plain-text body."""
+
+    def __init__(self, name: str, url: str, recipients: List[str], sender: str, headers: Optional[Dict[str, str]] = None):
+        """Initialize the channel with the addresses every notification is sent from and to."""
+        super().__init__(name, url, headers)
+        self.recipients = recipients
+        self.sender = sender
+
+    def payload(self, notification: Notification) -> Dict[str, Any]:
+        """Email message for a notification."""
+        return {'from': self.sender, 'to': self.recipients, 'subject': notification.subject, 'text': notification.text}
+
+
+class ChatChannel(HttpChannel):
+    """Chat incoming webhook receiving a single text message."""
+
+    def payload(self, notification: Notification) -> Dict[str, Any]:
+        """Chat message for a notification."""
+        return {'text': f'{notification.subject}: {notification.text}'}
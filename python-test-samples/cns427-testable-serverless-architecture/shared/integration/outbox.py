@@ -0,0 +1,47 @@
+"""
+Transactional outbox record format.
+
+Task mutations write an outbox item in the same DynamoDB transaction as the task itself.
+The outbox table's stream feeds the relay Lambda, which rebuilds the TaskEvent from the
+new image and publishes it to EventBridge. Both sides use the helpers in this module so
+the record format is defined in one place.
+"""
+
+import json
+import time
+from datetime import UTC, datetime
+from typing import Any, Dict
+from uuid import uuid4
+
+from services.task_service.models.task import TaskEvent
+
+# Outbox items only need to live until the relay has drained them; TTL deletions are
+# filtered out of the relay's stream source
+OUTBOX_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def outbox_item(event: TaskEvent) -> Dict[str, Any]:
+    """Convert a task event to a low-level DynamoDB outbox item."""
+    now = datetime.now(UTC)
+    item = {
+        'event_id': {'S': str(uuid4())},
+        'event_type': {'S': event.event_type},
+        'source': {'S': event.source},
+        'detail': {'S': json.dumps(event.task_data, default=str)},
+        'created_at': {'S': now.isoformat()},
+        'expires_at': {'N': str(int(time.time()) + OUTBOX_TTL_SECONDS)},
+    }
+    if event.detail_type_prefix:
+        item['detail_type_prefix'] = {'S': event.detail_type_prefix}
+    return item
+
+
+def event_from_outbox_image(image: Dict[str, Any]) -> TaskEvent:
+    """Rebuild the task event from an outbox item's stream image (DynamoDB JSON)."""
+    prefix = image.get('detail_type_prefix')
+    return TaskEvent(
+        event_type=image['event_type']['S'],
+        task_data=json.loads(image['detail']['S']),
+        source=image['source']['S'],
+        detail_type_prefix=prefix['S'] if prefix else None,
+    )
@@ -0,0 +1,316 @@
+"""
+Circuit breaker and spill buffer around event publishing.
+
+Inline publishing runs after the task write has succeeded, so a degraded event bus should
+neither slow the API down nor fail the request. ResilientEventPublisher sends through
+another publisher while its circuit is closed. After failure_threshold consecutive
+failures the circuit opens: events go straight to a durable spill buffer (SQS in Lambda,
+a local file in tests and local runs) without calling the bus. Once reset_timeout has
+passed the circuit half-opens and the next publish drains the spill buffer as its trial
+call; success closes the circuit, failure opens it again.
+"""
+
+import json
+import os
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import MetricUnit
+from botocore.exceptions import ClientError
+
+from services.task_service.domain.exceptions import RepositoryError
+from services.task_service.models.task import TaskEvent
+from shared.integration.interfaces import EventPublisher, EventSpillBuffer
+from shared.observability import metrics
+
+logger = Logger()
+
+AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
+_sqs_client = None
+
+# SQS batch API limit
+SQS_BATCH_MAX_MESSAGES = 10
+
+
+def get_sqs_client():
+    """Return the shared SQS client, creating it on first use."""
+    global _sqs_client
+    if _sqs_client is None:
+        import boto3
+
+        _sqs_client = boto3.client('sqs', region_name=AWS_REGION)
+    return _sqs_client
+
+
+def spill_record(event: TaskEvent) -> str:
+    """Serialize a task event for a spill buffer."""
+    return json.dumps(
+        {'event_type': event.event_type, 'task_data': event.task_data, 'source': event.source, 'detail_type_prefix': event.detail_type_prefix},
+        default=str,
+    )
+
+
+def event_from_spill_record(record: str) -> TaskEvent:
+    """Rebuild a task event written by spill_record."""
+    data = json.loads(record)
+    return TaskEvent(event_type=data['event_type'], task_data=data['task_data'], source=data['source'], detail_type_prefix=data['detail_type_prefix'])
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    While half-open only one trial call is let through at a time; the others are refused
+    until the trial has been recorded as a success or a failure.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """Initialize a closed breaker."""
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1')
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit reads as half-open once reset_timeout has passed."""
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """Whether a call may be made now; in the half-open state this claims the trial call."""
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return True
+            if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            if self._state is not CircuitState.CLOSED:
+                logger.info('Event publishing circuit closed')
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failed call; returns True if it opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            state = self._current_state()
+            if state is CircuitState.OPEN or (state is CircuitState.CLOSED and self._failures < self.failure_threshold):
+                return False
+            self._state = CircuitState.OPEN
+            self._opened_at = self.clock()
+            return True
+
+    def _current_state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+
+class ResilientEventPublisher(EventPublisher):
+    """
+    Decorator adding a circuit breaker and a spill buffer to another publisher.
+
+    Publishing never raises because the bus is unavailable: events the bus did not take are
+    spilled instead. It only raises if the spill buffer fails as well. Spilled events are
+    drained, drain_batch_size at a time and ahead of new events, from the half-open trial
+    until the buffer reads empty. A buffer may read short while events are still queued (an
+    SQS short poll samples only some servers), so it counts as empty only after
+    empty_drains_to_clear short drains in a row. drain_spilled drains without new events,
+    for a scheduled invocation in quiet periods.
+    """
+
+    def __init__(
+        self,
+        publisher: EventPublisher,
+        spill_buffer: EventSpillBuffer,
+        breaker: Optional[CircuitBreaker] = None,
+        drain_batch_size: int = 50,
+        empty_drains_to_clear: int = 3,
+    ):
+        """Initialize the decorator around the publisher it sends through."""
+        self.publisher = publisher
+        self.spill_buffer = spill_buffer
+        self.breaker = breaker or CircuitBreaker()
+        self.drain_batch_size = drain_batch_size
+        self.empty_drains_to_clear = empty_drains_to_clear
+        # Spilled events may be waiting; set on every spill and at cold start, since other containers may have spilled
+        self._backlog = True
+        self._short_drains = 0
+
+    def publish_event(self, event: TaskEvent) -> None:
+        """Publish a task event, spilling it if the bus is unavailable."""
+        self.publish_events([event])
+
+    def publish_events(self, events: List[TaskEvent]) -> None:
+        """Publish task events, spilling them if the circuit is open or the bus fails."""
+        if not self.breaker.allow_request():
+            self._spill(events, 'circuit open')
+            return
+
+        try:
+            if self._backlog:
+                self._drain()
+            self.publisher.publish_events(events)
+        except Exception as e:
+            self._record_failure()
+            self._spill(events, str(e))
+            return
+        self.breaker.record_success()
+
+    def drain_spilled(self) -> int:
+        """
+        Drain the spill buffer until it reads empty, without publishing new events.
+
+        Stops while the circuit refuses calls or when a drain fails; the events stay spilled
+        for the next call. Returns the number of events drained.
+        """
+        self._backlog = True
+        drained = 0
+        while self._backlog and self.breaker.allow_request():
+            try:
+                drained += self._drain()
+            except Exception as e:
+                self._record_failure()
+                logger.warning(f'Failed to drain spilled events: {e}')
+                break
+            self.breaker.record_success()
+        return drained
+
+    def _drain(self) -> int:
+        """Publish up to one batch of spilled events, clearing the backlog flag once the buffer has read empty often enough."""
+        drained = self.spill_buffer.drain(self.publisher.publish_events, self.drain_batch_size)
+        if drained:
+            logger.info(f'Drained {drained} spilled event(s)')
+            metrics.add_metric(name='EventsDrained', unit=MetricUnit.Count, value=drained)
+        if drained < self.drain_batch_size:
+            self._short_drains += 1
+            if self._short_drains >= self.empty_drains_to_clear:
+                self._backlog = False
+                self._short_drains = 0
+        else:
+            self._short_drains = 0
+        return drained
+
+    def _record_failure(self) -> None:
+        if self.breaker.record_failure():
+            logger.warning('Event publishing circuit opened')
+            metrics.add_metric(name='EventCircuitOpened', unit=MetricUnit.Count, value=1)
+
+    def _spill(self, events: List[TaskEvent], reason: str) -> None:
+        try:
+            self.spill_buffer.spill(events)
+        except Exception as e:
+            logger.error(f'Failed to spill {len(events)} event(s): {e}')
+            raise RepositoryError(f'Event publishing and spill buffer both unavailable: {e}') from e
+        self._backlog = True
+        self._short_drains = 0
+        logger.warning(f'Spilled {len(events)} event(s): {reason}')
+        metrics.add_metric(name='EventsSpilled', unit=MetricUnit.Count, value=len(events))
+
+
+class SqsSpillBuffer(EventSpillBuffer):
+    """
+    Spill buffer backed by an SQS queue.
+
+    A standard queue does not keep order, so drained events may be published out of order;
+    consumers already see task versions on every event. Messages are deleted only after
+    they were published; if publishing fails they reappear once their visibility timeout ends.
+    """
+
+    def __init__(self, queue_url: str, sqs_client=None, visibility_timeout: int = 30):
+        """Initialize the buffer for the given queue."""
+        self.queue_url = queue_url
+        self.visibility_timeout = visibility_timeout
+        self._sqs = sqs_client
+
+    @property
+    def sqs(self):
+        """SQS client; the shared client is created on first use unless one was injected."""
+        if self._sqs is None:
+            self._sqs = get_sqs_client()
+        return self._sqs
+
+    def spill(self, events: List[TaskEvent]) -> None:
+        """Send events to the queue in batches."""
+        try:
+            for start in range(0, len(events), SQS_BATCH_MAX_MESSAGES):
+                chunk = events[start : start + SQS_BATCH_MAX_MESSAGES]
+                entries = [{'Id': str(index), 'MessageBody': spill_record(event)} for index, event in enumerate(chunk)]
+                response = self.sqs.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+                if response.get('Failed'):
+                    raise RepositoryError(f'SQS rejected {len(response["Failed"])} spilled event(s)')
+        except ClientError as e:
+            raise RepositoryError(f'SQS error spilling events: {e.response["Error"]["Code"]}') from e
+
+    def drain(self, publish: Callable[[List[TaskEvent]], None], max_events: int) -> int:
+        """Receive, publish and delete up to max_events queued events."""
+        drained = 0
+        while drained < max_events:
+            response = self.sqs.receive_message(
+                QueueUrl=self.queue_url,
+                MaxNumberOfMessages=min(SQS_BATCH_MAX_MESSAGES, max_events - drained),
+                VisibilityTimeout=self.visibility_timeout,
+                WaitTimeSeconds=0,
+            )
+            messages = response.get('Messages', [])
+            if not messages:
+                break
+            publish([event_from_spill_record(message['Body']) for message in messages])
+            entries = [{'Id': str(index), 'ReceiptHandle': message['ReceiptHandle']} for index, message in enumerate(messages)]
+            self.sqs.delete_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            drained += len(messages)
+        return drained
+
+
+class FileSpillBuffer(EventSpillBuffer):
+    """Spill buffer appending events to a local NDJSON file, for tests and local runs. Drains keep spill order."""
+
+    def __init__(self, path: str):
+        """Initialize the buffer; the file is created on the first spill."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def spill(self, events: List[TaskEvent]) -> None:
+        """Append events to the file."""
+        with self._lock, self.path.open('a', encoding='utf-8') as spill_file:
+            spill_file.writelines(spill_record(event) + '\n' for event in events)
+
+    def drain(self, publish: Callable[[List[TaskEvent]], None], max_events: int) -> int:
+        """Publish the oldest max_events events, then rewrite the file without them."""
+        with self._lock:
+            if not self.path.exists():
+                return 0
+            lines = self.path.read_text(encoding='utf-8').splitlines()
+            batch, rest = lines[:max_events], lines[max_events:]
+            if not batch:
+                return 0
+            publish([event_from_spill_record(line) for line in batch])
+            self.path.write_text(''.join(line + '\n' for line in rest), encoding='utf-8')
+            return len(batch)
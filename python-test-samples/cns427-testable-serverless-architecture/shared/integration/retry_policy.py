@@ -0,0 +1,271 @@
+"""
+Client-side retries and adaptive rate limiting for AWS SDK calls.
+
+Throttled calls are retried inside the function instead of being returned to API clients,
+whose own retries would multiply the load during a burst. Three mechanisms keep the
+retries from becoming a storm of their own:
+
+- An adaptive token bucket: after a throttle the send rate is cut to a fraction of the
+  rate measured over the last second, then raised again with every success until it is
+  well clear of the throttled rate, at which point the limiter switches off.
+- Decorrelated-jitter backoff between attempts: each delay is drawn between the base delay
+  and three times the previous delay, so concurrent callers spread out.
+- A retry budget per invocation: a retry is only made if it can finish before the Lambda
+  deadline, less a safety margin, so the function still has time to answer.
+
+Retries, throttles absorbed by a successful retry and budget exhaustion are counted
+in-process; publish_metrics() records what was counted since the previous call.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Optional
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import MetricUnit
+from botocore.exceptions import ClientError
+
+from services.task_service.domain.exceptions import ThrottlingError
+from shared.observability import metrics
+
+logger = Logger()
+
+THROTTLING_ERROR_CODES = frozenset({'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded'})
+TRANSIENT_ERROR_CODES = frozenset({'InternalServerError', 'ServiceUnavailable', 'RequestTimeout', 'RequestTimeoutException'})
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose fill rate follows the throttling DynamoDB reports.
+
+    The limiter is off until the first throttle. A throttle sets the fill rate to beta times
+    the rate measured over the last second (never below min_rate); each success then adds
+    rate_step requests per second. Once the rate is recovery_factor times the rate at the
+    last throttle the limiter switches off again.
+    """
+
+    def __init__(
+        self,
+        min_rate: float = 1.0,
+        beta: float = 0.7,
+        rate_step: float = 0.5,
+        recovery_factor: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a disabled limiter."""
+        self.min_rate = min_rate
+        self.beta = beta
+        self.rate_step = rate_step
+        self.recovery_factor = recovery_factor
+        self.clock = clock
+        self.enabled = False
+        self.rate = 0.0
+        self._throttled_rate = 0.0
+        self._tokens = 0.0
+        self._refilled_at = 0.0
+        self._sent: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token for one request.
+
+        Returns:
+            Seconds the caller must wait before sending; the token is already reserved
+        """
+        with self._lock:
+            now = self.clock()
+            self._record_send(now)
+            if not self.enabled:
+                return 0.0
+            self._tokens = min(max(self.rate, 1.0), self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def on_throttle(self) -> None:
+        """Cut the fill rate after a throttled request."""
+        with self._lock:
+            now = self.clock()
+            measured = len(self._sent)
+            base = min(self.rate, measured) if self.enabled else measured
+            self.rate = max(self.min_rate, base * self.beta)
+            self._throttled_rate = self.rate
+            if not self.enabled:
+                self.enabled = True
+                self._tokens = 0.0
+            self._refilled_at = now
+
+    def on_success(self) -> None:
+        """Raise the fill rate after a successful request, switching off once recovered."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.rate += self.rate_step
+            if self.rate >= self._throttled_rate * self.recovery_factor:
+                self.enabled = False
+
+    def _record_send(self, now: float) -> None:
+        """Keep the send times of the last second, from which the current rate is measured."""
+        self._sent.append(now)
+        while self._sent and self._sent[0] <= now - 1.0:
+            self._sent.popleft()
+
+
+class RetryPolicy:
+    """
+    Retry rules and retry budget shared by every client wrapped with it.
+
+    Call begin_invocation at the start of each Lambda invocation to set the deadline retries
+    must finish by; without one, only max_attempts bounds the retries.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.025,
+        max_delay: float = 1.0,
+        safety_margin: float = 0.5,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts: Attempts per call, including the first
+            base_delay: Smallest backoff delay in seconds
+            max_delay: Largest backoff delay in seconds
+            safety_margin: Seconds of the invocation kept free of retries, to build the response
+            rate_limiter: Adaptive limiter, or None to retry without client-side rate limiting
+            clock: Monotonic clock in seconds
+            sleep: Sleep function
+            rng: Uniform random number in [0, 1)
+        """
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.safety_margin = safety_margin
+        self.rate_limiter = rate_limiter
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng
+        self._deadline: Optional[float] = None
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.throttles_absorbed = 0
+        self.budget_exhausted = 0
+        self._published = {'DynamoDBRetries': 0, 'DynamoDBThrottlesAbsorbed': 0, 'DynamoDBRetryBudgetExhausted': 0}
+
+    def begin_invocation(self, remaining_time_millis: Optional[Callable[[], int]]) -> None:
+        """Set the deadline for retries from the Lambda context's remaining time, or clear it."""
+        self._deadline = None if remaining_time_millis is None else self.clock() + remaining_time_millis() / 1000 - self.safety_margin
+
+    def backoff(self, previous_delay: float) -> float:
+        """Decorrelated-jitter delay following previous_delay."""
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, self.base_delay + self.rng() * (upper - self.base_delay))
+
+    def call(self, operation: Callable[..., Any], **kwargs) -> Any:
+        """
+        Call an SDK operation, retrying throttled and transient failures.
+
+        Raises:
+            ClientError: The error of the last attempt, when it is not retryable, attempts run out or
+                another retry would not finish before the deadline
+            ThrottlingError: Waiting for the rate limiter would overrun the deadline
+        """
+        delay = 0.0
+        throttles = 0
+        attempt = 1
+        while True:
+            self._wait(self.rate_limiter.acquire() if self.rate_limiter else 0.0, operation)
+            try:
+                response = operation(**kwargs)
+            except ClientError as e:
+                code = e.response.get('Error', {}).get('Code')
+                if code not in THROTTLING_ERROR_CODES and code not in TRANSIENT_ERROR_CODES:
+                    raise
+                if code in THROTTLING_ERROR_CODES:
+                    throttles += 1
+                    if self.rate_limiter:
+                        self.rate_limiter.on_throttle()
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.backoff(delay)
+                if not self._within_budget(delay):
+                    self._count('budget_exhausted')
+                    raise
+                self._count('retries')
+                logger.debug(f'Retrying {_operation_name(operation)} after {code} in {delay:.3f}s (attempt {attempt + 1})')
+                self.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.rate_limiter:
+                self.rate_limiter.on_success()
+            if throttles:
+                self._count('throttles_absorbed', throttles)
+            return response
+
+    def stats(self) -> dict:
+        """Current counters."""
+        return {'retries': self.retries, 'throttles_absorbed': self.throttles_absorbed, 'budget_exhausted': self.budget_exhausted}
+
+    def publish_metrics(self) -> None:
+        """Add counter increments since the last call to the metrics the handler flushes."""
+        counters = {
+            'DynamoDBRetries': self.retries,
+            'DynamoDBThrottlesAbsorbed': self.throttles_absorbed,
+            'DynamoDBRetryBudgetExhausted': self.budget_exhausted,
+        }
+        if counters == self._published:
+            return
+        for name, value in counters.items():
+            metrics.add_metric(name=name, unit=MetricUnit.Count, value=value - self._published[name])
+        self._published = counters
+
+    def _wait(self, delay: float, operation: Callable[..., Any]) -> None:
+        """Wait out a rate limiter delay, failing fast if it would overrun the deadline."""
+        if delay <= 0:
+            return
+        if not self._within_budget(delay):
+            self._count('budget_exhausted')
+            raise ThrottlingError(f'Client-side rate limit would exceed the invocation deadline during {_operation_name(operation)}')
+        self.sleep(delay)
+
+    def _within_budget(self, delay: float) -> bool:
+        return self._deadline is None or self.clock() + delay < self._deadline
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+
+class RetryingClient:
+    """Proxy for a boto3 client that runs every operation through a RetryPolicy."""
+
+    def __init__(self, client, policy: RetryPolicy):
+        """Wrap client; its own retries should be turned off so attempts are not multiplied."""
+        self.client = client
+        self.policy = policy
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.client, name)
+        if not callable(attribute) or name.startswith('_') or name in ('can_paginate', 'get_paginator', 'get_waiter', 'close'):
+            return attribute
+
+        def call(**kwargs):
+            return self.policy.call(attribute, **kwargs)
+
+        return call
+
+
+def _operation_name(operation: Callable[..., Any]) -> str:
+    return getattr(operation, '__name__', 'operation')
@@ -0,0 +1,112 @@
+"""
+Task <-> DynamoDB attribute-value codec.
+
+Converts between Task and the low-level DynamoDB item format directly, field by field,
+instead of going through TypeSerializer/TypeDeserializer (one type dispatch per attribute)
+and re-validating items with pydantic. Items in the tasks table are only ever written by
+encode_task, so trusted reads build the model with model_construct and skip validation.
+
+Item layout:
+    task_id, title, status, priority, status_priority, created_at, updated_at: S
+    description: S, or NULL when unset
+    dependencies: L of S
+    version: N
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Sequence
+
+from services.task_service.models.task import PartialTask, Task, TaskPriority, TaskStatus
+
+# Enum members by stored value: a dict lookup is cheaper than calling the enum
+_STATUSES = {status.value: status for status in TaskStatus}
+_PRIORITIES = {priority.value: priority for priority in TaskPriority}
+
+_NULL = {'NULL': True}
+
+_fromisoformat = datetime.fromisoformat
+
+
+def status_priority_key(status: TaskStatus, priority: TaskPriority) -> str:
+    """Composite partition key for the status + priority index."""
+    return f'{status.value}#{priority.value}'
+
+
+def encode_task(task: Task) -> Dict[str, Any]:
+    """Convert a task to a low-level DynamoDB item, including derived index keys."""
+    description = task.description
+    return {
+        'task_id': {'S': task.task_id},
+        'title': {'S': task.title},
+        'description': _NULL if description is None else {'S': description},
+        'status': {'S': task.status.value},
+        'priority': {'S': task.priority.value},
+        'status_priority': {'S': status_priority_key(task.status, task.priority)},
+        'dependencies': {'L': [{'S': dep_id} for dep_id in task.dependencies]},
+        'created_at': {'S': task.created_at.isoformat()},
+        'updated_at': {'S': task.updated_at.isoformat()},
+        'version': {'N': str(task.version)},
+    }
+
+
+def decode_task(item: Dict[str, Any]) -> Task:
+    """
+    Convert a low-level DynamoDB item written by encode_task to a task, without validation.
+
+    Derived index keys and unknown attributes are ignored.
+    """
+    description = item.get('description')
+    dependencies = item.get('dependencies')
+    return Task.model_construct(
+        task_id=item['task_id']['S'],
+        title=item['title']['S'],
+        description=description.get('S') if description is not None else None,
+        status=_STATUSES[item['status']['S']],
+        priority=_PRIORITIES[item['priority']['S']],
+        dependencies=_decode_string_list(dependencies) if dependencies is not None else [],
+        created_at=_fromisoformat(item['created_at']['S']),
+        updated_at=_fromisoformat(item['updated_at']['S']),
+        version=int(item['version']['N']),
+    )
+
+
+def decode_tasks(items: List[Dict[str, Any]]) -> List[Task]:
+    """Decode a page of trusted items."""
+    return [decode_task(item) for item in items]
+
+
+def decode_partial_task(item: Dict[str, Any]) -> PartialTask:
+    """Convert a projected item to a partial task holding just the attributes it contains."""
+    return PartialTask.model_construct(**{name: decode(item[name]) for name, decode in _FIELD_DECODERS.items() if name in item})
+
+
+def projection(fields: Sequence[str]) -> Dict[str, Any]:
+    """ProjectionExpression request parameters reading only the given task fields."""
+    names = {f'#p{index}': name for index, name in enumerate(fields)}
+    return {'ProjectionExpression': ', '.join(names), 'ExpressionAttributeNames': names}
+
+
+def decode_task_validated(item: Dict[str, Any]) -> Task:
+    """Convert a low-level DynamoDB item to a task with full model validation, for untrusted data."""
+    return Task.model_validate(decode_task(item).model_dump())
+
+
+def _decode_string_list(value: Dict[str, Any]) -> List[str]:
+    """Decode a list of strings stored as L of S (or, from older writers, SS)."""
+    if 'L' in value:
+        return [element['S'] for element in value['L']]
+    return list(value.get('SS', []))
+
+
+# Per-attribute decoders for projected items, matching decode_task
+_FIELD_DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'task_id': lambda value: value['S'],
+    'title': lambda value: value['S'],
+    'description': lambda value: value.get('S'),
+    'status': lambda value: _STATUSES[value['S']],
+    'priority': lambda value: _PRIORITIES[value['S']],
+    'dependencies': _decode_string_list,
+    'created_at': lambda value: _fromisoformat(value['S']),
+    'updated_at': lambda value: _fromisoformat(value['S']),
+    'version': lambda value: int(value['N']),
+}
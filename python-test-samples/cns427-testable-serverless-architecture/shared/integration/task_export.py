@@ -0,0 +1,168 @@
+"""
+Streaming NDJSON export of every task.
+
+Pages come from TaskRepository.scan_tasks; for DynamoDB that is a parallel Scan whose
+segment threads feed a bounded queue, so reading continues while the caller serializes
+and uploads. Each page is written as one JSON object per line, optionally gzip-compressed,
+to a binary sink as soon as it arrives. Memory use is bounded by the scan queue and the
+sink's buffer, whatever the size of the table.
+"""
+
+import os
+import zlib
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+from aws_lambda_powertools import Logger
+from pydantic_core import to_json
+
+from shared.integration.interfaces import TaskRepository
+
+logger = Logger()
+
+AWS_REGION = os.environ.get('AWS_REGION', 'us-west-2')
+_s3_client = None
+
+# Every multipart upload part except the last must be at least 5 MiB
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_PART_SIZE = 8 * 1024 * 1024
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+GZIP_CONTENT_TYPE = 'application/gzip'
+
+# zlib window bits selecting the gzip container instead of raw zlib
+GZIP_WBITS = 31
+
+
+class BinarySink(Protocol):
+    """Anything export bytes can be written to, such as a file, a socket stream or an S3 upload."""
+
+    def write(self, data: bytes) -> int: ...
+
+
+@dataclass
+class ExportResult:
+    """Summary of a finished export."""
+
+    task_count: int
+    bytes_written: int
+
+
+def get_s3_client():
+    """Return the shared S3 client, creating it on first use."""
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+
+        _s3_client = boto3.client('s3', region_name=AWS_REGION)
+    return _s3_client
+
+
+def export_tasks(repository: TaskRepository, sink: BinarySink, compress: bool = False, page_size: int = 100) -> ExportResult:
+    """
+    Write every task to the sink as NDJSON.
+
+    Args:
+        repository: Repository to read tasks from
+        sink: Binary destination; it is written to but not closed
+        compress: Gzip-compress the stream
+        page_size: Tasks per scan page
+
+    Returns:
+        Number of tasks exported and bytes written to the sink
+    """
+    compressor = zlib.compressobj(wbits=GZIP_WBITS) if compress else None
+    task_count = bytes_written = 0
+
+    for tasks in repository.scan_tasks(page_size):
+        chunk = b'\n'.join(to_json(task) for task in tasks) + b'\n'
+        if compressor is not None:
+            chunk = compressor.compress(chunk)
+        if chunk:
+            sink.write(chunk)
+            bytes_written += len(chunk)
+        task_count += len(tasks)
+
+    if compressor is not None:
+        tail = compressor.flush()
+        sink.write(tail)
+        bytes_written += len(tail)
+
+    logger.info(f'Exported {task_count} tasks ({bytes_written} bytes)')
+    return ExportResult(task_count=task_count, bytes_written=bytes_written)
+
+
+class S3MultipartWriter:
+    """
+    Binary sink that streams to an S3 object.
+
+    Writes are buffered into parts of part_size bytes, each uploaded as soon as it is full,
+    so at most one part is held in memory. Exports smaller than one part are stored with a
+    single PutObject. Use as a context manager: the upload is completed on success and
+    aborted if the block raises, so no partial object is left behind.
+    """
+
+    def __init__(self, bucket: str, key: str, content_type: str = NDJSON_CONTENT_TYPE, part_size: int = S3_PART_SIZE, s3_client=None):
+        """Initialize the writer for s3://bucket/key."""
+        if part_size < S3_MIN_PART_SIZE:
+            raise ValueError(f'part_size must be at least {S3_MIN_PART_SIZE} bytes')
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self._object_args = {'ContentType': content_type}
+        self._s3 = s3_client
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: list = []
+
+    @property
+    def s3(self):
+        """S3 client; the shared client is created on first use unless one was injected."""
+        if self._s3 is None:
+            self._s3 = get_s3_client()
+        return self._s3
+
+    def write(self, data: bytes) -> int:
+        """Buffer data, uploading every full part."""
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(data)
+
+    def close(self) -> None:
+        """Upload the remaining bytes and complete the object."""
+        if self._upload_id is None:
+            self.s3.put_object(Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer), **self._object_args)
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            self.s3.complete_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id, MultipartUpload={'Parts': self._parts})
+        self._buffer.clear()
+
+    def abort(self) -> None:
+        """Discard the upload and any parts already sent."""
+        if self._upload_id is not None:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id)
+            self._upload_id = None
+        self._buffer.clear()
+
+    def __enter__(self) -> 'S3MultipartWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.abort()
+        except Exception as abort_error:
+            logger.warning(f'Failed to abort multipart upload of s3://{self.bucket}/{self.key}: {abort_error}')
+
+    def _upload_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            response = self.s3.create_multipart_upload(Bucket=self.bucket, Key=self.key, **self._object_args)
+            self._upload_id = response['UploadId']
+        part_number = len(self._parts) + 1
+        response = self.s3.upload_part(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id, PartNumber=part_number, Body=body)
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
@@ -0,0 +1,91 @@
+"""
+DynamoDB store for coalescing windows of task updates.
+
+One item per task holds the merged state of its current window. Writes are conditional on
+the revision read, so concurrent consumers merging into the same window cannot overwrite
+each other's updates; the loser gets a ConflictError and its records are retried. Items
+expire ttl_seconds after their window closes, long enough for the owner's redelivery to
+find the window marked delivered.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from aws_lambda_powertools import Logger
+from botocore.exceptions import ClientError
+
+from services.notification_service.models.update_window import UpdateWindow
+from services.task_service.domain.exceptions import ConflictError, RepositoryError
+from shared.integration.dynamodb_adapter import get_dynamodb_client, get_retry_policy
+from shared.integration.interfaces import UpdateWindowStore
+from shared.integration.retry_policy import RetryingClient
+
+logger = Logger()
+
+
+class DynamoDBUpdateWindowStore(UpdateWindowStore):
+    """DynamoDB implementation of UpdateWindowStore, keyed on task_id with expires_at as the TTL attribute."""
+
+    def __init__(self, table_name: str, ttl_seconds: int = 60 * 60):
+        """Initialize the store for the given table."""
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+        self._dynamodb = None
+
+    @property
+    def dynamodb(self):
+        """Low-level DynamoDB client; the shared client, wrapped with the retry policy, is created on first use unless one was injected."""
+        if self._dynamodb is None:
+            self._dynamodb = RetryingClient(get_dynamodb_client(), get_retry_policy())
+        return self._dynamodb
+
+    @dynamodb.setter
+    def dynamodb(self, client) -> None:
+        self._dynamodb = client
+
+    def get_window(self, task_id: str) -> Optional[UpdateWindow]:
+        """Read the window of a task with a strongly consistent read, so the revision is current."""
+        try:
+            response = self.dynamodb.get_item(TableName=self.table_name, Key={'task_id': {'S': task_id}}, ConsistentRead=True)
+        except ClientError as e:
+            raise RepositoryError(f'Update window store error during get_window: {e.response["Error"]["Code"]}') from e
+        item = response.get('Item')
+        if item is None:
+            return None
+        return UpdateWindow(
+            task_id=item['task_id']['S'],
+            window_ends_at=float(item['window_ends_at']['N']),
+            task_data=json.loads(item['task_data']['S']),
+            owner_event_id=item['owner_event_id']['S'] if 'owner_event_id' in item else None,
+            changed_fields={value['S'] for value in item['changed_fields']['L']},
+            event_count=int(item['event_count']['N']),
+            delivered=item['delivered']['BOOL'],
+            revision=int(item['revision']['N']),
+        )
+
+    def put_window(self, window: UpdateWindow, expected_revision: Optional[int] = None) -> None:
+        """Write the window if the stored revision is still expected_revision."""
+        item: Dict[str, Dict[str, Any]] = {
+            'task_id': {'S': window.task_id},
+            'window_ends_at': {'N': str(window.window_ends_at)},
+            'task_data': {'S': json.dumps(window.task_data, default=str)},
+            'changed_fields': {'L': [{'S': name} for name in sorted(window.changed_fields)]},
+            'event_count': {'N': str(window.event_count)},
+            'delivered': {'BOOL': window.delivered},
+            'revision': {'N': str(window.revision)},
+            'expires_at': {'N': str(int(window.window_ends_at) + self.ttl_seconds)},
+        }
+        if window.owner_event_id is not None:
+            item['owner_event_id'] = {'S': window.owner_event_id}
+
+        condition: Dict[str, Any]
+        if expected_revision is None:
+            condition = {'ConditionExpression': 'attribute_not_exists(task_id)'}
+        else:
+            condition = {'ConditionExpression': 'revision = :expected', 'ExpressionAttributeValues': {':expected': {'N': str(expected_revision)}}}
+        try:
+            self.dynamodb.put_item(TableName=self.table_name, Item=item, **condition)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ConflictError(f'Update window of task {window.task_id} was changed by another consumer') from e
+            raise RepositoryError(f'Update window store error during put_window: {e.response["Error"]["Code"]}') from e
@@ -0,0 +1,8 @@
+"""Metrics shared by the adapters of every Lambda function."""
+
+import os
+
+from aws_lambda_powertools import Metrics
+
+# Adapters only add metrics to this instance; each handler flushes it once per invocation with @metrics.log_metrics
+metrics = Metrics(namespace=os.environ.get('POWERTOOLS_METRICS_NAMESPACE', 'CNS427/TaskAPI'))
@@ -30,6 +30,13 @@ class DynamoDBFake:
         """Convert DynamoDB format to Python dict."""
         return {k: self._deserializer.deserialize(v) for k, v in dynamo_item.items()}
 
+    def _serialize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert Python dict to DynamoDB format."""
+        from boto3.dynamodb.types import TypeSerializer
+
+        serializer = TypeSerializer()
+        return {k: serializer.serialize(v) for k, v in item.items()}
+
     def put_item(self, **kwargs) -> Dict[str, Any]:
         """Simulate put_item with errors and data storage."""
         # Simple error simulation (but NOT conditional_check - that's only for updates)
@@ -100,9 +107,10 @@ class DynamoDBFake:
 
                     # Simulate conditional check failure if versions don't match
                     if expected_version and current_version and expected_version != current_version:
-                        raise ClientError(
-                            {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'The conditional request failed'}}, 'UpdateItem'
-                        )
+                        error_response = {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'The conditional request failed'}}
+                        if kwargs.get('ReturnValuesOnConditionCheckFailure') == 'ALL_OLD':
+                            error_response['Item'] = self._serialize_item(current_item)
+                        raise ClientError(error_response, 'UpdateItem')
 
                     # Update the item with new values
                     if ':new_version' in expression_values:
@@ -112,9 +120,14 @@ class DynamoDBFake:
 
                     # Apply other updates based on expression values
                     for key, value in expression_values.items():
+                        if key.startswith(':from_status_'):
+                            continue  # Condition-only values
                         if key.startswith(':') and key not in [':expected_version', ':new_version', ':updated_at']:
                             field_name = key[1:]  # Remove ':' prefix
                             current_item[field_name] = value
+
+                    if kwargs.get('ReturnValues') == 'ALL_NEW':
+                        return {'Attributes': self._serialize_item(current_item)}
             elif self.error_type == 'conditional_check':
                 # Force conditional check failure for testing
                 raise ClientError({'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Condition not met'}}, 'UpdateItem')
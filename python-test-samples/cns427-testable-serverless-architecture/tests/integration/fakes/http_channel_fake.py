@@ -0,0 +1,56 @@
+"""
+HTTP Channel Fake for Notification Delivery
+
+Local HTTP server standing in for webhook, email relay and chat endpoints. It records
+every request and can answer a path slowly or with an error status.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class HttpChannelFake:
+    """Threaded HTTP server on 127.0.0.1 recording POSTed JSON bodies per path."""
+
+    def __init__(self):
+        self.requests = []
+        self.delays = {}
+        self.statuses = {}
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'null')
+                time.sleep(fake.delays.get(self.path, 0))
+                with fake._lock:
+                    fake.requests.append({'path': self.path, 'headers': dict(self.headers), 'body': body})
+                self.send_response(fake.statuses.get(self.path, 200))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        """URL of a path on this server."""
+        return f'http://127.0.0.1:{self.server.server_address[1]}{path}'
+
+    def requests_for(self, path: str) -> list:
+        """Requests received on a path."""
+        with self._lock:
+            return [request for request in self.requests if request['path'] == path]
+
+    def start(self) -> 'HttpChannelFake':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
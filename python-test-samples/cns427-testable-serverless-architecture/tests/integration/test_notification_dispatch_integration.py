@@ -0,0 +1,88 @@
+"""
+Notification Dispatch Integration Tests
+
+Tests the HTTP channels and the concurrent dispatcher against a local HTTP server, so
+slow and failing endpoints can be simulated without any external service.
+"""
+
+import time
+
+import pytest
+
+from services.notification_service.domain.dispatcher import ChannelSettings, NotificationDispatcher
+from services.notification_service.domain.exceptions import ChannelError
+from services.notification_service.models.notification import Notification
+from shared.integration.notification_channels import ChatChannel, EmailRelayChannel, WebhookChannel
+from tests.integration.fakes.http_channel_fake import HttpChannelFake
+
+
+@pytest.fixture
+def http_fake():
+    fake = HttpChannelFake().start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def dispatcher(http_fake):
+    settings = ChannelSettings(timeout=0.5)
+    dispatcher = NotificationDispatcher(
+        [
+            (WebhookChannel('webhook', http_fake.url('/webhook')), settings),
+            (EmailRelayChannel('email', http_fake.url('/email'), ['team@example.com'], 'tasks@example.com'), settings),
+            (ChatChannel('chat', http_fake.url('/chat')), settings),
+        ]
+    )
+    yield dispatcher
+    dispatcher.close()
+
+
+@pytest.fixture
+def notification():
+    return Notification('TaskCreated', 'task-1', 'Task created: Write docs', 'Task task-1 was created.', {'task_id': 'task-1'}, event_id='event-1')
+
+
+def test_fan_out_renders_each_channel_payload(http_fake, dispatcher, notification):
+    # WHEN dispatching to all channels
+    failures = dispatcher.dispatch(notification)
+
+    # THEN each endpoint receives its own payload with a per-channel idempotency key
+    assert failures == {}
+    [webhook] = http_fake.requests_for('/webhook')
+    [email] = http_fake.requests_for('/email')
+    [chat] = http_fake.requests_for('/chat')
+    assert webhook['body']['task_id'] == 'task-1'
+    assert webhook['headers']['Idempotency-Key'] == 'event-1:webhook'
+    assert email['body'] == {
+        'from': 'tasks@example.com',
+        'to': ['team@example.com'],
+        'subject': 'Task created: Write docs',
+        'text': 'Task task-1 was created.',
+    }
+    assert chat['body'] == {'text': 'Task created: Write docs: Task task-1 was created.'}
+
+
+def test_slow_channel_times_out_without_delaying_the_others(http_fake, dispatcher, notification):
+    # GIVEN an email relay slower than the channel timeout
+    http_fake.delays['/email'] = 2.0
+
+    # WHEN dispatching
+    started = time.monotonic()
+    failures = dispatcher.dispatch(notification)
+    elapsed = time.monotonic() - started
+
+    # THEN only the email channel fails, within about one timeout
+    assert list(failures) == ['email']
+    assert isinstance(failures['email'], ChannelError)
+    assert len(http_fake.requests_for('/webhook')) == 1
+    assert len(http_fake.requests_for('/chat')) == 1
+    assert elapsed < 1.5
+
+
+def test_error_status_fails_only_that_channel(http_fake, dispatcher, notification):
+    http_fake.statuses['/chat'] = 500
+
+    failures = dispatcher.dispatch(notification)
+
+    assert list(failures) == ['chat']
+    assert 'HTTP 500' in str(failures['chat'])
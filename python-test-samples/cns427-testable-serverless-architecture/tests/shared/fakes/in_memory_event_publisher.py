@@ -2,8 +2,8 @@
 
 from typing import List
 
-from task_api.models.interfaces import EventPublisher
-from task_api.models.task import TaskEvent
+from services.task_service.models.task import TaskEvent
+from shared.integration.interfaces import EventPublisher
 
 
 class InMemoryEventPublisher(EventPublisher):
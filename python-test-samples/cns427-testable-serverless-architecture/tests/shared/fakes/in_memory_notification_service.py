@@ -2,7 +2,7 @@
 
 from typing import List
 
-from task_api.models.task import TaskEvent, TaskEventType
+from services.task_service.models.task import TaskEvent, TaskEventType
 
 
 class InMemoryNotificationService:
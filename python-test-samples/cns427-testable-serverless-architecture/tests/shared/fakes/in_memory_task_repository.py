@@ -1,9 +1,18 @@
 """In-memory fake implementation of TaskRepository for all test types."""
 
-from typing import Dict, List, Optional
+import itertools
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-from task_api.models.interfaces import TaskRepository
-from task_api.models.task import Task
+from services.task_service.domain.exceptions import ConflictError
+from services.task_service.models.task import Task, TaskEvent, TaskPatch, TaskPriority, TaskSortOrder, TaskStatus
+from shared.integration.interfaces import TaskRepository
+from shared.integration.task_codec import status_priority_key
+
+# (created_at, insertion sequence): sort key of the secondary indexes, as on the DynamoDB GSIs
+IndexEntry = Tuple[datetime, int]
 
 
 class InMemoryTaskRepository(TaskRepository):
@@ -11,85 +20,171 @@ class InMemoryTaskRepository(TaskRepository):
     In-memory implementation of TaskRepository for testing.
 
     This fake stores tasks in memory instead of DynamoDB, making it suitable
-    for unit tests that need complete isolation from external dependencies.
+    for unit tests that need complete isolation from external dependencies,
+    and fast enough to drive TaskService at high request rates in process.
+
+    Tasks keep their insertion order. Like the DynamoDB table, the fake keeps secondary
+    indexes on status, priority and status + priority, sorted by created_at, and a
+    reverse index of dependents. Listing bisects to the page token and reads one page,
+    so paging through all tasks is linear rather than quadratic. Every operation holds
+    one reentrant lock, so the fake can be shared by a thread pool; outbox events are
+    recorded under the same lock as the mutation they belong to.
     """
 
     def __init__(self):
         """Initialize with empty task storage."""
         self._tasks: Dict[str, Task] = {}
+        self._lock = threading.RLock()
+        self._sequence = itertools.count(1)
+        # Insertion sequence of each task, live sequences in order, and the task at each sequence
+        self._sequences: Dict[str, int] = {}
+        self._order: List[int] = []
+        self._ids_by_sequence: Dict[int, str] = {}
+        self._indexes: Dict[str, List[IndexEntry]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self.outbox_events: List[TaskEvent] = []
 
-    def create_task(self, task: Task) -> Task:
+    def create_task(self, task: Task, outbox_event: Optional[TaskEvent] = None) -> Task:
         """Create a new task in memory."""
-        if task.task_id in self._tasks:
-            raise ValueError(f'Task already exists: {task.task_id}')
+        with self._lock:
+            if task.task_id in self._tasks:
+                raise ValueError(f'Task already exists: {task.task_id}')
 
-        self._tasks[task.task_id] = task
-        return task
+            sequence = next(self._sequence)
+            self._sequences[task.task_id] = sequence
+            self._order.append(sequence)
+            self._ids_by_sequence[sequence] = task.task_id
+            self._tasks[task.task_id] = task
+            self._index(task)
+            self._record(outbox_event)
+            return task
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Retrieve a task by ID from memory."""
-        return self._tasks.get(task_id)
-
-    def list_tasks(self, limit: int = 50, next_token: Optional[str] = None) -> tuple[List[Task], Optional[str]]:
-        """List tasks with pagination from memory."""
-        tasks = list(self._tasks.values())
-
-        # Simple pagination simulation
-        start_index = 0
-        if next_token:
-            try:
-                start_index = int(next_token)
-            except (ValueError, TypeError):
-                start_index = 0
+        with self._lock:
+            return self._tasks.get(task_id)
 
-        end_index = start_index + limit
-        page_tasks = tasks[start_index:end_index]
+    def list_tasks(
+        self,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        sort: Optional[TaskSortOrder] = None,
+    ) -> tuple[List[Task], Optional[str]]:
+        """
+        List tasks with pagination from memory.
 
-        # Generate next token if there are more tasks
-        next_page_token = None
-        if end_index < len(tasks):
-            next_page_token = str(end_index)
+        Without filters tasks come in insertion order; with a status or priority filter they
+        come from the matching index in created_at order, as the DynamoDB adapter returns them.
+        """
+        with self._lock:
+            if status is None and priority is None:
+                if sort is not None:
+                    raise ValueError('Sorting requires a status or priority filter')
+                return self._list_in_order(limit, next_token, created_after)
+            return self._list_from_index(self._index_key(status, priority), limit, next_token, created_after, sort)
 
-        return page_tasks, next_page_token
+    def scan_tasks(self, page_size: int = 100) -> Iterator[List[Task]]:
+        """Read every task, one page at a time, from a snapshot taken on the first read."""
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for start in range(0, len(tasks), page_size):
+            yield tasks[start : start + page_size]
 
-    def update_task(self, task: Task, expected_version: int) -> Task:
+    def update_task(self, task: Task, expected_version: int, outbox_event: Optional[TaskEvent] = None) -> Task:
         """Update an existing task with optimistic locking."""
-        existing_task = self._tasks.get(task.task_id)
-        if existing_task is None:
-            raise ValueError(f'Task not found: {task.task_id}')
+        with self._lock:
+            existing_task = self._tasks.get(task.task_id)
+            if existing_task is None:
+                raise ValueError(f'Task not found: {task.task_id}')
 
-        # Check version for optimistic locking
-        if existing_task.version != expected_version:
-            from services.task_service.domain.exceptions import ConflictError
+            # Check version for optimistic locking
+            if existing_task.version != expected_version:
+                raise ConflictError(f'Version conflict for task: {task.task_id}', current_task=existing_task.model_dump())
 
-            raise ConflictError(f'Version conflict for task: {task.task_id}', current_task=existing_task.model_dump())
+            self._unindex(existing_task)
+            self._tasks[task.task_id] = task
+            self._index(task)
+            self._record(outbox_event)
+            return task
 
-        self._tasks[task.task_id] = task
-        return task
+    def patch_task(
+        self,
+        task_id: str,
+        patch: TaskPatch,
+        expected_version: int,
+        allowed_statuses: Optional[List[TaskStatus]] = None,
+        build_outbox_event: Optional[Callable[[Task], TaskEvent]] = None,
+        known_task: Optional[Task] = None,
+    ) -> Task:
+        """Apply the patch with its read, checks and write under the lock, as one conditional write."""
+        with self._lock:
+            return super().patch_task(
+                task_id, patch, expected_version, allowed_statuses=allowed_statuses, build_outbox_event=build_outbox_event, known_task=known_task
+            )
 
-    def delete_task(self, task_id: str, version: int) -> None:
+    def delete_task(self, task_id: str, version: int, outbox_event: Optional[TaskEvent] = None) -> None:
         """Delete a task with version check."""
-        existing_task = self._tasks.get(task_id)
-        if existing_task is None:
-            raise ValueError(f'Task not found: {task_id}')
+        with self._lock:
+            existing_task = self._tasks.get(task_id)
+            if existing_task is None:
+                raise ValueError(f'Task not found: {task_id}')
 
-        # Check version for optimistic locking
-        if existing_task.version != version:
-            raise ValueError(f'Version conflict for task: {task_id}')
+            # Check version for optimistic locking
+            if existing_task.version != version:
+                raise ConflictError(f'Version conflict for task: {task_id}', current_task=existing_task.model_dump())
 
-        del self._tasks[task_id]
+            self._unindex(existing_task)
+            sequence = self._sequences.pop(task_id)
+            del self._order[bisect_left(self._order, sequence)]
+            del self._ids_by_sequence[sequence]
+            del self._tasks[task_id]
+            self._record(outbox_event)
+
+    def get_dependency_graph(self, task_ids: List[str]) -> Dict[str, List[str]]:
+        """Walk the dependencies reachable from the given tasks, reading only those tasks."""
+        with self._lock:
+            graph: Dict[str, List[str]] = {}
+            frontier = list(dict.fromkeys(task_ids))
+            seen = set(frontier)
+            while frontier:
+                task = self._tasks.get(frontier.pop())
+                if task is None or not task.dependencies:
+                    continue
+                graph[task.task_id] = task.dependencies
+                for dep_id in task.dependencies:
+                    if dep_id not in seen:
+                        seen.add(dep_id)
+                        frontier.append(dep_id)
+            return graph
+
+    def get_dependents(self, task_id: str) -> List[str]:
+        """Return the IDs of tasks that depend on the given task."""
+        with self._lock:
+            return sorted(self._dependents.get(task_id, ()))
 
     def clear(self) -> None:
         """Clear all tasks (useful for test cleanup)."""
-        self._tasks.clear()
+        with self._lock:
+            self._tasks.clear()
+            self._sequences.clear()
+            self._order.clear()
+            self._ids_by_sequence.clear()
+            self._indexes.clear()
+            self._dependents.clear()
+            self.outbox_events.clear()
 
     def count(self) -> int:
         """Get total number of tasks."""
-        return len(self._tasks)
+        with self._lock:
+            return len(self._tasks)
 
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks (useful for test verification)."""
-        return list(self._tasks.values())
+        with self._lock:
+            return list(self._tasks.values())
 
     def simulate_failure(self, should_fail: bool = True, message: str = 'Simulated repository failure'):
         """Configure the fake to simulate failures for error testing."""
@@ -100,3 +195,82 @@ class InMemoryTaskRepository(TaskRepository):
         """Check if failure should be simulated."""
         if getattr(self, 'should_fail', False):
             raise RuntimeError(getattr(self, 'failure_message', 'Simulated repository failure'))
+
+    @staticmethod
+    def _index_key(status: Optional[TaskStatus], priority: Optional[TaskPriority]) -> str:
+        """Name and partition of the index matching the filters, chosen as the DynamoDB adapter chooses its GSI."""
+        if status is not None and priority is not None:
+            return f'status_priority:{status_priority_key(status, priority)}'
+        if status is not None:
+            return f'status:{status.value}'
+        return f'priority:{priority.value}'
+
+    def _index(self, task: Task) -> None:
+        """Add a stored task to the secondary indexes."""
+        entry = (task.created_at, self._sequences[task.task_id])
+        for key in (self._index_key(task.status, None), self._index_key(None, task.priority), self._index_key(task.status, task.priority)):
+            insort(self._indexes.setdefault(key, []), entry)
+        for dep_id in task.dependencies:
+            self._dependents.setdefault(dep_id, set()).add(task.task_id)
+
+    def _unindex(self, task: Task) -> None:
+        """Remove a stored task from the secondary indexes."""
+        entry = (task.created_at, self._sequences[task.task_id])
+        for key in (self._index_key(task.status, None), self._index_key(None, task.priority), self._index_key(task.status, task.priority)):
+            entries = self._indexes[key]
+            del entries[bisect_left(entries, entry)]
+        for dep_id in task.dependencies:
+            self._dependents[dep_id].discard(task.task_id)
+
+    def _record(self, outbox_event: Optional[TaskEvent]) -> None:
+        """Keep an outbox event written together with a mutation."""
+        if outbox_event is not None:
+            self.outbox_events.append(outbox_event)
+
+    def _list_in_order(self, limit: int, next_token: Optional[str], created_after: Optional[datetime]) -> tuple[List[Task], Optional[str]]:
+        """Page through all tasks in insertion order; the token is the sequence of the last task read."""
+        try:
+            position = bisect_right(self._order, int(next_token)) if next_token else 0
+        except ValueError as e:
+            raise ValueError('Invalid pagination token') from e
+
+        page: List[Task] = []
+        while position < len(self._order) and len(page) < limit:
+            task = self._tasks[self._ids_by_sequence[self._order[position]]]
+            position += 1
+            if created_after is None or task.created_at > created_after:
+                page.append(task)
+        return page, str(self._order[position - 1]) if position < len(self._order) else None
+
+    def _list_from_index(
+        self, key: str, limit: int, next_token: Optional[str], created_after: Optional[datetime], sort: Optional[TaskSortOrder]
+    ) -> tuple[List[Task], Optional[str]]:
+        """Page through one index in created_at order; the token is the index entry of the last task read."""
+        entries = self._indexes.get(key, [])
+        lower = bisect_right(entries, (created_after, float('inf'))) if created_after is not None else 0
+        cursor = self._decode_index_token(next_token) if next_token else None
+
+        if sort == TaskSortOrder.CREATED_AT_DESC:
+            end = bisect_left(entries, cursor) if cursor is not None else len(entries)
+            start = max(lower, end - limit)
+            page_entries = entries[start:end][::-1]
+            has_more = start > lower
+        else:
+            start = max(lower, bisect_right(entries, cursor)) if cursor is not None else lower
+            page_entries = entries[start : start + limit]
+            has_more = start + limit < len(entries)
+
+        page = [self._tasks[self._ids_by_sequence[sequence]] for _, sequence in page_entries]
+        if not has_more or not page_entries:
+            return page, None
+        created_at, sequence = page_entries[-1]
+        return page, f'{created_at.isoformat()}|{sequence}'
+
+    @staticmethod
+    def _decode_index_token(token: str) -> IndexEntry:
+        """Parse a token written by _list_from_index."""
+        try:
+            created_at, sequence = token.rsplit('|', 1)
+            return datetime.fromisoformat(created_at), int(sequence)
+        except ValueError as e:
+            raise ValueError('Invalid pagination token') from e
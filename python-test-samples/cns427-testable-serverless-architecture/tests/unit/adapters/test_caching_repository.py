@@ -0,0 +1,214 @@
+"""Unit tests for CachingTaskRepository read-through, invalidation and eviction."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from services.task_service.domain.exceptions import ConflictError
+from services.task_service.models.task import Task, TaskPatch, TaskStatus
+from shared.integration.caching_repository import CachingTaskRepository, task_size
+from shared.integration.interfaces import TaskRepository
+
+
+class CountingRepository(TaskRepository):
+    """Dict-backed repository that counts get_task calls."""
+
+    def __init__(self):
+        self.tasks = {}
+        self.reads = 0
+
+    def create_task(self, task, outbox_event=None):
+        self.tasks[task.task_id] = task
+        return task
+
+    def get_task(self, task_id):
+        self.reads += 1
+        return self.tasks.get(task_id)
+
+    def list_tasks(self, limit=50, next_token=None, status=None, priority=None, created_after=None, sort=None):
+        return list(self.tasks.values())[:limit], None
+
+    def update_task(self, task, expected_version, outbox_event=None):
+        current = self.tasks.get(task.task_id)
+        if current.version != expected_version:
+            raise ConflictError('conflict', current_task=current.model_dump())
+        self.tasks[task.task_id] = task
+        return task
+
+    def delete_task(self, task_id, version, outbox_event=None):
+        self.tasks.pop(task_id, None)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_task(task_id='task-1', version=1, **fields):
+    now = datetime.now(UTC)
+    return Task(task_id=task_id, title=fields.pop('title', 'Task'), created_at=now, updated_at=now, version=version, **fields)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def backend():
+    return CountingRepository()
+
+
+@pytest.fixture
+def cache(backend, clock):
+    return CachingTaskRepository(backend, max_entries=3, max_staleness_seconds=1.0, clock=clock)
+
+
+class TestReadThrough:
+    """Reads are served from the cache within the staleness bound."""
+
+    def test_repeated_reads_hit_the_cache(self, cache, backend):
+        backend.create_task(make_task())
+
+        assert cache.get_task('task-1') == cache.get_task('task-1')
+
+        assert backend.reads == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entries_past_the_staleness_bound_are_read_again(self, cache, backend, clock):
+        backend.create_task(make_task())
+        cache.get_task('task-1')
+
+        # GIVEN another container updated the task
+        backend.tasks['task-1'] = make_task(version=2)
+        clock.now = 1.5
+
+        assert cache.get_task('task-1').version == 2
+        assert backend.reads == 2
+        assert cache.expirations == 1
+
+    def test_missing_tasks_are_not_cached(self, cache, backend):
+        assert cache.get_task('missing') is None
+        assert cache.get_task('missing') is None
+
+        assert backend.reads == 2
+
+    def test_version_reads_use_fresh_entries(self, cache, backend, clock):
+        """Conditional reads are answered from the cache, and fall back to the repository once stale."""
+        backend.create_task(make_task(version=1))
+        cache.get_task('task-1')
+
+        assert cache.get_task_version('task-1') == 1
+        assert backend.reads == 1
+
+        backend.tasks['task-1'] = make_task(version=2)
+        clock.now = 1.5
+        assert cache.get_task_version('task-1') == 2
+
+
+class TestInvalidation:
+    """Writes made through the cache never leave an older version behind."""
+
+    def test_update_caches_the_written_version(self, cache, backend):
+        backend.create_task(make_task())
+        cache.get_task('task-1')
+
+        cache.update_task(make_task(version=2, title='Renamed'), expected_version=1)
+
+        assert cache.get_task('task-1').title == 'Renamed'
+        assert backend.reads == 1
+
+    def test_patch_caches_the_written_version(self, cache, backend):
+        backend.create_task(make_task())
+        cache.get_task('task-1')
+
+        cache.patch_task('task-1', TaskPatch(version=2, updated_at=datetime.now(UTC), status=TaskStatus.IN_PROGRESS), expected_version=1)
+
+        assert cache.get_task('task-1').status == TaskStatus.IN_PROGRESS
+
+    def test_patch_passes_the_cached_task_as_known_task(self, cache, backend, clock):
+        backend.create_task(make_task())
+        cache.get_task('task-1')
+        clock.now = 5.0
+        received = []
+        backend.patch_task = lambda *args, **kwargs: received.append(args) or make_task(version=2)
+
+        cache.patch_task('task-1', TaskPatch(version=2, updated_at=datetime.now(UTC), title='Renamed'), expected_version=1)
+
+        assert received[0][-1].version == 1
+
+    def test_conflict_caches_the_current_version(self, cache, backend):
+        backend.create_task(make_task(version=5))
+
+        with pytest.raises(ConflictError):
+            cache.update_task(make_task(version=6), expected_version=1)
+
+        assert cache.get_task('task-1').version == 5
+        assert backend.reads == 0
+
+    def test_delete_invalidates(self, cache, backend):
+        backend.create_task(make_task())
+        cache.get_task('task-1')
+
+        cache.delete_task('task-1', 1)
+
+        assert cache.get_task('task-1') is None
+
+    def test_older_version_does_not_replace_newer(self, cache, backend):
+        backend.create_task(make_task(version=1))
+        cache.update_task(make_task(version=3), expected_version=1)
+
+        cache._store(make_task(version=2))
+
+        assert cache.get_task('task-1').version == 3
+
+
+class TestEviction:
+    """The cache stays within its entry and byte budgets."""
+
+    def test_least_recently_used_entry_is_evicted(self, cache, backend):
+        for i in range(4):
+            backend.create_task(make_task(f'task-{i}'))
+        for task_id in ('task-0', 'task-1', 'task-2', 'task-0', 'task-3'):
+            cache.get_task(task_id)
+
+        assert cache.evictions == 1
+        cache.get_task('task-0')
+        assert cache.hits == 2
+        cache.get_task('task-1')
+        assert cache.stats()['misses'] == 5
+
+    def test_byte_budget(self, backend, clock):
+        tasks = [make_task(f'task-{i}', description='x' * 400) for i in range(3)]
+        for task in tasks:
+            backend.create_task(task)
+        cache = CachingTaskRepository(backend, max_bytes=2 * task_size(tasks[0]), clock=clock)
+
+        for task in tasks:
+            cache.get_task(task.task_id)
+
+        assert cache.stats()['entries'] == 2
+        assert cache.size_bytes <= cache.max_bytes
+
+
+class TestMetrics:
+    """Counters are published as increments since the previous publish."""
+
+    def test_publishes_increments(self, cache, backend, monkeypatch):
+        from shared.integration import caching_repository
+
+        published = []
+        monkeypatch.setattr(caching_repository.metrics, 'add_metric', lambda name, unit, value: published.append((name, value)))
+        backend.create_task(make_task())
+
+        cache.get_task('task-1')
+        cache.publish_metrics()
+        cache.get_task('task-1')
+        cache.publish_metrics()
+
+        counts = [dict(published[:6]), dict(published[6:])]
+        assert (counts[0]['CacheMisses'], counts[0]['CacheHits']) == (1, 0)
+        assert (counts[1]['CacheMisses'], counts[1]['CacheHits']) == (0, 1)
@@ -0,0 +1,63 @@
+"""Unit tests for opaque pagination cursors."""
+
+import uuid
+
+import pytest
+
+from shared.integration.cursors import decode_cursor, encode_cursor
+
+INDEX_KEY = ('status', 'created_at', 'task_id')
+
+
+class TestCursors:
+    """Cursors round-trip positions and reject anything they did not produce."""
+
+    def test_round_trips_index_position(self):
+        # GIVEN the LastEvaluatedKey of a GSI query
+        task_id = str(uuid.uuid4())
+        last_key = {'status': {'S': 'pending'}, 'created_at': {'S': '2026-01-02T03:04:05.678901+00:00'}, 'task_id': {'S': task_id}}
+
+        # WHEN encoding and decoding it
+        token = encode_cursor({0: last_key}, INDEX_KEY)
+
+        # THEN the key comes back unchanged and the token hides the key layout
+        assert decode_cursor(token, INDEX_KEY) == (1, {0: last_key})
+        assert 'task_id' not in token and 'status' not in token
+        assert set(token) <= set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_')
+
+    def test_uuid_keys_are_packed(self):
+        """A task ID key packs into a cursor shorter than the ID string itself."""
+        last_key = {'task_id': {'S': str(uuid.uuid4())}}
+
+        token = encode_cursor({0: last_key}, ('task_id',))
+
+        assert len(token) < len(last_key['task_id']['S'])
+        assert decode_cursor(token, ('task_id',)) == (1, {0: last_key})
+
+    @pytest.mark.parametrize('task_id', ['task-1', str(uuid.uuid4()).upper(), 'ünïcode-ïd'])
+    def test_non_canonical_values_round_trip(self, task_id):
+        last_key = {'task_id': {'S': task_id}}
+
+        assert decode_cursor(encode_cursor({0: last_key}, ('task_id',)), ('task_id',)) == (1, {0: last_key})
+
+    def test_carries_multi_segment_state(self):
+        """Unstarted segments keep no key and finished segments are left out."""
+        positions = {0: None, 2: {'task_id': {'S': 'task-9'}}, 200: None}
+
+        token = encode_cursor(positions, ('task_id',), total_segments=300)
+
+        assert decode_cursor(token, ('task_id',)) == (300, positions)
+
+    def test_finished_read_has_no_token(self):
+        assert encode_cursor({}, ('task_id',), total_segments=4) is None
+
+    @pytest.mark.parametrize('token', ['', 'not-a-cursor', '{"task_id": {"S": "task-1"}}', 'AgEBAAEAAA', 'AQEBAAEABXRhc2s'])
+    def test_rejects_foreign_tokens(self, token):
+        with pytest.raises(ValueError, match='Invalid pagination token'):
+            decode_cursor(token, ('task_id',))
+
+    def test_rejects_token_for_another_key_layout(self):
+        token = encode_cursor({0: {'task_id': {'S': 'task-1'}}}, ('task_id',))
+
+        with pytest.raises(ValueError, match='Invalid pagination token'):
+            decode_cursor(token, INDEX_KEY)
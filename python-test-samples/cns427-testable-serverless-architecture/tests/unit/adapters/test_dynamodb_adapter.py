@@ -0,0 +1,863 @@
+"""Unit tests for DynamoDB adapter request building - no AWS calls.
+
+A recording stub replaces the boto3 client so we can assert on the exact
+low-level requests the adapter issues.
+"""
+
+import threading
+from datetime import UTC, datetime
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.task_service.domain.exceptions import ConflictError, ThrottlingError
+from services.task_service.models.task import Task, TaskCreatedEvent, TaskDeletedEvent, TaskPatch, TaskPriority, TaskSortOrder, TaskStatus
+from shared.integration.dynamodb_adapter import PRIORITY_INDEX, STATUS_INDEX, STATUS_PRIORITY_INDEX, DynamoDBTaskRepository
+from shared.integration.task_codec import encode_task
+
+
+class RecordingDynamoDBClient:
+    """Minimal DynamoDB client stub that records calls and serves adjacency from a dict."""
+
+    def __init__(self, adjacency=None, unprocessed_once=False):
+        self.adjacency = adjacency or {}
+        self.unprocessed_once = unprocessed_once
+        self.calls = []
+
+    def batch_get_item(self, RequestItems):
+        self.calls.append(('batch_get_item', RequestItems))
+        (table_name, request), *_ = RequestItems.items()
+        attribute = request['ExpressionAttributeNames']['#edges']
+        keys = [key['task_id']['S'] for key in request['Keys']]
+
+        unprocessed = {}
+        if self.unprocessed_once and len(keys) > 1:
+            self.unprocessed_once = False
+            unprocessed = {table_name: {**request, 'Keys': request['Keys'][1:]}}
+            keys = keys[:1]
+
+        items = []
+        for task_id in keys:
+            if task_id not in self.adjacency:
+                continue
+            item = {'task_id': {'S': task_id}}
+            if self.adjacency[task_id]:
+                item[attribute] = {'SS': self.adjacency[task_id]}
+            items.append(item)
+        return {'Responses': {table_name: items}, 'UnprocessedKeys': unprocessed}
+
+    def get_item(self, **kwargs):
+        self.calls.append(('get_item', kwargs))
+        task_id = kwargs['Key']['task_id']['S']
+        if self.adjacency.get(task_id):
+            return {'Item': {'task_id': {'S': task_id}, 'depends_on': {'SS': self.adjacency[task_id]}}}
+        return {}
+
+    def put_item(self, **kwargs):
+        self.calls.append(('put_item', kwargs))
+        return {}
+
+    def update_item(self, **kwargs):
+        self.calls.append(('update_item', kwargs))
+        return {}
+
+    def delete_item(self, **kwargs):
+        self.calls.append(('delete_item', kwargs))
+        return {}
+
+    def query(self, **kwargs):
+        self.calls.append(('query', kwargs))
+        return {'Items': []}
+
+    def scan(self, **kwargs):
+        self.calls.append(('scan', kwargs))
+        return {'Items': []}
+
+    def transact_write_items(self, TransactItems):
+        self.calls.append(('transact_write_items', TransactItems))
+        return {}
+
+    def batch_write_item(self, RequestItems):
+        self.calls.append(('batch_write_item', RequestItems))
+        return {'UnprocessedItems': {}}
+
+    def operations(self):
+        return [name for name, _ in self.calls]
+
+
+def make_task(task_id='task-1', dependencies=None, version=1000):
+    now = datetime.now(UTC)
+    return Task(
+        task_id=task_id,
+        title='Task',
+        status=TaskStatus.PENDING,
+        dependencies=dependencies or [],
+        created_at=now,
+        updated_at=now,
+        version=version,
+    )
+
+
+def index_updates(transact_items):
+    """Map graph index item key -> Update request from a transaction."""
+    return {
+        item['Update']['Key']['task_id']['S']: item['Update']
+        for item in transact_items
+        if 'Update' in item and item['Update']['TableName'] == 'graph'
+    }
+
+
+@pytest.fixture
+def make_repository():
+    def factory(graph_table_name='graph', outbox_table_name=None, **client_kwargs):
+        repository = DynamoDBTaskRepository(table_name='tasks', graph_table_name=graph_table_name, outbox_table_name=outbox_table_name)
+        repository.dynamodb = RecordingDynamoDBClient(**client_kwargs)
+        return repository
+
+    return factory
+
+
+class TestDependencyGraphLoading:
+    """Subgraph loading via batched frontier expansion."""
+
+    def test_loads_only_reachable_subgraph(self, make_repository):
+        """Nodes not reachable from the roots are never requested."""
+        adjacency = {'a': ['b'], 'b': ['c'], 'c': [], 'unrelated': ['a']}
+        repository = make_repository(adjacency=adjacency)
+
+        graph = repository.get_dependency_graph(['a'])
+
+        assert graph == {'a': ['b'], 'b': ['c']}
+        requested = [key['task_id']['S'] for _, items in repository.dynamodb.calls for key in items['graph']['Keys']]
+        assert 'unrelated' not in requested
+        # One BatchGetItem per BFS level
+        assert repository.dynamodb.operations() == ['batch_get_item'] * 3
+
+    def test_frontier_is_chunked_to_batch_get_limit(self, make_repository):
+        """A frontier wider than 100 keys is split across BatchGetItem calls."""
+        roots = [f'task-{i}' for i in range(250)]
+        repository = make_repository(adjacency={root: [] for root in roots})
+
+        repository.get_dependency_graph(roots)
+
+        sizes = [len(items['graph']['Keys']) for _, items in repository.dynamodb.calls]
+        assert sizes == [100, 100, 50]
+
+    def test_unprocessed_keys_are_retried(self, make_repository):
+        """UnprocessedKeys from BatchGetItem are re-requested."""
+        repository = make_repository(adjacency={'a': ['x'], 'b': ['y']}, unprocessed_once=True)
+
+        graph = repository.get_dependency_graph(['a', 'b'])
+
+        assert graph == {'a': ['x'], 'b': ['y']}
+
+    def test_without_graph_index_reads_tasks_table_projection(self, make_repository):
+        """Without the index, adjacency is projected from the tasks table."""
+        repository = make_repository(graph_table_name=None, adjacency={'a': []})
+
+        repository.get_dependency_graph(['a'])
+
+        _, request_items = repository.dynamodb.calls[0]
+        assert request_items['tasks']['ExpressionAttributeNames'] == {'#edges': 'dependencies'}
+
+
+class TestGraphIndexMaintenance:
+    """Index items are written in the same transaction as the task."""
+
+    def test_create_with_dependencies_is_transactional(self, make_repository):
+        """Task put, adjacency and reverse adjacency go in one TransactWriteItems call."""
+        repository = make_repository()
+
+        repository.create_task(make_task(dependencies=['dep-1', 'dep-2']))
+
+        assert repository.dynamodb.operations() == ['transact_write_items']
+        transact_items = repository.dynamodb.calls[0][1]
+        assert transact_items[0]['Put']['TableName'] == 'tasks'
+        updates = index_updates(transact_items)
+        assert updates['task-1']['ExpressionAttributeValues'] == {':deps': {'SS': ['dep-1', 'dep-2']}}
+        assert updates['dep-1']['UpdateExpression'] == 'ADD dependents :added'
+        assert updates['dep-2']['ExpressionAttributeValues'] == {':added': {'SS': ['task-1']}}
+
+    def test_create_without_dependencies_is_single_put(self, make_repository):
+        """Tasks without edges skip the index entirely."""
+        repository = make_repository()
+
+        repository.create_task(make_task())
+
+        assert repository.dynamodb.operations() == ['put_item']
+
+    def test_update_with_changed_dependencies_moves_edges(self, make_repository):
+        """Added edges are ADDed and removed edges DELETEd from reverse adjacency."""
+        repository = make_repository(adjacency={'task-1': ['old-dep', 'kept']})
+
+        repository.update_task(make_task(dependencies=['kept', 'new-dep'], version=2000), expected_version=1000)
+
+        assert repository.dynamodb.operations() == ['get_item', 'transact_write_items']
+        transact_items = repository.dynamodb.calls[1][1]
+        assert transact_items[0]['Update']['TableName'] == 'tasks'
+        updates = index_updates(transact_items)
+        assert set(updates) == {'task-1', 'new-dep', 'old-dep'}
+        assert updates['new-dep']['UpdateExpression'] == 'ADD dependents :added'
+        assert updates['old-dep']['UpdateExpression'] == 'DELETE dependents :removed'
+
+    def test_update_with_unchanged_dependencies_is_single_update(self, make_repository):
+        """Unchanged edges do not touch the index."""
+        repository = make_repository(adjacency={'task-1': ['kept']})
+
+        repository.update_task(make_task(dependencies=['kept'], version=2000), expected_version=1000)
+
+        assert repository.dynamodb.operations() == ['get_item', 'update_item']
+
+    def test_backfill_indexes_stored_tasks_with_dependencies(self, make_repository):
+        """Tasks stored before the index existed get their adjacency and reverse adjacency written."""
+        repository = make_repository()
+        stored = [make_task('task-1', dependencies=['dep-1']), make_task('task-2', dependencies=['dep-1']), make_task('dep-1')]
+        repository.dynamodb.scan = lambda **kwargs: {'Items': [encode_task(task) for task in stored]}
+
+        backfilled = repository.backfill_graph_index()
+
+        assert backfilled == 2
+        updates = {call['Key']['task_id']['S']: call for name, call in repository.dynamodb.calls if name == 'update_item'}
+        assert set(updates) == {'task-1', 'task-2', 'dep-1'}
+        assert updates['task-1']['UpdateExpression'] == 'SET depends_on = :deps'
+        assert updates['dep-1']['ExpressionAttributeValues'] == {':added': {'SS': ['task-1', 'task-2']}}
+
+    def test_too_many_dependencies_rejected(self, make_repository):
+        """Dependency changes beyond the transaction item limit are rejected."""
+        repository = make_repository()
+
+        with pytest.raises(ValueError, match='transaction limit'):
+            repository.create_task(make_task(dependencies=[f'dep-{i}' for i in range(120)]))
+
+
+class TestFilteredListing:
+    """Filters are mapped to GSI queries instead of scans."""
+
+    @pytest.mark.parametrize(
+        ('filters', 'index_name', 'partition_value'),
+        [
+            ({'status': TaskStatus.PENDING}, STATUS_INDEX, 'pending'),
+            ({'priority': TaskPriority.HIGH}, PRIORITY_INDEX, 'high'),
+            ({'status': TaskStatus.COMPLETED, 'priority': TaskPriority.LOW}, STATUS_PRIORITY_INDEX, 'completed#low'),
+        ],
+    )
+    def test_filters_use_matching_index(self, make_repository, filters, index_name, partition_value):
+        """Each filter combination queries its own index."""
+        repository = make_repository()
+
+        repository.list_tasks(limit=10, **filters)
+
+        operation, request = repository.dynamodb.calls[0]
+        assert operation == 'query'
+        assert request['IndexName'] == index_name
+        assert request['ExpressionAttributeValues'][':pk'] == {'S': partition_value}
+        assert request['Limit'] == 10
+
+    def test_created_after_and_sort_map_to_key_condition(self, make_repository):
+        """created_after is a sort-key condition and descending sort reverses the index."""
+        repository = make_repository()
+
+        repository.list_tasks(status=TaskStatus.PENDING, created_after=datetime(2025, 1, 1, tzinfo=UTC), sort=TaskSortOrder.CREATED_AT_DESC)
+
+        _, request = repository.dynamodb.calls[0]
+        assert request['KeyConditionExpression'] == '#pk = :pk AND created_at > :created_after'
+        assert request['ExpressionAttributeValues'][':created_after'] == {'S': '2025-01-01T00:00:00+00:00'}
+        assert request['ScanIndexForward'] is False
+
+    def test_status_and_priority_filter_status_index_until_backfilled(self, make_repository):
+        """Before the status_priority backfill, the priority is a filter on the status index."""
+        repository = make_repository()
+        repository.status_priority_index = False
+
+        repository.list_tasks(limit=10, status=TaskStatus.COMPLETED, priority=TaskPriority.LOW)
+
+        _, request = repository.dynamodb.calls[0]
+        assert request['IndexName'] == STATUS_INDEX
+        assert request['FilterExpression'] == 'priority = :priority'
+        assert request['ExpressionAttributeValues'] == {':pk': {'S': 'completed'}, ':priority': {'S': 'low'}}
+
+    def test_backfill_sets_status_priority_on_unchanged_tasks(self, make_repository):
+        """Only tasks without the attribute are read, and a task changed meanwhile is skipped."""
+        repository = make_repository(graph_table_name=None)
+        scanned = [{'task_id': {'S': f'task-{index}'}, 'status': {'S': 'completed'}, 'priority': {'S': 'high'}} for index in range(2)]
+        repository.dynamodb.scan = lambda **kwargs: repository.dynamodb.calls.append(('scan', kwargs)) or {'Items': scanned}
+        updates = []
+
+        def update_item(**kwargs):
+            updates.append(kwargs)
+            if kwargs['Key']['task_id']['S'] == 'task-1':
+                raise condition_failed()
+            return {}
+
+        repository.dynamodb.update_item = update_item
+
+        backfilled = repository.backfill_status_priority()
+
+        assert backfilled == 1
+        assert repository.dynamodb.calls[0][1]['FilterExpression'] == 'attribute_not_exists(status_priority)'
+        assert updates[0]['ExpressionAttributeValues'][':status_priority'] == {'S': 'completed#high'}
+        assert updates[0]['ConditionExpression'] == '#status = :status AND priority = :priority'
+
+    def test_unfiltered_listing_scans(self, make_repository):
+        """Without status or priority the table is scanned."""
+        repository = make_repository()
+
+        repository.list_tasks(limit=5)
+
+        assert repository.dynamodb.operations() == ['scan']
+
+    def test_writes_maintain_composite_index_key(self, make_repository):
+        """Creates write the status + priority composite key."""
+        repository = make_repository(graph_table_name=None)
+
+        repository.create_task(make_task())
+
+        _, request = repository.dynamodb.calls[0]
+        assert request['Item']['status_priority'] == {'S': 'pending#medium'}
+
+
+class SegmentedScanClient:
+    """DynamoDB client stub that pages a Scan over tasks split into segments by index modulo."""
+
+    def __init__(self, task_count, barrier=None):
+        self.items = [encode_task(make_task(task_id=f'task-{i:03d}')) for i in range(task_count)]
+        self.barrier = barrier
+        self.requests = []
+
+    def scan(self, **kwargs):
+        self.requests.append(kwargs)
+        if self.barrier is not None:
+            self.barrier.wait()
+        total, segment = kwargs.get('TotalSegments', 1), kwargs.get('Segment', 0)
+        items = [item for i, item in enumerate(self.items) if i % total == segment]
+        start = 0
+        if 'ExclusiveStartKey' in kwargs:
+            start = next(i for i, item in enumerate(items) if item['task_id'] == kwargs['ExclusiveStartKey']['task_id']) + 1
+        page = items[start : start + kwargs['Limit']]
+        response = {'Items': page}
+        if start + kwargs['Limit'] < len(items):
+            response['LastEvaluatedKey'] = {'task_id': page[-1]['task_id']}
+        return response
+
+
+def walk(repository, limit, next_token=None):
+    """Page through list_tasks to the end, returning task IDs and tokens."""
+    task_ids, tokens = [], []
+    while True:
+        tasks, next_token = repository.list_tasks(limit=limit, next_token=next_token)
+        task_ids.extend(task.task_id for task in tasks)
+        if not next_token:
+            return task_ids, tokens
+        tokens.append(next_token)
+
+
+class TestPagination:
+    """Listings return opaque cursors and can be split into parallel scan segments."""
+
+    def make_repository(self, task_count, scan_segments=1, barrier=None):
+        repository = DynamoDBTaskRepository(table_name='tasks', scan_segments=scan_segments)
+        repository.dynamodb = SegmentedScanClient(task_count, barrier)
+        return repository
+
+    def test_single_segment_walk(self):
+        # GIVEN a table with 7 tasks
+        repository = self.make_repository(7)
+
+        # WHEN paging through it 3 at a time
+        task_ids, tokens = walk(repository, limit=3)
+
+        # THEN every task is returned once and tokens are opaque
+        assert task_ids == [f'task-{i:03d}' for i in range(7)]
+        assert len(tokens) == 2
+        assert all('task_id' not in token for token in tokens)
+
+    def test_parallel_segments_split_the_page_limit(self):
+        """Each page reads every segment at once and never returns more than the limit."""
+        repository = self.make_repository(20, scan_segments=4, barrier=threading.Barrier(4, timeout=1))
+
+        tasks, next_token = repository.list_tasks(limit=8)
+
+        assert len(tasks) == 8
+        assert sorted((request['Segment'], request['TotalSegments'], request['Limit']) for request in repository.dynamodb.requests) == [
+            (0, 4, 2),
+            (1, 4, 2),
+            (2, 4, 2),
+            (3, 4, 2),
+        ]
+        assert next_token is not None
+
+    def test_parallel_walk_returns_every_task_once(self):
+        repository = self.make_repository(23, scan_segments=3)
+
+        task_ids, _ = walk(repository, limit=5)
+
+        assert sorted(task_ids) == [f'task-{i:03d}' for i in range(23)]
+
+    def test_walk_keeps_segment_count_of_its_first_page(self):
+        """Tokens carry the segment count, so configuration changes do not break a walk in progress."""
+        repository = self.make_repository(10, scan_segments=2)
+        tasks, next_token = repository.list_tasks(limit=4)
+
+        repository.scan_segments = 5
+        rest, _ = walk(repository, limit=4, next_token=next_token)
+
+        assert sorted([task.task_id for task in tasks] + rest) == [f'task-{i:03d}' for i in range(10)]
+        assert {request['TotalSegments'] for request in repository.dynamodb.requests} == {2}
+
+    def test_rejects_legacy_json_tokens(self):
+        repository = self.make_repository(3)
+
+        with pytest.raises(ValueError, match='Invalid pagination token'):
+            repository.list_tasks(next_token='{"task_id": {"S": "task-001"}}')
+
+    def test_scan_tasks_reads_segments_in_parallel(self):
+        """A full read runs one thread per segment and yields every task once."""
+        repository = self.make_repository(30, scan_segments=3, barrier=threading.Barrier(3, timeout=1))
+
+        task_ids = [task.task_id for page in repository.scan_tasks(page_size=4) for task in page]
+
+        assert sorted(task_ids) == [f'task-{i:03d}' for i in range(30)]
+
+    def test_scan_tasks_stops_segments_when_abandoned(self):
+        """Stopping early leaves no segment thread running."""
+        repository = self.make_repository(100, scan_segments=4)
+
+        pages = repository.scan_tasks(page_size=1)
+        next(pages)
+        pages.close()
+
+        assert len(repository.dynamodb.requests) < 100
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith('scan-segment')]
+
+    def test_scan_tasks_maps_client_errors(self):
+        repository = self.make_repository(10, scan_segments=2)
+        repository.dynamodb.scan = lambda **kwargs: (_ for _ in ()).throw(
+            ClientError({'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'Rate exceeded'}}, 'Scan')
+        )
+
+        with pytest.raises(ThrottlingError):
+            list(repository.scan_tasks())
+
+
+class TestBulkCreate:
+    """Bulk creates are chunked into BatchWriteItem calls or per-component transactions."""
+
+    def test_independent_tasks_chunked_into_batch_writes(self, make_repository):
+        """Unlinked tasks are written 25 at a time."""
+        repository = make_repository(graph_table_name=None)
+        tasks = [make_task(task_id=f'task-{i}') for i in range(60)]
+
+        failures = repository.create_tasks(tasks)
+
+        assert failures == {}
+        sizes = [len(items['tasks']) for operation, items in repository.dynamodb.calls if operation == 'batch_write_item']
+        assert sizes == [25, 25, 10]
+
+    def test_linked_tasks_written_in_one_transaction(self, make_repository):
+        """Tasks linked by in-batch dependencies are written atomically together."""
+        repository = make_repository()
+        tasks = [make_task(task_id='parent'), make_task(task_id='child', dependencies=['parent', 'existing']), make_task(task_id='solo')]
+
+        repository.create_tasks(tasks)
+
+        assert sorted(repository.dynamodb.operations()) == ['batch_write_item', 'transact_write_items']
+        transact_items = next(items for operation, items in repository.dynamodb.calls if operation == 'transact_write_items')
+        puts = [item['Put']['Item']['task_id']['S'] for item in transact_items if 'Put' in item]
+        assert sorted(puts) == ['child', 'parent']
+        updates = index_updates(transact_items)
+        assert updates['parent']['ExpressionAttributeValues'] == {':added': {'SS': ['child']}}
+        assert updates['child']['ExpressionAttributeValues'] == {':deps': {'SS': ['existing', 'parent']}}
+
+    def test_failed_transaction_fails_whole_component(self, make_repository):
+        """A cancelled transaction reports every task in the component as failed."""
+        repository = make_repository()
+
+        def cancel(TransactItems):
+            raise ClientError(
+                {'Error': {'Code': 'TransactionCanceledException'}, 'CancellationReasons': [{'Code': 'ConditionalCheckFailed'}]}, 'TransactWriteItems'
+            )
+
+        repository.dynamodb.transact_write_items = cancel
+
+        failures = repository.create_tasks([make_task(task_id='a'), make_task(task_id='b', dependencies=['a'])])
+
+        assert set(failures) == {'a', 'b'}
+        assert all(isinstance(error, ConflictError) for error in failures.values())
+
+    def test_oversized_component_rejected_before_writing(self, make_repository):
+        """A linked chain needing more than 100 transaction items fails with a message naming it; other tasks are still written."""
+        # GIVEN a chain of 34 linked tasks, each needing a task put, an outbox put and a graph index item
+        repository = make_repository(outbox_table_name='outbox')
+        chain = [make_task(task_id='link-0')] + [make_task(task_id=f'link-{i}', dependencies=[f'link-{i - 1}']) for i in range(1, 34)]
+        tasks = chain + [make_task(task_id='solo')]
+
+        # WHEN creating the batch
+        failures = repository.create_tasks(tasks, outbox_events={task.task_id: TaskCreatedEvent(task) for task in tasks})
+
+        # THEN the whole chain fails up front and only the independent task is written
+        assert set(failures) == {task.task_id for task in chain}
+        assert all(isinstance(error, ValueError) for error in failures.values())
+        assert 'The 34 tasks linked by dependencies to task link-0 need 102 writes' in str(failures['link-5'])
+        written = [
+            item['Put']['Item']['task_id']['S']
+            for _, items in repository.dynamodb.calls
+            for item in items
+            if 'Put' in item and item['Put']['TableName'] == 'tasks'
+        ]
+        assert written == ['solo']
+
+
+class TestTransactionalOutbox:
+    """Outbox records are written in the same transaction as the task mutation."""
+
+    def test_create_writes_task_and_outbox_record_atomically(self, make_repository):
+        """A create with an outbox event becomes a two-item transaction."""
+        repository = make_repository(graph_table_name=None, outbox_table_name='outbox')
+        task = make_task()
+
+        repository.create_task(task, outbox_event=TaskCreatedEvent(task))
+
+        assert repository.dynamodb.operations() == ['transact_write_items']
+        task_put, outbox_put = (item['Put'] for item in repository.dynamodb.calls[0][1])
+        assert task_put['TableName'] == 'tasks'
+        assert outbox_put['TableName'] == 'outbox'
+        assert outbox_put['Item']['event_type'] == {'S': 'TaskCreated'}
+        assert 'expires_at' in outbox_put['Item']
+
+    def test_update_and_delete_include_outbox_record(self, make_repository):
+        """Updates and deletes are transactional when they carry an outbox event."""
+        repository = make_repository(graph_table_name=None, outbox_table_name='outbox')
+
+        repository.update_task(make_task(version=2000), expected_version=1000, outbox_event=TaskCreatedEvent(make_task()))
+        repository.delete_task('task-1', 2000, outbox_event=TaskDeletedEvent('task-1'))
+
+        assert repository.dynamodb.operations() == ['transact_write_items', 'transact_write_items']
+        update_items, delete_items = (items for _, items in repository.dynamodb.calls)
+        assert [next(iter(item)) for item in update_items] == ['Update', 'Put']
+        assert [next(iter(item)) for item in delete_items] == ['Delete', 'Put']
+
+    def test_outbox_event_without_outbox_table_is_rejected(self, make_repository):
+        """Events are never silently dropped when no outbox table is configured."""
+        from services.task_service.domain.exceptions import RepositoryError
+
+        repository = make_repository(graph_table_name=None)
+        task = make_task()
+
+        with pytest.raises(RepositoryError):
+            repository.create_task(task, outbox_event=TaskCreatedEvent(task))
+
+        assert repository.dynamodb.calls == []
+
+    def test_bulk_create_packs_independent_tasks_into_transactions(self, make_repository):
+        """With outbox events, independent tasks share transactions of 50 tasks and 50 outbox records."""
+        repository = make_repository(graph_table_name=None, outbox_table_name='outbox')
+        tasks = [make_task(task_id=f'task-{i}') for i in range(60)]
+
+        failures = repository.create_tasks(tasks, outbox_events={task.task_id: TaskCreatedEvent(task) for task in tasks})
+
+        assert failures == {}
+        assert repository.dynamodb.operations() == ['transact_write_items', 'transact_write_items']
+        assert [len(items) for _, items in repository.dynamodb.calls] == [100, 20]
+
+
+def stored_item(status='pending', priority='medium', version=1000, status_priority=None):
+    now = datetime.now(UTC).isoformat()
+    return {
+        'task_id': {'S': 'task-1'},
+        'title': {'S': 'Task'},
+        'status': {'S': status},
+        'priority': {'S': priority},
+        'status_priority': {'S': status_priority or f'{status}#{priority}'},
+        'dependencies': {'L': []},
+        'created_at': {'S': now},
+        'updated_at': {'S': now},
+        'version': {'N': str(version)},
+    }
+
+
+def condition_failed(item=None):
+    response = {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'The conditional request failed'}}
+    if item is not None:
+        response['Item'] = item
+    return ClientError(response, 'UpdateItem')
+
+
+class TestConditionalPatch:
+    """Updates are a single conditional UpdateItem on both the happy and the conflict path."""
+
+    def test_patch_is_one_call_with_conditions_and_return_values(self, make_repository):
+        """Version and allowed statuses are conditions; the new item comes back from the write."""
+        repository = make_repository(graph_table_name=None)
+        repository.dynamodb.update_item = lambda **kwargs: (
+            repository.dynamodb.calls.append(('update_item', kwargs))
+            or {'Attributes': stored_item(status='in_progress', priority='high', version=2000)}
+        )
+        patch = TaskPatch(version=2000, updated_at=datetime.now(UTC), status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH)
+
+        task = repository.patch_task('task-1', patch, expected_version=1000, allowed_statuses=[TaskStatus.PENDING])
+
+        assert repository.dynamodb.operations() == ['update_item']
+        request = repository.dynamodb.calls[0][1]
+        assert request['ConditionExpression'] == 'attribute_exists(task_id) AND #version = :expected_version AND #status IN (:from_status_0)'
+        assert request['ExpressionAttributeValues'][':from_status_0'] == {'S': 'pending'}
+        assert request['ExpressionAttributeValues'][':status_priority'] == {'S': 'in_progress#high'}
+        assert request['ReturnValues'] == 'ALL_NEW'
+        assert request['ReturnValuesOnConditionCheckFailure'] == 'ALL_OLD'
+        assert task.status == TaskStatus.IN_PROGRESS and task.version == 2000
+
+    def test_version_conflict_uses_returned_item(self, make_repository):
+        """A stale version raises ConflictError from the ALL_OLD item without another read."""
+        repository = make_repository(graph_table_name=None)
+
+        def update_item(**kwargs):
+            repository.dynamodb.calls.append(('update_item', kwargs))
+            raise condition_failed(stored_item(version=1500))
+
+        repository.dynamodb.update_item = update_item
+
+        with pytest.raises(ConflictError) as exc_info:
+            repository.patch_task('task-1', TaskPatch(version=2000, updated_at=datetime.now(UTC), title='New'), expected_version=1000)
+
+        assert repository.dynamodb.operations() == ['update_item']
+        assert exc_info.value.current_task['version'] == 1500
+
+    def test_disallowed_status_and_missing_task(self, make_repository):
+        """Matching version with a disallowed status is a transition error; no item means not found."""
+        repository = make_repository(graph_table_name=None)
+        patch = TaskPatch(version=2000, updated_at=datetime.now(UTC), status=TaskStatus.IN_PROGRESS)
+
+        def completed(**kwargs):
+            raise condition_failed(stored_item(status='completed'))
+
+        repository.dynamodb.update_item = completed
+        with pytest.raises(ValueError, match='Invalid status transition from completed to in_progress'):
+            repository.patch_task('task-1', patch, expected_version=1000, allowed_statuses=[TaskStatus.PENDING])
+
+        def missing(**kwargs):
+            raise condition_failed()
+
+        repository.dynamodb.update_item = missing
+        with pytest.raises(ValueError, match='Task not found'):
+            repository.patch_task('task-1', patch, expected_version=1000, allowed_statuses=[TaskStatus.PENDING])
+
+    def test_status_only_patch_writes_composite_index_key_in_one_call(self, make_repository):
+        """Changing only the status assumes the default priority, requires it and rewrites the status + priority key in the same write."""
+        repository = make_repository(graph_table_name=None)
+        repository.dynamodb.update_item = lambda **kwargs: (
+            repository.dynamodb.calls.append(('update_item', kwargs)) or {'Attributes': stored_item(status='completed', version=2000)}
+        )
+        patch = TaskPatch(version=2000, updated_at=datetime.now(UTC), status=TaskStatus.COMPLETED)
+
+        repository.patch_task('task-1', patch, expected_version=1000, allowed_statuses=[TaskStatus.PENDING, TaskStatus.IN_PROGRESS])
+
+        assert repository.dynamodb.operations() == ['update_item']
+        request = repository.dynamodb.calls[0][1]
+        assert 'priority = :current_priority' in request['ConditionExpression']
+        assert request['ExpressionAttributeValues'][':current_priority'] == {'S': 'medium'}
+        assert request['ExpressionAttributeValues'][':status_priority'] == {'S': 'completed#medium'}
+
+    def test_wrong_assumed_index_part_is_corrected_from_returned_item(self, make_repository):
+        """A priority-only patch of a task not in the assumed status is written again with the status from the ALL_OLD item."""
+        repository = make_repository(graph_table_name=None)
+        responses = [
+            condition_failed(stored_item(status='in_progress')),
+            {'Attributes': stored_item(status='in_progress', priority='high', version=2000)},
+        ]
+
+        def update_item(**kwargs):
+            repository.dynamodb.calls.append(('update_item', kwargs))
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        repository.dynamodb.update_item = update_item
+        patch = TaskPatch(version=2000, updated_at=datetime.now(UTC), priority=TaskPriority.HIGH)
+
+        task = repository.patch_task('task-1', patch, expected_version=1000)
+
+        assert repository.dynamodb.operations() == ['update_item', 'update_item']
+        first, second = (request for _, request in repository.dynamodb.calls)
+        assert first['ExpressionAttributeValues'][':status_priority'] == {'S': 'pending#high'}
+        assert second['ExpressionAttributeValues'][':current_status'] == {'S': 'in_progress'}
+        assert second['ExpressionAttributeValues'][':status_priority'] == {'S': 'in_progress#high'}
+        assert task.priority == TaskPriority.HIGH
+
+    def test_known_task_supplies_unpatched_index_part(self, make_repository):
+        """A priority-only patch takes the status from a known task at the expected version and writes once."""
+        repository = make_repository(graph_table_name=None)
+        repository.dynamodb.update_item = lambda **kwargs: (
+            repository.dynamodb.calls.append(('update_item', kwargs))
+            or {'Attributes': stored_item(status='in_progress', priority='high', version=2000)}
+        )
+        now = datetime.now(UTC)
+        known_task = Task(task_id='task-1', title='Task', status=TaskStatus.IN_PROGRESS, created_at=now, updated_at=now, version=1000)
+        patch = TaskPatch(version=2000, updated_at=now, priority=TaskPriority.HIGH)
+
+        repository.patch_task('task-1', patch, expected_version=1000, known_task=known_task)
+
+        assert repository.dynamodb.operations() == ['update_item']
+        request = repository.dynamodb.calls[0][1]
+        assert request['ExpressionAttributeValues'][':current_status'] == {'S': 'in_progress'}
+        assert request['ExpressionAttributeValues'][':status_priority'] == {'S': 'in_progress#high'}
+
+    def test_index_part_changing_twice_raises_conflict_with_current_task(self, make_repository):
+        """When the unpatched half differs again on the second write, the conflict carries the last stored task."""
+        repository = make_repository(graph_table_name=None)
+        responses = [condition_failed(stored_item(status='in_progress')), condition_failed(stored_item(status='completed'))]
+
+        def update_item(**kwargs):
+            repository.dynamodb.calls.append(('update_item', kwargs))
+            raise responses.pop(0)
+
+        repository.dynamodb.update_item = update_item
+        patch = TaskPatch(version=2000, updated_at=datetime.now(UTC), priority=TaskPriority.HIGH)
+
+        with pytest.raises(ConflictError) as exc_info:
+            repository.patch_task('task-1', patch, expected_version=1000)
+
+        assert exc_info.value.current_task['status'] == TaskStatus.COMPLETED
+
+
+class TestConditionalDelete:
+    """Deletes map a failed condition to conflict or not-found without reading first."""
+
+    def test_stale_version_raises_conflict_with_current_task(self, make_repository):
+        """The ALL_OLD item becomes the conflict payload."""
+        repository = make_repository(graph_table_name=None)
+
+        def delete_item(**kwargs):
+            repository.dynamodb.calls.append(('delete_item', kwargs))
+            raise condition_failed(stored_item(version=1500))
+
+        repository.dynamodb.delete_item = delete_item
+
+        with pytest.raises(ConflictError) as exc_info:
+            repository.delete_task('task-1', 1000)
+
+        assert repository.dynamodb.operations() == ['delete_item']
+        assert repository.dynamodb.calls[0][1]['ReturnValuesOnConditionCheckFailure'] == 'ALL_OLD'
+        assert exc_info.value.current_task['version'] == 1500
+
+    def test_missing_task_raises_not_found(self, make_repository):
+        """A failed condition without an item means the task does not exist."""
+        repository = make_repository(graph_table_name=None)
+
+        def delete_item(**kwargs):
+            raise condition_failed()
+
+        repository.dynamodb.delete_item = delete_item
+
+        with pytest.raises(ValueError, match='Task not found'):
+            repository.delete_task('task-1', 1000)
+
+    def test_cancelled_transaction_uses_cancellation_item(self, make_repository):
+        """Graph-indexed deletes read the conflict payload from the cancellation reason."""
+        repository = make_repository(adjacency={'task-1': ['dep-1']})
+
+        def cancel(TransactItems):
+            raise ClientError(
+                {
+                    'Error': {'Code': 'TransactionCanceledException'},
+                    'CancellationReasons': [{'Code': 'ConditionalCheckFailed', 'Item': stored_item(version=1500)}, {'Code': 'None'}],
+                },
+                'TransactWriteItems',
+            )
+
+        repository.dynamodb.transact_write_items = cancel
+
+        with pytest.raises(ConflictError) as exc_info:
+            repository.delete_task('task-1', 1000)
+
+        assert exc_info.value.current_task['version'] == 1500
+
+    def test_graph_indexed_delete_is_one_transaction_without_reads(self, make_repository):
+        """The task's graph index item is deleted in the same transaction, without reading its adjacency first."""
+        repository = make_repository(adjacency={'task-1': ['dep-1']})
+
+        repository.delete_task('task-1', 1000)
+
+        assert repository.dynamodb.operations() == ['transact_write_items']
+        task_delete, graph_delete = (item['Delete'] for item in repository.dynamodb.calls[0][1])
+        assert task_delete['TableName'] == 'tasks'
+        assert graph_delete == {'TableName': 'graph', 'Key': {'task_id': {'S': 'task-1'}}}
+
+
+class TestVersionRead:
+    """Conditional reads project only the version attribute."""
+
+    def test_projects_version(self, make_repository):
+        repository = make_repository()
+        repository.dynamodb.get_item = lambda **kwargs: repository.dynamodb.calls.append(('get_item', kwargs)) or {'Item': {'version': {'N': '42'}}}
+
+        assert repository.get_task_version('task-1') == 42
+
+        _, request = repository.dynamodb.calls[0]
+        assert request['ProjectionExpression'] == '#version'
+        assert request['ExpressionAttributeNames'] == {'#version': 'version'}
+
+    def test_missing_task(self, make_repository):
+        repository = make_repository()
+
+        assert repository.get_task_version('missing') is None
+
+
+class TestSparseFieldsets:
+    """fields= reads are projected to the requested attributes."""
+
+    def test_get_task_fields_projects_and_decodes(self, make_repository):
+        repository = make_repository()
+        item = {'task_id': {'S': 'task-1'}, 'status': {'S': 'pending'}}
+        repository.dynamodb.get_item = lambda **kwargs: repository.dynamodb.calls.append(('get_item', kwargs)) or {'Item': item}
+
+        task = repository.get_task_fields('task-1', ['task_id', 'status'])
+
+        _, request = repository.dynamodb.calls[0]
+        assert request['ProjectionExpression'] == '#p0, #p1'
+        assert request['ExpressionAttributeNames'] == {'#p0': 'task_id', '#p1': 'status'}
+        assert task.model_dump(mode='json') == {'task_id': 'task-1', 'status': 'pending'}
+
+    def test_index_query_merges_projection_names(self, make_repository):
+        repository = make_repository()
+
+        repository.list_task_fields(['title'], limit=10, status=TaskStatus.PENDING)
+
+        operation, request = repository.dynamodb.calls[0]
+        assert operation == 'query'
+        assert request['ProjectionExpression'] == '#p0'
+        assert request['ExpressionAttributeNames'] == {'#pk': 'status', '#p0': 'title'}
+
+    def test_full_listing_is_not_projected(self, make_repository):
+        repository = make_repository()
+
+        repository.list_tasks(limit=10)
+
+        _, request = repository.dynamodb.calls[0]
+        assert 'ProjectionExpression' not in request
+
+
+class TestLazyClient:
+    """The boto3 client is only created when the repository first talks to DynamoDB."""
+
+    def test_client_created_on_first_use(self, monkeypatch):
+        from shared.integration import dynamodb_adapter
+
+        created = []
+        monkeypatch.setattr(dynamodb_adapter, 'get_dynamodb_client', lambda: created.append('client') or RecordingDynamoDBClient())
+
+        repository = DynamoDBTaskRepository(table_name='tasks')
+        assert created == []
+
+        repository.get_task('missing')
+        repository.get_task('missing')
+        assert created == ['client']
+
+    def test_handler_import_does_not_load_boto3(self):
+        """Importing the handlers leaves boto3 for the first request that needs it."""
+        import subprocess
+        import sys
+
+        code = 'import sys, services.task_service.handler, services.notification_service.handler; print("boto3" in sys.modules)'
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == 'False'
@@ -0,0 +1,122 @@
+"""
+Unit tests for EventBridgePublisher batching and partial-failure retry.
+
+A recording stub stands in for the EventBridge client so tests can assert on the
+exact PutEvents calls the publisher makes.
+"""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from services.task_service.domain.exceptions import RepositoryError
+from services.task_service.models.task import Task, TaskCreatedEvent
+from shared.integration import eventbridge_adapter
+from shared.integration.eventbridge_adapter import PUT_EVENTS_MAX_BYTES, EventBridgePublisher, entry_size, pack_entries
+
+
+class RecordingEventsClient:
+    """EventBridge client stub that records calls and fails entries on request."""
+
+    def __init__(self, fail_plan=None):
+        # fail_plan: per call, a mapping of entry position -> ErrorCode
+        self.fail_plan = list(fail_plan or [])
+        self.calls = []
+
+    def put_events(self, Entries):
+        self.calls.append(Entries)
+        failures = self.fail_plan.pop(0) if self.fail_plan else {}
+        results = [{'ErrorCode': failures[i], 'ErrorMessage': 'failed'} if i in failures else {'EventId': f'id-{i}'} for i in range(len(Entries))]
+        return {'FailedEntryCount': len(failures), 'Entries': results}
+
+
+def make_event(title='Task'):
+    now = datetime.now(UTC)
+    task = Task(task_id=f'task-{title}', title=title, created_at=now, updated_at=now, version=1)
+    return TaskCreatedEvent(task)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip backoff delays."""
+    monkeypatch.setattr(eventbridge_adapter.time, 'sleep', lambda seconds: None)
+
+
+@pytest.fixture
+def make_publisher():
+    def _make(fail_plan=None):
+        publisher = EventBridgePublisher(event_bus_name='bus')
+        publisher.events_client = RecordingEventsClient(fail_plan)
+        return publisher
+
+    return _make
+
+
+class TestPacking:
+    """Entries are packed within the PutEvents entry-count and size limits."""
+
+    def test_packs_ten_entries_per_call(self):
+        """25 small entries need three calls."""
+        entries = [make_event(str(i)).to_eventbridge_entry('bus') for i in range(25)]
+
+        assert [len(batch) for batch in pack_entries(entries)] == [10, 10, 5]
+
+    def test_packs_by_size(self):
+        """Large entries start a new call before the 256 KB limit is crossed."""
+        entries = [{'Source': 's', 'DetailType': 't', 'Detail': json.dumps({'n': i, 'x': 'y' * 100_000})} for i in range(5)]
+
+        batches = list(pack_entries(entries))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert all(sum(entry_size(entry) for entry in batch) <= PUT_EVENTS_MAX_BYTES for batch in batches)
+
+    def test_oversized_entry_rejected(self):
+        """An entry larger than a whole call can never be sent."""
+        entry = {'Source': 's', 'DetailType': 't', 'Detail': json.dumps({'x': 'y' * PUT_EVENTS_MAX_BYTES})}
+
+        with pytest.raises(RepositoryError):
+            list(pack_entries([entry]))
+
+
+class TestBatchPublishing:
+    """publish_events packs the events it is given into as few calls as the limits allow."""
+
+    def test_publish_events_packs_calls(self, make_publisher):
+        publisher = make_publisher()
+
+        publisher.publish_events([make_event(str(i)) for i in range(12)])
+
+        assert [len(call) for call in publisher.events_client.calls] == [10, 2]
+
+
+class TestPartialFailureRetry:
+    """Only failed entries are resent."""
+
+    def test_resends_only_failed_entries(self, make_publisher):
+        """Entries reported as failed are resent; successful ones are not."""
+        publisher = make_publisher(fail_plan=[{1: 'ThrottlingException', 3: 'InternalFailure'}])
+
+        publisher.publish_events([make_event(str(i)) for i in range(5)])
+
+        first, retry = publisher.events_client.calls
+        assert len(first) == 5
+        assert [json.loads(entry['Detail'])['title'] for entry in retry] == ['1', '3']
+
+    def test_non_retryable_entry_failure_is_not_resent(self, make_publisher):
+        """Entries failing for non-transient reasons raise without a resend."""
+        publisher = make_publisher(fail_plan=[{0: 'MalformedDetail'}])
+
+        with pytest.raises(RepositoryError, match='MalformedDetail'):
+            publisher.publish_events([make_event('a'), make_event('b')])
+
+        assert len(publisher.events_client.calls) == 1
+
+    def test_persistent_failure_raises_after_retries(self, make_publisher):
+        """Entries still failing after every attempt raise RepositoryError."""
+        publisher = make_publisher(fail_plan=[{0: 'ThrottlingException'}] * 3)
+
+        with pytest.raises(RepositoryError, match='Failed to publish 1 event'):
+            publisher.publish_event(make_event())
+
+        assert len(publisher.events_client.calls) == publisher.max_retries
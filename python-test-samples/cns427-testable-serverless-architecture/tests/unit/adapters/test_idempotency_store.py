@@ -0,0 +1,140 @@
+"""Unit tests for the DynamoDB idempotency store and its in-container cache."""
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.task_service.domain.exceptions import RepositoryError
+from shared.integration.idempotency_store import CachingIdempotencyStore, DynamoDBIdempotencyStore
+from shared.integration.interfaces import IdempotencyStore
+
+
+def client_error(code):
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'PutItem')
+
+
+class ConditionalDynamoDBClient:
+    """DynamoDB client stub that fails conditional puts for keys it already holds."""
+
+    def __init__(self, error_code=None):
+        self.items = {}
+        self.error_code = error_code
+        self.calls = []
+
+    def put_item(self, **kwargs):
+        self.calls.append(('put_item', kwargs))
+        if self.error_code:
+            raise client_error(self.error_code)
+        key = kwargs['Item']['idempotency_key']['S']
+        if key in self.items:
+            raise client_error('ConditionalCheckFailedException')
+        self.items[key] = kwargs['Item']
+        return {}
+
+    def update_item(self, **kwargs):
+        self.calls.append(('update_item', kwargs))
+        return {}
+
+    def delete_item(self, **kwargs):
+        self.calls.append(('delete_item', kwargs))
+        self.items.pop(kwargs['Key']['idempotency_key']['S'], None)
+        return {}
+
+
+class CountingStore(IdempotencyStore):
+    """In-memory store counting the claims that reach it."""
+
+    def __init__(self):
+        self.claimed = set()
+        self.claims = 0
+
+    def claim(self, key):
+        self.claims += 1
+        if key in self.claimed:
+            return False
+        self.claimed.add(key)
+        return True
+
+    def complete(self, key):
+        pass
+
+    def release(self, key):
+        self.claimed.discard(key)
+
+
+@pytest.fixture
+def store():
+    store = DynamoDBIdempotencyStore('idempotency', ttl_seconds=3600, lease_seconds=60, clock=lambda: 1000.0)
+    store.dynamodb = ConditionalDynamoDBClient()
+    return store
+
+
+class TestDynamoDBIdempotencyStore:
+    """Claims are conditional puts with a lease and a TTL."""
+
+    def test_first_claim_wins(self, store):
+        assert store.claim('event-1') is True
+        assert store.claim('event-1') is False
+
+        _, request = store.dynamodb.calls[0]
+        assert request['Item']['status'] == {'S': 'in_progress'}
+        assert request['Item']['lease_expires_at'] == {'N': '1060'}
+        assert request['Item']['expires_at'] == {'N': '4600'}
+        assert 'lease_expires_at < :now' in request['ConditionExpression']
+        assert request['ExpressionAttributeValues'][':now'] == {'N': '1000'}
+
+    def test_complete_sets_status_and_ttl(self, store):
+        store.complete('event-1')
+
+        _, request = store.dynamodb.calls[0]
+        assert request['ExpressionAttributeValues'] == {':completed': {'S': 'completed'}, ':expires_at': {'N': '4600'}}
+
+    def test_release_only_deletes_in_progress_claims(self, store):
+        store.claim('event-1')
+        store.release('event-1')
+
+        _, request = store.dynamodb.calls[-1]
+        assert request['ConditionExpression'] == '#status = :in_progress'
+        assert store.claim('event-1') is True
+
+    def test_other_errors_raise_repository_error(self, store):
+        store.dynamodb = ConditionalDynamoDBClient(error_code='AccessDeniedException')
+
+        with pytest.raises(RepositoryError):
+            store.claim('event-1')
+
+
+class TestCachingIdempotencyStore:
+    """Completed keys are answered locally and counted."""
+
+    def test_completed_keys_skip_the_store(self):
+        # GIVEN a key completed in this container
+        inner = CountingStore()
+        store = CachingIdempotencyStore(inner)
+        assert store.claim('event-1') is True
+        store.complete('event-1')
+
+        # WHEN the same key is claimed again
+        claimed = store.claim('event-1')
+
+        # THEN the local cache answers without asking the store
+        assert claimed is False
+        assert inner.claims == 1
+        assert store.stats() == {'local_hits': 1, 'store_hits': 0, 'misses': 1, 'entries': 1}
+
+    def test_duplicates_from_other_containers_count_as_store_hits(self):
+        inner = CountingStore()
+        inner.claimed.add('event-1')
+        store = CachingIdempotencyStore(inner)
+
+        assert store.claim('event-1') is False
+        assert store.stats()['store_hits'] == 1
+
+    def test_cache_is_bounded(self):
+        store = CachingIdempotencyStore(CountingStore(), max_entries=2)
+        for key in ['event-1', 'event-2', 'event-3']:
+            store.claim(key)
+            store.complete(key)
+
+        assert store.stats()['entries'] == 2
+        assert store.claim('event-1') is False
+        assert store.stats()['store_hits'] == 1
@@ -0,0 +1,255 @@
+"""Unit tests for the circuit breaker and spill buffers around event publishing."""
+
+import json
+
+import pytest
+
+from services.task_service.domain.exceptions import RepositoryError
+from services.task_service.models.task import TaskEvent
+from shared.integration.interfaces import EventPublisher
+from shared.integration.resilient_publisher import (
+    CircuitBreaker,
+    CircuitState,
+    FileSpillBuffer,
+    ResilientEventPublisher,
+    SqsSpillBuffer,
+    event_from_spill_record,
+    spill_record,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FlakyPublisher(EventPublisher):
+    """Publisher that records what it sent and fails while `failing` is set."""
+
+    def __init__(self):
+        self.failing = False
+        self.calls = 0
+        self.published = []
+
+    def publish_event(self, event):
+        self.publish_events([event])
+
+    def publish_events(self, events):
+        self.calls += 1
+        if self.failing:
+            raise RepositoryError('EventBridge service error during publish_event: ServiceUnavailableException')
+        self.published.extend(event.task_data['task_id'] for event in events)
+
+
+class RecordingSqsClient:
+    """SQS client stub backed by a list of message bodies."""
+
+    def __init__(self):
+        self.messages = []
+        self.deleted = []
+
+    def send_message_batch(self, QueueUrl, Entries):
+        self.messages.extend(entry['MessageBody'] for entry in Entries)
+        return {'Successful': [{'Id': entry['Id']} for entry in Entries]}
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages, VisibilityTimeout, WaitTimeSeconds):
+        batch, self.messages = self.messages[:MaxNumberOfMessages], self.messages[MaxNumberOfMessages:]
+        return {'Messages': [{'Body': body, 'ReceiptHandle': f'handle-{len(self.deleted) + index}'} for index, body in enumerate(batch)]}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        self.deleted.extend(entry['ReceiptHandle'] for entry in Entries)
+        return {}
+
+
+def make_event(task_id):
+    return TaskEvent('TaskCreated', {'task_id': task_id, 'title': 'Task'})
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_publisher(tmp_path, clock):
+    def factory(**breaker_kwargs):
+        inner = FlakyPublisher()
+        breaker = CircuitBreaker(clock=clock, **{'failure_threshold': 2, 'reset_timeout': 30.0, **breaker_kwargs})
+        spill_buffer = FileSpillBuffer(str(tmp_path / 'spill.ndjson'))
+        return ResilientEventPublisher(inner, spill_buffer, breaker), inner, spill_buffer
+
+    return factory
+
+
+class TestCircuitBreaker:
+    """State transitions of the breaker."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is True
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_one_trial(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 10.0
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        assert breaker.record_failure() is True
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestResilientEventPublisher:
+    """Events are spilled while the bus is failing and drained once it recovers."""
+
+    def test_publishes_through_closed_circuit(self, make_publisher):
+        publisher, inner, _ = make_publisher()
+
+        publisher.publish_event(make_event('task-1'))
+
+        assert inner.published == ['task-1']
+
+    def test_failures_spill_instead_of_raising(self, make_publisher):
+        # GIVEN a failing event bus
+        publisher, inner, spill_buffer = make_publisher()
+        inner.failing = True
+
+        # WHEN publishing past the failure threshold
+        for task_id in ['task-1', 'task-2', 'task-3']:
+            publisher.publish_event(make_event(task_id))
+
+        # THEN nothing raises, the open circuit stops calling the bus and every event is spilled
+        assert inner.calls == 2
+        assert publisher.breaker.state is CircuitState.OPEN
+        spilled = [json.loads(line)['task_data']['task_id'] for line in spill_buffer.path.read_text().splitlines()]
+        assert spilled == ['task-1', 'task-2', 'task-3']
+
+    def test_half_open_drains_spilled_events_first(self, make_publisher, clock):
+        # GIVEN spilled events and an open circuit
+        publisher, inner, spill_buffer = make_publisher()
+        inner.failing = True
+        for task_id in ['task-1', 'task-2']:
+            publisher.publish_event(make_event(task_id))
+
+        # WHEN the bus recovers and the circuit half-opens
+        inner.failing = False
+        clock.now = 30.0
+        publisher.publish_event(make_event('task-3'))
+
+        # THEN spilled events are published ahead of the new one and the circuit closes
+        assert inner.published == ['task-1', 'task-2', 'task-3']
+        assert spill_buffer.path.read_text() == ''
+        assert publisher.breaker.state is CircuitState.CLOSED
+
+    def test_failed_trial_reopens_and_keeps_spill(self, make_publisher, clock):
+        publisher, inner, spill_buffer = make_publisher()
+        inner.failing = True
+        for task_id in ['task-1', 'task-2']:
+            publisher.publish_event(make_event(task_id))
+
+        clock.now = 30.0
+        publisher.publish_event(make_event('task-3'))
+
+        assert publisher.breaker.state is CircuitState.OPEN
+        assert len(spill_buffer.path.read_text().splitlines()) == 3
+
+    def test_one_empty_read_does_not_clear_the_backlog(self, make_publisher):
+        """A short poll may read empty while events are queued, so the buffer is checked again."""
+        # GIVEN a spilled event the buffer hides from the first drain, as an SQS short poll can
+        publisher, inner, spill_buffer = make_publisher()
+        spill_buffer.spill([make_event('task-1')])
+        real_drain, reads = spill_buffer.drain, []
+
+        def drain(publish, max_events):
+            reads.append(max_events)
+            return real_drain(publish, max_events) if len(reads) > 1 else 0
+
+        spill_buffer.drain = drain
+
+        # WHEN publishing twice
+        publisher.publish_event(make_event('task-2'))
+        publisher.publish_event(make_event('task-3'))
+
+        # THEN the second publish drains the hidden event
+        assert inner.published == ['task-2', 'task-1', 'task-3']
+
+    def test_drain_spilled_empties_buffer_without_new_events(self, make_publisher, clock):
+        publisher, inner, spill_buffer = make_publisher()
+        spill_buffer.spill([make_event(f'task-{index}') for index in range(120)])
+
+        drained = publisher.drain_spilled()
+
+        assert drained == 120
+        assert len(inner.published) == 120
+        assert spill_buffer.path.read_text() == ''
+
+    def test_drain_spilled_waits_for_open_circuit(self, make_publisher):
+        publisher, inner, spill_buffer = make_publisher(failure_threshold=1)
+        inner.failing = True
+        publisher.publish_event(make_event('task-1'))
+
+        assert publisher.drain_spilled() == 0
+        assert inner.calls == 1
+
+    def test_spill_failure_is_raised(self, make_publisher, tmp_path):
+        publisher, inner, _ = make_publisher()
+        inner.failing = True
+        publisher.spill_buffer = FileSpillBuffer(str(tmp_path / 'missing' / 'spill.ndjson'))
+
+        with pytest.raises(RepositoryError):
+            publisher.publish_event(make_event('task-1'))
+
+
+class TestSpillBuffers:
+    """Spill records round-trip through both buffers."""
+
+    def test_spill_record_round_trip(self):
+        event = TaskEvent('TaskUpdated', {'task_id': 'task-1'}, source='test-source', detail_type_prefix='TEST-')
+
+        restored = event_from_spill_record(spill_record(event))
+
+        assert restored.to_eventbridge_entry('bus') == event.to_eventbridge_entry('bus')
+
+    def test_sqs_buffer_deletes_only_published_messages(self):
+        client = RecordingSqsClient()
+        spill_buffer = SqsSpillBuffer('https://sqs.example/queue', sqs_client=client)
+        spill_buffer.spill([make_event(f'task-{index}') for index in range(12)])
+        published = []
+
+        drained = spill_buffer.drain(lambda events: published.extend(event.task_data['task_id'] for event in events), max_events=11)
+
+        assert drained == 11
+        assert published == [f'task-{index}' for index in range(11)]
+        assert len(client.deleted) == 11
+        assert len(client.messages) == 1
+
+    def test_sqs_buffer_keeps_messages_when_publish_fails(self):
+        client = RecordingSqsClient()
+        spill_buffer = SqsSpillBuffer('https://sqs.example/queue', sqs_client=client)
+        spill_buffer.spill([make_event('task-1')])
+
+        def fail(events):
+            raise RepositoryError('still down')
+
+        with pytest.raises(RepositoryError):
+            spill_buffer.drain(fail, max_events=10)
+
+        assert client.deleted == []
@@ -0,0 +1,170 @@
+"""Unit tests for the DynamoDB retry policy and adaptive rate limiter."""
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.task_service.domain.exceptions import ThrottlingError
+from shared.integration.dynamodb_adapter import DynamoDBTaskRepository
+from shared.integration.retry_policy import AdaptiveRateLimiter, RetryingClient, RetryPolicy
+
+
+def client_error(code):
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'GetItem')
+
+
+class FakeClock:
+    """Clock that only moves when slept on."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FlakyClient:
+    """DynamoDB client stub whose get_item fails with the given error codes before succeeding."""
+
+    def __init__(self, *codes):
+        self.codes = list(codes)
+        self.calls = 0
+
+    def get_item(self, **kwargs):
+        self.calls += 1
+        if self.codes:
+            raise client_error(self.codes.pop(0))
+        return {'Item': {'task_id': {'S': kwargs['Key']['task_id']['S']}, 'version': {'N': '7'}}}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_policy(clock):
+    def factory(**kwargs):
+        return RetryPolicy(clock=clock, sleep=clock.sleep, rng=lambda: 1.0, **kwargs)
+
+    return factory
+
+
+class TestRetryPolicy:
+    """Throttled and transient errors are retried with jittered backoff within a budget."""
+
+    def test_throttles_are_absorbed(self, make_policy, clock):
+        # GIVEN a client throttled twice before succeeding
+        policy = make_policy(max_attempts=4, base_delay=0.01, max_delay=1.0)
+        client = FlakyClient('ProvisionedThroughputExceededException', 'ThrottlingException')
+
+        # WHEN calling through the policy
+        response = RetryingClient(client, policy).get_item(Key={'task_id': {'S': 'task-1'}})
+
+        # THEN the call succeeds after decorrelated-jitter backoff
+        assert response['Item']['version'] == {'N': '7'}
+        assert client.calls == 3
+        assert clock.sleeps == pytest.approx([0.01, 0.03])
+        assert policy.stats() == {'retries': 2, 'throttles_absorbed': 2, 'budget_exhausted': 0}
+
+    def test_backoff_is_capped(self, make_policy):
+        policy = make_policy(base_delay=0.1, max_delay=0.5)
+
+        assert policy.backoff(0.0) == pytest.approx(0.1)
+        assert policy.backoff(0.1) == pytest.approx(0.3)
+        assert policy.backoff(0.3) == pytest.approx(0.5)
+
+    def test_non_retryable_errors_are_raised_at_once(self, make_policy):
+        policy = make_policy()
+        client = FlakyClient('ConditionalCheckFailedException')
+
+        with pytest.raises(ClientError):
+            RetryingClient(client, policy).get_item(Key={'task_id': {'S': 'task-1'}})
+
+        assert client.calls == 1
+        assert policy.retries == 0
+
+    def test_attempts_are_bounded(self, make_policy):
+        policy = make_policy(max_attempts=3)
+        client = FlakyClient(*['InternalServerError'] * 5)
+
+        with pytest.raises(ClientError):
+            RetryingClient(client, policy).get_item(Key={'task_id': {'S': 'task-1'}})
+
+        assert client.calls == 3
+
+    def test_retry_budget_follows_remaining_invocation_time(self, make_policy):
+        # GIVEN an invocation with just over the safety margin left
+        policy = make_policy(base_delay=0.2, safety_margin=0.5)
+        policy.begin_invocation(lambda: 600)
+        client = FlakyClient('ThrottlingException', 'ThrottlingException')
+
+        # WHEN the second retry would overrun the deadline
+        with pytest.raises(ClientError):
+            RetryingClient(client, policy).get_item(Key={'task_id': {'S': 'task-1'}})
+
+        # THEN the error is returned instead of retrying, and counted
+        assert client.calls == 1
+        assert policy.stats() == {'retries': 0, 'throttles_absorbed': 0, 'budget_exhausted': 1}
+
+    def test_repository_maps_exhausted_retries_to_throttling_error(self, make_policy):
+        repository = DynamoDBTaskRepository(table_name='tasks')
+        repository.dynamodb = RetryingClient(FlakyClient(*['ThrottlingException'] * 4), make_policy(max_attempts=2))
+
+        with pytest.raises(ThrottlingError):
+            repository.get_task_version('task-1')
+
+
+class TestAdaptiveRateLimiter:
+    """The limiter backs off to the measured rate after a throttle and recovers on success."""
+
+    def test_disabled_until_throttled(self, clock):
+        limiter = AdaptiveRateLimiter(clock=clock)
+
+        assert [limiter.acquire() for _ in range(50)] == [0.0] * 50
+        assert not limiter.enabled
+
+    def test_throttle_cuts_rate_to_fraction_of_measured_rate(self, clock):
+        # GIVEN 20 requests sent within the last second
+        limiter = AdaptiveRateLimiter(beta=0.5, clock=clock)
+        for _ in range(20):
+            limiter.acquire()
+
+        # WHEN a request is throttled
+        limiter.on_throttle()
+
+        # THEN further requests are paced at half the measured rate
+        assert limiter.rate == 10
+        assert limiter.acquire() == pytest.approx(0.1)
+        assert limiter.acquire() == pytest.approx(0.2)
+
+    def test_recovers_and_switches_off(self, clock):
+        limiter = AdaptiveRateLimiter(beta=0.5, rate_step=1.0, recovery_factor=2.0, min_rate=1.0, clock=clock)
+        for _ in range(4):
+            limiter.acquire()
+        limiter.on_throttle()
+        assert limiter.enabled and limiter.rate == 2
+
+        limiter.on_success()
+        assert limiter.enabled
+        limiter.on_success()
+        assert not limiter.enabled
+
+    def test_policy_fails_fast_when_limiter_wait_overruns_deadline(self, make_policy, clock):
+        limiter = AdaptiveRateLimiter(min_rate=1.0, clock=clock)
+        limiter.on_throttle()
+        policy = make_policy(rate_limiter=limiter, safety_margin=0.5)
+        policy.begin_invocation(lambda: 1800)
+        client = RetryingClient(FlakyClient(), policy)
+
+        # The first request waits a full second for a token; the next wait would pass the deadline
+        client.get_item(Key={'task_id': {'S': 'task-1'}})
+        assert clock.sleeps == [1.0]
+        with pytest.raises(ThrottlingError):
+            client.get_item(Key={'task_id': {'S': 'task-1'}})
+
+        assert policy.budget_exhausted == 1
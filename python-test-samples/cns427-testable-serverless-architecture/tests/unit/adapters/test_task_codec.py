@@ -0,0 +1,114 @@
+"""
+Unit tests for the Task <-> DynamoDB codec.
+
+The codec must produce and accept exactly the items the TypeSerializer-based conversion
+did, so existing table data keeps reading the same way.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from services.task_service.models.task import Task, TaskPriority, TaskStatus
+from shared.integration.dynamodb_adapter import dynamo_to_python, python_to_dynamo
+from shared.integration.task_codec import decode_partial_task, decode_task, decode_task_validated, encode_task
+
+
+def make_task(**overrides):
+    now = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+    fields = {
+        'task_id': 'task-1',
+        'title': 'Task',
+        'description': 'Details',
+        'status': TaskStatus.IN_PROGRESS,
+        'priority': TaskPriority.HIGH,
+        'dependencies': ['task-0', 'task-2'],
+        'created_at': now,
+        'updated_at': now,
+        'version': 3,
+    }
+    fields.update(overrides)
+    return Task(**fields)
+
+
+def serializer_item(task):
+    """The item format written before the codec existed."""
+    item = task.model_dump(mode='json')
+    item['created_at'] = task.created_at.isoformat()
+    item['updated_at'] = task.updated_at.isoformat()
+    item['status_priority'] = f'{task.status.value}#{task.priority.value}'
+    return python_to_dynamo(item)
+
+
+class TestEncodeTask:
+    """encode_task writes the same item as the serializer-based conversion."""
+
+    @pytest.mark.parametrize('overrides', [{}, {'description': None}, {'dependencies': []}])
+    def test_matches_serializer_format(self, overrides):
+        task = make_task(**overrides)
+
+        assert encode_task(task) == serializer_item(task)
+
+
+class TestDecodeTask:
+    """decode_task reads items back to equal tasks."""
+
+    @pytest.mark.parametrize('overrides', [{}, {'description': None}, {'dependencies': []}])
+    def test_round_trip(self, overrides):
+        task = make_task(**overrides)
+
+        assert decode_task(encode_task(task)) == task
+
+    def test_matches_validated_conversion(self):
+        """The trusted decode produces the same task as deserializing and validating."""
+        item = serializer_item(make_task())
+        legacy = dynamo_to_python(item)
+        legacy.pop('status_priority')
+        legacy['created_at'] = datetime.fromisoformat(legacy['created_at'])
+        legacy['updated_at'] = datetime.fromisoformat(legacy['updated_at'])
+
+        decoded = decode_task(item)
+
+        assert decoded == Task(**legacy)
+        assert decoded.model_dump() == Task(**legacy).model_dump()
+        assert isinstance(decoded.status, TaskStatus) and isinstance(decoded.version, int)
+
+    def test_accepts_missing_optional_attributes_and_string_sets(self):
+        """Items without a description, or with dependencies stored as a string set, still decode."""
+        item = encode_task(make_task())
+        del item['description']
+        item['dependencies'] = {'SS': ['task-0']}
+
+        task = decode_task(item)
+
+        assert task.description is None
+        assert task.dependencies == ['task-0']
+
+    def test_validated_decode_rejects_invalid_items(self):
+        """Untrusted items still go through model validation."""
+        item = encode_task(make_task())
+        item['title'] = {'S': 'x' * 101}
+
+        with pytest.raises(ValidationError):
+            decode_task_validated(item)
+
+
+class TestDecodePartialTask:
+    """decode_partial_task reads projected items."""
+
+    def test_decodes_only_projected_attributes(self):
+        item = encode_task(make_task())
+        projected = {name: item[name] for name in ('task_id', 'status', 'created_at')}
+
+        task = decode_partial_task(projected)
+
+        assert task.model_fields_set == {'task_id', 'status', 'created_at'}
+        assert task.status is TaskStatus.IN_PROGRESS
+        assert task.model_dump(mode='json') == {'task_id': 'task-1', 'status': 'in_progress', 'created_at': '2026-01-02T03:04:05.678901+00:00'}
+
+    def test_matches_full_decode_for_every_field(self):
+        """With every attribute projected, the fields equal those of decode_task."""
+        item = encode_task(make_task())
+
+        assert decode_partial_task(item).model_dump() == decode_task(item).model_dump()
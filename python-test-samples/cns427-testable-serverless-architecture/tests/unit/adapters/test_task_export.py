@@ -0,0 +1,137 @@
+"""Unit tests for the NDJSON task export and the S3 multipart sink - no AWS calls."""
+
+import gzip
+import io
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from services.task_service.models.task import Task
+from shared.integration.task_export import S3_MIN_PART_SIZE, S3MultipartWriter, export_tasks
+
+
+def make_task(index):
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    return Task(task_id=f'task-{index}', title=f'Task {index}', description='Zürich', created_at=now, updated_at=now, version=1)
+
+
+class PagedRepository:
+    """Repository stub serving fixed scan pages."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def scan_tasks(self, page_size=100):
+        yield from self.pages
+
+
+class RecordingS3Client:
+    """S3 client stub recording uploads."""
+
+    def __init__(self):
+        self.calls = []
+        self.parts = []
+
+    def put_object(self, **kwargs):
+        self.calls.append(('put_object', kwargs))
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append(('create_multipart_upload', kwargs))
+        return {'UploadId': 'upload-1'}
+
+    def upload_part(self, **kwargs):
+        self.calls.append(('upload_part', kwargs))
+        self.parts.append(kwargs['Body'])
+        return {'ETag': f'etag-{kwargs["PartNumber"]}'}
+
+    def complete_multipart_upload(self, **kwargs):
+        self.calls.append(('complete_multipart_upload', kwargs))
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append(('abort_multipart_upload', kwargs))
+
+    def operations(self):
+        return [name for name, _ in self.calls]
+
+
+class TestExportTasks:
+    """Every task is written as one JSON line, page by page."""
+
+    def test_writes_ndjson(self):
+        # GIVEN two scan pages
+        repository = PagedRepository([[make_task(0), make_task(1)], [make_task(2)]])
+        sink = io.BytesIO()
+
+        # WHEN exporting
+        result = export_tasks(repository, sink)
+
+        # THEN each line is a task in its API JSON form
+        lines = sink.getvalue().decode().splitlines()
+        assert [json.loads(line)['task_id'] for line in lines] == ['task-0', 'task-1', 'task-2']
+        assert json.loads(lines[0])['created_at'] == '2026-01-01T00:00:00+00:00'
+        assert result.task_count == 3
+        assert result.bytes_written == len(sink.getvalue())
+
+    def test_gzip_stream_decompresses_to_the_same_lines(self):
+        pages = [[make_task(i) for i in range(start, start + 50)] for start in range(0, 200, 50)]
+        plain, compressed = io.BytesIO(), io.BytesIO()
+
+        export_tasks(PagedRepository(pages), plain)
+        result = export_tasks(PagedRepository(pages), compressed, compress=True)
+
+        assert gzip.decompress(compressed.getvalue()) == plain.getvalue()
+        assert result.bytes_written == len(compressed.getvalue()) < len(plain.getvalue())
+
+    def test_empty_table(self):
+        sink = io.BytesIO()
+
+        result = export_tasks(PagedRepository([]), sink, compress=True)
+
+        assert result.task_count == 0
+        assert gzip.decompress(sink.getvalue()) == b''
+
+
+class TestS3MultipartWriter:
+    """Full parts are uploaded as they fill; small exports are a single PutObject."""
+
+    def test_small_export_is_one_put(self):
+        client = RecordingS3Client()
+
+        with S3MultipartWriter('bucket', 'tasks.ndjson', s3_client=client) as writer:
+            writer.write(b'{"task_id":"task-1"}\n')
+
+        assert client.operations() == ['put_object']
+        assert client.calls[0][1]['Body'] == b'{"task_id":"task-1"}\n'
+        assert client.calls[0][1]['ContentType'] == 'application/x-ndjson'
+
+    def test_large_export_streams_parts(self):
+        # GIVEN writes adding up to two and a half parts
+        client = RecordingS3Client()
+        chunk = b'x' * (S3_MIN_PART_SIZE // 2)
+
+        # WHEN writing them
+        with S3MultipartWriter('bucket', 'tasks.ndjson', part_size=S3_MIN_PART_SIZE, s3_client=client) as writer:
+            for _ in range(5):
+                writer.write(chunk)
+            # THEN full parts are uploaded before the writer is closed
+            assert len(client.parts) == 2
+
+        # AND the remainder is the last part of the completed upload
+        assert [len(part) for part in client.parts] == [S3_MIN_PART_SIZE, S3_MIN_PART_SIZE, len(chunk)]
+        complete = client.calls[-1][1]
+        assert complete['MultipartUpload']['Parts'] == [{'ETag': f'etag-{n}', 'PartNumber': n} for n in (1, 2, 3)]
+
+    def test_failure_aborts_upload(self):
+        client = RecordingS3Client()
+
+        with pytest.raises(RuntimeError):
+            with S3MultipartWriter('bucket', 'tasks.ndjson', part_size=S3_MIN_PART_SIZE, s3_client=client) as writer:
+                writer.write(b'x' * S3_MIN_PART_SIZE)
+                raise RuntimeError('scan failed')
+
+        assert client.operations() == ['create_multipart_upload', 'upload_part', 'abort_multipart_upload']
+
+    def test_rejects_parts_below_s3_minimum(self):
+        with pytest.raises(ValueError, match='part_size'):
+            S3MultipartWriter('bucket', 'key', part_size=1024)
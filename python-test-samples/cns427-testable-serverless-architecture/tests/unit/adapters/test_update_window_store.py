@@ -0,0 +1,93 @@
+"""Unit tests for the DynamoDB store of coalescing windows."""
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.notification_service.models.update_window import UpdateWindow
+from services.task_service.domain.exceptions import ConflictError, RepositoryError
+from shared.integration.update_window_store import DynamoDBUpdateWindowStore
+
+
+class RevisionedDynamoDBClient:
+    """DynamoDB client stub evaluating the store's two write conditions."""
+
+    def __init__(self, error_code=None):
+        self.items = {}
+        self.error_code = error_code
+        self.requests = []
+
+    def get_item(self, **kwargs):
+        self.requests.append(kwargs)
+        item = self.items.get(kwargs['Key']['task_id']['S'])
+        return {'Item': item} if item is not None else {}
+
+    def put_item(self, **kwargs):
+        self.requests.append(kwargs)
+        if self.error_code:
+            raise ClientError({'Error': {'Code': self.error_code, 'Message': self.error_code}}, 'PutItem')
+        key = kwargs['Item']['task_id']['S']
+        current = self.items.get(key)
+        if kwargs['ConditionExpression'] == 'attribute_not_exists(task_id)':
+            allowed = current is None
+        else:
+            allowed = current is not None and current['revision'] == kwargs['ExpressionAttributeValues'][':expected']
+        if not allowed:
+            raise ClientError({'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'}}, 'PutItem')
+        self.items[key] = kwargs['Item']
+        return {}
+
+
+@pytest.fixture
+def store():
+    store = DynamoDBUpdateWindowStore('update-windows', ttl_seconds=3600)
+    store.dynamodb = RevisionedDynamoDBClient()
+    return store
+
+
+def make_window(revision=1, **fields):
+    return UpdateWindow(
+        task_id='task-1',
+        window_ends_at=1030.0,
+        task_data={'task_id': 'task-1', 'title': 'Task', 'version': 3},
+        owner_event_id='event-1',
+        changed_fields={'title', 'status'},
+        event_count=2,
+        revision=revision,
+        **fields,
+    )
+
+
+def test_window_round_trip(store):
+    store.put_window(make_window())
+
+    window = store.get_window('task-1')
+
+    assert window == make_window()
+    assert store.dynamodb.requests[-1]['ConsistentRead'] is True
+    assert store.dynamodb.items['task-1']['expires_at'] == {'N': '4630'}
+
+
+def test_missing_window_is_none(store):
+    assert store.get_window('task-1') is None
+
+
+def test_writes_are_conditional_on_revision(store):
+    # GIVEN a stored window at revision 1
+    store.put_window(make_window())
+
+    # WHEN two consumers write over revision 1
+    store.put_window(make_window(revision=2, delivered=True), expected_revision=1)
+
+    # THEN only the first succeeds
+    with pytest.raises(ConflictError):
+        store.put_window(make_window(revision=2), expected_revision=1)
+    with pytest.raises(ConflictError):
+        store.put_window(make_window())
+    assert store.get_window('task-1').delivered
+
+
+def test_other_errors_raise_repository_error(store):
+    store.dynamodb = RevisionedDynamoDBClient(error_code='AccessDeniedException')
+
+    with pytest.raises(RepositoryError):
+        store.put_window(make_window())
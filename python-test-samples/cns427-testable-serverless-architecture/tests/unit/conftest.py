@@ -1,5 +1,7 @@
 """Unit test configuration - automatically disables socket connections."""
 
+from typing import Optional
+
 import pytest
 
 
@@ -8,7 +10,8 @@ def disable_socket_for_unit_tests():
     """Automatically disable socket connections for all unit tests."""
     import pytest_socket
 
-    pytest_socket.disable_socket()
+    # Unix sockets stay allowed: asyncio event loops use a local socketpair to wake themselves
+    pytest_socket.disable_socket(allow_unix_socket=True)
     yield
     pytest_socket.enable_socket()
 
@@ -32,7 +35,7 @@ import pytest
 
 from services.task_service.domain.exceptions import CircularDependencyError, ConflictError
 from services.task_service.models.api import CreateTaskRequest, UpdateTaskRequest
-from services.task_service.models.task import Task, TaskPriority, TaskStatus
+from services.task_service.models.task import PartialTask, Task, TaskPriority, TaskStatus
 
 
 class FakeTaskService:
@@ -46,6 +49,9 @@ class FakeTaskService:
         self.return_task = None
         self.return_none = False
         self.value_error_message = 'Task not found'
+        self.last_list_filters = None
+        self.last_delete_version = None
+        self.last_update_request = None
 
     def create_task(self, request: CreateTaskRequest) -> Task:
         """Create a task from CreateTaskRequest."""
@@ -69,8 +75,21 @@ class FakeTaskService:
         )
         return task
 
-    def get_task(self, task_id: str) -> Task:
-        """Get a task by ID."""
+    def create_tasks(self, requests: list) -> list:
+        """Create tasks from batch items; items titled 'Fail' report a circular dependency."""
+        from services.task_service.models.task import TaskBatchResult
+
+        results = []
+        for index, request in enumerate(requests):
+            if request.title == 'Fail':
+                error = CircularDependencyError('Circular dependency detected: a -> a', cycle_path=['a', 'a'])
+                results.append(TaskBatchResult(index=index, ref=request.ref, error=error))
+            else:
+                results.append(TaskBatchResult(index=index, ref=request.ref, task=self.create_task(request)))
+        return results
+
+    def get_task(self, task_id: str, fields=None) -> Task:
+        """Get a task by ID, or just the requested fields of it."""
         if self.should_raise_generic_error:
             raise Exception('Database connection failed')
 
@@ -80,11 +99,8 @@ class FakeTaskService:
         if self.return_none:
             raise ValueError(f'Task not found: {task_id}')
 
-        if self.return_task:
-            return self.return_task
-
-        # Return fake task
-        task = Task(
+        # Return the configured task or a fake one
+        task = self.return_task or Task(
             task_id=task_id,
             title='Retrieved Task',
             description='Test task',
@@ -95,10 +111,15 @@ class FakeTaskService:
             updated_at=datetime.now(UTC),
             version=int(datetime.now(UTC).timestamp() * 1000),
         )
-        return task
+        return task if fields is None else PartialTask.from_task(task, fields)
+
+    def get_task_version(self, task_id: str) -> int:
+        """Get only the version of a task."""
+        return self.get_task(task_id).version
 
-    def list_tasks(self, limit: int = 50, next_token: str = None):
+    def list_tasks(self, limit: int = 50, next_token: str = None, fields=None, **filters):
         """List tasks with pagination."""
+        self.last_list_filters = filters
         tasks = [
             Task(
                 task_id='task-1',
@@ -123,10 +144,13 @@ class FakeTaskService:
                 version=int(datetime.now(UTC).timestamp() * 1000),
             ),
         ]
+        if fields is not None:
+            tasks = [PartialTask.from_task(task, fields) for task in tasks]
         return tasks, None  # Return tasks and next_token
 
     def update_task(self, task_id: str, request: UpdateTaskRequest) -> Task:
         """Update a task."""
+        self.last_update_request = request
         if self.should_raise_value_error:
             raise ValueError(self.value_error_message)
 
@@ -162,8 +186,12 @@ class FakeTaskService:
         )
         return task
 
-    def delete_task(self, task_id: str) -> None:
+    def delete_task(self, task_id: str, version: Optional[int] = None) -> None:
         """Delete a task."""
+        self.last_delete_version = version
+        if self.should_raise_conflict_error:
+            raise ConflictError('Task was modified by another process', current_task={'task_id': task_id, 'version': 9876543210})
+
         if self.should_raise_value_error:
             raise ValueError(self.value_error_message)
 
@@ -195,15 +223,31 @@ class FakeNotificationService:
 
     def __init__(self):
         self.should_raise_error = False
+        self.failing_task_ids = set()
+        self.deferred_task_ids = {}
         self.processed_events = []
 
-    def process_task_event(self, event_type: str, task_data: dict) -> None:
+    def process_task_event(self, event_type: str, task_data: dict, event_id: str = None) -> None:
         """Process a task event and track it."""
         if self.should_raise_error:
             raise Exception('Notification processing failed')
 
         # Track processed events for verification
-        self.processed_events.append({'event_type': event_type, 'task_data': task_data})
+        self.processed_events.append({'event_type': event_type, 'task_data': task_data, 'event_id': event_id})
+
+    def process_task_events(self, events) -> dict:
+        """Process a batch of task events, failing those whose task_id is in failing_task_ids and deferring those in deferred_task_ids."""
+        from services.notification_service.domain.exceptions import NotificationDeferred
+
+        failures = {}
+        for index, event in enumerate(events):
+            if event.task_data.get('task_id') in self.failing_task_ids:
+                failures[index] = Exception('Notification processing failed')
+            elif event.task_data.get('task_id') in self.deferred_task_ids:
+                failures[index] = NotificationDeferred(self.deferred_task_ids[event.task_data['task_id']])
+            else:
+                self.process_task_event(event.event_type, event.task_data, event.event_id)
+        return failures
 
 
 @pytest.fixture
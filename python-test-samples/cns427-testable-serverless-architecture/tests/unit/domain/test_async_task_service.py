@@ -0,0 +1,174 @@
+"""Unit tests for AsyncTaskService and the executor-backed async adapters.
+
+Coroutines are driven with asyncio.run so the tests need no async test plugin.
+"""
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.task_service.domain.async_task_service import AsyncTaskService
+from services.task_service.domain.exceptions import CircularDependencyError, ConflictError
+from services.task_service.models.api import CreateTaskRequest, UpdateTaskRequest
+from services.task_service.models.task import Task, TaskEventType, TaskStatus
+from shared.integration.async_adapters import ExecutorTaskRepository
+from shared.integration.interfaces import AsyncTaskRepository
+
+
+def make_task(task_id='task-1', version=1000, **fields):
+    now = datetime.now(UTC)
+    return Task(task_id=task_id, title='Task', created_at=now, updated_at=now, version=version, **fields)
+
+
+class OverlapRepository(AsyncTaskRepository):
+    """Async repository whose reads only complete once both have started, so sequential reads would deadlock."""
+
+    def __init__(self, task, graph):
+        self.task = task
+        self.graph = graph
+        self.both_started = asyncio.Event()
+        self.started = 0
+        self.updated = None
+
+    async def _started(self):
+        self.started += 1
+        if self.started == 2:
+            self.both_started.set()
+        await asyncio.wait_for(self.both_started.wait(), timeout=1)
+
+    async def get_task(self, task_id):
+        await self._started()
+        return self.task
+
+    async def get_dependency_graph(self, task_ids):
+        await self._started()
+        return self.graph
+
+    async def update_task(self, task, expected_version, outbox_event=None):
+        self.updated = (task, expected_version)
+        return task
+
+    async def create_task(self, task, outbox_event=None):
+        return task
+
+    async def create_tasks(self, tasks, outbox_events=None):
+        return {}
+
+    async def list_tasks(self, limit=50, next_token=None, status=None, priority=None, created_after=None, sort=None):
+        return [], None
+
+    async def patch_task(self, task_id, patch, expected_version, allowed_statuses=None, build_outbox_event=None):
+        raise AssertionError('dependency updates should not use patch_task')
+
+    async def delete_task(self, task_id, version, outbox_event=None):
+        return None
+
+
+@pytest.fixture
+def publisher():
+    return AsyncMock()
+
+
+class TestAsyncTaskService:
+    """Business rules match TaskService; independent reads are awaited together."""
+
+    def test_dependency_update_loads_task_and_graph_concurrently(self, publisher):
+        """The stored task and the dependency graph are read at the same time."""
+        # GIVEN a stored task and a dependency graph without cycles
+        repository = OverlapRepository(make_task(), {'dep-1': ['dep-2']})
+        service = AsyncTaskService(repository, publisher)
+
+        # WHEN updating its dependencies
+        saved = asyncio.run(service.update_task('task-1', UpdateTaskRequest(dependencies=['dep-1'], version=1000)))
+
+        # THEN both reads overlapped and the write carries the version condition
+        assert saved.dependencies == ['dep-1']
+        assert repository.updated[1] == 1000
+        assert publisher.publish_event.await_args[0][0].event_type == TaskEventType.TASK_UPDATED
+
+    def test_dependency_update_detects_cycles(self, publisher):
+        repository = OverlapRepository(make_task(), {'dep-1': ['task-1']})
+        service = AsyncTaskService(repository, publisher)
+
+        with pytest.raises(CircularDependencyError):
+            asyncio.run(service.update_task('task-1', UpdateTaskRequest(dependencies=['dep-1'], version=1000)))
+
+        assert repository.updated is None
+
+    def test_dependency_update_detects_version_conflicts(self, publisher):
+        repository = OverlapRepository(make_task(version=2000), {})
+        service = AsyncTaskService(repository, publisher)
+
+        with pytest.raises(ConflictError) as exc_info:
+            asyncio.run(service.update_task('task-1', UpdateTaskRequest(dependencies=['dep-1'], version=1000)))
+
+        assert exc_info.value.current_task['version'] == 2000
+
+    def test_clearing_dependencies_updates_the_stored_task(self, publisher):
+        """An empty dependency list is a dependency change, so the graph index transaction drops the old edges."""
+        repository = OverlapRepository(make_task(dependencies=['dep-1']), {})
+        service = AsyncTaskService(repository, publisher)
+
+        saved = asyncio.run(service.update_task('task-1', UpdateTaskRequest(dependencies=[], version=1000)))
+
+        assert saved.dependencies == []
+        assert repository.updated[1] == 1000
+
+    def test_field_update_is_a_single_patch(self, publisher):
+        """Updates without dependency changes go straight to the conditional patch."""
+        repository = AsyncMock()
+        repository.patch_task.return_value = make_task(status=TaskStatus.IN_PROGRESS)
+        service = AsyncTaskService(repository, publisher)
+
+        asyncio.run(service.update_task('task-1', UpdateTaskRequest(status=TaskStatus.IN_PROGRESS, version=1000)))
+
+        repository.patch_task.assert_awaited_once()
+        repository.get_task.assert_not_awaited()
+
+    def test_create_and_get(self, publisher):
+        repository = AsyncMock()
+        repository.create_task.side_effect = lambda task, **kwargs: task
+        repository.get_task.return_value = None
+        service = AsyncTaskService(repository, publisher)
+
+        created = asyncio.run(service.create_task(CreateTaskRequest(title='New')))
+
+        assert created.status == TaskStatus.PENDING
+        publisher.publish_event.assert_awaited_once()
+        with pytest.raises(ValueError, match='Task not found'):
+            asyncio.run(service.get_task('missing'))
+
+    def test_outbox_mode_does_not_publish(self, publisher):
+        repository = AsyncMock()
+        service = AsyncTaskService(repository, publisher, use_outbox=True)
+
+        asyncio.run(service.delete_task('task-1', version=1000))
+
+        assert repository.delete_task.await_args.kwargs['outbox_event'].event_type == TaskEventType.TASK_DELETED
+        publisher.publish_event.assert_not_awaited()
+
+
+class TestExecutorTaskRepository:
+    """Blocking repository calls awaited together run on separate threads at the same time."""
+
+    def test_calls_overlap(self):
+        barrier = threading.Barrier(2, timeout=1)
+
+        class BlockingRepository:
+            def get_task(self, task_id):
+                barrier.wait()
+                return task_id
+
+            def get_dependency_graph(self, task_ids):
+                barrier.wait()
+                return {}
+
+        repository = ExecutorTaskRepository(BlockingRepository())
+
+        async def both():
+            return await asyncio.gather(repository.get_task('task-1'), repository.get_dependency_graph(['dep-1']))
+
+        assert asyncio.run(both()) == ['task-1', {}]
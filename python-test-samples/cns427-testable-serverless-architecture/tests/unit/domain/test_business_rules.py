@@ -7,8 +7,11 @@ No external dependencies, no mocks, just pure functions and assertions.
 import pytest
 
 from services.task_service.domain.business_rules import (
+    allowed_source_statuses,
     can_transition_to,
     compare_version_tokens,
+    find_cyclic_dependencies,
+    find_dependency_cycle,
     has_circular_dependency,
     is_valid_version_token,
     validate_version_token_for_update,
@@ -185,3 +188,94 @@ class TestCircularDependencies:
         """Dependency on task not in the chain is not circular."""
         dependencies = {'task-B': ['task-X'], 'task-X': ['task-Y'], 'task-Y': []}
         assert has_circular_dependency('task-A', 'task-B', dependencies) is False
+
+
+class TestBatchCycleDetection:
+    """Test batch cycle detection across all proposed dependencies."""
+
+    def test_no_cycle_returns_none(self):
+        """Acyclic graph reports no cycle."""
+        dependencies = {'task-B': ['task-D'], 'task-C': ['task-D']}
+        assert find_dependency_cycle('task-A', ['task-B', 'task-C'], dependencies) is None
+
+    def test_reports_offending_path(self):
+        """Cycle path starts and ends at the task that closes it."""
+        dependencies = {'task-B': ['task-C'], 'task-C': ['task-A']}
+        assert find_dependency_cycle('task-A', ['task-X', 'task-B'], dependencies) == ['task-A', 'task-B', 'task-C', 'task-A']
+
+    def test_self_dependency_path(self):
+        """Self-dependency is reported as a one-edge cycle."""
+        assert find_dependency_cycle('task-A', ['task-A'], {}) == ['task-A', 'task-A']
+
+    def test_existing_cycle_in_reachable_graph(self):
+        """Pre-existing cycles reachable from the task are reported."""
+        dependencies = {'task-B': ['task-C'], 'task-C': ['task-D'], 'task-D': ['task-B']}
+        assert find_dependency_cycle('task-A', ['task-B'], dependencies) == ['task-B', 'task-C', 'task-D', 'task-B']
+
+    def test_existing_edges_of_task_are_replaced(self):
+        """The task's current edges are ignored in favour of the proposed ones."""
+        dependencies = {'task-A': ['task-B'], 'task-B': ['task-A']}
+        assert find_dependency_cycle('task-A', ['task-C'], dependencies) is None
+
+    def test_deep_chain_does_not_overflow_stack(self):
+        """Chains far deeper than the recursion limit are handled iteratively."""
+        depth = 50_000
+        dependencies = {f'task-{i}': [f'task-{i + 1}'] for i in range(depth)}
+        assert find_dependency_cycle('new-task', ['task-0'], dependencies) is None
+
+        dependencies[f'task-{depth}'] = ['new-task']
+        cycle = find_dependency_cycle('new-task', ['task-0'], dependencies)
+        assert cycle[0] == cycle[-1] == 'new-task'
+        assert len(cycle) == depth + 3
+
+    def test_shared_subgraphs_explored_once(self):
+        """Stacked diamonds stay fast because explored nodes are shared across paths."""
+        dependencies = {}
+        for level in range(200):
+            dependencies[f'top-{level}'] = [f'left-{level}', f'right-{level}']
+            dependencies[f'left-{level}'] = [f'top-{level + 1}']
+            dependencies[f'right-{level}'] = [f'top-{level + 1}']
+        assert find_dependency_cycle('task-A', ['top-0', 'left-0', 'right-0'], dependencies) is None
+
+
+class TestWholeBatchCycleDetection:
+    """Test single-pass cycle detection for a batch of new tasks."""
+
+    def test_acyclic_batch_is_valid(self):
+        """Batch forming a DAG has no invalid tasks."""
+        dependencies = {'new-1': ['new-2', 'existing'], 'new-2': ['existing']}
+        assert find_cyclic_dependencies(['new-1', 'new-2'], dependencies) == {}
+
+    def test_cycle_members_and_dependents_are_invalid(self):
+        """Tasks on a cycle and tasks depending on them are reported; others are not."""
+        dependencies = {'new-1': ['new-2'], 'new-2': ['new-3'], 'new-3': ['new-2'], 'new-4': ['existing']}
+        invalid = find_cyclic_dependencies(['new-1', 'new-2', 'new-3', 'new-4'], dependencies)
+
+        assert set(invalid) == {'new-1', 'new-2', 'new-3'}
+        assert invalid['new-1'] == ['new-2', 'new-3', 'new-2']
+
+    def test_self_dependency_in_batch(self):
+        """Self-dependency inside a batch is invalid."""
+        assert find_cyclic_dependencies(['new-1'], {'new-1': ['new-1']}) == {'new-1': ['new-1', 'new-1']}
+
+    def test_deep_batch_does_not_overflow_stack(self):
+        """Long in-batch chains are handled iteratively."""
+        task_ids = [f'new-{i}' for i in range(20_000)]
+        dependencies = {task_ids[i]: [task_ids[i + 1]] for i in range(len(task_ids) - 1)}
+        assert find_cyclic_dependencies(task_ids, dependencies) == {}
+
+
+class TestAllowedSourceStatuses:
+    """Test the inverse of the status transition rules."""
+
+    @pytest.mark.parametrize(
+        'new_status,expected',
+        [
+            (TaskStatus.IN_PROGRESS, [TaskStatus.PENDING]),
+            (TaskStatus.COMPLETED, [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
+            (TaskStatus.PENDING, [TaskStatus.COMPLETED]),
+        ],
+    )
+    def test_matches_can_transition_to(self, new_status, expected):
+        """Every allowed source status can transition to the target, and no other can."""
+        assert allowed_source_statuses(new_status) == expected
@@ -0,0 +1,155 @@
+"""Unit tests for the indexed, thread-safe in-memory task repository, alone and behind TaskService."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from services.task_service.domain.exceptions import ConflictError
+from services.task_service.domain.task_service import TaskService
+from services.task_service.models.api import CreateTaskRequest, UpdateTaskRequest
+from services.task_service.models.task import Task, TaskPriority, TaskSortOrder, TaskStatus
+from tests.shared.fakes import InMemoryEventPublisher, InMemoryTaskRepository
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def make_task(index, status=TaskStatus.PENDING, priority=TaskPriority.MEDIUM, dependencies=None, created_offset=None):
+    created_at = START + timedelta(seconds=index if created_offset is None else created_offset)
+    return Task(
+        task_id=f'task-{index:04d}',
+        title=f'Task {index}',
+        status=status,
+        priority=priority,
+        dependencies=dependencies or [],
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def read_all(repository, page_size, **filters):
+    tasks, next_token = repository.list_tasks(limit=page_size, **filters)
+    pages = [tasks]
+    while next_token:
+        tasks, next_token = repository.list_tasks(limit=page_size, next_token=next_token, **filters)
+        pages.append(tasks)
+    return [task.task_id for page in pages for task in page], len(pages)
+
+
+@pytest.fixture
+def repository():
+    return InMemoryTaskRepository()
+
+
+class TestPagination:
+    """Pages follow insertion order, or created_at order on an index."""
+
+    def test_pages_cover_every_task_once_in_insertion_order(self, repository):
+        # GIVEN tasks created out of created_at order
+        for index in range(25):
+            repository.create_task(make_task(index, created_offset=100 - index))
+
+        # WHEN paging through them
+        task_ids, pages = read_all(repository, page_size=10)
+
+        # THEN every task is read once, in insertion order, and the last page ends the listing
+        assert task_ids == [f'task-{index:04d}' for index in range(25)]
+        assert pages == 3
+
+    def test_deleted_tasks_do_not_break_tokens(self, repository):
+        for index in range(6):
+            repository.create_task(make_task(index))
+        page, next_token = repository.list_tasks(limit=3)
+
+        repository.delete_task(page[-1].task_id, version=1)
+        rest, _ = repository.list_tasks(limit=3, next_token=next_token)
+
+        assert [task.task_id for task in rest] == ['task-0003', 'task-0004', 'task-0005']
+
+    def test_index_listing_sorted_and_filtered(self, repository):
+        for index in range(12):
+            repository.create_task(make_task(index, status=[TaskStatus.PENDING, TaskStatus.COMPLETED][index % 2], created_offset=12 - index))
+
+        ascending, _ = read_all(repository, page_size=4, status=TaskStatus.PENDING)
+        descending, _ = read_all(repository, page_size=4, status=TaskStatus.PENDING, sort=TaskSortOrder.CREATED_AT_DESC)
+        recent, _ = read_all(repository, page_size=2, status=TaskStatus.PENDING, created_after=START + timedelta(seconds=6))
+
+        assert ascending == ['task-0010', 'task-0008', 'task-0006', 'task-0004', 'task-0002', 'task-0000']
+        assert descending == ascending[::-1]
+        assert recent == ['task-0004', 'task-0002', 'task-0000']
+
+    def test_status_and_priority_use_the_combined_index(self, repository):
+        repository.create_task(make_task(1, status=TaskStatus.PENDING, priority=TaskPriority.HIGH))
+        repository.create_task(make_task(2, status=TaskStatus.PENDING, priority=TaskPriority.LOW))
+        repository.create_task(make_task(3, status=TaskStatus.COMPLETED, priority=TaskPriority.HIGH))
+
+        tasks, _ = repository.list_tasks(status=TaskStatus.PENDING, priority=TaskPriority.HIGH)
+
+        assert [task.task_id for task in tasks] == ['task-0001']
+
+    def test_updates_move_tasks_between_indexes(self, repository):
+        task = repository.create_task(make_task(1))
+
+        repository.update_task(task.model_copy(update={'status': TaskStatus.COMPLETED, 'version': 2}), expected_version=1)
+
+        assert repository.list_tasks(status=TaskStatus.PENDING) == ([], None)
+        assert [task.task_id for task in repository.list_tasks(status=TaskStatus.COMPLETED)[0]] == ['task-0001']
+
+    def test_sorting_requires_an_index_and_tokens_are_validated(self, repository):
+        with pytest.raises(ValueError):
+            repository.list_tasks(sort=TaskSortOrder.CREATED_AT_ASC)
+        with pytest.raises(ValueError):
+            repository.list_tasks(next_token='not-a-token')
+        with pytest.raises(ValueError):
+            repository.list_tasks(status=TaskStatus.PENDING, next_token='not-a-token')
+
+
+class TestDependencies:
+    """Dependencies are walked from the tasks reached and indexed in reverse."""
+
+    def test_graph_and_dependents(self, repository):
+        repository.create_task(make_task(1))
+        repository.create_task(make_task(2, dependencies=['task-0001']))
+        repository.create_task(make_task(3, dependencies=['task-0002', 'task-0001']))
+        repository.create_task(make_task(4, dependencies=['task-0001']))
+
+        assert repository.get_dependency_graph(['task-0003']) == {'task-0003': ['task-0002', 'task-0001'], 'task-0002': ['task-0001']}
+        assert repository.get_dependents('task-0001') == ['task-0002', 'task-0003', 'task-0004']
+
+        repository.delete_task('task-0004', version=1)
+
+        assert repository.get_dependents('task-0001') == ['task-0002', 'task-0003']
+
+
+class TestConcurrentUse:
+    """TaskService can be driven from a thread pool against one repository."""
+
+    def test_concurrent_creates_and_conflicting_updates(self, repository):
+        # GIVEN a service shared by a thread pool
+        service = TaskService(repository, InMemoryEventPublisher())
+
+        # WHEN tasks are created concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            created = list(executor.map(lambda index: service.create_task(CreateTaskRequest(title=f'Task {index}')), range(200)))
+
+        # THEN every task is stored and listed exactly once
+        task_ids, _ = read_all(repository, page_size=50)
+        assert sorted(task_ids) == sorted(task.task_id for task in created)
+        assert repository.count() == 200
+
+        # WHEN many clients update the same task from the same version
+        target = created[0]
+
+        def update(index):
+            try:
+                return service.update_task(target.task_id, UpdateTaskRequest(title=f'Renamed {index}', version=target.version))
+            except ConflictError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(update, range(32)))
+
+        # THEN exactly one wins
+        winners = [result for result in results if result is not None]
+        assert len(winners) == 1
+        assert repository.get_task(target.task_id) == winners[0]
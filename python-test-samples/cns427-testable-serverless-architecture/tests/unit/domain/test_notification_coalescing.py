@@ -0,0 +1,209 @@
+"""Unit tests for coalescing bursts of TaskUpdated events into one notification."""
+
+import copy
+
+import pytest
+
+from services.notification_service.domain.coalescing import UpdateCoalescer, merge_task_states
+from services.notification_service.domain.exceptions import NotificationDeferred
+from services.notification_service.domain.notification_service import NotificationService
+from services.task_service.domain.exceptions import ConflictError
+from services.task_service.models.task import TaskEvent
+from shared.integration.interfaces import UpdateWindowStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class InMemoryUpdateWindowStore(UpdateWindowStore):
+    """Window store holding copies of windows in a dict, with the same revision checks as DynamoDB."""
+
+    def __init__(self):
+        self.windows = {}
+
+    def get_window(self, task_id):
+        window = self.windows.get(task_id)
+        return copy.deepcopy(window) if window is not None else None
+
+    def put_window(self, window, expected_revision=None):
+        current = self.windows.get(window.task_id)
+        if (current.revision if current is not None else None) != expected_revision:
+            raise ConflictError(f'Update window of task {window.task_id} was changed by another consumer')
+        self.windows[window.task_id] = copy.deepcopy(window)
+
+
+def update(task_id='task-1', version=2, event_id=None, **fields):
+    task_data = {'task_id': task_id, 'title': 'Task', 'status': 'pending', 'priority': 'medium', 'version': version, **fields}
+    return TaskEvent('TaskUpdated', task_data, event_id=event_id or f'{task_id}-v{version}')
+
+
+class RecordingNotificationService(NotificationService):
+    """NotificationService recording the events it notifies."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.notified = []
+
+    def process_task_event(self, event_type, task_data, event_id=None):
+        self.notified.append((event_type, task_data, event_id))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store():
+    return InMemoryUpdateWindowStore()
+
+
+class TestMergeTaskStates:
+    """The newest state wins and every changed field is kept."""
+
+    def test_union_of_changed_fields(self):
+        state, changed = merge_task_states(
+            {'task_id': 't', 'title': 'A', 'status': 'pending', 'version': 1},
+            set(),
+            [{'task_id': 't', 'title': 'B', 'status': 'pending', 'version': 2}, {'task_id': 't', 'title': 'B', 'status': 'completed', 'version': 3}],
+        )
+
+        assert state['version'] == 3
+        assert changed == {'title', 'status'}
+
+    def test_out_of_order_update_does_not_replace_newer_state(self):
+        state, changed = merge_task_states({'task_id': 't', 'title': 'C', 'version': 3}, {'priority'}, [{'task_id': 't', 'title': 'B', 'version': 2}])
+
+        assert state['title'] == 'C'
+        assert changed == {'priority', 'title'}
+
+
+class TestCoalescingWithinBatch:
+    """Without a window store, updates of the same task in one batch produce one notification."""
+
+    def test_burst_in_batch_is_one_notification(self):
+        # GIVEN three updates of one task and one update of another in the same batch
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30))
+        events = [update(version=2, title='Draft'), update(task_id='task-2'), update(version=3, title='Final'), update(version=4, status='completed')]
+
+        # WHEN processing the batch
+        failures = service.process_task_events(events)
+
+        # THEN each task is notified once, with its last state and every changed field
+        assert failures == {}
+        notified = {task_data['task_id']: task_data for _, task_data, _ in service.notified}
+        assert len(service.notified) == 2
+        assert notified['task-1']['version'] == 4
+        assert notified['task-1']['changed_fields'] == ['status', 'title']
+        assert notified['task-1']['coalesced_events'] == 3
+        assert 'changed_fields' not in notified['task-2']
+
+    def test_other_event_types_pass_through(self):
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30))
+
+        service.process_task_events([TaskEvent('TaskCreated', {'task_id': 'task-1'}), TaskEvent('TaskDeleted', {'task_id': 'task-1'})])
+
+        assert [event_type for event_type, _, _ in service.notified] == ['TaskCreated', 'TaskDeleted']
+
+    def test_failed_merged_notification_fails_every_merged_record(self):
+        class FailingService(NotificationService):
+            def process_task_event(self, event_type, task_data, event_id=None):
+                raise RuntimeError('downstream unavailable')
+
+        service = FailingService(coalescer=UpdateCoalescer(30))
+
+        failures = service.process_task_events([update(version=2), update(version=3)])
+
+        assert sorted(failures) == [0, 1]
+
+
+class TestCoalescingAcrossBatches:
+    """With a window store, updates within the window are merged into one deferred notification."""
+
+    def test_first_update_opens_window_and_is_deferred(self, store, clock):
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30, store=store, clock=clock))
+
+        failures = service.process_task_events([update(version=2)])
+
+        assert isinstance(failures[0], NotificationDeferred)
+        assert failures[0].delay_seconds == 30
+        assert service.notified == []
+        assert store.windows['task-1'].owner_event_id == 'task-1-v2'
+
+    def test_window_delivers_merged_state_once(self, store, clock):
+        # GIVEN a window opened by one update and extended by two later batches
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30, store=store, clock=clock))
+        service.process_task_events([update(version=2)])
+        clock.now += 10
+        assert service.process_task_events([update(version=3, title='Renamed')]) == {}
+        clock.now += 10
+        assert service.process_task_events([update(version=4, status='in_progress')]) == {}
+
+        # WHEN the owner is redelivered after the window has closed
+        clock.now += 15
+        failures = service.process_task_events([update(version=2)])
+
+        # THEN one notification carries the last state, every changed field and the owner's event id
+        assert failures == {}
+        [(event_type, task_data, event_id)] = service.notified
+        assert event_type == 'TaskUpdated'
+        assert task_data['version'] == 4
+        assert task_data['changed_fields'] == ['status', 'title']
+        assert task_data['coalesced_events'] == 3
+        assert event_id == 'task-1-v2'
+        assert store.windows['task-1'].delivered
+
+        # AND a second redelivery of the owner notifies nothing
+        assert service.process_task_events([update(version=2)]) == {}
+        assert len(service.notified) == 1
+
+    def test_early_redelivery_of_owner_is_deferred_again(self, store, clock):
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30, store=store, clock=clock))
+        service.process_task_events([update(version=2)])
+        clock.now += 20
+
+        failures = service.process_task_events([update(version=2)])
+
+        assert failures[0].delay_seconds == pytest.approx(10)
+        assert service.notified == []
+
+    def test_update_after_window_closes_delivers_before_the_owner(self, store, clock):
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30, store=store, clock=clock))
+        service.process_task_events([update(version=2)])
+        clock.now += 40
+
+        assert service.process_task_events([update(version=3, title='Late')]) == {}
+        assert service.process_task_events([update(version=2)]) == {}
+
+        [(_, task_data, event_id)] = service.notified
+        assert task_data['title'] == 'Late'
+        assert event_id == 'task-1-v2'
+
+    def test_update_after_delivery_opens_a_new_window(self, store, clock):
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30, store=store, clock=clock))
+        service.process_task_events([update(version=2)])
+        clock.now += 40
+        service.process_task_events([update(version=2)])
+
+        failures = service.process_task_events([update(version=5)])
+
+        assert isinstance(failures[0], NotificationDeferred)
+        assert store.windows['task-1'].owner_event_id == 'task-1-v5'
+        assert not store.windows['task-1'].delivered
+
+    def test_concurrent_window_change_fails_the_records(self, store, clock):
+        class RacingStore(InMemoryUpdateWindowStore):
+            def put_window(self, window, expected_revision=None):
+                raise ConflictError('Update window of task task-1 was changed by another consumer')
+
+        service = RecordingNotificationService(coalescer=UpdateCoalescer(30, store=RacingStore(), clock=clock))
+
+        failures = service.process_task_events([update(version=2), update(version=3)])
+
+        assert sorted(failures) == [0, 1]
+        assert all(isinstance(error, ConflictError) for error in failures.values())
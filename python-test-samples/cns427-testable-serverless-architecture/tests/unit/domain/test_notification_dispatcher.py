@@ -0,0 +1,170 @@
+"""Unit tests for concurrent notification delivery."""
+
+import threading
+import time
+
+import pytest
+
+from services.notification_service.domain.dispatcher import ChannelSettings, NotificationDispatcher, TokenBucket
+from services.notification_service.domain.exceptions import ChannelError, NotificationDeliveryError
+from services.notification_service.domain.notification_service import NotificationService
+from services.notification_service.models.notification import Notification
+from shared.integration.interfaces import NotificationChannel
+from tests.unit.domain.test_notification_service import InMemoryIdempotencyStore
+from tests.unit.test_helpers import create_task_event_detail
+
+
+class FakeClock:
+    """Clock advanced only by the sleeps it is asked for."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RecordingChannel(NotificationChannel):
+    """Channel recording what it was sent, optionally blocking or failing."""
+
+    def __init__(self, name, error=None, release=None):
+        self.name = name
+        self.error = error
+        self.release = release
+        self.sent = []
+
+    def send(self, notification, timeout):
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        self.sent.append(notification)
+
+
+def make_notification(event_id=None):
+    return Notification('TaskCreated', 'task-1', 'Task created: Task', 'Task task-1 was created.', event_id=event_id)
+
+
+class TestTokenBucket:
+    """Tokens refill continuously up to the bucket capacity."""
+
+    def test_burst_then_wait_for_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        assert bucket.try_acquire(0)
+        assert bucket.try_acquire(0)
+        assert not bucket.try_acquire(0.1)
+        assert bucket.try_acquire(0.5)
+        assert clock.now == pytest.approx(0.5)
+
+    def test_refill_is_capped(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=clock, sleep=clock.sleep)
+        bucket.try_acquire(0)
+
+        clock.now = 100.0
+
+        assert bucket.try_acquire(0)
+        assert not bucket.try_acquire(0)
+
+
+class TestNotificationDispatcher:
+    """Channels are delivered to concurrently and fail independently."""
+
+    def test_delivers_to_every_channel(self):
+        channels = [RecordingChannel('webhook'), RecordingChannel('chat')]
+        dispatcher = NotificationDispatcher([(channel, ChannelSettings()) for channel in channels])
+
+        failures = dispatcher.dispatch(make_notification())
+
+        assert failures == {}
+        assert [len(channel.sent) for channel in channels] == [1, 1]
+
+    def test_slow_channel_does_not_delay_the_others(self):
+        # GIVEN a channel that blocks until released and a fast one
+        release = threading.Event()
+        slow = RecordingChannel('email', release=release)
+        fast = RecordingChannel('webhook')
+        dispatcher = NotificationDispatcher([(slow, ChannelSettings(timeout=0.2)), (fast, ChannelSettings(timeout=0.2))])
+
+        # WHEN dispatching
+        started = time.monotonic()
+        failures = dispatcher.dispatch(make_notification())
+        elapsed = time.monotonic() - started
+        release.set()
+        dispatcher.close()
+
+        # THEN the fast channel is delivered, the slow one times out and dispatch waits only for the timeout
+        assert len(fast.sent) == 1
+        assert list(failures) == ['email']
+        assert isinstance(failures['email'], ChannelError)
+        assert elapsed < 1.0
+
+    def test_failures_are_reported_per_channel(self):
+        channels = [RecordingChannel('webhook', error=ChannelError('webhook returned HTTP 500')), RecordingChannel('chat')]
+        dispatcher = NotificationDispatcher([(channel, ChannelSettings()) for channel in channels])
+
+        failures = dispatcher.dispatch(make_notification())
+
+        assert list(failures) == ['webhook']
+        assert len(channels[1].sent) == 1
+
+    def test_exhausted_rate_limit_fails_the_channel(self):
+        clock = FakeClock()
+        channel = RecordingChannel('chat')
+        dispatcher = NotificationDispatcher([(channel, ChannelSettings(rate=1.0, burst=1, timeout=0.5))], clock=clock, sleep=clock.sleep)
+
+        assert dispatcher.dispatch(make_notification()) == {}
+        failures = dispatcher.dispatch(make_notification())
+
+        assert 'rate limit' in str(failures['chat'])
+        assert len(channel.sent) == 1
+
+
+class TestNotificationServiceDelivery:
+    """The service delivers each notification through its dispatcher."""
+
+    def test_notification_carries_event_id(self):
+        channel = RecordingChannel('webhook')
+        service = NotificationService(dispatcher=NotificationDispatcher([(channel, ChannelSettings())]))
+
+        service.process_task_event('TaskCreated', create_task_event_detail(task_id='task-1', title='Write docs'), event_id='event-1')
+
+        [notification] = channel.sent
+        assert notification.task_id == 'task-1'
+        assert notification.event_id == 'event-1'
+        assert notification.subject == 'Task created: Write docs'
+
+    def test_failed_channel_fails_the_event(self):
+        channels = [RecordingChannel('webhook', error=ChannelError('webhook returned HTTP 500')), RecordingChannel('chat')]
+        service = NotificationService(dispatcher=NotificationDispatcher([(channel, ChannelSettings()) for channel in channels]))
+
+        with pytest.raises(NotificationDeliveryError) as exc_info:
+            service.process_task_event('TaskDeleted', create_task_event_detail(task_id='task-1'))
+
+        assert list(exc_info.value.channel_errors) == ['webhook']
+
+    def test_retry_delivers_only_to_failed_channels(self):
+        # GIVEN a flaky chat channel next to a working webhook, with an idempotency store
+        chat = RecordingChannel('chat', error=ChannelError('chat returned HTTP 503'))
+        webhook = RecordingChannel('webhook')
+        store = InMemoryIdempotencyStore()
+        service = NotificationService(
+            idempotency_store=store, dispatcher=NotificationDispatcher([(webhook, ChannelSettings()), (chat, ChannelSettings())])
+        )
+        detail = create_task_event_detail(task_id='task-1')
+
+        # WHEN the event fails on chat and is redelivered after chat recovers
+        with pytest.raises(NotificationDeliveryError):
+            service.process_task_event('TaskCreated', detail, event_id='event-1')
+        chat.error = None
+        service.process_task_event('TaskCreated', detail, event_id='event-1')
+
+        # THEN the webhook was notified once, and chat once on the retry
+        assert len(webhook.sent) == 1
+        assert len(chat.sent) == 1
+        assert store.completed == {'event-1', 'event-1#webhook', 'event-1#chat'}
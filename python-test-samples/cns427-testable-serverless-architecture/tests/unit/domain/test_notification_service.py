@@ -1,8 +1,13 @@
 """Unit tests for notification service domain logic."""
 
+from datetime import datetime
+
 import pytest
 
 from services.notification_service.domain.notification_service import NotificationService
+from services.task_service.models.event_payloads import TaskUpdatedPayload
+from services.task_service.models.task import TaskEvent, TaskStatus
+from shared.integration.interfaces import IdempotencyStore
 from tests.unit.test_helpers import create_task_event_detail
 
 
@@ -90,3 +95,93 @@ class TestNotificationService:
         assert 'Task created notification: Task 1' in caplog.text
         assert 'Task updated notification: Task 2' in caplog.text
         assert 'Task deleted notification: task-3' in caplog.text
+
+    def test_handlers_receive_typed_payloads(self, notification_service, monkeypatch):
+        """Test handlers get validated payload objects rather than raw dicts."""
+        received = []
+        monkeypatch.setattr(notification_service, '_handle_task_updated', received.append)
+
+        notification_service.process_task_event('TaskUpdated', create_task_event_detail(task_id='task-1', status='in_progress'))
+
+        [payload] = received
+        assert isinstance(payload, TaskUpdatedPayload)
+        assert payload.status is TaskStatus.IN_PROGRESS
+        assert isinstance(payload.created_at, datetime)
+
+    def test_invalid_payload_fails_the_event(self, notification_service):
+        """Test a detail that does not match its event type is rejected."""
+        with pytest.raises(ValueError):
+            notification_service.process_task_event('TaskCreated', {'task_id': 'task-1'})
+
+    def test_process_task_events_isolates_failures(self, notification_service, monkeypatch):
+        """Test one failing event in a batch does not stop the others."""
+        # GIVEN a batch where the second event fails
+        handled = []
+
+        def handle_created(payload):
+            if payload.task_id == 'task-2':
+                raise RuntimeError('downstream unavailable')
+            handled.append(payload.task_id)
+
+        monkeypatch.setattr(notification_service, '_handle_task_created', handle_created)
+        events = [TaskEvent('TaskCreated', create_task_event_detail(task_id=f'task-{index}')) for index in range(1, 4)]
+
+        # WHEN processing the batch
+        failures = notification_service.process_task_events(events)
+
+        # THEN only the failing index is reported
+        assert list(failures) == [1]
+        assert isinstance(failures[1], RuntimeError)
+        assert handled == ['task-1', 'task-3']
+
+    def test_duplicate_events_are_skipped_before_notification(self, monkeypatch):
+        """Test an event id seen before is not processed again."""
+        # GIVEN a service with an idempotency store
+        store = InMemoryIdempotencyStore()
+        service = NotificationService(idempotency_store=store)
+        handled = []
+        monkeypatch.setattr(service, '_handle_task_created', lambda payload: handled.append(payload.task_id))
+
+        # WHEN the same event is delivered twice
+        for _ in range(2):
+            service.process_task_event('TaskCreated', create_task_event_detail(task_id='task-1'), event_id='event-1')
+
+        # THEN it is notified once and recorded as completed
+        assert handled == ['task-1']
+        assert store.completed == {'event-1'}
+
+    def test_failed_event_is_released_for_retry(self, monkeypatch):
+        """Test a failure gives up the claim so a redelivery is processed."""
+        store = InMemoryIdempotencyStore()
+        service = NotificationService(idempotency_store=store)
+
+        def fail(payload):
+            raise RuntimeError('downstream unavailable')
+
+        monkeypatch.setattr(service, '_handle_task_created', fail)
+        with pytest.raises(RuntimeError):
+            service.process_task_event('TaskCreated', create_task_event_detail(task_id='task-1'), event_id='event-1')
+
+        assert store.claimed == set()
+        assert store.claim('event-1') is True
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Idempotency store holding claims in sets."""
+
+    def __init__(self):
+        self.claimed = set()
+        self.completed = set()
+
+    def claim(self, key):
+        if key in self.claimed or key in self.completed:
+            return False
+        self.claimed.add(key)
+        return True
+
+    def complete(self, key):
+        self.claimed.discard(key)
+        self.completed.add(key)
+
+    def release(self, key):
+        self.claimed.discard(key)
@@ -10,14 +10,16 @@ Focus: Test actual business rules and behavior, not pass-through operations.
 """
 
 from datetime import UTC, datetime
+from functools import partial
 from unittest.mock import Mock
 
 import pytest
 
 from services.task_service.domain.exceptions import CircularDependencyError, ConflictError
 from services.task_service.domain.task_service import TaskService
-from services.task_service.models.api import CreateTaskRequest, UpdateTaskRequest
-from services.task_service.models.task import Task, TaskEventType, TaskPriority, TaskStatus
+from services.task_service.models.api import BatchCreateTaskItem, CreateTaskRequest, UpdateTaskRequest
+from services.task_service.models.task import PartialTask, Task, TaskEventType, TaskPriority, TaskSortOrder, TaskStatus
+from shared.integration.interfaces import TaskRepository
 
 
 class TestTaskService:
@@ -25,8 +27,10 @@ class TestTaskService:
 
     @pytest.fixture
     def repository(self):
-        """Create mock repository for each test."""
-        return Mock()
+        """Create mock repository for each test; patch_task runs the interface's read-check-update default."""
+        repository = Mock()
+        repository.patch_task.side_effect = partial(TaskRepository.patch_task, repository)
+        return repository
 
     @pytest.fixture
     def publisher(self):
@@ -143,6 +147,28 @@ class TestTaskService:
         # Repository update should NOT be called
         repository.update_task.assert_not_called()
 
+    def test_update_task_pushes_checks_into_single_patch(self, service, repository, publisher):
+        """Test update hands the version and allowed source statuses to one repository patch call."""
+        # GIVEN a repository that applies patches conditionally in one call
+        now = datetime.now(UTC)
+        patched = Task(task_id='test-id', title='Test', status=TaskStatus.IN_PROGRESS, created_at=now, updated_at=now, version=2)
+        repository.patch_task.side_effect = None
+        repository.patch_task.return_value = patched
+
+        # WHEN moving the task to in_progress
+        service.update_task('test-id', UpdateTaskRequest(status='in_progress', version=1))
+
+        # THEN the checks should travel with the write, without reading the task first
+        repository.get_task.assert_not_called()
+        args, kwargs = repository.patch_task.call_args
+        assert args[0] == 'test-id'
+        assert args[1].status == TaskStatus.IN_PROGRESS
+        assert kwargs['expected_version'] == 1
+        assert kwargs['allowed_statuses'] == [TaskStatus.PENDING]
+
+        # AND the event should describe the patched task
+        assert publisher.publish_event.call_args[0][0].task_data['version'] == 2
+
     def test_update_task_invalid_status_transition_raises_error(self, service, repository):
         """BUSINESS RULE: Invalid status transitions should be rejected."""
         # GIVEN task in COMPLETED status
@@ -186,8 +212,8 @@ class TestTaskService:
         )
         repository.get_task.return_value = existing_task
 
-        # Mock repository to return tasks that would create circular dependency
-        repository.list_tasks.return_value = ([Mock(task_id='dep-1', dependencies=['test-id'])], None)
+        # Mock repository to return a reachable subgraph that would create circular dependency
+        repository.get_dependency_graph.return_value = {'dep-1': ['test-id']}
 
         # WHEN attempting to add dependency that creates cycle
         update_request = UpdateTaskRequest(dependencies=['dep-1'], version=existing_task.version)
@@ -198,6 +224,98 @@ class TestTaskService:
 
         # Repository update should NOT be called
         repository.update_task.assert_not_called()
+        # AND only the subgraph reachable from the new dependencies should be loaded
+        repository.get_dependency_graph.assert_called_once_with(['dep-1'])
+        repository.list_tasks.assert_not_called()
+
+    def test_create_tasks_resolves_refs_and_publishes_events(self, service, repository, publisher):
+        """Test batch items can depend on each other by ref and are written in one repository call."""
+        # GIVEN a batch where the child depends on the parent by ref
+        repository.create_tasks.return_value = {}
+        requests = [BatchCreateTaskItem(title='Parent', ref='p'), BatchCreateTaskItem(title='Child', ref='c', dependencies=['p'])]
+
+        # WHEN creating the batch
+        results = service.create_tasks(requests)
+
+        # THEN refs should be resolved to generated task IDs
+        parent, child = results[0].task, results[1].task
+        assert child.dependencies == [parent.task_id]
+        assert [result.ref for result in results] == ['p', 'c']
+
+        # AND all tasks should be written together, without loading the graph for in-batch links
+        repository.create_tasks.assert_called_once()
+        repository.get_dependency_graph.assert_not_called()
+
+        # AND an event should be published per created task
+        publisher.publish_events.assert_called_once()
+        assert len(publisher.publish_events.call_args[0][0]) == 2
+
+    def test_create_tasks_rejects_cycles_per_item(self, service, repository, publisher):
+        """BUSINESS RULE: Items on or behind a cycle fail; other items are still created."""
+        # GIVEN a batch with an in-batch cycle and an independent item
+        repository.create_tasks.return_value = {}
+        requests = [
+            BatchCreateTaskItem(title='A', ref='a', dependencies=['b']),
+            BatchCreateTaskItem(title='B', ref='b', dependencies=['a']),
+            BatchCreateTaskItem(title='C', ref='c'),
+        ]
+
+        # WHEN creating the batch
+        results = service.create_tasks(requests)
+
+        # THEN cyclic items should fail with the cycle path
+        assert isinstance(results[0].error, CircularDependencyError)
+        assert isinstance(results[1].error, CircularDependencyError)
+        assert results[0].error.cycle_path[0] == results[0].error.cycle_path[-1]
+
+        # AND only the valid item should be written and announced
+        written = repository.create_tasks.call_args[0][0]
+        assert [task.title for task in written] == ['C']
+        assert results[2].error is None
+        assert [event.task_data['title'] for event in publisher.publish_events.call_args[0][0]] == ['C']
+
+    def test_create_tasks_reports_repository_failures(self, service, repository, publisher):
+        """Test per-item repository failures are surfaced and not announced."""
+        repository.get_dependency_graph.return_value = {}
+        repository.create_tasks.side_effect = lambda tasks: {tasks[0].task_id: ConflictError('Task already exists')}
+
+        results = service.create_tasks([BatchCreateTaskItem(title='A', dependencies=['existing']), BatchCreateTaskItem(title='B')])
+
+        assert isinstance(results[0].error, ConflictError)
+        assert results[1].task is not None
+        repository.get_dependency_graph.assert_called_once_with(['existing'])
+        assert [event.task_data['title'] for event in publisher.publish_events.call_args[0][0]] == ['B']
+
+    def test_delete_task_with_version_skips_read(self, service, repository, publisher):
+        """Test a client-supplied version makes delete a single conditional repository call."""
+        # WHEN deleting with a known version
+        service.delete_task('task-1', version=42)
+
+        # THEN the task should not be read first
+        repository.get_task.assert_not_called()
+        repository.delete_task.assert_called_once_with('task-1', 42)
+        publisher.publish_event.assert_called_once()
+
+    def test_outbox_mode_hands_events_to_repository(self, repository, publisher):
+        """Test outbox mode stores events with the write instead of publishing them inline."""
+        # GIVEN a service in outbox mode
+        service = TaskService(repository, publisher, use_outbox=True)
+        repository.create_task.side_effect = lambda task, **kwargs: task
+        existing = Task(task_id='task-1', title='Task', created_at=datetime.now(UTC), updated_at=datetime.now(UTC), version=1)
+        repository.get_task.return_value = existing
+
+        # WHEN creating and deleting tasks
+        created = service.create_task(CreateTaskRequest(title='New'))
+        service.delete_task('task-1')
+
+        # THEN the repository should receive the matching events
+        create_event = repository.create_task.call_args.kwargs['outbox_event']
+        assert create_event.event_type == 'TaskCreated'
+        assert create_event.task_data['task_id'] == created.task_id
+        assert repository.delete_task.call_args.kwargs['outbox_event'].event_type == 'TaskDeleted'
+
+        # AND nothing should be published inline
+        publisher.publish_event.assert_not_called()
 
     def test_get_task_not_found_raises_error(self, service, repository):
         """BUSINESS RULE: Getting non-existent task should raise ValueError."""
@@ -212,6 +330,27 @@ class TestTaskService:
         assert 'not found' in str(exc_info.value).lower()
         repository.get_task.assert_called_once_with('non-existent-id')
 
+    def test_get_task_with_fields_reads_projection(self, service, repository):
+        """Test a sparse fieldset is read through get_task_fields, not a full get_task."""
+        # GIVEN repository returns a partial task
+        partial_task = PartialTask(task_id='test-id', title='Task')
+        repository.get_task_fields.return_value = partial_task
+
+        # WHEN getting selected fields
+        result = service.get_task('test-id', fields=['task_id', 'title'])
+
+        # THEN only the projected read should be made
+        assert result is partial_task
+        repository.get_task_fields.assert_called_once_with('test-id', ['task_id', 'title'])
+        repository.get_task.assert_not_called()
+
+    def test_get_task_with_fields_not_found_raises_error(self, service, repository):
+        """BUSINESS RULE: A sparse read of a non-existent task raises the same not-found error."""
+        repository.get_task_fields.return_value = None
+
+        with pytest.raises(ValueError, match='not found'):
+            service.get_task('non-existent-id', fields=['title'])
+
     def test_delete_task_calls_repository_and_publisher(self, service, repository, publisher):
         """Test that delete_task calls repository and publisher correctly."""
         # GIVEN existing task
@@ -254,6 +393,23 @@ class TestTaskService:
         # Repository delete should NOT be called
         repository.delete_task.assert_not_called()
 
+    def test_list_tasks_passes_filters_to_repository(self, service, repository):
+        """Test filters are forwarded to the repository for index-backed queries."""
+        repository.list_tasks.return_value = ([], None)
+
+        service.list_tasks(10, status=TaskStatus.PENDING, sort=TaskSortOrder.CREATED_AT_DESC)
+
+        repository.list_tasks.assert_called_once_with(
+            10, None, status=TaskStatus.PENDING, priority=None, created_after=None, sort=TaskSortOrder.CREATED_AT_DESC
+        )
+
+    def test_list_tasks_sort_without_filter_raises_error(self, service, repository):
+        """BUSINESS RULE: Sorting is only supported on index-backed (filtered) listings."""
+        with pytest.raises(ValueError, match='requires a status or priority filter'):
+            service.list_tasks(sort=TaskSortOrder.CREATED_AT_ASC)
+
+        repository.list_tasks.assert_not_called()
+
     def test_validate_pagination_params_default(self, service):
         """Test default pagination parameters."""
         result = service._validate_pagination_params(None)
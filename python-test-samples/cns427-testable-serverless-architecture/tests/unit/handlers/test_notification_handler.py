@@ -1,5 +1,7 @@
 """Unit tests for notification handler focusing on event processing and Lambda integration."""
 
+import json
+
 import pytest
 
 from services.notification_service.handler import lambda_handler
@@ -12,6 +14,22 @@ def lambda_context():
     return create_test_context()
 
 
+def create_sqs_batch(*bodies):
+    """Wrap EventBridge events as SQS records, the way an SQS rule target delivers them."""
+    return {
+        'Records': [
+            {
+                'messageId': f'message-{index}',
+                'receiptHandle': f'handle-{index}',
+                'body': body if isinstance(body, str) else json.dumps(body),
+                'eventSource': 'aws:sqs',
+                'eventSourceARN': 'arn:aws:sqs:us-west-2:123456789012:notifications',
+            }
+            for index, body in enumerate(bodies)
+        ]
+    }
+
+
 class TestNotificationHandler:
     """Unit tests for notification handler focusing on event processing and Lambda integration."""
 
@@ -73,3 +91,93 @@ class TestNotificationHandler:
         # THEN should propagate the exception
         with pytest.raises(Exception, match='Notification processing failed'):
             lambda_handler(event, lambda_context)
+
+    def test_sqs_batch_processes_every_record(self, fake_notification_service, lambda_context):
+        """Test an SQS batch is processed in one invocation with no failures reported."""
+        # GIVEN a batch of three EventBridge events delivered through SQS
+        event = create_sqs_batch(*(create_eventbridge_event(task_id=f'task-{index}') for index in range(3)))
+
+        # WHEN processing the batch
+        result = lambda_handler(event, lambda_context)
+
+        # THEN every event should be processed
+        assert result == {'batchItemFailures': []}
+        assert [processed['task_data']['task_id'] for processed in fake_notification_service.processed_events] == ['task-0', 'task-1', 'task-2']
+
+    def test_sqs_batch_reports_only_failed_records(self, fake_notification_service, lambda_context):
+        """Test failed and malformed records are reported for retry while the rest succeed."""
+        # GIVEN a batch where one event fails and one record is not JSON
+        fake_notification_service.failing_task_ids = {'task-1'}
+        event = create_sqs_batch(create_eventbridge_event(task_id='task-0'), create_eventbridge_event(task_id='task-1'), 'not json')
+
+        # WHEN processing the batch
+        result = lambda_handler(event, lambda_context)
+
+        # THEN only the failed records should be reported
+        assert sorted(failure['itemIdentifier'] for failure in result['batchItemFailures']) == ['message-1', 'message-2']
+        assert [processed['task_data']['task_id'] for processed in fake_notification_service.processed_events] == ['task-0']
+
+    def test_event_id_is_passed_for_deduplication(self, fake_notification_service, lambda_context):
+        """Test the EventBridge event id reaches the service as the idempotency key."""
+        event = {**create_eventbridge_event(task_id='task-1'), 'id': 'event-1'}
+
+        lambda_handler(create_sqs_batch(event), lambda_context)
+
+        assert fake_notification_service.processed_events[0]['event_id'] == 'event-1'
+
+    def test_deferred_records_are_hidden_until_their_window_closes(self, fake_notification_service, lambda_context, monkeypatch):
+        """Test a record held back by coalescing is reported for retry with its visibility extended."""
+        # GIVEN a batch where the update of task-1 is deferred by the coalescer
+        import shared.integration.resilient_publisher as resilient_publisher
+
+        sqs_client = RecordingSqsClient()
+        monkeypatch.setattr(resilient_publisher, '_sqs_client', sqs_client)
+        fake_notification_service.deferred_task_ids = {'task-1': 29.2}
+        event = create_sqs_batch(create_eventbridge_event(task_id='task-0'), create_eventbridge_event(task_id='task-1'))
+
+        # WHEN processing the batch
+        result = lambda_handler(event, lambda_context)
+
+        # THEN the deferred record returns to the queue once its window has closed
+        assert result == {'batchItemFailures': [{'itemIdentifier': 'message-1'}]}
+        assert sqs_client.calls == [
+            {'QueueUrl': 'https://sqs.us-west-2.amazonaws.com/123456789012/notifications', 'ReceiptHandle': 'handle-1', 'VisibilityTimeout': 30}
+        ]
+
+    def test_each_invocation_bounds_and_reports_dynamodb_retries(self, fake_notification_service, lambda_context, monkeypatch):
+        """Test the retry policy of the DynamoDB stores gets the invocation deadline and publishes its counters, for both event shapes."""
+        # GIVEN a recording retry policy
+        import shared.integration.dynamodb_adapter as dynamodb_adapter
+
+        retry_policy = RecordingRetryPolicy()
+        monkeypatch.setattr(dynamodb_adapter, '_retry_policy', retry_policy)
+
+        # WHEN a direct event and an SQS batch are processed
+        lambda_handler(create_eventbridge_event(task_id='task-1'), lambda_context)
+        lambda_handler(create_sqs_batch(create_eventbridge_event(task_id='task-2')), lambda_context)
+
+        # THEN every invocation set the deadline first and published the counters last
+        assert retry_policy.calls == ['begin_invocation', 'publish_metrics', 'begin_invocation', 'publish_metrics']
+
+
+class RecordingRetryPolicy:
+    """Retry policy stub recording the invocation lifecycle calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def begin_invocation(self, remaining_time_millis):
+        self.calls.append('begin_invocation')
+
+    def publish_metrics(self):
+        self.calls.append('publish_metrics')
+
+
+class RecordingSqsClient:
+    """SQS client stub recording visibility changes."""
+
+    def __init__(self):
+        self.calls = []
+
+    def change_message_visibility(self, **kwargs):
+        self.calls.append(kwargs)
@@ -0,0 +1,136 @@
+"""Unit tests for the outbox relay handler focusing on stream batch handling and partial failures."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from services.outbox_relay.handler import lambda_handler
+from services.task_service.models.task import Task, TaskCreatedEvent
+from shared.integration.interfaces import EventPublisher
+from shared.integration.outbox import event_from_outbox_image, outbox_item
+from shared.integration.resilient_publisher import CircuitBreaker, FileSpillBuffer, ResilientEventPublisher
+from tests.unit.test_helpers import create_test_context
+
+
+class RecordingPublisher(EventPublisher):
+    """Publisher fake that records published batches and fails from a given call onwards."""
+
+    def __init__(self, fail_on_call=None):
+        self.fail_on_call = fail_on_call
+        self.batches = []
+
+    def publish_event(self, event):
+        self.publish_events([event])
+
+    def publish_events(self, events):
+        if self.fail_on_call is not None and len(self.batches) + 1 >= self.fail_on_call:
+            raise RuntimeError('EventBridge unavailable')
+        self.batches.append(events)
+
+
+def make_stream_record(index, event_name='INSERT'):
+    now = datetime.now(UTC)
+    task = Task(task_id=f'task-{index}', title=f'Task {index}', created_at=now, updated_at=now, version=1)
+    return {
+        'eventName': event_name,
+        'dynamodb': {'SequenceNumber': f'{index:05d}', 'NewImage': outbox_item(TaskCreatedEvent(task))},
+    }
+
+
+@pytest.fixture
+def lambda_context():
+    """Fixture for Lambda context."""
+    return create_test_context()
+
+
+@pytest.fixture
+def inject_publisher():
+    """Inject a recording publisher into the relay handler."""
+    import services.outbox_relay.handler as handler
+
+    original_publisher = handler.event_publisher
+
+    def _inject(publisher):
+        handler.event_publisher = publisher
+        return publisher
+
+    yield _inject
+
+    handler.event_publisher = original_publisher
+
+
+class TestOutboxRecordFormat:
+    """The outbox item round-trips to an equivalent task event."""
+
+    def test_round_trip(self):
+        """Event type, source, prefix and payload survive the outbox record."""
+        now = datetime.now(UTC)
+        task = Task(task_id='task-1', title='Task', created_at=now, updated_at=now, version=7)
+        event = TaskCreatedEvent(task, source='TEST-cns427-task-api', detail_type_prefix='TEST-')
+
+        restored = event_from_outbox_image(outbox_item(event))
+
+        assert restored.to_eventbridge_entry('bus') == event.to_eventbridge_entry('bus')
+
+
+class TestOutboxRelayHandler:
+    """Unit tests for relaying outbox stream batches."""
+
+    def test_relays_inserts_in_put_events_sized_chunks(self, inject_publisher, lambda_context):
+        """Test inserts are published in order in chunks of 10; removals are skipped."""
+        # GIVEN 23 inserts and a TTL removal
+        publisher = inject_publisher(RecordingPublisher())
+        records = [make_stream_record(i) for i in range(23)] + [make_stream_record(99, event_name='REMOVE')]
+
+        # WHEN relaying the batch
+        result = lambda_handler({'Records': records}, lambda_context)
+
+        # THEN every insert should be published in order
+        assert result == {'batchItemFailures': []}
+        assert [len(batch) for batch in publisher.batches] == [10, 10, 3]
+        assert publisher.batches[0][0].task_data['task_id'] == 'task-0'
+
+    def test_failed_chunk_reports_its_first_record(self, inject_publisher, lambda_context):
+        """Test a failed chunk is reported so Lambda retries from it, without resending earlier chunks."""
+        # GIVEN a publisher that fails on the second chunk
+        inject_publisher(RecordingPublisher(fail_on_call=2))
+        records = [make_stream_record(i) for i in range(25)]
+
+        # WHEN relaying the batch
+        result = lambda_handler({'Records': records}, lambda_context)
+
+        # THEN the first record of the failed chunk should be reported
+        assert result == {'batchItemFailures': [{'itemIdentifier': '00010'}]}
+
+    def test_chunks_are_spilled_instead_of_retried_while_eventbridge_is_down(self, inject_publisher, lambda_context, tmp_path):
+        """Test a resilient publisher spills failed chunks, so the stream batch succeeds and a later batch drains them."""
+        # GIVEN a resilient publisher around a publisher that fails from its second call
+        failing = RecordingPublisher(fail_on_call=2)
+        spill_buffer = FileSpillBuffer(str(tmp_path / 'spill.ndjson'))
+        inject_publisher(ResilientEventPublisher(failing, spill_buffer, CircuitBreaker(failure_threshold=1, reset_timeout=0)))
+        records = [make_stream_record(i) for i in range(25)]
+
+        # WHEN relaying the batch, then relaying another once EventBridge is back
+        result = lambda_handler({'Records': records}, lambda_context)
+        failing.fail_on_call = None
+        lambda_handler({'Records': [make_stream_record(99)]}, lambda_context)
+
+        # THEN no record should be reported and every event should be published exactly once
+        assert result == {'batchItemFailures': []}
+        published = [event.task_data['task_id'] for batch in failing.batches for event in batch]
+        assert sorted(published) == sorted([f'task-{i}' for i in range(25)] + ['task-99'])
+
+    def test_scheduled_invocation_drains_the_spill_buffer(self, inject_publisher, lambda_context, tmp_path):
+        """Test a scheduled drain publishes spilled events without any stream records."""
+        # GIVEN spilled events and a healthy EventBridge
+        publisher = RecordingPublisher()
+        spill_buffer = FileSpillBuffer(str(tmp_path / 'spill.ndjson'))
+        spill_buffer.spill([event_from_outbox_image(make_stream_record(i)['dynamodb']['NewImage']) for i in range(3)])
+        inject_publisher(ResilientEventPublisher(publisher, spill_buffer))
+
+        # WHEN the schedule invokes the relay
+        result = lambda_handler({'drain_spill_queue': True}, lambda_context)
+
+        # THEN every spilled event should be published
+        assert result == {'drained': 3}
+        assert [event.task_data['task_id'] for batch in publisher.batches for event in batch] == ['task-0', 'task-1', 'task-2']
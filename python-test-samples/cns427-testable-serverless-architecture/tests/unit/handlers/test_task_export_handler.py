@@ -0,0 +1,62 @@
+"""Unit tests for the task export handler."""
+
+import gzip
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from services.task_export.handler import lambda_handler
+from services.task_service.models.task import Task
+from tests.unit.adapters.test_task_export import PagedRepository, RecordingS3Client
+from tests.unit.test_helpers import create_test_context
+
+
+@pytest.fixture
+def lambda_context():
+    """Fixture for Lambda context."""
+    return create_test_context()
+
+
+@pytest.fixture
+def export_env(monkeypatch):
+    """Inject a repository and an S3 client into the export handler."""
+    import services.task_export.handler as handler
+    import shared.integration.task_export as task_export
+
+    now = datetime.now(UTC)
+    client = RecordingS3Client()
+    monkeypatch.setenv('EXPORT_BUCKET_NAME', 'exports')
+    monkeypatch.setattr(handler, 'repository', PagedRepository([[Task(task_id='task-1', title='Task', created_at=now, updated_at=now, version=1)]]))
+    monkeypatch.setattr(task_export, '_s3_client', client)
+    return client
+
+
+class TestTaskExportHandler:
+    """The handler streams the export to the configured bucket."""
+
+    def test_exports_gzip_by_default(self, export_env, lambda_context):
+        # WHEN invoked without options
+        result = lambda_handler({}, lambda_context)
+
+        # THEN a gzip NDJSON object is written under a timestamped key
+        put = export_env.calls[0][1]
+        assert put['Bucket'] == 'exports'
+        assert put['Key'].startswith('exports/tasks-') and put['Key'].endswith('.ndjson.gz')
+        assert put['ContentType'] == 'application/gzip'
+        assert json.loads(gzip.decompress(put['Body']))['task_id'] == 'task-1'
+        assert result == {'bucket': 'exports', 'key': put['Key'], 'task_count': 1, 'bytes_written': len(put['Body'])}
+
+    def test_plain_export_to_given_key(self, export_env, lambda_context):
+        result = lambda_handler({'key': 'daily/tasks.ndjson', 'gzip': False}, lambda_context)
+
+        put = export_env.calls[0][1]
+        assert result['key'] == put['Key'] == 'daily/tasks.ndjson'
+        assert put['ContentType'] == 'application/x-ndjson'
+        assert json.loads(put['Body'])['task_id'] == 'task-1'
+
+    def test_gzip_flag_given_as_string(self, export_env, lambda_context):
+        for flag in ['false', 'False', '0']:
+            lambda_handler({'key': 'daily/tasks.ndjson', 'gzip': flag}, lambda_context)
+
+        assert [put['ContentType'] for _, put in export_env.calls] == ['application/x-ndjson'] * 3
@@ -1,10 +1,12 @@
 """Unit tests for task handler focusing on HTTP response handling."""
 
 import json
+from datetime import UTC, datetime
 
 import pytest
 
 from services.task_service.handler import lambda_handler
+from services.task_service.models.task import Task, TaskPriority, TaskSortOrder, TaskStatus
 from tests.unit.test_helpers import create_api_gateway_event, create_test_context
 
 
@@ -14,6 +16,11 @@ def lambda_context():
     return create_test_context()
 
 
+def make_task(version):
+    now = datetime.now(UTC)
+    return Task(task_id='test-id', title='Task', created_at=now, updated_at=now, version=version)
+
+
 # fake_task_service fixture defined in conftest.py
 class TestTaskHandler:
     """Unit tests for task handler focusing on HTTP response handling and status codes."""
@@ -34,6 +41,40 @@ class TestTaskHandler:
         assert body['title'] == 'New Task'
         assert body['task_id'] == 'test-task-123'
 
+    def test_create_tasks_batch_returns_201(self, fake_task_service, lambda_context):
+        """Test bulk create returns 201 with a result per item when all succeed."""
+        event = create_api_gateway_event(method='POST', path='/tasks:batch', body={'tasks': [{'title': 'One', 'ref': 'a'}, {'title': 'Two'}]})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 201
+        results = json.loads(response['body'])['results']
+        assert [item['status_code'] for item in results] == [201, 201]
+        assert results[0]['ref'] == 'a'
+        assert results[1]['task']['title'] == 'Two'
+
+    def test_create_tasks_batch_partial_failure_returns_207(self, fake_task_service, lambda_context):
+        """Test bulk create with failed items returns 207 and per-item errors."""
+        event = create_api_gateway_event(method='POST', path='/tasks:batch', body={'tasks': [{'title': 'One'}, {'title': 'Fail'}]})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 207
+        results = json.loads(response['body'])['results']
+        assert results[0]['status_code'] == 201
+        assert results[1]['status_code'] == 400
+        assert results[1]['error']['details'] == {'cycle_path': ['a', 'a']}
+
+    def test_create_tasks_batch_duplicate_refs_returns_400(self, fake_task_service, lambda_context):
+        """Test duplicate refs within a batch are rejected."""
+        event = create_api_gateway_event(
+            method='POST', path='/tasks:batch', body={'tasks': [{'title': 'One', 'ref': 'a'}, {'title': 'Two', 'ref': 'a'}]}
+        )
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 400
+
     def test_get_task_returns_200(self, fake_task_service, lambda_context):
         """Test successful task retrieval returns 200 status code."""
         # GIVEN fake service will return a task
@@ -47,6 +88,30 @@ class TestTaskHandler:
         assert body['task_id'] == 'test-id'
         assert body['title'] == 'Retrieved Task'
 
+    def test_async_service_runs_on_one_event_loop(self, fake_task_service, lambda_context, monkeypatch):
+        """Test coroutine results from the async service are run on a single loop reused across invocations."""
+        import asyncio
+
+        import services.task_service.handler as handler
+
+        # GIVEN a service whose get_task is a coroutine
+        loops = []
+        sync_get_task = fake_task_service.get_task
+
+        async def get_task(task_id, fields=None):
+            loops.append(asyncio.get_running_loop())
+            return sync_get_task(task_id, fields)
+
+        monkeypatch.setattr(fake_task_service, 'get_task', get_task)
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id', path_parameters={'task_id': 'test-id'})
+
+        # WHEN handling two invocations
+        responses = [handler.lambda_handler(event, lambda_context) for _ in range(2)]
+
+        # THEN both should succeed on the same loop
+        assert [response['statusCode'] for response in responses] == [200, 200]
+        assert loops[0] is loops[1]
+
     def test_get_task_not_found_returns_404(self, fake_task_service, lambda_context):
         """Test getting non-existent task returns 404."""
         # GIVEN service will raise ValueError for not found
@@ -62,6 +127,105 @@ class TestTaskHandler:
         body = json.loads(response['body'])
         assert 'not found' in body['message'].lower()
 
+    def test_get_task_returns_version_etag(self, fake_task_service, lambda_context):
+        """Test the task version is returned as a strong entity tag."""
+        fake_task_service.return_task = make_task(version=42)
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id')
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 200
+        assert response['multiValueHeaders']['ETag'] == ['"42"']
+
+    def test_get_task_if_none_match_returns_304(self, fake_task_service, lambda_context):
+        """Test an unchanged task is answered with 304 and no body, in any entity tag form."""
+        fake_task_service.return_task = make_task(version=42)
+        for header in ['"42"', 'W/"42"', '"7", "42"', '*']:
+            event = create_api_gateway_event(method='GET', path='/tasks/test-id', headers={'If-None-Match': header})
+
+            response = lambda_handler(event, lambda_context)
+
+            assert response['statusCode'] == 304
+            assert not response['body']
+            assert response['multiValueHeaders']['ETag'] == ['"42"']
+
+    def test_get_task_if_none_match_star(self, fake_task_service, lambda_context):
+        """Test * answers 304 for an existing task of any version and 404 for a missing one."""
+        fake_task_service.return_task = make_task(version=43)
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id', headers={'If-None-Match': '*'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 304
+        assert response['multiValueHeaders']['ETag'] == ['"43"']
+
+        fake_task_service.return_none = True
+        assert lambda_handler(event, lambda_context)['statusCode'] == 404
+
+    def test_get_task_reads_lowercase_if_none_match_and_exposes_etag(self, fake_task_service, lambda_context):
+        """Test header names are matched case-insensitively and browsers may read the entity tag."""
+        fake_task_service.return_task = make_task(version=42)
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id', headers={'if-none-match': '"42"', 'Origin': 'https://example.com'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 304
+        assert response['multiValueHeaders']['Access-Control-Expose-Headers'] == ['ETag']
+
+    def test_get_task_if_none_match_stale_returns_200(self, fake_task_service, lambda_context):
+        """Test a changed task is returned in full with its new entity tag."""
+        fake_task_service.return_task = make_task(version=43)
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id', headers={'If-None-Match': '"42"'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 200
+        assert json.loads(response['body'])['version'] == 43
+        assert response['multiValueHeaders']['ETag'] == ['"43"']
+
+    def test_get_task_fields_returns_only_selected_fields(self, fake_task_service, lambda_context):
+        """Test fields= returns a sparse fieldset with a weak entity tag."""
+        # GIVEN a request selecting some fields
+        fake_task_service.return_task = make_task(version=42)
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id', query_parameters={'fields': 'task_id,title,version'})
+
+        # WHEN getting the task
+        response = lambda_handler(event, lambda_context)
+
+        # THEN only those fields should be returned
+        assert response['statusCode'] == 200
+        assert json.loads(response['body']) == {'task_id': 'test-id', 'title': 'Task', 'version': 42}
+        assert response['multiValueHeaders']['ETag'] == ['W/"42"']
+
+    def test_get_task_fields_without_version_has_no_etag(self, fake_task_service, lambda_context):
+        """Test a sparse fieldset without the version carries no entity tag."""
+        fake_task_service.return_task = make_task(version=42)
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id', query_parameters={'fields': 'title'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 200
+        assert json.loads(response['body']) == {'title': 'Task'}
+        assert 'ETag' not in (response.get('multiValueHeaders') or {})
+
+    def test_get_task_unknown_field_returns_400(self, fake_task_service, lambda_context):
+        """Test an unknown field name is rejected."""
+        event = create_api_gateway_event(method='GET', path='/tasks/test-id', query_parameters={'fields': 'title,secret'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 400
+
+    def test_list_tasks_fields_returns_only_selected_fields(self, fake_task_service, lambda_context):
+        """Test fields= applies to every listed task."""
+        event = create_api_gateway_event(method='GET', path='/tasks', query_parameters={'fields': 'task_id,status'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert body['tasks'] == [{'task_id': 'task-1', 'status': 'pending'}, {'task_id': 'task-2', 'status': 'in_progress'}]
+
     def test_list_tasks_returns_200(self, fake_task_service, lambda_context):
         """Test task listing returns 200 status code."""
         # GIVEN fake service returns task list
@@ -91,6 +255,34 @@ class TestTaskHandler:
         # Fake service returns None for next_token
         assert body['pagination']['next_token'] is None
 
+    def test_list_tasks_passes_filters_to_service(self, fake_task_service, lambda_context):
+        """Test filter and sort query parameters are parsed and passed through."""
+        # GIVEN filter query parameters
+        event = create_api_gateway_event(
+            method='GET',
+            path='/tasks',
+            query_parameters={'status': 'pending', 'priority': 'high', 'created_after': '2025-01-01T00:00:00', 'sort': '-created_at'},
+        )
+
+        # WHEN listing tasks
+        response = lambda_handler(event, lambda_context)
+
+        # THEN filters should reach the service as typed values
+        assert response['statusCode'] == 200
+        filters = fake_task_service.last_list_filters
+        assert filters['status'] == TaskStatus.PENDING
+        assert filters['priority'] == TaskPriority.HIGH
+        assert filters['created_after'] == datetime(2025, 1, 1, tzinfo=UTC)
+        assert filters['sort'] == TaskSortOrder.CREATED_AT_DESC
+
+    def test_list_tasks_invalid_filter_returns_400(self, fake_task_service, lambda_context):
+        """Test unknown status value returns 400."""
+        event = create_api_gateway_event(method='GET', path='/tasks', query_parameters={'status': 'archived'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 400
+
     def test_update_task_returns_200(self, fake_task_service, lambda_context):
         """Test successful task update returns 200 status code."""
         # GIVEN fake service returns updated task
@@ -120,6 +312,25 @@ class TestTaskHandler:
         # THEN should return 409 for conflict
         assert response['statusCode'] == 409
 
+    def test_update_task_takes_version_from_if_match(self, fake_task_service, lambda_context):
+        """Test If-Match supplies the expected version when the body has none."""
+        event = create_api_gateway_event(method='PUT', path='/tasks/test-id', body={'title': 'Updated Task'}, headers={'If-Match': '"1234"'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 200
+        assert fake_task_service.last_update_request.version == 1234
+        assert response['multiValueHeaders']['ETag'] == [f'"{json.loads(response["body"])["version"]}"']
+
+    def test_update_task_if_match_differs_from_body_returns_400(self, fake_task_service, lambda_context):
+        """Test conflicting versions in If-Match and the body are rejected."""
+        event = create_api_gateway_event(method='PUT', path='/tasks/test-id', body={'title': 'Updated Task', 'version': 1}, headers={'If-Match': '2'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 400
+        assert fake_task_service.last_update_request is None
+
     def test_delete_task_returns_204(self, fake_task_service, lambda_context):
         """Test successful task deletion returns 204 status code."""
         # GIVEN fake service deletes successfully
@@ -131,6 +342,34 @@ class TestTaskHandler:
         assert response['statusCode'] == 204
         assert response['body'] == ''
 
+    def test_delete_task_passes_if_match_version(self, fake_task_service, lambda_context):
+        """Test If-Match is passed through as the expected version, in bare or entity tag form."""
+        for header, expected in [('1234', 1234), ('"1234"', 1234), ('W/"1234"', 1234)]:
+            event = create_api_gateway_event(method='DELETE', path='/tasks/test-id', headers={'If-Match': header})
+
+            response = lambda_handler(event, lambda_context)
+
+            assert response['statusCode'] == 204
+            assert fake_task_service.last_delete_version == expected
+
+    def test_delete_task_invalid_if_match_returns_400(self, fake_task_service, lambda_context):
+        """Test a non-numeric If-Match is rejected."""
+        event = create_api_gateway_event(method='DELETE', path='/tasks/test-id', headers={'If-Match': 'abc'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 400
+
+    def test_delete_task_stale_version_returns_409(self, fake_task_service, lambda_context):
+        """Test a version conflict on delete returns 409 with the current task."""
+        fake_task_service.should_raise_conflict_error = True
+        event = create_api_gateway_event(method='DELETE', path='/tasks/test-id', headers={'If-Match': '1'})
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response['statusCode'] == 409
+        assert json.loads(response['body'])['current_task']['version'] == 9876543210
+
     def test_delete_task_not_found_returns_404(self, fake_task_service, lambda_context):
         """Test deleting non-existent task returns 404."""
         # GIVEN service raises ValueError for not found
@@ -0,0 +1,88 @@
+"""Unit tests for typed task event payloads."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from services.task_service.models.event_payloads import (
+    TaskCreatedPayload,
+    TaskDeletedPayload,
+    TaskUpdatedPayload,
+    decode_payload,
+    event_type_for,
+)
+from services.task_service.models.task import Task, TaskCreatedEvent, TaskEvent, TaskPriority, TaskStatus, TaskUpdatedEvent
+
+
+@pytest.fixture
+def task():
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    return Task(task_id='task-1', title='Write docs', priority=TaskPriority.HIGH, dependencies=['task-0'], created_at=now, updated_at=now, version=2)
+
+
+class TestDecodePayload:
+    """Event details decode into the payload type of their event type."""
+
+    def test_created_event_round_trip(self, task):
+        payload = decode_payload('TaskCreated', TaskCreatedEvent(task).task_data)
+
+        assert payload == TaskCreatedPayload(
+            task_id='task-1',
+            title='Write docs',
+            status=TaskStatus.PENDING,
+            priority=TaskPriority.HIGH,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            version=2,
+            dependencies=('task-0',),
+        )
+
+    def test_updated_event_carries_coalescing_fields(self, task):
+        detail = {**TaskUpdatedEvent(task).task_data, 'changed_fields': ['status', 'title'], 'coalesced_events': 3}
+
+        payload = decode_payload('TaskUpdated', detail)
+
+        assert isinstance(payload, TaskUpdatedPayload)
+        assert payload.changed_fields == ('status', 'title')
+        assert payload.coalesced_events == 3
+
+    def test_unknown_keys_are_ignored(self):
+        assert decode_payload('TaskDeleted', {'task_id': 'task-1', 'deleted_by': 'someone'}) == TaskDeletedPayload(task_id='task-1')
+
+    def test_payloads_are_slotted_and_frozen(self):
+        payload = decode_payload('TaskDeleted', {'task_id': 'task-1'})
+
+        assert not hasattr(payload, '__dict__')
+        with pytest.raises(AttributeError):
+            payload.task_id = 'task-2'
+
+    @pytest.mark.parametrize(
+        'event_type, detail',
+        [
+            ('TaskCreated', {'task_id': 'task-1'}),
+            ('TaskUpdated', {'task_id': 'task-1', 'title': 'Task', 'status': 'archived'}),
+            ('TaskArchived', {'task_id': 'task-1'}),
+        ],
+    )
+    def test_invalid_details_raise_value_error(self, event_type, detail):
+        with pytest.raises(ValueError):
+            decode_payload(event_type, detail)
+
+
+class TestDetailTypes:
+    """Detail types map to event types by lookup."""
+
+    @pytest.mark.parametrize(
+        'detail_type, event_type',
+        [('TaskCreated', 'TaskCreated'), ('TEST-TaskUpdated', 'TaskUpdated'), ('TEST-TaskArchived', 'TaskArchived'), ('', '')],
+    )
+    def test_event_type_for(self, detail_type, event_type):
+        assert event_type_for(detail_type) == event_type
+
+    def test_from_eventbridge_event_strips_test_prefix(self):
+        event = TaskEvent.from_eventbridge_event(
+            {'id': 'event-1', 'detail-type': 'TEST-TaskDeleted', 'source': 'test', 'detail': {'task_id': 'task-1'}}
+        )
+
+        assert event.event_type == 'TaskDeleted'
+        assert event.event_id == 'event-1'
@@ -0,0 +1,36 @@
+"""Unit tests for the API response serializer."""
+
+import json
+from datetime import UTC, datetime
+
+from services.task_service.models.api import PaginationInfo, TaskResponse, dumps_response
+from services.task_service.models.task import Task, TaskPriority, TaskStatus
+from shared.integration.task_codec import decode_task, encode_task
+
+
+def make_task(**fields):
+    now = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+    return Task(task_id='task-1', title='Task', created_at=now, updated_at=now, version=7, **fields)
+
+
+class TestDumpsResponse:
+    """Tasks serialize directly to the same JSON TaskResponse produced."""
+
+    def test_task_matches_task_response(self):
+        task = make_task(description='Details', status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH, dependencies=['task-0'])
+
+        assert json.loads(dumps_response(task)) == TaskResponse.from_task(task).model_dump()
+
+    def test_timestamps_keep_isoformat_offset(self):
+        body = json.loads(dumps_response(make_task()))
+
+        assert body['created_at'] == '2026-01-02T03:04:05.678901+00:00'
+
+    def test_list_body_with_models(self):
+        """Plain dicts holding tasks and pagination models serialize in one pass, including codec-built tasks."""
+        tasks = [make_task(), decode_task(encode_task(make_task(description=None)))]
+
+        body = json.loads(dumps_response({'tasks': tasks, 'pagination': PaginationInfo(limit=2, next_token=None)}))
+
+        assert body['tasks'] == [TaskResponse.from_task(task).model_dump() for task in tasks]
+        assert body['pagination'] == {'next_token': None, 'limit': 2}
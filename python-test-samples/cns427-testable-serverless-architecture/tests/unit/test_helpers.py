@@ -12,6 +12,7 @@ def create_api_gateway_event(
     body: Optional[Dict[str, Any]] = None,
     query_parameters: Optional[Dict[str, str]] = None,
     path_parameters: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Create API Gateway event for testing.
@@ -24,7 +25,7 @@ def create_api_gateway_event(
         'pathParameters': path_parameters,
         'queryStringParameters': query_parameters or {},
         'body': json.dumps(body) if body else None,
-        'headers': {'Content-Type': 'application/json'} if body else {},
+        'headers': {**({'Content-Type': 'application/json'} if body else {}), **(headers or {})},
         'requestContext': {'requestId': 'test-request-id', 'stage': 'test'},
     }
     return event